@@ -16,9 +16,12 @@ import hashlib
 
 from ebcli.containers import commands
 from ebcli.containers import dockerrun
+from ebcli.containers import imagecache
 from ebcli.containers import log
+from ebcli.core import io
 from ebcli.objects.exceptions import CommandError
 from ebcli.lib import utils
+from ebcli.resources.strings import strings
 
 
 class AbstractContainer(object):
@@ -51,8 +54,8 @@ class AbstractContainer(object):
     def start(self):
         """
         Ensure .elasticbeanstalk/* ignored in .dockerignore, containerize app
-        by adding Dockerfile if user doesn't provide one, then pull, build, and
-        run the container.
+        by adding Dockerfile if user doesn't provide one, then pull, build
+        unless an image of the same inputs exists, and run the container.
         :return None
         """
 
@@ -122,8 +125,27 @@ class AbstractContainer(object):
         return commands.pull_img(self._get_full_docker_path())
 
     def _build(self):
-        return commands.build_img(self.pathconfig.docker_proj_path(),
-                                  self._get_full_docker_path())
+        """
+        Build the image tagged with the digest of its inputs, or reuse the
+        image which already has that tag, and remove the images that earlier
+        builds of this project left behind.
+        :return str: id of the image
+        """
+        full_docker_path = self._get_full_docker_path()
+        img_tag = imagecache.image_tag(self.get_name(),
+                                       self.pathconfig.docker_proj_path(),
+                                       full_docker_path,
+                                       self.fs_handler.dockerrun,
+                                       commands.get_base_img_id(full_docker_path))
+        img_id = commands.get_img_id(img_tag)
+        if img_id:
+            io.log_info(strings['local.run.imagecached'].format(img_tag))
+        else:
+            img_id = commands.build_img(self.pathconfig.docker_proj_path(),
+                                        full_docker_path,
+                                        img_tag=img_tag)
+        commands.rm_superseded_imgs(imagecache.repository(self.get_name()), img_tag)
+        return img_id
 
     def _run(self, img_id):
         log_volume_map = self._get_log_volume_map()
@@ -47,21 +47,74 @@ def pull_img(full_docker_path):
     _pull_img(img)
 
 
-def build_img(docker_path, file_path=None):
+def build_img(docker_path, file_path=None, img_tag=None):
     """
     Builds a docker image using Dockerfile found in docker path.
     :param docker_path: str: path of dir containing the Dockerfile
     :param file_path: str: optional name of Dockerfile
+    :param img_tag: str: optional `repository:tag` to tag the image with. Random by default
     :return: str: id of the new image
     """
-    img = utils.random_string(6)
-    tag = utils.random_string(6)
-    img_tag = '{}:{}'.format(img, tag)
+    if img_tag is None:
+        img = utils.random_string(6)
+        tag = utils.random_string(6)
+        img_tag = '{}:{}'.format(img, tag)
     opts = ['-t', img_tag ,'-f', file_path] if file_path else ['-t', img_tag]
     args = ['docker', 'build'] + opts + [docker_path]
     output = _run_live(args)
     return _get_img_id_from_img_tag(img_tag)
 
+def get_img_id(img_tag):
+    """
+    Get the id of the local image with the given tag.
+    :param img_tag: str: image reference, `repository[:tag]`
+    :return str: id of the image, or None if there is no such image
+    """
+    output = _run_quiet(['docker', 'images', '-q', img_tag])
+    return output.split()[0] if output and output.split() else None
+
+
+def get_base_img_id(full_docker_path):
+    """
+    Get the id of the local image that the Dockerfile builds FROM.
+    :param full_docker_path: str: path to the Dockerfile
+    :return str: id of the image, or None if it is not available locally
+    """
+    try:
+        img = _get_base_img(full_docker_path)
+    except (IOError, OSError, ValidationError):
+        return None
+    if not _is_tag_specified(img):
+        img += LATEST_TAG
+    try:
+        return get_img_id(img)
+    except CommandError:
+        return None
+
+
+def rm_superseded_imgs(repository, img_tag):
+    """
+    Remove the images of a repository other than the one with the given tag.
+    Images which are in use by a container are left in place.
+    :param repository: str: the image repository
+    :param img_tag: str: `repository:tag` of the image to keep
+    :return list: the `repository:tag` of each image removed
+    """
+    output = _run_quiet(['docker', 'images', '--format', '{{.Tag}}', repository]) or ''
+    removed = []
+    for tag in output.split():
+        superseded = '{}:{}'.format(repository, tag)
+        if superseded == img_tag or tag == '<none>':
+            continue
+        try:
+            _run_quiet(['docker', 'rmi', superseded])
+        except CommandError:
+            LOG.debug('Could not remove superseded image ' + superseded)
+            continue
+        removed.append(superseded)
+    return removed
+
+
 def run_container(full_docker_path, image_id, host_port=None,
                   envvars_map=None, volume_map=None, name=None):
     """
@@ -132,6 +185,68 @@ def get_container_lowlvl_info(container_id):
     return info[0]
 
 
+def inspect_containers(container_ids):
+    """
+    Get the low level info of several containers with a single `docker inspect`.
+    :param container_ids: list: the ids or names of the containers to inspect
+    :return dict: low level info of each container that exists, keyed by the
+    id or name it was asked for. Containers that do not exist are left out.
+    """
+
+    container_ids = list(container_ids)
+    if not container_ids:
+        return {}
+
+    # One JSON document per line, so the containers that exist can be read
+    # even when docker fails because some of the others do not
+    args = ['docker', 'inspect', '--type', 'container', '--format', '{{json .}}'] + container_ids
+    try:
+        output = utils.exec_cmd_quiet(args)
+    except CommandError as e:
+        output = e.output or ''
+
+    infos = [json.loads(line) for line in output.splitlines() if line.startswith('{')]
+    snapshot = {}
+    for container_id in container_ids:
+        for info in infos:
+            if _is_container(info, container_id):
+                snapshot[container_id] = info
+                break
+    return snapshot
+
+
+def is_running_from_info(info):
+    """
+    Return whether the container described by low level `info` is running.
+    :param info: dict: the container's low level info, or None if it does not exist
+    :return bool
+    """
+
+    return bool(info) and info[STATE_KEY][RUNNING_KEY]
+
+
+def exposed_hostports_from_info(info):
+    """
+    Get the host ports exposed by the container described by low level `info`.
+    :param info: dict: the container's low level info, or None if it does not exist
+    :return list
+    """
+
+    # Since we ran the container, we can guarantee that
+    # one host port and one or more container ports are exposed.
+    # Example of port_map:
+    #
+    #    {'4848/tcp': None,
+    #     '8080/tcp': [{'HostPort': '8080', 'HostIp': '0.0.0.0'}],
+    #     '8181/tcp': None}
+
+    if not info:
+        return []
+    port_map = info[NETWORK_SETTINGS_KEY][PORTS_KEY] or {}
+    return utils.flatten([[p[HOST_PORT_KEY] for p in ports]
+                         for ports in six.itervalues(port_map) if ports])
+
+
 def is_container_existent(container_id):
     """
     Return whether container exists.
@@ -154,8 +269,7 @@ def is_running(container_id):
     """
 
     try:
-        info = get_container_lowlvl_info(container_id)
-        return info[STATE_KEY][RUNNING_KEY]
+        return is_running_from_info(get_container_lowlvl_info(container_id))
     except CommandError:
         return False
 
@@ -167,18 +281,8 @@ def get_exposed_hostports(container_id):
     :return list
     """
 
-    # Since we ran the container, we can guarantee that
-    # one host port and one or more container ports are exposed.
-    # Example of port_map:
-    #
-    #    {'4848/tcp': None,
-    #     '8080/tcp': [{'HostPort': '8080', 'HostIp': '0.0.0.0'}],
-    #     '8181/tcp': None}
-
     try:
-        port_map = _get_network_settings(container_id)[PORTS_KEY] or {}
-        return utils.flatten([[p[HOST_PORT_KEY] for p in ports]
-                             for ports in six.itervalues(port_map) if ports])
+        return exposed_hostports_from_info(get_container_lowlvl_info(container_id))
     except CommandError:  # Not running
         return []
 
@@ -208,9 +312,9 @@ def _get_img_id_from_img_tag(img_tag):
     return output.split()[0]
 
 
-def _get_network_settings(container_id):
-    info = get_container_lowlvl_info(container_id)
-    return info[NETWORK_SETTINGS_KEY]
+def _is_container(info, container_id):
+    return (info.get('Name', '').lstrip('/') == container_id or
+            info.get('Id', '').startswith(container_id))
 
 
 def _pull_img(img):
@@ -60,12 +60,13 @@ class ContainerViewModel(object):
 
         soln_stk = container.soln_stk
         cids = _get_cids(container)
-        container.is_running()
         ip = compat.container_ip()
+        # One `docker inspect` for all the services rather than several per service
+        snapshot = commands.inspect_containers(cids)
         services = [ServiceInfo(cid=cid,
                                 ip=ip,
-                                is_running=commands.is_running(cid),
-                                hostports=commands.get_exposed_hostports(cid))
+                                is_running=commands.is_running_from_info(snapshot.get(cid)),
+                                hostports=commands.exposed_hostports_from_info(snapshot.get(cid)))
                     for cid in cids]
 
         return cls(soln_stk, ip, services)
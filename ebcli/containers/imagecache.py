@@ -0,0 +1,188 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Deterministic tags for the images that `eb local run` builds.
+
+The tag of an image is a digest of everything `docker build` reads: the
+Dockerfile, the Dockerrun.aws.json configuration, the id of the local base
+image and the files of the build context that `.dockerignore` does not
+exclude. An image which already carries the tag was built from the same
+inputs, so building it again can be skipped.
+"""
+import hashlib
+import json
+import os
+import re
+import stat
+
+REPOSITORY_PREFIX = 'eb-local-'
+DOCKERIGNORE_FILENAME = '.dockerignore'
+_CHUNK_SIZE = 1024 * 1024
+
+
+def repository(container_name):
+    """
+    Returns the image repository of the project whose container is named
+    `container_name`.
+    """
+    return REPOSITORY_PREFIX + container_name[:12]
+
+
+def image_tag(container_name, docker_path, dockerfile_path, dockerrun, base_image_id=None):
+    """
+    Returns the `repository:tag` reference of the image to build from the
+    build context at `docker_path` and the Dockerfile at `dockerfile_path`.
+    :param container_name: str: name of the project's container
+    :param dockerrun: dict: Dockerrun.aws.json as dict
+    :param base_image_id: str: id of the local image the Dockerfile builds FROM, if any
+    """
+    digest = hashlib.sha256()
+    _update(digest, 'dockerfile', _file_digest(dockerfile_path))
+    _update(digest, 'dockerrun', json.dumps(dockerrun, sort_keys=True, default=str))
+    _update(digest, 'base', str(base_image_id or ''))
+    for relative_path, mode, file_digest in context_manifest(docker_path):
+        _update(digest, relative_path, '{0:o}'.format(mode), file_digest)
+    return '{0}:{1}'.format(repository(container_name), digest.hexdigest()[:16])
+
+
+def context_manifest(docker_path):
+    """
+    Returns a sorted list of the relative path, permission bits and content
+    digest of every file in the build context at `docker_path` which
+    `.dockerignore` does not exclude. Symbolic links are described by their
+    target, as `docker build` sends them.
+    """
+    patterns = read_dockerignore(docker_path)
+    can_reinclude = any(exclusion for _, exclusion in patterns)
+    manifest = []
+    for directory, dirnames, filenames in os.walk(docker_path):
+        relative_directory = os.path.relpath(directory, docker_path)
+        relative_directory = '' if relative_directory == os.curdir else relative_directory.replace(os.sep, '/') + '/'
+        if not can_reinclude:
+            dirnames[:] = [name for name in dirnames if not is_ignored(relative_directory + name, patterns)]
+        for name in filenames + [name for name in dirnames if os.path.islink(os.path.join(directory, name))]:
+            relative_path = relative_directory + name
+            if is_ignored(relative_path, patterns):
+                continue
+            location = os.path.join(directory, name)
+            try:
+                status = os.lstat(location)
+                if stat.S_ISLNK(status.st_mode):
+                    file_digest = 'link:' + os.readlink(location)
+                else:
+                    file_digest = _file_digest(location)
+            except OSError:
+                continue
+            manifest.append((relative_path, stat.S_IMODE(status.st_mode), file_digest))
+    return sorted(manifest)
+
+
+def read_dockerignore(docker_path):
+    """
+    Returns the patterns of the `.dockerignore` of the build context at
+    `docker_path` as a list of compiled pattern and whether it is an
+    exclusion (`!pattern`) from the patterns before it.
+    """
+    try:
+        with open(os.path.join(docker_path, DOCKERIGNORE_FILENAME)) as f:
+            lines = f.read().splitlines()
+    except (IOError, OSError):
+        return []
+
+    patterns = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        exclusion = line.startswith('!')
+        if exclusion:
+            line = line[1:].strip()
+        line = os.path.normpath(line).replace(os.sep, '/').lstrip('/')
+        if not line or line == '.':
+            continue
+        patterns.append((re.compile(_translate(line)), exclusion))
+    return patterns
+
+
+def is_ignored(relative_path, patterns):
+    """
+    Returns whether `.dockerignore` `patterns` exclude `relative_path`, a
+    '/'-separated path relative to the build context. As in Docker, a
+    pattern which matches a parent directory matches the files under it, and
+    the last matching pattern decides.
+    """
+    ignored = False
+    parents = _parents(relative_path)
+    for pattern, exclusion in patterns:
+        if any(pattern.match(path) for path in parents):
+            ignored = not exclusion
+    return ignored
+
+
+def _parents(relative_path):
+    parts = relative_path.split('/')
+    return ['/'.join(parts[:index]) for index in range(len(parts), 0, -1)]
+
+
+def _translate(pattern):
+    """
+    Translates a `.dockerignore` pattern, in the syntax of Go's
+    `filepath.Match` extended with `**`, into a regular expression.
+    """
+    regex = ''
+    index = 0
+    while index < len(pattern):
+        character = pattern[index]
+        if pattern.startswith('**', index):
+            index += 2
+            if pattern.startswith('/', index):
+                index += 1
+                regex += '(?:.*/)?'
+            else:
+                regex += '.*'
+            continue
+        if character == '*':
+            regex += '[^/]*'
+        elif character == '?':
+            regex += '[^/]'
+        elif character == '[':
+            end = pattern.find(']', index + 1)
+            if end < 0:
+                regex += re.escape(character)
+            else:
+                regex += '[' + pattern[index + 1:end] + ']'
+                index = end
+        elif character == '\\' and index + 1 < len(pattern):
+            index += 1
+            regex += re.escape(pattern[index])
+        else:
+            regex += re.escape(character)
+        index += 1
+    return regex + r'\Z'
+
+
+def _file_digest(location):
+    digest = hashlib.sha256()
+    try:
+        with open(location, 'rb') as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+                digest.update(chunk)
+    except (IOError, OSError):
+        return ''
+    return digest.hexdigest()
+
+
+def _update(digest, *fields):
+    for field in fields:
+        digest.update(field.encode('utf-8'))
+        digest.update(b'\0')
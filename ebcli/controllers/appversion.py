@@ -12,7 +12,6 @@
 # language governing permissions and limitations under the License.
 from ebcli.core.abstractcontroller import AbstractBaseController
 from ebcli.core import fileoperations
-from ebcli.lib import elasticbeanstalk as elasticbeanstalk
 from ebcli.operations import appversionops
 from ebcli.resources.strings import strings, flag_text, alerts
 from ebcli.objects.exceptions import InvalidOptionsError
@@ -78,5 +77,4 @@ class AppVersionController(AbstractBaseController):
         - delete a certain version
         Run when the user supplies no argument to the --delete flag.
         """
-        app_versions = elasticbeanstalk.get_application_versions(self.app_name)['ApplicationVersions']
-        appversionops.display_versions(self.app_name, self.env_name, app_versions)
+        appversionops.display_versions(self.app_name, self.env_name)
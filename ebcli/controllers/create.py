@@ -374,8 +374,7 @@ class CreateController(AbstractBaseController):
 
         root_dir = os.getcwd()
 
-        version_labels = []
-        grouped_env_names = []
+        module_plans = []
         app_name = None
         for module in module_names:
             if not os.path.isdir(os.path.join(root_dir, module)):
@@ -384,37 +383,48 @@ class CreateController(AbstractBaseController):
                 continue
 
             os.chdir(os.path.join(root_dir, module))
-
-            if not fileoperations.env_yaml_exists():
-                io.log_warning(strings['compose.noenvyaml'].replace('{module}',
-                                                                    module))
-                continue
-
-            io.echo('--- Creating application version for module: {0} ---'.format(module))
-
-            hooks.set_region(None)
-            hooks.set_ssl(None)
-            hooks.set_profile(None)
-
-            commonops.set_group_suffix_for_current_branch(group)
-
-            if not app_name:
-                app_name = self.get_app_name()
-            process_app_version = fileoperations.env_yaml_exists()
-            version_label = commonops.create_app_version(app_name, process=process_app_version)
-
-            version_labels.append(version_label)
-
-            environment_name = fileoperations.get_env_name_from_env_yaml()
-            if environment_name is not None:
-                commonops.set_environment_for_current_branch(environment_name.
-                                                             replace('+', '-{0}'.
-                                                                     format(group)))
-
-                grouped_env_names.append(environment_name.replace('+', '-{0}'.
-                                                                  format(group)))
-
-            os.chdir(root_dir)
+            try:
+                if not fileoperations.env_yaml_exists():
+                    io.log_warning(strings['compose.noenvyaml'].replace('{module}',
+                                                                        module))
+                    continue
+
+                io.echo('--- Creating application version for module: {0} ---'.format(module))
+
+                hooks.set_region(None)
+                hooks.set_ssl(None)
+                hooks.set_profile(None)
+
+                commonops.set_group_suffix_for_current_branch(group)
+
+                if not app_name:
+                    app_name = self.get_app_name()
+                process_app_version = fileoperations.env_yaml_exists()
+                plan = commonops.plan_app_version(process=process_app_version)
+
+                environment_name = fileoperations.get_env_name_from_env_yaml()
+                grouped_env_name = None
+                if environment_name is not None:
+                    commonops.set_environment_for_current_branch(environment_name.
+                                                                 replace('+', '-{0}'.
+                                                                         format(group)))
+
+                    grouped_env_name = environment_name.replace('+', '-{0}'.format(group))
+                module_plans.append((grouped_env_name, plan))
+            finally:
+                os.chdir(root_dir)
+
+        # The modules' versions are zipped up and uploaded concurrently
+        version_labels = composeops.create_module_app_versions(
+            app_name,
+            [plan for _, plan in module_plans]
+        )
+        grouped_env_names = [
+            grouped_env_name
+            for (grouped_env_name, _), version_label in zip(module_plans, version_labels)
+            if grouped_env_name is not None and version_label is not None
+        ]
+        version_labels = [version_label for version_label in version_labels if version_label is not None]
 
         if len(version_labels) > 0:
             composeops.compose(app_name, version_labels, grouped_env_names, group,
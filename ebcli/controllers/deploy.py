@@ -34,7 +34,7 @@ class DeployController(AbstractBaseController):
         description = strings['deploy.info']
         arguments = [
             (['environment_name'], dict(
-                action='store', nargs='?', default=[],
+                action='store', nargs='*', default=[],
                 help=flag_text['deploy.env'])),
             (['--modules'], dict(help=flag_text['deploy.modules'], nargs='*')),
             (['-g', '--env-group-suffix'], dict(help=flag_text['deploy.group_suffix'])),
@@ -49,7 +49,11 @@ class DeployController(AbstractBaseController):
             (['--source'], dict(help=flag_text['deploy.source'])),
             (['-p', '--process'], dict(
                 action='store_true', help=flag_text['deploy.process'])),
-            (['--archive'], dict(help=flag_text['deploy.archive'])),]
+            (['--archive'], dict(help=flag_text['deploy.archive'])),
+            (['--max-concurrency'], dict(
+                type=int, default=deployops.DEFAULT_MAX_CONCURRENCY,
+                help=flag_text['deploy.max_concurrency'])),
+            (['--wave-size'], dict(type=int, help=flag_text['deploy.wave_size'])),]
 
         usage = AbstractBaseController.Meta.usage.replace('{cmd}', label)
 
@@ -72,7 +76,20 @@ class DeployController(AbstractBaseController):
         if self.source and self.archive:
             raise InvalidOptionsError(strings['deploy.archivewithsource'])
 
-        self.env_name = self.app.pargs.environment_name
+        wave_size = self.app.pargs.wave_size
+        if wave_size is not None and wave_size < 1:
+            raise InvalidOptionsError(strings['deploy.invalidwavesize'])
+
+        env_names = self.app.pargs.environment_name
+        if len(env_names) > 1 or any(
+            wildcard in name for name in env_names for wildcard in deployops.ENVIRONMENT_NAME_WILDCARDS
+        ):
+            if self.archive:
+                raise InvalidOptionsError(strings['deploy.archivewithmultipleenvs'])
+            self.multiple_env_deploy(env_names)
+            return
+
+        self.env_name = env_names[0] if env_names else None
         if self.archive and not self.env_name:
             raise InvalidOptionsError(strings['deploy.archivewithoutenvname'])
         elif not self.archive:
@@ -109,6 +126,34 @@ class DeployController(AbstractBaseController):
                          staged=self.staged, timeout=self.timeout, source=self.source,
                          source_bundle=source_bundle_zip)
 
+    def multiple_env_deploy(self, env_names):
+        self.app_name = self.get_app_name()
+        self.version = self.app.pargs.version
+        self.label = self.app.pargs.label
+        if self.version and (self.message or self.label):
+            raise InvalidOptionsError(strings['deploy.invalidoptions'])
+
+        env_names = deployops.resolve_environment_names(self.app_name, env_names)
+        for environment in elasticbeanstalk.get_environments(env_names):
+            statusops.alert_environment_status(environment)
+
+        process_app_versions = fileoperations.env_yaml_exists() or self.app.pargs.process
+
+        deployops.deploy_to_environments(
+            self.app_name,
+            env_names,
+            self.version,
+            self.label,
+            self.message,
+            group_name=self.app.pargs.env_group_suffix,
+            process_app_versions=process_app_versions,
+            staged=self.staged,
+            timeout=self.timeout,
+            source=self.source,
+            max_concurrency=self.app.pargs.max_concurrency,
+            wave_size=self.app.pargs.wave_size
+        )
+
     def multiple_app_deploy(self):
         missing_env_yaml = []
         top_dir = getcwd()
@@ -144,55 +189,59 @@ class DeployController(AbstractBaseController):
         stages_env_names = {}
 
         top_dir = getcwd()
+        module_plans = []
         for module in modules:
             if not path.isdir(path.join(top_dir, module)):
                 io.log_error(strings['deploy.notadirectory'].replace('{module}', module))
                 continue
 
             chdir(path.join(top_dir, module))
+            try:
+                if not group_name:
+                    group_name = commonops.get_current_branch_group_suffix()
+                if group_name not in stages_version_labels.keys():
+                    stages_version_labels[group_name] = []
+                    stages_env_names[group_name] = []
 
-            if not group_name:
-                group_name = commonops.get_current_branch_group_suffix()
-            if group_name not in stages_version_labels.keys():
-                stages_version_labels[group_name] = []
-                stages_env_names[group_name] = []
+                if not app_name:
+                    app_name = self.get_app_name()
 
-            if not app_name:
-                app_name = self.get_app_name()
+                io.echo('--- Creating application version for module: {0} ---'.format(module))
 
-            io.echo('--- Creating application version for module: {0} ---'.format(module))
+                hooks.set_region(None)
+                hooks.set_ssl(None)
+                hooks.set_profile(None)
 
-            hooks.set_region(None)
-            hooks.set_ssl(None)
-            hooks.set_profile(None)
+                if not app_name:
+                    app_name = self.get_app_name()
 
-            if not app_name:
-                app_name = self.get_app_name()
+                environment_name = fileoperations.get_env_name_from_env_yaml()
+                if environment_name is None:
+                    io.echo(strings['deploy.noenvname'].replace('{module}', module))
+                    continue
 
-            process_app_version = fileoperations.env_yaml_exists()
-            version_label = commonops.create_app_version(app_name, process=process_app_version)
+                process_app_version = fileoperations.env_yaml_exists()
+                plan = commonops.plan_app_version(process=process_app_version)
 
-            stages_version_labels[group_name].append(version_label)
-
-            environment_name = fileoperations.get_env_name_from_env_yaml()
-
-            if environment_name is not None:
                 commonops.set_environment_for_current_branch(environment_name.
                                                              replace('+', '-{0}'.
                                                                      format(group_name)))
-
                 env_name = commonops.get_current_branch_environment()
-                stages_env_names[group_name].append(env_name)
-                env_names.append(env_name)
-            else:
-                io.echo(strings['deploy.noenvname'].replace('{module}', module))
-
-                stages_version_labels[group_name] = [
-                    v for v in stages_version_labels[group_name]
-                    if v != version_label
-                ]
-
-            chdir(top_dir)
+                module_plans.append((group_name, env_name, plan))
+            finally:
+                chdir(top_dir)
+
+        # The modules' versions are zipped up and uploaded concurrently
+        version_labels = composeops.create_module_app_versions(
+            app_name,
+            [plan for _, _, plan in module_plans]
+        )
+        for (group, env_name, _), version_label in zip(module_plans, version_labels):
+            if version_label is None:
+                continue
+            stages_version_labels[group].append(version_label)
+            stages_env_names[group].append(env_name)
+            env_names.append(env_name)
 
         if len(stages_version_labels) > 0:
             for stage in stages_version_labels.keys():
@@ -12,6 +12,7 @@
 # language governing permissions and limitations under the License.
 
 from ebcli.core.abstractcontroller import AbstractBaseController
+from ebcli.core.eventstore import SEVERITIES
 from ebcli.resources.strings import strings, flag_text
 from ebcli.operations import eventsops
 
@@ -22,7 +23,12 @@ class EventsController(AbstractBaseController):
         description = strings['events.info']
         arguments = AbstractBaseController.Meta.arguments + [
             (['-f', '--follow'], dict(
-                action='store_true', help=flag_text['events.follow']))
+                action='store_true', help=flag_text['events.follow'])),
+            (['--since'], dict(help=flag_text['events.since'])),
+            (['--severity'], dict(
+                type=str.upper, choices=SEVERITIES, help=flag_text['events.severity'])),
+            (['--request-id'], dict(help=flag_text['events.request_id'])),
+            (['--version-label'], dict(help=flag_text['events.version_label'])),
         ]
         usage = AbstractBaseController.Meta.usage.replace('{cmd}', label)
 
@@ -31,4 +37,12 @@ class EventsController(AbstractBaseController):
         env_name = self.get_env_name()
         follow = self.app.pargs.follow
 
-        eventsops.print_events(app_name, env_name, follow)
+        eventsops.print_events(
+            app_name,
+            env_name,
+            follow,
+            since=self.app.pargs.since,
+            severity=self.app.pargs.severity,
+            request_id=self.app.pargs.request_id,
+            version_label=self.app.pargs.version_label,
+        )
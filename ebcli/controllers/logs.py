@@ -42,6 +42,9 @@ class LogsController(AbstractBaseController):
             (['-cls', '--cloudwatch-log-source'], dict(help=flag_text['logs.cloudwatch_log_source'])),
             (['--stream'], dict(action='store_true',
                                 help=flag_text['logs.stream'])),
+            (['--start-time'], dict(help=flag_text['logs.start_time'])),
+            (['--end-time'], dict(help=flag_text['logs.end_time'])),
+            (['--grep'], dict(metavar='PATTERN', help=flag_text['logs.grep'])),
 
         ]
         epilog = strings['logs.epilog']
@@ -57,11 +60,16 @@ class LogsController(AbstractBaseController):
         self.cloudwatch_logs = self.app.pargs.cloudwatch_logs
         self.cloudwatch_log_source = self.app.pargs.cloudwatch_log_source
         self.stream = self.app.pargs.stream
+        self.start_time = self.app.pargs.start_time
+        self.end_time = self.app.pargs.end_time
+        self.grep = self.app.pargs.grep
 
         self.__raise_if_incompatible_arguments_are_present()
 
         if self.cloudwatch_logs:
             self.__modify_log_streaming()
+        elif self.grep:
+            logsops.search_retrieved_logs(self.grep, instance_id=self.instance, **self.__time_range())
         elif self.stream:
             self.__stream_cloudwatch_logs()
         elif self.analyze:
@@ -91,6 +99,7 @@ class LogsController(AbstractBaseController):
                 self.__normalized_log_group_name(),
                 info_type,
                 do_zip=should_zip_logs,
+                **self.__time_range()
             )
         elif self.cloudwatch_log_source == logs_operations_constants.LOG_SOURCES.INSTANCE_LOG_SOURCE:
             logsops.raise_if_instance_log_streaming_is_not_enabled(self.app_name, self.env_name)
@@ -101,6 +110,9 @@ class LogsController(AbstractBaseController):
         elif logsops.instance_log_streaming_enabled(self.app_name, self.env_name):
             self.__retrieve_cloudwatch_instance_logs(info_type, should_zip_logs)
         else:
+            if self.start_time or self.end_time:
+                raise InvalidOptionsError(strings['logs.time_range_requires_cloudwatch_bundle'])
+
             logsops.retrieve_beanstalk_logs(
                 self.env_name,
                 info_type,
@@ -127,9 +139,22 @@ class LogsController(AbstractBaseController):
             self.__normalized_log_group_name(),
             info_type,
             do_zip=should_zip_logs,
-            specific_log_stream=self.instance
+            specific_log_stream=self.instance,
+            **self.__time_range()
         )
 
+    def __time_range(self):
+        """
+        :return: the keyword arguments restricting the retrieval of CloudWatch logs to
+                 the time range given through --start-time and --end-time, if any
+        """
+        time_range = dict()
+        if self.start_time:
+            time_range['start_time'] = logsops.parse_log_time(self.start_time)
+        if self.end_time:
+            time_range['end_time'] = logsops.parse_log_time(self.end_time)
+        return time_range
+
     def __raise_if_incompatible_arguments_are_present(self):
         if self.all and self.instance:
             raise InvalidOptionsError(strings['logs.all_argument_and_instance_argument'])
@@ -137,6 +162,15 @@ class LogsController(AbstractBaseController):
         if self.all and self.zip:
             raise InvalidOptionsError(strings['logs.all_argument_and_zip_argument'])
 
+        if self.grep and any([
+                self.all, self.zip, self.analyze, self.stream, self.cloudwatch_logs,
+                self.cloudwatch_log_source, self.log_group
+        ]):
+            raise InvalidOptionsError(strings['logs.grep_argument_and_retrieval_argument'])
+
+        if (self.start_time or self.end_time) and not (self.all or self.zip or self.grep):
+            raise InvalidOptionsError(strings['logs.time_range_requires_cloudwatch_bundle'])
+
         if self.cloudwatch_logs and self.log_group:
             raise InvalidOptionsError(strings['logs.cloudwatch_logs_argument_and_log_group_argument'])
 
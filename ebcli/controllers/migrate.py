@@ -11,6 +11,7 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import datetime
+import functools
 import shutil
 import os
 import string
@@ -62,11 +63,9 @@ if is_supported():
 
 from cement.utils.misc import minimal_logger
 
-LOG = minimal_logger(__name__)
-
 from ebcli.core.abstractcontroller import AbstractBaseController
 from ebcli.core import io, fileoperations
-from ebcli.lib import utils, ec2, elasticbeanstalk, aws
+from ebcli.lib import utils, ec2, elasticbeanstalk, aws, sftptransfer
 from ebcli.objects import requests
 from ebcli.objects.platform import PlatformVersion, PlatformBranch
 from ebcli.objects.exceptions import (
@@ -79,6 +78,13 @@ from ebcli.operations import commonops, createops, platformops, statusops, platf
 from ebcli.operations.tagops import tagops
 from ebcli.resources.statics import namespaces
 
+LOG = minimal_logger(__name__)
+
+REMOTE_TRANSFER_CONCURRENCY = 4
+MAX_ALB_RULES_PER_LISTENER = 100
+MAX_ALB_CONDITION_VALUES_PER_RULE = 5
+ALB_TARGET_GROUP_TEMPLATE_ARN = "arn:aws:elasticloadbalancing:region:account-id:targetgroup/{port}"
+
 
 class MigrateExploreController(AbstractBaseController):
     class Meta:
@@ -729,6 +735,43 @@ class MigrateController(AbstractBaseController):
             add_virtual_directory_custom_script_to_manifest(upload_target_dir)
 
 
+def list_packaged_sites_remote(remote_connection, remote_directory):
+    """
+    Lists the zip files in `remote_directory` and in its immediate
+    subdirectories, with their size and SHA-256 digest, in one remote
+    execution.
+    """
+    ps_command = f'''
+    $root = (Get-Item -LiteralPath "{remote_directory}").FullName.TrimEnd('\\')
+    $files = @(Get-ChildItem -LiteralPath $root -Filter *.zip -File) + @(Get-ChildItem -LiteralPath $root -Directory | ForEach-Object {{
+        Get-ChildItem -LiteralPath $_.FullName -Filter *.zip -File
+    }})
+    $listing = @($files | ForEach-Object {{
+        @{{
+            RelativePath = $_.FullName.Substring($root.Length + 1)
+            Size = $_.Length
+            Sha256 = (Get-FileHash -LiteralPath $_.FullName -Algorithm SHA256).Hash
+        }}
+    }})
+    ConvertTo-Json -InputObject $listing -Compress
+    '''
+    command_bytes = ps_command.encode('utf-16le')
+    encoded_command = base64.b64encode(command_bytes).decode()
+    result = remote_connection.run(f'powershell -NoProfile -NonInteractive -EncodedCommand {encoded_command}', hide=True)
+    output = result.stdout.strip()
+    listing = json.loads(output[output.find('['):]) if '[' in output else []
+
+    return [
+        sftptransfer.RemoteFile(
+            path=convert_to_ssh_path(remote_directory + '\\' + entry['RelativePath']),
+            relative_path=entry['RelativePath'].replace('\\', '/'),
+            size=int(entry['Size']),
+            sha256=entry.get('Sha256'),
+        )
+        for entry in _as_list(listing)
+    ]
+
+
 def import_packaged_sites_from_remote(remote_connection, latest_migration_run_path_remote, upload_target_dir):
     upload_target_dir_remote = latest_migration_run_path_remote + "/upload_target"
     remote_directory = convert_to_ssh_path(upload_target_dir_remote)
@@ -739,53 +782,21 @@ def import_packaged_sites_from_remote(remote_connection, latest_migration_run_pa
         remote_directory = remote_directory[1:]
 
     try:
-        result = remote_connection.run(f'powershell -Command "Get-ChildItem -Path \"{remote_directory}\" -Filter *.zip | Select-Object -ExpandProperty Name"', hide=True)
-
-        filenames = [f.strip().rstrip('?') for f in result.stdout.strip().split('\n') if f.strip()]
-
-        for filename in filenames:
-            temp_remote_file = remote_directory+"/"+filename
-            temp_remote_file_normalized = convert_to_ssh_path(temp_remote_file)
-            local_file_path = os.path.join(local_directory, filename)
-
-            try:
-                remote_connection.get(temp_remote_file_normalized, local_file_path)
-            except Exception as e:
-                io.echo(f"Failed to download {filename}: {e}")
-                continue
-
-        # Now handle folders containing zip files
-        folder_result = remote_connection.run(
-            f'powershell -Command "Get-ChildItem -LiteralPath \'{remote_directory}\' -Directory | Select-Object -ExpandProperty Name"',
-            hide=True)
-        folders = [f.strip() for f in folder_result.stdout.strip().split('\n') if f.strip()]
-
-        for folder in folders:
-            # Create the local folder
-            local_folder_path = os.path.join(local_directory, folder)
-            os.makedirs(local_folder_path, exist_ok=True)
-
-            # Get zip files in this folder
-            zip_result = remote_connection.run(
-                f'powershell -Command "Get-ChildItem -LiteralPath \'{remote_directory}\\{folder}\' -Filter *.zip | Select-Object -ExpandProperty Name"',
-                hide=True)
-            zip_files = [f.strip() for f in zip_result.stdout.strip().split('\n') if f.strip()]
-
-            for zip_file in zip_files:
-                remote_zip_path = f"{remote_directory}\\{folder}\\{zip_file}"
-                remote_zip_path_normalized = convert_to_ssh_path(remote_zip_path)
-                local_zip_path = os.path.join(local_folder_path, zip_file)
-
-                try:
-                    remote_connection.get(remote_zip_path_normalized, local_zip_path)
-                except Exception as e:
-                    io.echo(f"Failed to download {zip_file} in folder {folder}: {e}")
-                    continue
-
+        remote_files = list_packaged_sites_remote(remote_connection, remote_directory)
+        remote_connection.open()
+        transfer_manager = sftptransfer.TransferManager(
+            remote_connection.client.open_sftp,
+            concurrency=REMOTE_TRANSFER_CONCURRENCY
+        )
+        summary = transfer_manager.download(remote_files, local_directory)
     except Exception as e:
         io.echo(f"Error during file download: {str(e)}")
         raise
 
+    for remote_file, error in summary.failed:
+        io.echo(f"Failed to download {remote_file.relative_path}: {error}")
+    io.echo(str(summary))
+
     return True
 
 def get_all_ports(sites):
@@ -1040,165 +1051,232 @@ def establish_candidate_sites(
         )
     return sites
 
-def establish_candidate_sites_remote(remote_connection, site_names):
-    ps_command = '''
-    Import-Module WebAdministration
-    Get-Website | Select-Object -ExpandProperty Name | ForEach-Object {
-        Write-Host $_
-    }
-    '''
-    command_bytes = ps_command.encode('utf-16le')
-    encoded_command = base64.b64encode(command_bytes).decode()
-    result = remote_connection.run(f'powershell -NoProfile -NonInteractive -EncodedCommand {encoded_command}', hide=True)
-    output = result.stdout.strip()
-
-    available_sites = [site for site in output.split('\n') if site.strip()]
-
-    if not available_sites:
-        raise EnvironmentError(
-            "`eb migrate` failed because there are no sites on this IIS server."
-        )
-
-    if site_names:
-        site_names = site_names.split(",")
-        sites = []
-
-        for site_name in site_names:
-            if site_name not in available_sites:
-                raise ValueError(
-                    f"Specified site, '{site_name}', does not exist. Available sites: [{', '.join(available_sites)}]"
-                )
-            sites.append(site_name)
-        return sites
-    else:
-        return available_sites
-
-def populate_site_data_remote(remote_connection, site_names):
-    sites = []
-    for name in site_names:
-        sites.append(get_site_remote(remote_connection, name))
-
-    return sites
 
-def get_site_remote(c, site_name) -> None:
-    ps_command = f"""
-    Import-Module WebAdministration
-    $site = Get-Item "IIS:\\Sites\\{site_name}"
-    $config = Get-WebConfiguration -Filter "system.webServer/httpProtocol/customHeaders" -PSPath "IIS:\\Sites\\{site_name}"
-    $hsts = $config.Collection | Where-Object {{ $_.ElementTagName -eq 'add' -and $_.Attributes['name'].Value -eq 'Strict-Transport-Security' }}
-    $bindings = Get-WebBinding -Name "{site_name}"
+IIS_INVENTORY_SCRIPT = '''
+Import-Module WebAdministration
 
-    $rootVDirs = @(Get-WebConfiguration "/system.applicationHost/sites/site[@name='{site_name}']/application[@path='/']/virtualDirectory" | ForEach-Object {{
-        @{{
+function Get-VirtualDirectories($siteName, $appPath) {
+    @(Get-WebConfiguration "/system.applicationHost/sites/site[@name='$siteName']/application[@path='$appPath']/virtualDirectory" | ForEach-Object {
+        $logonMethod = switch ($_.GetAttributeValue("logonMethod")) {
+            0 { "Interactive" }
+            1 { "Batch" }
+            2 { "Network" }
+            3 { "ClearText" }
+            default { "$_" }
+        }
+        @{
             Path = $_.GetAttributeValue("path")
             PhysicalPath = $_.GetAttributeValue("physicalPath")
-        }}
-    }})
+            LogonMethod = $logonMethod
+            UserName = $_.GetAttributeValue("userName")
+            HasPassword = [bool]$_.GetAttributeValue("password")
+        }
+    })
+}
+
+$sites = @(Get-Website | ForEach-Object {
+    $site = $_
+    $sitePath = "IIS:\\Sites\\$($site.Name)"
+    $headers = Get-WebConfiguration -Filter "system.webServer/httpProtocol/customHeaders" -PSPath $sitePath
+    $hsts = $headers.Collection | Where-Object { $_.ElementTagName -eq 'add' -and $_.Attributes['name'].Value -eq 'Strict-Transport-Security' }
 
-    $rootApp = @{{
+    $rootApp = @{
         Path = "/"
         ApplicationPoolName = $site.applicationPool
         PhysicalPath = $site.PhysicalPath
-        VirtualDirectories = $rootVDirs
-    }}
-
-    $applications = Get-WebApplication -Site "{site_name}" | ForEach-Object {{
-        $appPath = $_.path
-        $appVDirs = @(Get-WebConfiguration "/system.applicationHost/sites/site[@name='{site_name}']/application[@path='$appPath']/virtualDirectory" | ForEach-Object {{
-            @{{
-                Path = $_.GetAttributeValue("path")
-                PhysicalPath = $_.GetAttributeValue("physicalPath")
-            }}
-        }})
-
-        @{{
-            Path = $appPath
+        EnabledProtocols = $site.enabledProtocols
+        VirtualDirectories = Get-VirtualDirectories $site.Name "/"
+    }
+    $applications = @(Get-WebApplication -Site $site.Name | ForEach-Object {
+        @{
+            Path = $_.path
             ApplicationPoolName = $_.applicationPool
             PhysicalPath = $_.PhysicalPath
-            VirtualDirectories = $appVDirs
-        }}
-    }}
+            EnabledProtocols = $_.enabledProtocols
+            VirtualDirectories = Get-VirtualDirectories $site.Name $_.path
+        }
+    })
 
-    $allApplications = @($rootApp) + @($applications)
+    $webConfig = $null
+    $webConfigPath = Join-Path ([Environment]::ExpandEnvironmentVariables($site.PhysicalPath)) "web.config"
+    if (Test-Path -Path $webConfigPath -PathType Leaf) {
+        $webConfig = Get-Content -Path $webConfigPath -Raw
+    }
 
-    $result = @{{
+    @{
         Name = $site.Name
-        Attributes = @($site.Attributes | ForEach-Object {{ @{{ Name = $_.Name; Value = $_.Value }} }})
-        Bindings = @($bindings | ForEach-Object {{
+        Attributes = @($site.Attributes | ForEach-Object { @{ Name = $_.Name; Value = "$($_.Value)" } })
+        Bindings = @(Get-WebBinding -Name $site.Name | ForEach-Object {
             $bindingInfo = $_.bindingInformation -split ':'
-            $hostValue = if ($bindingInfo[2] -eq '') {{ '*' }} else {{ $bindingInfo[2] }}
-            @{{
+            $hostValue = if ($bindingInfo[2] -eq '') { '*' } else { $bindingInfo[2] }
+            @{
                 BindingInformation = $_.bindingInformation
                 Protocol = $_.protocol
                 CertificateHash = $_.certificateHash
                 CertificateStoreName = $_.certificateStoreName
                 Host = $hostValue
-                EndPoint = @{{
+                EndPoint = @{
                     Port = [int]$bindingInfo[1]
                     Address = $bindingInfo[0]
-                }}
-            }}
-        }})
-        Applications = $allApplications
-        HSTS = @{{
+                }
+            }
+        })
+        Applications = @($rootApp) + $applications
+        HSTS = @{
             Enabled = $hsts -ne $null
-            MaxAge = if ($hsts) {{ $hsts.Attributes['value'].Value }} else {{ $null }}
-        }}
-    }}
+            MaxAge = if ($hsts) { $hsts.Attributes['value'].Value } else { $null }
+        }
+        WebConfig = $webConfig
+    }
+})
+
+$users = @()
+try {
+    $users = @(Get-LocalUser | Where-Object { $_.Enabled -eq $true } | ForEach-Object {
+        @{ Name = $_.Name; HomeDirectory = $_.HomeDirectory }
+    })
+} catch {
+    # Silently skip if user enumeration fails
+}
+
+$inventory = @{
+    Sites = $sites
+    ArrEnabled = (Get-WebConfiguration -Filter "system.webServer/proxy" -ErrorAction SilentlyContinue) -ne $null
+    Users = $users
+}
+ConvertTo-Json -InputObject $inventory -Depth 8 -Compress
+'''
+
+RemoteEndPoint = namedtuple('RemoteEndPoint', ['Port', 'Address'])
+RemoteAttribute = namedtuple('RemoteAttribute', ['get_Name', 'get_Value'])
+RemoteBinding = namedtuple('RemoteBinding', ['get_BindingInformation', 'BindingInformation', 'Protocol', 'get_Protocol',
+                                             'get_CertificateHash', 'get_CertificateStoreName', 'Host', 'get_Host',
+                                             'EndPoint', 'get_EndPoint'])
+RemoteVirtualDirectory = namedtuple('RemoteVirtualDirectory', ['Path', 'PhysicalPath'])
+RemoteApplication = namedtuple('RemoteApplication', ['Path', 'ApplicationPoolName', 'PhysicalPath', 'VirtualDirectories'])
+RemoteHSTS = namedtuple('RemoteHSTS', ['Enabled', 'MaxAge'])
+RemoteSite = namedtuple('RemoteSite', ['Name', 'Bindings', 'get_Attributes', 'get_Bindings', 'Applications', 'HSTS'])
+
+
+class IISInventory:
+    """
+    Sites, ARR status and local users of a remote IIS server, as read by
+    `IIS_INVENTORY_SCRIPT` in a single remote execution.
+
+    Args:
+        document: The JSON document printed by `IIS_INVENTORY_SCRIPT`, as dict
 
-    ConvertTo-Json -InputObject $result -Depth 5
+    Attributes:
+        sites (List[RemoteSite]): The sites of the server, in the order IIS lists them
+        site_documents (Dict[str, dict]): The raw description of each site, by name
+        arr_enabled (bool): Whether Application Request Routing is installed
+        users (List[Tuple[str, str]]): The name and home directory of each enabled local user
     """
 
-    command_bytes = ps_command.encode('utf-16le')
+    def __init__(self, document: Dict[str, Any]) -> None:
+        self.site_documents = collections.OrderedDict(
+            (site_data['Name'], site_data) for site_data in _as_list(document.get('Sites'))
+        )
+        self.sites = [_site_from_document(site_data) for site_data in self.site_documents.values()]
+        self.arr_enabled = bool(document.get('ArrEnabled'))
+        self.users = [
+            (user['Name'], user.get('HomeDirectory') or 'None')
+            for user in _as_list(document.get('Users'))
+        ]
+
+    @property
+    def site_names(self) -> List[str]:
+        return list(self.site_documents.keys())
+
+    def site(self, site_name: str) -> "RemoteSite":
+        for site in self.sites:
+            if site.Name == site_name:
+                return site
+        raise ValueError(
+            f"Specified site, '{site_name}', does not exist. Available sites: [{', '.join(self.site_names)}]"
+        )
+
+    def web_config(self, site_name: str) -> Optional[str]:
+        """
+        Returns the contents of the web.config at the root of the site, or None
+        if it has none.
+        """
+        return self.site_documents[site_name].get('WebConfig')
+
+
+_iis_inventories = {}
+
+
+def get_iis_inventory_remote(remote_connection, refresh: bool = False) -> IISInventory:
+    """
+    Returns the inventory of the IIS server at the other end of
+    `remote_connection`. The inventory is read once per connection, in a
+    single remote execution, and reused by every later call unless `refresh`
+    is True.
+    """
+    if not refresh and remote_connection in _iis_inventories:
+        return _iis_inventories[remote_connection]
+
+    command_bytes = IIS_INVENTORY_SCRIPT.encode('utf-16le')
     encoded_command = base64.b64encode(command_bytes).decode()
-    result = c.run(f'powershell -NoProfile -NonInteractive -EncodedCommand {encoded_command}', hide=True)
+    result = remote_connection.run(f'powershell -NoProfile -NonInteractive -EncodedCommand {encoded_command}', hide=True)
+    output = result.stdout.strip()
+    inventory = IISInventory(json.loads(output[output.find('{'):]))
+    _iis_inventories[remote_connection] = inventory
+    return inventory
 
-    site_data = json.loads(result.stdout.strip())
 
-    EndPoint = namedtuple('EndPoint', ['Port', 'Address'])
+def _as_list(value) -> List[Any]:
+    """
+    ConvertTo-Json renders empty collections as null and, in some versions of
+    PowerShell, single-element collections as their element.
+    """
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
 
-    Attribute = namedtuple('Attribute', ['get_Name', 'get_Value'])
-    Binding = namedtuple('Binding', ['get_BindingInformation', 'BindingInformation', 'Protocol', 'get_Protocol', 'get_CertificateHash',
-                                     'get_CertificateStoreName', 'Host', 'get_Host', 'EndPoint', 'get_EndPoint'])
-    VirtualDirectory = namedtuple('VirtualDirectory', ['Path', 'PhysicalPath'])
-    Application = namedtuple('Application', ['Path', 'ApplicationPoolName', 'PhysicalPath', 'VirtualDirectories'])
-    HSTS = namedtuple('HSTS', ['Enabled', 'MaxAge'])
-    Site = namedtuple('Site', ['Name', 'Bindings', 'get_Attributes', 'get_Bindings', 'Applications', 'HSTS'])
 
-    attributes = [Attribute(
+def _site_from_document(site_data: Dict[str, Any]) -> "RemoteSite":
+    attributes = [RemoteAttribute(
         get_Name=lambda name=attr['Name']: name,
         get_Value=lambda value=attr['Value']: value
-    ) for attr in site_data['Attributes']]
-
-    bindings = [Binding(
-        get_BindingInformation=lambda bi=b['BindingInformation']: bi,
-        BindingInformation=b['BindingInformation'],
-        Protocol=b['Protocol'],
-        get_Protocol=lambda p=b['Protocol']: p,
-        get_CertificateHash=lambda ch=b['CertificateHash']: ch,
-        get_CertificateStoreName=lambda csn=b['CertificateStoreName']: csn,
-        Host=b['Host'],  # Use the Host value directly
-        get_Host=lambda h=b['Host']: h,
-        EndPoint=EndPoint(Port=b['EndPoint']['Port'], Address=b['EndPoint']['Address']),
-        get_EndPoint=lambda ep=EndPoint(Port=b['EndPoint']['Port'], Address=b['EndPoint']['Address']): ep
-    ) for b in site_data['Bindings']]
-
-    applications = [Application(
+    ) for attr in _as_list(site_data.get('Attributes'))]
+
+    bindings = []
+    for b in _as_list(site_data.get('Bindings')):
+        endpoint = RemoteEndPoint(Port=b['EndPoint']['Port'], Address=b['EndPoint']['Address'])
+        bindings.append(RemoteBinding(
+            get_BindingInformation=lambda bi=b['BindingInformation']: bi,
+            BindingInformation=b['BindingInformation'],
+            Protocol=b['Protocol'],
+            get_Protocol=lambda p=b['Protocol']: p,
+            get_CertificateHash=lambda ch=b.get('CertificateHash'): ch,
+            get_CertificateStoreName=lambda csn=b.get('CertificateStoreName'): csn,
+            Host=b['Host'],
+            get_Host=lambda h=b['Host']: h,
+            EndPoint=endpoint,
+            get_EndPoint=lambda ep=endpoint: ep
+        ))
+
+    applications = [RemoteApplication(
         Path=app['Path'],
         ApplicationPoolName=app['ApplicationPoolName'],
         PhysicalPath=app['PhysicalPath'],
-        VirtualDirectories=[VirtualDirectory(
+        VirtualDirectories=[RemoteVirtualDirectory(
             Path=vdir['Path'],
             PhysicalPath=vdir['PhysicalPath']
-        ) for vdir in app['VirtualDirectories']]
-    ) for app in site_data['Applications']]
+        ) for vdir in _as_list(app.get('VirtualDirectories'))]
+    ) for app in _as_list(site_data.get('Applications'))]
 
-    hsts = HSTS(
-        Enabled=site_data['HSTS']['Enabled'],
-        MaxAge=site_data['HSTS']['MaxAge']
+    hsts_data = site_data.get('HSTS') or {}
+    hsts = RemoteHSTS(
+        Enabled=bool(hsts_data.get('Enabled')),
+        MaxAge=hsts_data.get('MaxAge')
     )
 
-    site = Site(
+    return RemoteSite(
         Name=site_data['Name'],
         Bindings=bindings,
         get_Attributes=lambda: attributes,
@@ -1207,7 +1285,35 @@ def get_site_remote(c, site_name) -> None:
         HSTS=hsts
     )
 
-    return site
+
+def establish_candidate_sites_remote(remote_connection, site_names):
+    available_sites = get_iis_inventory_remote(remote_connection).site_names
+
+    if not available_sites:
+        raise EnvironmentError(
+            "`eb migrate` failed because there are no sites on this IIS server."
+        )
+
+    if site_names:
+        site_names = site_names.split(",")
+        sites = []
+
+        for site_name in site_names:
+            if site_name not in available_sites:
+                raise ValueError(
+                    f"Specified site, '{site_name}', does not exist. Available sites: [{', '.join(available_sites)}]"
+                )
+            sites.append(site_name)
+        return sites
+    else:
+        return available_sites
+
+def populate_site_data_remote(remote_connection, site_names):
+    inventory = get_iis_inventory_remote(remote_connection)
+    return [inventory.site(name) for name in site_names]
+
+def get_site_remote(c, site_name) -> "RemoteSite":
+    return get_iis_inventory_remote(c).site(site_name)
 
 
 def list_sites_verbosely():
@@ -1243,79 +1349,30 @@ def list_sites_verbosely():
 
 
 def list_sites_verbosely_remote(remote_connection):
-    ps_command = '''
-    Import-Module WebAdministration
-    $sites = Get-Website
-    $output = @()
-    $index = 1
-    foreach ($site in $sites) {
-        $siteInfo = "$index`: $($site.Name):`n"
-        $siteInfo += "  - Bindings:`n"
-        $bindings = Get-WebBinding -Name $site.Name
-        foreach ($binding in $bindings) {
-            $siteInfo += "    - $($binding.bindingInformation)`n"
-        }
-        $applications = @(Get-WebApplication -Site $site.Name)
-        $rootApp = @{
-            Path = "/"
-            ApplicationPoolName = $site.applicationPool
-            EnabledProtocols = $site.enabledProtocols
-        }
-        $allApps = @($rootApp) + $applications
-        foreach ($app in $allApps) {
-            $appPath = if ($app.Path) { $app.Path } else { "/" }
-            $appPool = if ($app.ApplicationPoolName) { $app.ApplicationPoolName } else { $app.applicationPool }
-            $protocols = if ($app.EnabledProtocols) { $app.EnabledProtocols } else { $app.enabledProtocols }
-            $siteInfo += "  - Application '$appPath':`n"
-            $siteInfo += "    - Application Pool: $appPool`n"
-            $siteInfo += "    - Enabled Protocols: $protocols`n"
-            $siteInfo += "    - Virtual Directories:`n"
-            $vdirs = Get-WebConfiguration "/system.applicationHost/sites/site[@name='$($site.Name)']/application[@path='$appPath']/virtualDirectory"
-            foreach ($vdir in $vdirs) {
-                $vdirPath = $vdir.GetAttributeValue("path")
-                $physicalPath = $vdir.GetAttributeValue("physicalPath")
-                $logonMethodValue = $vdir.GetAttributeValue("logonMethod")
-                $logonMethod = switch ($logonMethodValue) {
-                    0 { "Interactive" }
-                    1 { "Batch" }
-                    2 { "Network" }
-                    3 { "ClearText" }
-                    default { $logonMethodValue }
-                }
-                $userName = $vdir.GetAttributeValue("userName")
-                $password = $vdir.GetAttributeValue("password")
-                $siteInfo += "      - $vdirPath`:`n"
-                $siteInfo += "        - Physical Path: $physicalPath`n"
-                $siteInfo += "        - Logon Method: $logonMethod`n"
-                if ($userName) {
-                    $siteInfo += "        - Username: $userName`n"
-                }
-                if ($password) {
-                    $siteInfo += "        - Password: <redacted>`n"
-                }
-            }
-        }
-        $output += $siteInfo
-        $index++
-    }
-    Write-Host ($output -join "")
-    Write-Host "----------------------------------------------------"
-    Write-Host "Users:"
-    try {
-        $users = Get-LocalUser | Where-Object { $_.Enabled -eq $true }
-        foreach ($user in $users) {
-            $homedir = if ($user.HomeDirectory) { $user.HomeDirectory } else { "None" }
-            Write-Host "  - $($user.Name)"
-            Write-Host "    - Home: $homedir"
-        }
-    } catch {
-        # Silently skip if user enumeration fails
-    }
-    '''
-    command_bytes = ps_command.encode('utf-16le')
-    encoded_command = base64.b64encode(command_bytes).decode()
-    result = remote_connection.run(f'powershell -NoProfile -NonInteractive -EncodedCommand {encoded_command}', hide=True)
-    io.echo(result.stdout.strip())
+    inventory = get_iis_inventory_remote(remote_connection)
+    for i, site_data in enumerate(inventory.site_documents.values(), 1):
+        io.echo(f"{i}: {site_data['Name']}:")
+        io.echo("  - Bindings:")
+        for binding in _as_list(site_data.get('Bindings')):
+            io.echo(f"    - {binding['BindingInformation']}")
+        for application in _as_list(site_data.get('Applications')):
+            io.echo(f"  - Application '{application['Path'] or '/'}':")
+            io.echo(f"    - Application Pool: {application['ApplicationPoolName']}")
+            io.echo(f"    - Enabled Protocols: {application.get('EnabledProtocols')}")
+            io.echo("    - Virtual Directories:")
+            for vdir in _as_list(application.get('VirtualDirectories')):
+                io.echo(f"      - {vdir['Path']}:")
+                io.echo(f"        - Physical Path: {vdir['PhysicalPath']}")
+                io.echo(f"        - Logon Method: {vdir.get('LogonMethod')}")
+                if vdir.get('UserName'):
+                    io.echo(f"        - Username: {vdir['UserName']}")
+                if vdir.get('HasPassword'):
+                    io.echo("        - Password: <redacted>")
+    io.echo("----------------------------------------------------")
+    io.echo("Users:")
+    for username, homedir in inventory.users:
+        io.echo(f"  - {username}")
+        io.echo(f"    - Home: {homedir}")
 
 def get_local_users():
     ctx = PrincipalContext(ContextType.Machine)
@@ -2778,39 +2835,8 @@ def _arr_enabled() -> bool:
         raise e
 
 def _arr_enabled_remote(remote_connection):
-    ps_command = '''
-    function Check-ARREnabled {
-        try {
-            # Import WebAdministration module
-            Import-Module WebAdministration -ErrorAction Stop
-
-            # Check if the proxy section exists in IIS configuration
-            $proxySection = Get-WebConfiguration -Filter "system.webServer/proxy" -ErrorAction SilentlyContinue
-
-            if ($proxySection -ne $null) {
-                Write-Output "True"
-            } else {
-                Write-Output "False"
-            }
-        }
-        catch {
-            Write-Output "False"
-            Write-Error "Error checking ARR status: $_"
-            exit 1
-        }
-    }
-
-    Check-ARREnabled
-    '''
-
-    command_bytes = ps_command.encode('utf-16le')
-    encoded_command = base64.b64encode(command_bytes).decode()
-
     try:
-        result = remote_connection.run(f'powershell -NoProfile -NonInteractive -EncodedCommand {encoded_command}', hide=True)
-        output = result.stdout.strip()
-
-        return output.lower() == "true"
+        return get_iis_inventory_remote(remote_connection).arr_enabled
     except Exception as e:
         io.echo(f"Error checking ARR status: {str(e)}")
         return False
@@ -3770,7 +3796,7 @@ def get_listener_configs(sites: List["Site"], remote, remote_connection, ssl_cer
     option_settings = []
     try:
         site_configs = get_site_configs_remote(remote_connection, sites=sites) if remote else get_site_configs(sites=sites)
-        alb_rules = create_alb_rules(site_configs)
+        alb_rules = compile_alb_rules(site_configs)
 
         converted_alb_rules = convert_alb_rules_to_option_settings(
             alb_rules, ssl_certificate_domain_name
@@ -4060,6 +4086,7 @@ def convert_alb_rules_to_option_settings(
         - Process names are extracted from target group ARNs
         - Port 80 is mapped to 'default' process name
         - If no host header is specified, path pattern defaults to '*'
+        - The values of multi-value conditions are joined with commas
     """
     http_listener_rule_option_settings: List[Dict[str, str]] = []
     https_listener_rule_option_settings: List[Dict[str, str]] = []
@@ -4072,9 +4099,9 @@ def convert_alb_rules_to_option_settings(
         if conditions:
             for condition in conditions:
                 if condition["Field"] == "host-header":
-                    host_header = condition["Values"][0]
+                    host_header = ",".join(condition["Values"])
                 if condition["Field"] == "path-pattern":
-                    path_pattern = condition["Values"][0]
+                    path_pattern = ",".join(condition["Values"])
 
         namespace = f"aws:elbv2:listenerrule:rule{i}"
         protocol = rule["Protocol"].upper()
@@ -4264,136 +4291,64 @@ def get_site_configs(sites: List["Site"]):
 
     return site_configs
 
-def get_site_configs_remote(remote_connection, sites: List["Site"]) -> "SiteConfig":
+def get_site_configs_remote(remote_connection, sites: List["Site"]) -> List["SiteConfig"]:
+    """
+    Remote counterpart of `get_site_configs`. The rewrite rules are parsed
+    from the web.config contents captured by the IIS inventory of the remote
+    server, so no further remote execution is needed.
+    """
+    inventory = get_iis_inventory_remote(remote_connection)
     site_configs = []
 
     for site in sites:
+        web_config_content = inventory.web_config(site.Name)
+        rewrite_rules = []
+        if web_config_content:
+            try:
+                rewrite_rules = _parse_rewrite_rules(web_config_content)
+            except Exception as e:
+                io.log_warning(
+                    f"Error reading web.config for {site.Name}: {str(e)}. Skipping over rewrite rule identification for {site.Name}"
+                )
+
+        physical_path = None
+        for app in site.Applications:
+            if app.Path == "/":
+                for vdir in app.VirtualDirectories:
+                    if vdir.Path == "/":
+                        physical_path = vdir.PhysicalPath
+                        break
+                break
+
         for binding in site.Bindings:
             binding_info = _parse_binding_info(binding)
-            physical_path = None
-            for app in site.Applications:
-                if app.Path == "/":
-                    for vdir in app.VirtualDirectories:
-                        if vdir.Path == "/":
-                            physical_path = vdir.PhysicalPath
-                            break
-                    break
             config = SiteConfig(
                 name=site.Name,
                 binding_info=binding.BindingInformation,
                 physical_path=physical_path,
                 protocol=binding_info["protocol"],
             )
-
-            # Get rewrite rules from web.config remotely
-            if "SystemDrive" in config.physical_path:
-                web_config_path = config.physical_path.replace("%SystemDrive%", "")  # This will leave \inetpub\wwwroot
-                web_config_path = windows_path_join(web_config_path, "web.config")
-                # Check if web.config exists remotely
-                ps_check_file = f'''
-                $path = $env:SystemDrive + "{web_config_path}"
-                if (Test-Path -Path $path -PathType Leaf) {{
-                    Write-Output "EXISTS"
-                }} else {{
-                    Write-Output "NOT_EXISTS"
-                }}
-                '''
-                command_bytes = ps_check_file.encode('utf-16le')
-                encoded_command = base64.b64encode(command_bytes).decode()
-                result = remote_connection.run(f'powershell -NoProfile -NonInteractive -EncodedCommand {encoded_command}', hide=True)
-                file_exists = result.stdout.strip() == "EXISTS"
-            else:
-                web_config_path = windows_path_join(config.physical_path, "web.config")
-                # Check if web.config exists remotely
-                ps_check_file = f'''
-                $path = "{web_config_path}"
-                if (Test-Path -Path $path -PathType Leaf) {{
-                    Write-Output "EXISTS"
-                }} else {{
-                    Write-Output "NOT_EXISTS"
-                }}
-                '''
-                command_bytes = ps_check_file.encode('utf-16le')
-                encoded_command = base64.b64encode(command_bytes).decode()
-                result = remote_connection.run(f'powershell -NoProfile -NonInteractive -EncodedCommand {encoded_command}', hide=True)
-                file_exists = result.stdout.strip() == "EXISTS"
-            
-            if file_exists:
-                try:
-                    # Read web.config content remotely
-                    ps_read_file = f'''
-                    $webConfigContent = Get-Content -Path "{web_config_path}" -Raw
-                    Write-Output $webConfigContent
-                    '''
-                    command_bytes = ps_read_file.encode('utf-16le')
-                    encoded_command = base64.b64encode(command_bytes).decode()
-                    result = remote_connection.run(f'powershell -NoProfile -NonInteractive -EncodedCommand {encoded_command}', hide=True)
-                    web_config_content = result.stdout.strip()
-                    
-                    # Parse XML content
-                    root = ET.fromstring(web_config_content)
-                    rules = root.findall(".//rewrite/rules/rule")
-
-                    for rule in rules:
-                        match_element = rule.find("match")
-                        action_element = rule.find("action")
-                        
-                        if match_element is not None and action_element is not None:
-                            config.rewrite_rules.append({
-                                "name": rule.get("name"),
-                                "pattern": match_element.get("url"),
-                                "action_type": action_element.get("type"),
-                                "action_url": action_element.get("url"),
-                            })
-                except Exception as e:
-                    io.log_warning(
-                        f"Error reading web.config for {site.Name}: {str(e)}. Skipping over rewrite rule identification for {site.Name}"
-                    )
-
+            config.rewrite_rules = list(rewrite_rules)
             site_configs.append(config)
 
     return site_configs
 
 
+def _parse_rewrite_rules(web_config_content: str) -> List[Dict[str, Any]]:
+    rewrite_rules = []
+    root = ET.fromstring(web_config_content.lstrip('\ufeff'))
+    for rule in root.findall(".//rewrite/rules/rule"):
+        match_element = rule.find("match")
+        action_element = rule.find("action")
 
-
-def _sort_rules_by_specificity(rules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """
-    Sort Application Load Balancer rules by their specificity in descending order.
-
-    Rules are sorted based on a scoring system where:
-    - Path pattern conditions contribute 20 points
-    - Host header conditions contribute 10 points
-    The total score determines the rule's specificity, with higher scores indicating
-    more specific rules.
-
-    Args:
-        rules: A list of ALB rule dictionaries. Each rule is a dictionary containing:
-            - 'Actions': List of action configurations
-            - 'Protocol': String indicating the protocol (e.g., "http")
-            - 'Conditions' (optional): List of condition dictionaries with 'Field' and 'Values'
-
-    Returns:
-        A new list containing the same rules sorted by specificity in descending order,
-        where rules with more specific conditions (higher scores) appear first.
-
-    Example:
-        A rule with both path-pattern and host-header conditions (score: 30) would be
-        sorted before a rule with only a host-header condition (score: 10).
-    """
-
-    def calculate_rule_specificity(rule):
-        score = 0
-        conditions = rule.get("Conditions", [])
-
-        for condition in conditions:
-            if condition["Field"] == "host-header":
-                score += 10
-            elif condition["Field"] == "path-pattern":
-                score += 20
-        return score
-
-    return sorted(rules, key=calculate_rule_specificity, reverse=True)
+        if match_element is not None and action_element is not None:
+            rewrite_rules.append({
+                "name": rule.get("name"),
+                "pattern": match_element.get("url"),
+                "action_type": action_element.get("type"),
+                "action_url": action_element.get("url"),
+            })
+    return rewrite_rules
 
 
 def create_alb_rules(site_configs: List["SiteConfig"]) -> List[Dict[str, Any]]:
@@ -4401,10 +4356,9 @@ def create_alb_rules(site_configs: List["SiteConfig"]) -> List[Dict[str, Any]]:
         Create Application Load Balancer (ALB) rules from IIS site configurations.
 
         Transforms IIS site configurations into ALB rules by:
-        1. Grouping sites by port
-        2. Creating host-header based rules for each site
-        3. Creating path-pattern based rules from site rewrite rules
-        4. Sorting rules by specificity and assigning priorities
+        1. Creating host-header based rules for each site binding
+        2. Creating path-pattern based rules from site rewrite rules
+        3. Sorting rules by specificity and assigning priorities
 
     Args:
         site_configs: List of SiteConfig objects containing IIS site configurations
@@ -4418,106 +4372,150 @@ def create_alb_rules(site_configs: List["SiteConfig"]) -> List[Dict[str, Any]]:
                     * host-header conditions from site bindings
                     * path-pattern conditions from rewrite rules
 
-        Process Flow:
-            1. Groups sites by port for target group creation
-            2. Processes host-header based rules first
-            3. Processes URL rewrite rules from web.config
-            4. Sorts rules by specificity (host+path > host > path)
-            5. Assigns sequential priorities to sorted rules
-
         Notes:
             - Creates synthetic target group ARNs using port numbers
             - Deduplicates patterns per host header
             - Only processes HTTP/HTTPS protocols
-            - Host header rules take precedence over path patterns
+            - Emits one rule per binding and rewrite rule; use `compile_alb_rules`
+              to merge them and fit them within the limits of a listener
     """
-    port_groups = collections.defaultdict(list)
-    valid_protocols = ["http", "https"]
-    for config in site_configs:
-        if config.protocol in valid_protocols:
-            port_groups[config.port].append(config)
-
-    target_group_template_arn = (
-        "arn:aws:elasticloadbalancing:region:account-id:targetgroup/{port}"
-    )
-    target_groups = {
-        port: target_group_template_arn.format(port=port) for port in port_groups.keys()
-    }
+    return ALBRuleCompiler(merge=False, max_rules_per_listener=None).compile(site_configs)
 
-    unsorted_rules = _process_host_header_based_rules(port_groups, target_groups)
-    processed_patterns = set()
-    rewrite_rules = _process_url_rewrite_rules(
-        port_groups, processed_patterns, target_groups
-    )
-    unsorted_rules.extend(rewrite_rules)
-    sorted_rules = _sort_rules_by_specificity(unsorted_rules)
-    return _assign_priorities_after_sorting(sorted_rules)
 
+def compile_alb_rules(site_configs: List["SiteConfig"]) -> List[Dict[str, Any]]:
+    """
+    Create the fewest ALB rules that route the bindings and rewrite rules of
+    `site_configs`, within the per-rule condition value and per-listener rule
+    limits of ALB. See `ALBRuleCompiler`.
+    """
+    return ALBRuleCompiler().compile(site_configs)
 
-def _process_host_header_based_rules(port_groups, target_groups):
-    host_header_rules = []
-    for iis_port, sites in port_groups.items():
-        for site in sites:
-            host_rule = {
-                "Actions": [
-                    {
-                        "Type": "forward",
-                        "ForwardConfig": {
-                            "TargetGroups": [
-                                {"TargetGroupArn": target_groups[iis_port], "Weight": 1}
-                            ]
-                        },
-                    }
-                ],
-                "Protocol": site.protocol,
-            }
-            if site.host_header:
-                host_rule["Conditions"] = [
-                    {"Field": "host-header", "Values": [site.host_header]}
-                ]
-            host_header_rules.append(host_rule)
-            continue
-    return host_header_rules
 
+class ALBRuleCompiler:
+    """
+    Compiler of IIS site bindings and rewrite rules into ALB listener rules.
 
-def _process_url_rewrite_rules(port_groups, processed_patterns, target_groups):
-    rules = []
-    for iis_port, sites in port_groups.items():
-        for site in sites:
-            for rule in site.rewrite_rules:
-                rewrite_rule = _process_url_rewrite_rule(
-                    rule, processed_patterns, site, target_groups, iis_port
-                )
-                rules.append(rewrite_rule)
-    return rules
+    Every binding and rewrite rule is reduced to a route: a protocol, a target
+    group, and an optional host header and path pattern. Duplicate routes are
+    dropped, and, unless `merge` is False, the routes forwarding to the same
+    target group are merged into multi-value conditions:
 
+        - host-only routes into one host-header condition
+        - path-only routes into one path-pattern condition
+        - routes on the same host into one path-pattern condition
 
-def _process_url_rewrite_rule(rule, processed_patterns, site, target_groups, iis_port):
-    # Create unique key for pattern+host combination
-    pattern_key = f"{rule['pattern']}:{site.host_header}"
+    packed `max_condition_values` values per rule. The rules are ordered by
+    specificity, those matching a host and a path first, then those matching
+    a path, then a host, and the rules beyond `max_rules_per_listener` for a
+    protocol are dropped with a warning. All of
+    this takes time linear in the number of routes.
 
-    # Skip if we've already processed this pattern for this host
-    if pattern_key in processed_patterns:
-        return None
+    Args:
+        merge: Whether to merge routes into multi-value conditions
+        max_rules_per_listener: Maximum number of rules per listener, or None for no limit
+        max_condition_values: Maximum number of condition values per rule
+    """
 
-    processed_patterns.add(pattern_key)
+    HOST_AND_PATH, PATH, HOST, CATCH_ALL = range(4)
 
-    conditions = []
-    if site.host_header:
-        conditions.append({"Field": "host-header", "Values": [site.host_header]})
+    def __init__(
+        self,
+        merge: bool = True,
+        max_rules_per_listener: Optional[int] = MAX_ALB_RULES_PER_LISTENER,
+        max_condition_values: int = MAX_ALB_CONDITION_VALUES_PER_RULE,
+    ) -> None:
+        self.merge = merge
+        self.max_rules_per_listener = max_rules_per_listener
+        self.max_condition_values = max_condition_values
+
+    def compile(self, site_configs: List["SiteConfig"]) -> List[Dict[str, Any]]:
+        rules_by_specificity = [[] for _ in range(4)]
+        for kind, protocol, target_group, host, values in self._group_routes(site_configs):
+            rules_by_specificity[kind].extend(self._pack(kind, protocol, target_group, host, values))
+
+        alb_rules = []
+        rule_counts = collections.Counter()
+        dropped = collections.Counter()
+        for rules in rules_by_specificity:
+            for rule in rules:
+                if (
+                    self.max_rules_per_listener is not None
+                    and rule_counts[rule["Protocol"]] >= self.max_rules_per_listener
+                ):
+                    dropped[rule["Protocol"]] += 1
+                    continue
+                rule_counts[rule["Protocol"]] += 1
+                rule["Priority"] = len(alb_rules) + 1
+                alb_rules.append(rule)
+
+        for protocol, count in dropped.items():
+            io.log_warning(
+                f"{count} {protocol.upper()} listener rule(s) exceed the limit of "
+                f"{self.max_rules_per_listener} rules per listener and were not created."
+            )
+        return alb_rules
 
-    conditions.append(
-        {"Field": "path-pattern", "Values": [translate_iis_to_alb(rule["pattern"])]}
-    )
+    def _group_routes(self, site_configs):
+        """
+        Returns the deduplicated routes of `site_configs` as a list of
+        (kind, protocol, target group, host, values) tuples, where `values`
+        are the values of the condition the routes were merged on, in the
+        order they were first seen.
+        """
+        groups = collections.OrderedDict()
+        seen = set()
+
+        def add(kind, protocol, target_group, host, value):
+            route = (kind, protocol, target_group, host, value)
+            if route in seen:
+                return
+            seen.add(route)
+            key = (kind, protocol, target_group, host) if self.merge else route
+            groups.setdefault(key, []).append(value)
+
+        http_configs = [config for config in site_configs if config.protocol in ("http", "https")]
+        for config in http_configs:
+            target_group = ALB_TARGET_GROUP_TEMPLATE_ARN.format(port=config.port)
+            if config.host_header:
+                add(self.HOST, config.protocol, target_group, None, config.host_header)
+            else:
+                add(self.CATCH_ALL, config.protocol, target_group, None, None)
+
+        for config in http_configs:
+            target_group = ALB_TARGET_GROUP_TEMPLATE_ARN.format(port=config.port)
+            for rewrite_rule in config.rewrite_rules:
+                path = translate_iis_to_alb(rewrite_rule["pattern"])
+                if config.host_header:
+                    add(self.HOST_AND_PATH, config.protocol, target_group, config.host_header, path)
+                else:
+                    add(self.PATH, config.protocol, target_group, None, path)
+
+        return [key[:4] + (values,) for key, values in groups.items()]
 
-    return _create_rewrite_rule(conditions, target_groups[iis_port], site.protocol)
+    def _pack(self, kind, protocol, target_group, host, values):
+        """
+        Returns the rules forwarding the merged `values` to `target_group`,
+        with at most `max_condition_values` condition values each.
+        """
+        if kind == self.CATCH_ALL:
+            return [_create_rewrite_rule([], target_group, protocol)]
+
+        field = "host-header" if kind == self.HOST else "path-pattern"
+        chunk_size = max(1, self.max_condition_values - (1 if kind == self.HOST_AND_PATH else 0))
+        rules = []
+        for start in range(0, len(values), chunk_size):
+            conditions = []
+            if kind == self.HOST_AND_PATH:
+                conditions.append({"Field": "host-header", "Values": [host]})
+            conditions.append({"Field": field, "Values": values[start:start + chunk_size]})
+            rules.append(_create_rewrite_rule(conditions, target_group, protocol))
+        return rules
 
 
 def _create_rewrite_rule(
     conditions: List[Dict[str, Union[str , List[str]]]], target_group_arn: str, protocol: str
 ) -> Dict[str, Any]:
-    return {
-        "Conditions": conditions,
+    rule = {
         "Actions": [
             {
                 "Type": "forward",
@@ -4528,18 +4526,20 @@ def _create_rewrite_rule(
         ],
         "Protocol": protocol,
     }
+    if conditions:
+        rule["Conditions"] = conditions
+    return rule
 
 
-def _assign_priorities_after_sorting(
-    sorted_rules: List[Dict[str, Any]],
-) -> List[Dict[str, Any]]:
-    alb_rules = []
-    for priority, rule in enumerate(sorted_rules, 1):
-        rule["Priority"] = priority
-        alb_rules.append(rule)
-    return alb_rules
+_IIS_ONE_OR_MORE_CHARACTERS = re.compile(r"\.\+")
+_IIS_ANY_CHARACTERS = re.compile(r"\.\*")
+_IIS_SEGMENT = re.compile("({.*})")
+_IIS_ONE_OR_MORE_OF_CLASS = re.compile(r"\[.*?\]\+")
+_IIS_ANY_OF_CLASS = re.compile(r"\[.*?\]\*")
+_IIS_GROUP = re.compile(r"\([^()]*\)")
 
 
+@functools.lru_cache(maxsize=4096)
 def translate_iis_to_alb(iis_pattern: str) -> str:
     """
     Convert an IIS (Internet Information Services) URL rewrite pattern to an ALB (Application Load Balancer) path pattern.
@@ -4572,18 +4572,18 @@ def translate_iis_to_alb(iis_pattern: str) -> str:
     alb_pattern = iis_pattern.strip("^$")
 
     # replace .+ with *
-    alb_pattern = re.sub(r"\.\+", "?*", alb_pattern)
+    alb_pattern = _IIS_ONE_OR_MORE_CHARACTERS.sub("?*", alb_pattern)
     # replace .* with *
-    alb_pattern = re.sub(r"\.\*", "*", alb_pattern)
+    alb_pattern = _IIS_ANY_CHARACTERS.sub("*", alb_pattern)
     # replace {segment} with *
-    alb_pattern = re.sub("({.*})", "*", alb_pattern)
+    alb_pattern = _IIS_SEGMENT.sub("*", alb_pattern)
     alb_pattern = alb_pattern.lstrip("^")
     # replace groupings of the type "[0-9]+" with "*"
-    alb_pattern = re.sub(r"\[.*?\]\+", "*", alb_pattern)
+    alb_pattern = _IIS_ONE_OR_MORE_OF_CLASS.sub("*", alb_pattern)
     # replace groupings of the type "[0-9]*" with "*"
-    alb_pattern = re.sub(r"\[.*?\]\*", "*", alb_pattern)
+    alb_pattern = _IIS_ANY_OF_CLASS.sub("*", alb_pattern)
     # replace groupings of the type "([0-9]*)" with "*"
-    alb_pattern = re.sub(r"\([^()]*\)", "*", alb_pattern)
+    alb_pattern = _IIS_GROUP.sub("*", alb_pattern)
 
     # Ensure pattern starts with /
     if not alb_pattern.startswith("/"):
@@ -35,6 +35,9 @@ class SSHController(AbstractBaseController):
             (['--setup'], dict(
                 action='store_true', help=flag_text['ssh.setup'])),
             (['--timeout'], dict(type=int, help=flag_text['ssh.timeout'])),
+            (['--all'], dict(action='store_true', help=flag_text['ssh.all'])),
+            (['--concurrency'], dict(
+                type=int, default=sshops.FANOUT_CONCURRENCY, help=flag_text['ssh.concurrency'])),
         ]
 
     def do_command(self):
@@ -51,6 +54,21 @@ class SSHController(AbstractBaseController):
         if timeout and not setup:
             raise InvalidOptionsError(strings['ssh.timeout_without_setup'])
 
+        if self.app.pargs.all:
+            if instance or number or setup:
+                raise InvalidOptionsError(strings['ssh.allandinstance'])
+            if not cmd:
+                raise InvalidOptionsError(strings['ssh.allwithoutcommand'])
+            sshops.run_on_all_instances(
+                env_name,
+                cmd,
+                keep_open=keep_open,
+                force_open=force,
+                custom_ssh=custom_ssh,
+                concurrency=self.app.pargs.concurrency
+            )
+            return
+
         sshops.prepare_for_ssh(
                 env_name=env_name,
                 instance=instance,
@@ -12,7 +12,6 @@
 # language governing permissions and limitations under the License.
 
 import textwrap
-import json
 
 import sys
 import os
@@ -20,8 +19,8 @@ from cement.core import controller
 
 from ebcli import __version__
 from ebcli.core.ebglobals import Constants
-from ebcli.lib import elasticbeanstalk, utils
-from ebcli.core import io, fileoperations
+from ebcli.lib import elasticbeanstalk
+from ebcli.core import io, fileoperations, updatecheck
 from ebcli.objects.exceptions import (
     NoEnvironmentForBranchError,
     PlatformWorkspaceNotSupportedError,
@@ -33,6 +32,8 @@ from ebcli.resources.strings import strings, flag_text
 from ebcli.objects import region
 from ebcli.operations import commonops
 
+UPDATE_CHECK_COMMANDS = ('create', 'deploy', 'status', 'clone', 'config')
+
 
 class AbstractBaseController(controller.CementBaseController):
     """
@@ -88,6 +89,7 @@ class AbstractBaseController(controller.CementBaseController):
         from here.  It can also be overridden in the sub-class
 
         """
+        self.start_cli_update_check()
         self.validate_workspace()
         self.do_command()
         self.check_for_cli_update(__version__)
@@ -104,9 +106,13 @@ class AbstractBaseController(controller.CementBaseController):
                     strings['exit.applicationworkspacenotsupported']
                 )
 
+    def start_cli_update_check(self):
+        if self.Meta.label in UPDATE_CHECK_COMMANDS:
+            updatecheck.start()
+
     def check_for_cli_update(self, version):
         label = self.Meta.label
-        if label in ('create', 'deploy', 'status', 'clone', 'config'):
+        if label in UPDATE_CHECK_COMMANDS:
             if cli_update_exists(version):
                 if self.check_install_script_used():
                     io.log_alert(strings['base.update_available_script_install'])
@@ -210,11 +216,4 @@ commands:
 
 
 def cli_update_exists(current_version):
-    try:
-        data = utils.get_data_from_url(
-            'https://pypi.python.org/pypi/awsebcli/json', timeout=5)
-        data = json.loads(data)
-        latest = data['info']['version']
-        return latest != current_version
-    except:
-        return False
+    return updatecheck.update_available(current_version)
@@ -0,0 +1,580 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Optional long-lived agent which runs `eb` commands on behalf of short-lived `eb`
+processes, enabled by setting the `AWS_EB_AGENT` environment variable to 1.
+
+The `eb` entry point only imports this module before deciding where to run the
+command. When the agent is enabled, the arguments, working directory and
+environment of the invocation are sent over a per-user Unix domain socket along
+with its stdin, stdout and stderr file descriptors, and the invocation waits for
+the exit code of the command. If no agent is listening one is started in the
+background and the command runs locally, as it does when the agent is disabled,
+unavailable on the platform, or of a different version.
+
+The agent imports the whole CLI once, and keeps botocore sessions, clients,
+resolved credentials and platform branch listings for the settings that recent
+commands used. Each command runs in a process forked from the agent, so it
+starts with all of that in memory while its changes to the working directory,
+environment and module state stay isolated from other commands. When a command
+finishes, it reports the settings and services it used, and the agent warms
+them for the commands which follow. The agent exits after `AWS_EB_AGENT_IDLE_TIMEOUT`
+seconds without commands.
+"""
+import json
+import os
+import select
+import signal
+import socket
+import struct
+import sys
+import tempfile
+import threading
+import time
+from array import array
+
+_STARTED_AT = time.time()
+
+AGENT_ENV_VAR = 'AWS_EB_AGENT'
+IDLE_TIMEOUT_ENV_VAR = 'AWS_EB_AGENT_IDLE_TIMEOUT'
+DEFAULT_IDLE_TIMEOUT = 15 * 60
+PLATFORM_CACHE_TTL = 10 * 60
+SOCKET_DIRECTORY_PREFIX = 'ebcli-agent-'
+SOCKET_FILE_NAME = 'agent.sock'
+LOCK_FILE_NAME = 'agent.lock'
+WARM_SERVICES = ('elasticbeanstalk', 's3', 'ec2')
+# Commands which need the controlling terminal of the invoking process
+LOCAL_COMMANDS = frozenset(['ssh', 'local'])
+STANDARD_STREAMS = (0, 1, 2)
+RECEIVE_BUFFER_SIZE = 64 * 1024
+
+RUN = 'run'
+STOP = 'stop'
+ACCEPTED = 'accepted'
+INCOMPATIBLE = 'incompatible'
+STOPPING = 'stopping'
+
+
+def main():
+    """
+    Entry point of the `eb` command.
+    """
+    exit_code = forward(sys.argv[1:])
+    if exit_code is None:
+        from ebcli.core import ebcore
+        return ebcore.main()
+    return exit_code
+
+
+def is_enabled(environ):
+    return (
+        environ.get(AGENT_ENV_VAR, '').lower() in ('1', 'true', 'yes', 'on')
+        and hasattr(socket, 'AF_UNIX')
+        and hasattr(os, 'fork')
+    )
+
+
+def socket_location(environ):
+    runtime_directory = environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    return os.path.join(
+        runtime_directory,
+        '{0}{1}'.format(SOCKET_DIRECTORY_PREFIX, os.getuid()),
+        SOCKET_FILE_NAME
+    )
+
+
+def forward(args, environ=None, fds=STANDARD_STREAMS):
+    """
+    Runs the `eb` command with arguments `args` in the agent, starting the agent in
+    the background if it is enabled but not running.
+
+    :param args: the command line arguments, without the program name
+    :param environ: the environment of the command; defaults to `os.environ`
+    :param fds: the file descriptors to use as the stdin, stdout and stderr of the command
+    :return: the exit code of the command, or None if the command should run locally
+    """
+    environ = os.environ if environ is None else environ
+    if not is_enabled(environ) or LOCAL_COMMANDS.intersection(args):
+        return None
+
+    location = socket_location(environ)
+    if not _is_private_directory(os.path.dirname(location)):
+        _start_agent(environ)
+        return None
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(location)
+    except OSError:
+        connection.close()
+        _start_agent(environ)
+        return None
+
+    with connection:
+        try:
+            _send_message(connection, _run_request(args, environ), fds)
+            reader = connection.makefile('rb')
+            if _read_message(reader).get('status') != ACCEPTED:
+                return None
+        except (OSError, ValueError):
+            return None
+
+        return _wait_for_exit_code(connection, reader)
+
+
+def stop(environ=None):
+    """
+    Asks the agent to exit once its running commands finish.
+    :return: whether an agent was running
+    """
+    environ = os.environ if environ is None else environ
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(socket_location(environ))
+            _send_message(connection, {'type': STOP})
+            return _read_message(connection.makefile('rb')).get('status') == STOPPING
+    except (OSError, ValueError):
+        return False
+
+
+class Agent(object):
+    def __init__(self, location, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        """
+        :param location: path of the Unix domain socket to listen on
+        :param idle_timeout: seconds without running commands after which to exit
+        """
+        self.location = location
+        self.idle_timeout = idle_timeout
+        self.listener = None
+        self.children = set()
+        self.reports = {}
+        self.stopping = False
+        self._last_activity = time.time()
+        self._shared_config_signature = None
+        self._platform_branches_cached_at = {}
+
+    def warm_up_workspace(self):
+        """
+        Imports the CLI and warms the session and clients of the profile and region
+        that apply to the current working directory.
+        """
+        from ebcli.core import ebcore  # noqa: F401
+        from ebcli.core import hooks
+        from ebcli.lib import aws
+
+        try:
+            hooks.set_profile(None)
+            hooks.set_region(None)
+            aws.warm_up(WARM_SERVICES)
+        except Exception as e:
+            _log('Unable to warm up the agent: {0}'.format(e))
+
+    def serve(self, warm_up=True):
+        """
+        Accepts and runs commands until the agent is stopped or idle. Returns at once
+        if another agent already serves `location`.
+
+        :param warm_up: whether to warm up for the current working directory, and then
+                        leave it, before accepting commands
+        """
+        directory = os.path.dirname(self.location)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, mode=0o700)
+        if not _is_private_directory(directory):
+            _log('Not starting: {0} is accessible to other users'.format(directory))
+            return
+
+        with open(os.path.join(directory, LOCK_FILE_NAME), 'a') as lock_file:
+            import fcntl
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                _log('Not starting: another agent is running')
+                return
+
+            if warm_up:
+                self.warm_up_workspace()
+                os.chdir(os.path.sep)
+            if os.path.exists(self.location):
+                os.remove(self.location)
+            self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                self.listener.bind(self.location)
+                os.chmod(self.location, 0o600)
+                self.listener.listen(64)
+                self._serve_forever()
+            finally:
+                self.listener.close()
+                os.remove(self.location)
+
+    def _serve_forever(self):
+        while not self.stopping:
+            if self.children:
+                timeout = 1
+            else:
+                timeout = max(0, self._last_activity + self.idle_timeout - time.time())
+            readable, _, _ = select.select([self.listener] + list(self.reports), [], [], timeout)
+
+            for fd in readable:
+                if fd is self.listener:
+                    self._accept()
+                else:
+                    self._read_report(fd)
+            self._reap_children()
+
+            if self.children:
+                self._last_activity = time.time()
+            elif time.time() - self._last_activity >= self.idle_timeout:
+                _log('Exiting after {0} idle seconds'.format(self.idle_timeout))
+                break
+
+    def _accept(self):
+        connection, _ = self.listener.accept()
+        fds = []
+        try:
+            if not _is_same_user(connection):
+                return
+
+            request, fds = _receive_request(connection)
+            self._last_activity = time.time()
+            if request.get('type') == STOP:
+                self.stopping = True
+                _send_message(connection, {'status': STOPPING})
+            elif request.get('version') != _version() or request.get('package') != _package_location():
+                _log('Stopping: a client of a different version connected')
+                self.stopping = True
+                _send_message(connection, {'status': INCOMPATIBLE})
+            elif len(fds) == len(STANDARD_STREAMS):
+                self._fork(connection, request, fds)
+        except (OSError, ValueError) as e:
+            _log('Unable to handle a connection: {0}'.format(e))
+        finally:
+            for fd in fds:
+                os.close(fd)
+            connection.close()
+
+    def _fork(self, connection, request, fds):
+        self._prepare_caches(request['environment'])
+        report_reader, report_writer = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                os.close(report_reader)
+                self.listener.close()
+                for fd in self.reports:
+                    os.close(fd)
+                exit_code = _run_command(connection, request, fds, report_writer)
+            finally:
+                os._exit(exit_code)
+
+        os.close(report_writer)
+        self.children.add(pid)
+        self.reports[report_reader] = bytearray()
+
+    def _read_report(self, fd):
+        data = os.read(fd, RECEIVE_BUFFER_SIZE)
+        if data:
+            self.reports[fd].extend(data)
+            return
+
+        os.close(fd)
+        report = self.reports.pop(fd)
+        if report:
+            try:
+                self._warm_up(json.loads(report.decode('utf-8')))
+            except ValueError:
+                pass
+
+    def _warm_up(self, report):
+        from ebcli.lib import aws
+        from ebcli.operations import platform_branch_ops
+
+        saved_environment = dict(os.environ)
+        try:
+            for name in [name for name in os.environ if name.startswith('AWS_')]:
+                del os.environ[name]
+            os.environ.update(report['environment'])
+            aws.apply_session_settings(report['settings'])
+            aws.warm_up(report['services'])
+
+            region = report['settings']['region']
+            if report.get('platform_branches') and region not in self._platform_branches_cached_at:
+                platform_branch_ops._non_retired_platform_branches_cache[region] = report['platform_branches']
+                self._platform_branches_cached_at[region] = time.time()
+        except Exception as e:
+            _log('Unable to warm up the agent: {0}'.format(e))
+        finally:
+            os.environ.clear()
+            os.environ.update(saved_environment)
+
+    def _prepare_caches(self, environment):
+        """
+        Drops the sessions if the shared AWS config or credentials files changed since
+        they were created, and platform branch listings older than `PLATFORM_CACHE_TTL`.
+        """
+        from ebcli.lib import aws
+        from ebcli.operations import platform_branch_ops
+
+        signature = _shared_config_signature(environment)
+        if signature != self._shared_config_signature:
+            aws.clear_session_cache()
+            self._shared_config_signature = signature
+
+        for region, cached_at in list(self._platform_branches_cached_at.items()):
+            if time.time() - cached_at > PLATFORM_CACHE_TTL:
+                platform_branch_ops._non_retired_platform_branches_cache.pop(region, None)
+                del self._platform_branches_cached_at[region]
+
+    def _reap_children(self):
+        for pid in list(self.children):
+            try:
+                finished_pid, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                finished_pid = pid
+            if finished_pid:
+                self.children.discard(pid)
+
+
+def _run_command(connection, request, fds, report_writer):
+    """
+    Runs the command of `request` in a process forked from the agent.
+    :return: the exit code of the command
+    """
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    for target_fd, fd in zip(STANDARD_STREAMS, fds):
+        os.dup2(fd, target_fd)
+    for stream in (sys.stdout, sys.stderr):
+        if hasattr(stream, 'reconfigure'):
+            stream.reconfigure(line_buffering=stream.isatty())
+
+    os.environ.clear()
+    os.environ.update(request['environment'])
+    os.chdir(request['cwd'])
+    os.umask(request['umask'])
+    sys.argv = [request['program']] + request['args']
+
+    _send_message(connection, {'status': ACCEPTED})
+    watcher = threading.Thread(target=_watch_client, args=(connection,))
+    watcher.daemon = True
+    watcher.start()
+
+    try:
+        exit_code = _execute(request)
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+    _write_report(report_writer)
+    _send_message(connection, {'exit_code': exit_code})
+    return exit_code
+
+
+def _execute(request):
+    from ebcli.core import ebcore, tracing
+
+    tracing.IMPORTED_AT = request['started_at']
+    try:
+        ebcore.main()
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        sys.stderr.write('{0}\n'.format(e.code))
+        return 1
+    return 0
+
+
+def _watch_client(connection):
+    """
+    Delivers the interrupts of the invoking process to the command, and terminates
+    the command if the invoking process goes away.
+    """
+    try:
+        for line in connection.makefile('rb'):
+            if json.loads(line.decode('utf-8')).get('signal') == 'SIGINT':
+                os.kill(os.getpid(), signal.SIGINT)
+    except (OSError, ValueError):
+        pass
+    os.kill(os.getpid(), signal.SIGTERM)
+
+
+def _write_report(report_writer):
+    from ebcli.lib import aws
+    from ebcli.operations import platform_branch_ops
+
+    settings = aws.get_session_settings()
+    report = {
+        'settings': settings,
+        'environment': dict(
+            (name, value) for name, value in os.environ.items() if name.startswith('AWS_')
+        ),
+        'services': aws.get_client_service_names(),
+        'platform_branches': platform_branch_ops._non_retired_platform_branches_cache.get(settings['region']),
+    }
+    data = json.dumps(report).encode('utf-8')
+    try:
+        while data:
+            data = data[os.write(report_writer, data):]
+    except OSError:
+        pass
+    finally:
+        os.close(report_writer)
+
+
+def _wait_for_exit_code(connection, reader):
+    while True:
+        try:
+            message = _read_message(reader)
+        except KeyboardInterrupt:
+            _send_message(connection, {'signal': 'SIGINT'})
+            continue
+        except (OSError, ValueError):
+            message = {}
+
+        if 'exit_code' in message:
+            return message['exit_code']
+        if not message:
+            from ebcli.resources.strings import strings
+            sys.stderr.write(strings['agent.connection_lost'] + '\n')
+            return 1
+
+
+def _run_request(args, environ):
+    return {
+        'type': RUN,
+        'version': _version(),
+        'package': _package_location(),
+        'program': sys.argv[0] if sys.argv else 'eb',
+        'args': list(args),
+        'cwd': os.getcwd(),
+        'environment': dict(environ),
+        'umask': _current_umask(),
+        'started_at': _STARTED_AT,
+    }
+
+
+def _send_message(connection, message, fds=()):
+    data = json.dumps(message).encode('utf-8') + b'\n'
+    if fds:
+        sent = connection.sendmsg(
+            [data],
+            [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array('i', fds))]
+        )
+        data = data[sent:]
+    connection.sendall(data)
+
+
+def _read_message(reader):
+    line = reader.readline()
+    if not line:
+        return {}
+    return json.loads(line.decode('utf-8'))
+
+
+def _receive_request(connection):
+    """
+    :return: the first message sent over `connection`, and the file descriptors sent with it
+    """
+    data = bytearray()
+    fds = array('i')
+    ancillary_size = socket.CMSG_SPACE(len(STANDARD_STREAMS) * fds.itemsize)
+    while not data.endswith(b'\n'):
+        chunk, ancillary_data, _, _ = connection.recvmsg(RECEIVE_BUFFER_SIZE, ancillary_size)
+        if not chunk:
+            raise ValueError('The connection was closed before the request was received')
+        data.extend(chunk)
+        for level, kind, payload in ancillary_data:
+            if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+                fds.frombytes(payload[:len(payload) - (len(payload) % fds.itemsize)])
+    return json.loads(data.decode('utf-8')), list(fds)
+
+
+def _is_same_user(connection):
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return True
+    credentials = connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+    _, uid, _ = struct.unpack('3i', credentials)
+    return uid == os.getuid()
+
+
+def _is_private_directory(directory):
+    try:
+        status = os.stat(directory)
+    except OSError:
+        return False
+    return status.st_uid == os.getuid() and not status.st_mode & 0o077
+
+
+def _shared_config_signature(environment):
+    locations = [
+        environment.get('AWS_CONFIG_FILE') or os.path.join('~', '.aws', 'config'),
+        environment.get('AWS_SHARED_CREDENTIALS_FILE') or os.path.join('~', '.aws', 'credentials'),
+    ]
+    signature = []
+    for location in locations:
+        try:
+            signature.append(os.stat(os.path.expanduser(location)).st_mtime_ns)
+        except OSError:
+            signature.append(None)
+    return signature
+
+
+def _start_agent(environ):
+    import subprocess
+    try:
+        subprocess.Popen(
+            [sys.executable, '-m', 'ebcli.core.agent', '--serve'],
+            env=environ,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            close_fds=True
+        )
+    except OSError:
+        pass
+
+
+def _current_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def _version():
+    from ebcli import __version__
+    return __version__
+
+
+def _package_location():
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _idle_timeout(environ):
+    try:
+        return float(environ.get(IDLE_TIMEOUT_ENV_VAR) or DEFAULT_IDLE_TIMEOUT)
+    except ValueError:
+        return DEFAULT_IDLE_TIMEOUT
+
+
+def _log(message):
+    from cement.utils.misc import minimal_logger
+    minimal_logger(__name__).debug(message)
+
+
+if __name__ == '__main__':
+    if '--stop' in sys.argv[1:]:
+        sys.exit(0 if stop() else 1)
+
+    Agent(socket_location(os.environ), _idle_timeout(os.environ)).serve()
@@ -0,0 +1,340 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Size-capped cache of the artifacts the EB CLI leaves in the `.elasticbeanstalk`
+directory of a workspace: application version bundles under `app_versions/` and
+retrieved logs under `logs/`.
+
+Every artifact is tracked in an index file which records its size, the time it
+was last used and, for bundles, its modification time, version label and content
+hash, so reusable bundles can be looked up by label or content hash without
+scanning the directory. A bundle is only reused while its size and modification
+time match those recorded when it was zipped. Whenever an artifact is added, the
+least recently used artifacts are evicted until the cache fits in its byte
+budget. The index is only read and written while holding an exclusive lock
+on a sibling lock file, which makes the cache safe to share between `eb`
+processes running concurrently in the same workspace.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import time
+
+from cement.utils.misc import minimal_logger
+
+from ebcli.core import fileoperations
+from ebcli.objects.exceptions import EBCLIException
+
+LOG = minimal_logger(__name__)
+
+INDEX_FILE_NAME = 'artifact_cache.json'
+LOCK_FILE_NAME = 'artifact_cache.lock'
+MAX_SIZE_SETTING = 'artifact_cache_max_size'
+DEFAULT_MAX_SIZE_IN_MB = 2048
+HASH_BUFFER_SIZE = 64 * 1024
+
+APP_VERSIONS = 'app_versions'
+LOGS = 'logs'
+MANAGED_FOLDERS = (APP_VERSIONS, LOGS)
+
+
+class ArtifactCache(object):
+    def __init__(self, eb_directory, max_bytes):
+        """
+        :param eb_directory: absolute path of the `.elasticbeanstalk` directory of the workspace
+        :param max_bytes: byte budget of the cache; eviction is disabled when 0 or None
+        """
+        self.eb_directory = eb_directory
+        self.max_bytes = max_bytes
+        self.index_location = os.path.join(eb_directory, INDEX_FILE_NAME)
+        self.lock_location = os.path.join(eb_directory, LOCK_FILE_NAME)
+
+    def record(self, path, label=None, content_hash=None):
+        """
+        Adds the file or directory at `path` to the cache, or marks it as used if it
+        is already tracked, then evicts least recently used artifacts other than
+        `path` until the cache fits in its budget.
+        """
+        key = self._key(path)
+        with self._locked_index() as index:
+            for other_key in list(index['entries']):
+                if _contains(other_key, key):
+                    _forget(index, other_key)
+            index['entries'][key] = {
+                'size': _size_of(path),
+                'mtime': os.path.getmtime(path),
+                'last_used': time.time(),
+                'label': label,
+                'content_hash': content_hash,
+            }
+            if label:
+                index['labels'][label] = key
+            if content_hash:
+                index['hashes'][content_hash] = key
+            self._evict(index, protected_key=key)
+
+    def find_by_label(self, label):
+        """
+        :return: the path of the cached bundle created for the version `label`, or None
+        """
+        return self._find('labels', label)
+
+    def find_by_content_hash(self, content_hash):
+        """
+        :return: the path of a cached bundle whose contents hash to `content_hash`, or None
+        """
+        return self._find('hashes', content_hash)
+
+    def _find(self, lookup, value):
+        """
+        Looks up a bundle in the `lookup` section of the index and marks it as used.
+        Bundles whose size or modification time differ from those recorded when they
+        were zipped, such as those left truncated by an interrupted `eb` process, are
+        forgotten rather than reused.
+        """
+        with self._locked_index() as index:
+            key = index[lookup].get(value)
+            entry = index['entries'].get(key) if key else None
+            if entry is None or not entry.get('content_hash'):
+                return None
+
+            path = os.path.join(self.eb_directory, key)
+            if not _is_unchanged(path, entry):
+                LOG.debug('{0} is missing or was modified since it was cached; not reusing it'.format(path))
+                _forget(index, key)
+                return None
+
+            entry['last_used'] = time.time()
+            return path
+
+    def _evict(self, index, protected_key=None):
+        self._reconcile(index)
+        if not self.max_bytes:
+            return
+
+        entries = index['entries']
+        total_size = sum(entry['size'] for entry in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]['last_used']):
+            if total_size <= self.max_bytes:
+                break
+            if key == protected_key:
+                continue
+
+            LOG.debug('Evicting {0} from the artifact cache'.format(key))
+            total_size -= entries[key]['size']
+            _delete(os.path.join(self.eb_directory, key))
+            _forget(index, key)
+
+    def _reconcile(self, index):
+        """
+        Drops entries whose artifacts were deleted by other means and adopts
+        artifacts created before the cache existed, treating their modification
+        time as their last use.
+        """
+        entries = index['entries']
+        for key in list(entries):
+            if not os.path.exists(os.path.join(self.eb_directory, key)):
+                _forget(index, key)
+
+        for folder in MANAGED_FOLDERS:
+            folder_path = os.path.join(self.eb_directory, folder)
+            if not os.path.isdir(folder_path):
+                continue
+            for name in os.listdir(folder_path):
+                path = os.path.join(folder_path, name)
+                key = self._key(path)
+                if key in entries or os.path.islink(path):
+                    continue
+                if not any(_contains(key, tracked_key) for tracked_key in entries):
+                    entries[key] = {
+                        'size': _size_of(path),
+                        'last_used': os.path.getmtime(path),
+                        'label': None,
+                        'content_hash': None,
+                    }
+
+    def _key(self, path):
+        return os.path.relpath(os.path.abspath(path), self.eb_directory).replace(os.path.sep, '/')
+
+    @contextlib.contextmanager
+    def _locked_index(self):
+        with _exclusive_lock(self.lock_location):
+            index = self._read_index()
+            yield index
+            self._write_index(index)
+
+    def _read_index(self):
+        try:
+            with open(self.index_location, 'r') as f:
+                index = json.load(f)
+        except (IOError, OSError, ValueError):
+            index = {}
+
+        for section in ('entries', 'labels', 'hashes'):
+            index.setdefault(section, {})
+        return index
+
+    def _write_index(self, index):
+        temporary_location = '{0}.{1}.tmp'.format(self.index_location, os.getpid())
+        with open(temporary_location, 'w') as f:
+            json.dump(index, f)
+        os.replace(temporary_location, self.index_location)
+
+
+def get_artifact_cache():
+    """
+    :return: the `ArtifactCache` of the current workspace, whose budget is read from
+             the `artifact_cache_max_size` setting (in MB) of the `global` section of
+             the workspace configuration
+    """
+    eb_directory = os.path.join(fileoperations.get_project_root(), fileoperations.beanstalk_directory)
+    return _cache_for(os.path.abspath(eb_directory))
+
+
+def _cache_for(eb_directory):
+    max_size_in_mb = fileoperations.get_config_setting(
+        'global',
+        MAX_SIZE_SETTING,
+        default=DEFAULT_MAX_SIZE_IN_MB
+    )
+    return ArtifactCache(eb_directory, int(max_size_in_mb or 0) * 1024 * 1024)
+
+
+def _eb_directory_of(path):
+    directory = os.path.dirname(os.path.abspath(path))
+    eb_directory_name = fileoperations.beanstalk_directory.rstrip(os.path.sep)
+    while os.path.basename(directory) != eb_directory_name:
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+    return directory
+
+
+def record_artifact(path, label=None, hash_contents=False):
+    """
+    Records the use of the artifact at `path` in the cache of the workspace whose
+    `.elasticbeanstalk` directory contains it, evicting older artifacts as needed.
+    Bookkeeping is best-effort: failures are logged and never interrupt the command
+    that produced the artifact.
+
+    :param path: absolute path of a file or directory under `app_versions/` or `logs/`
+    :param label: version label of an application version bundle
+    :param hash_contents: whether to index a bundle by the SHA-256 digest of its contents,
+                          which makes it reusable through `find_reusable_bundle`
+    """
+    try:
+        eb_directory = _eb_directory_of(path)
+        if eb_directory is None:
+            LOG.debug('{0} is not a workspace artifact; not caching it'.format(path))
+            return
+
+        content_hash = content_hash_of_file(path) if hash_contents else None
+        _cache_for(eb_directory).record(path, label=label, content_hash=content_hash)
+    except (EBCLIException, IOError, OSError, ValueError) as e:
+        LOG.debug('Unable to record {0} in the artifact cache: {1}'.format(path, e))
+
+
+def find_reusable_bundle(path, label):
+    """
+    Returns `path` if it is the bundle recorded for the version `label` in the
+    cache of its workspace and is unchanged since, or None if it must be zipped
+    up again. Like `record_artifact`, failures are logged and treated as misses.
+    """
+    try:
+        eb_directory = _eb_directory_of(path)
+        if eb_directory is None:
+            return None
+
+        cached_path = _cache_for(eb_directory).find_by_label(label)
+    except (EBCLIException, IOError, OSError, ValueError) as e:
+        LOG.debug('Unable to look up {0} in the artifact cache: {1}'.format(path, e))
+        return None
+
+    if cached_path is None or os.path.abspath(cached_path) != os.path.abspath(path):
+        return None
+    return path
+
+
+def content_hash_of_file(path):
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for data in iter(lambda: f.read(HASH_BUFFER_SIZE), b''):
+            sha256.update(data)
+    return sha256.hexdigest()
+
+
+def _contains(ancestor_key, key):
+    return key.startswith(ancestor_key + '/')
+
+
+def _forget(index, key):
+    entry = index['entries'].pop(key, None) or {}
+    if index['labels'].get(entry.get('label')) == key:
+        del index['labels'][entry['label']]
+    if index['hashes'].get(entry.get('content_hash')) == key:
+        del index['hashes'][entry['content_hash']]
+
+
+def _is_unchanged(path, entry):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    return stat.st_size == entry['size'] and stat.st_mtime == entry.get('mtime')
+
+
+def _size_of(path):
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+
+    size = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            file_path = os.path.join(root, name)
+            if not os.path.islink(file_path):
+                size += os.path.getsize(file_path)
+    return size
+
+
+def _delete(path):
+    try:
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+    except OSError as e:
+        LOG.debug('Unable to evict {0}: {1}'.format(path, e))
+
+
+@contextlib.contextmanager
+def _exclusive_lock(location):
+    with open(location, 'a+') as lock_file:
+        if os.name == 'nt':
+            import msvcrt
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,261 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Shell completion for `eb` that answers from `ebcli.core.completioncache`
+without importing the controllers or calling the service, so that a Tab press
+costs little more than starting the interpreter.
+
+Enable it in bash (or in zsh after `autoload bashcompinit && bashcompinit`)
+with:
+
+    complete -C eb_completer eb
+
+The shell runs `eb_completer` with the line being completed in COMP_LINE and
+the cursor offset in COMP_POINT, and offers the lines it prints.
+
+Command and subcommand names are completed from the tables below, which the
+unit tests check against the controllers. Environment, application and version
+names are completed from the cache of the region that `eb` would use: the one
+passed with --region, else the project's default region, else the region in
+the environment; when none is known, the names cached for every region are
+offered. Inside a project, names of the project's application are preferred.
+"""
+import os
+import shlex
+import sys
+
+from ebcli.core import completioncache
+
+COMMANDS = [
+    'abort', 'appversion', 'clone', 'codesource', 'config', 'console', 'create', 'deploy', 'events',
+    'health', 'init', 'labs', 'list', 'local', 'logs', 'migrate', 'open', 'platform', 'printenv',
+    'restore', 'scale', 'setenv', 'ssh', 'status', 'swap', 'tags', 'terminate', 'upgrade', 'use',
+]
+SUBCOMMANDS = {
+    'appversion': ['lifecycle'],
+    'labs': [
+        'cleanup-versions', 'convert-dockerrun', 'download', 'quicklink', 'setup-cloudwatchlogs', 'setup-cwl', 'setup-ssl',
+    ],
+    'local': ['logs', 'open', 'printenv', 'run', 'setenv', 'status'],
+    'migrate': ['cleanup', 'explore'],
+    'platform': ['create', 'delete', 'events', 'init', 'list', 'logs', 'select', 'show', 'status', 'use'],
+}
+
+ENVIRONMENT = 'environment'
+APPLICATION = 'application'
+VERSION = 'version'
+REGION = 'region'
+
+# The kinds of name that the positional arguments of each command are
+ENVIRONMENT_COMMANDS = [
+    ('abort',), ('clone',), ('console',), ('deploy',), ('events',), ('health',), ('logs',), ('open',),
+    ('printenv',), ('ssh',), ('status',), ('swap',), ('tags',), ('terminate',), ('upgrade',), ('use',),
+    ('appversion', 'lifecycle'), ('labs', 'cleanup-versions'), ('labs', 'convert-dockerrun'),
+    ('labs', 'download'), ('labs', 'quicklink'), ('labs', 'setup-ssl'),
+]
+POSITIONAL_KINDS = dict(
+    [(command, [ENVIRONMENT]) for command in ENVIRONMENT_COMMANDS]
+    + [(('init',), [APPLICATION]), (('scale',), [None, ENVIRONMENT])]
+)
+
+# The kind of name that the value of each option is, by command
+GLOBAL_OPTION_KINDS = {'--region': REGION, '-r': REGION}
+OPTION_KINDS = {
+    ('appversion',): {'--application': APPLICATION, '-a': APPLICATION},
+    ('create',): {'--version': VERSION},
+    ('deploy',): {'--version': VERSION},
+    ('setenv',): {'--environment': ENVIRONMENT, '-e': ENVIRONMENT},
+    ('swap',): {'--destination_name': ENVIRONMENT, '-n': ENVIRONMENT},
+}
+# Global options which take a value, so that it is not taken for a positional argument
+VALUE_OPTIONS = {'--region', '-r', '--profile', '--endpoint-url'}
+
+
+def main():
+    try:
+        for candidate in complete(
+                os.environ.get('COMP_LINE', ''),
+                os.environ.get('COMP_POINT'),
+                environ=os.environ
+        ):
+            sys.stdout.write(candidate + '\n')
+    except Exception:
+        # Completion must never print a traceback into the user's prompt
+        return 1
+    return 0
+
+
+def complete(line, point=None, environ=None, cwd=None):
+    """
+    Returns the completions of the word under the cursor at offset `point` of
+    the command line `line`.
+    """
+    if point is not None:
+        line = line[:int(point)]
+    words = _split(line)
+    current = '' if not line or line[-1].isspace() else (words.pop() if words else '')
+    words = words[1:]
+
+    command, arguments = _command(words)
+    if current.startswith('-') or (not command and _positionals(words)):
+        return []
+
+    previous = words[-1] if words else None
+    kind = GLOBAL_OPTION_KINDS.get(previous) or OPTION_KINDS.get(command, {}).get(previous)
+    if not kind:
+        position = len(_positionals(arguments))
+        if previous in VALUE_OPTIONS:
+            return []
+        if not command:
+            return _matching(COMMANDS, current)
+        if len(command) == 1 and command[0] in SUBCOMMANDS and not position:
+            return _matching(SUBCOMMANDS[command[0]], current)
+        kinds = POSITIONAL_KINDS.get(command, [])
+        kind = kinds[position] if position < len(kinds) else None
+    if not kind:
+        return []
+
+    environ = os.environ if environ is None else environ
+    if kind == REGION:
+        return _matching(completioncache.cached_regions(environ), current)
+    project = _project_settings(cwd or os.getcwd())
+    applications = _cached_applications(_option_value(words, ('--region', '-r')), project, environ)
+    if kind == APPLICATION:
+        return _matching(applications, current)
+
+    app_name = _option_value(words, ('--application', '-a')) if command == ('appversion',) else None
+    app_name = app_name or project.get('application_name')
+    if app_name in applications:
+        applications = {app_name: applications[app_name]}
+    key = 'environments' if kind == ENVIRONMENT else 'versions'
+    names = []
+    for entry in applications.values():
+        names.extend(name for name in entry.get(key, []) if name not in names)
+    return _matching(names, current)
+
+
+def _split(line):
+    for closing_quote in ('', '"', "'"):
+        try:
+            # An unterminated quote opens the word being completed
+            return shlex.split(line + closing_quote)
+        except ValueError:
+            pass
+    return line.split()
+
+
+def _command(words):
+    """
+    Returns the command and subcommand path at the start of `words`, skipping
+    global options, and the words which follow it.
+    """
+    command = []
+    index = 0
+    while index < len(words):
+        word = words[index]
+        if word.startswith('-'):
+            index += 2 if word in VALUE_OPTIONS else 1
+            continue
+        if not command and word in COMMANDS:
+            command.append(word)
+        elif len(command) == 1 and word in SUBCOMMANDS.get(command[0], []):
+            command.append(word)
+        else:
+            break
+        index += 1
+    return tuple(command), words[index:]
+
+
+def _positionals(arguments):
+    positionals = []
+    value_options = VALUE_OPTIONS | set(GLOBAL_OPTION_KINDS)
+    for kinds in OPTION_KINDS.values():
+        value_options |= set(kinds)
+    skip = False
+    for word in arguments:
+        if skip:
+            skip = False
+        elif word.startswith('-'):
+            skip = word in value_options
+        else:
+            positionals.append(word)
+    return positionals
+
+
+def _option_value(words, options):
+    for index, word in enumerate(words[:-1]):
+        if word in options:
+            return words[index + 1]
+    for word in words:
+        for option in options:
+            if option.startswith('--') and word.startswith(option + '='):
+                return word[len(option) + 1:]
+
+
+def _matching(names, prefix):
+    return sorted(name for name in names if name.startswith(prefix))
+
+
+def _cached_applications(region, project, environ):
+    region = (
+        region
+        or project.get('default_region')
+        or environ.get('AWS_REGION')
+        or environ.get('AWS_DEFAULT_REGION')
+    )
+    if region:
+        return completioncache.load(region, environ)
+    applications = {}
+    for cached_region in completioncache.cached_regions(environ):
+        for app_name, entry in completioncache.load(cached_region, environ).items():
+            merged = applications.setdefault(app_name, {'environments': [], 'versions': []})
+            for key in merged:
+                merged[key].extend(name for name in entry.get(key, []) if name not in merged[key])
+    return applications
+
+
+def _project_settings(directory):
+    """
+    Returns the `application_name` and `default_region` settings of the
+    project which contains `directory`, read without a YAML parser from the
+    `global` section of the `.elasticbeanstalk/config.yml` that `eb init`
+    writes.
+    """
+    while True:
+        location = os.path.join(directory, '.elasticbeanstalk', 'config.yml')
+        if os.path.isfile(location):
+            break
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return {}
+        directory = parent
+
+    settings = {}
+    in_global_section = False
+    try:
+        with open(location) as f:
+            for line in f:
+                if line.strip() and not line[0].isspace():
+                    in_global_section = line.rstrip() == 'global:'
+                elif in_global_section and ':' in line:
+                    key, value = line.strip().split(':', 1)
+                    value = value.strip().strip('\'"')
+                    if key in ('application_name', 'default_region') and value and value != 'null':
+                        settings[key] = value
+    except (OSError, UnicodeDecodeError):
+        return {}
+    return settings
+
+
+if __name__ == '__main__':
+    sys.exit(main())
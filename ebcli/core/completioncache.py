@@ -0,0 +1,174 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+The on-disk cache of application, environment and version names that shell
+completion serves from.
+
+There is one small JSON file per region:
+
+    {"applications": {"my-app": {"environments": [...], "versions": [...]}}}
+
+The operations behind `eb list`, `eb create`, `eb clone`, `eb terminate`,
+`eb deploy`, `eb appversion` and friends refresh it with what they have just
+listed, created or deleted, so completion never has to call the service
+itself. Updates are best-effort: a cache that cannot be read or written only
+makes completion less helpful, never a command fail.
+
+This module is imported by `ebcli.core.completer` on every Tab press, so it
+must only import from the standard library.
+"""
+import json
+import os
+import threading
+
+from ebcli.core import usercache
+
+CACHE_DIRECTORY_NAME = 'completion'
+MAX_VERSIONS = 200
+
+_update_lock = threading.Lock()
+
+
+def cache_directory(environ=None):
+    return usercache.cache_path(CACHE_DIRECTORY_NAME, environ)
+
+
+def cache_location(region, environ=None):
+    return os.path.join(cache_directory(environ), '{0}.json'.format(region))
+
+
+def cached_regions(environ=None):
+    try:
+        names = os.listdir(cache_directory(environ))
+    except OSError:
+        return []
+    return sorted(name[:-len('.json')] for name in names if name.endswith('.json'))
+
+
+def load(region, environ=None):
+    """
+    Returns the cached names for `region` as a dict of application name to a
+    dict with 'environments' and 'versions' lists, or an empty dict when
+    nothing has been cached for the region.
+    """
+    try:
+        with open(cache_location(region, environ)) as f:
+            contents = json.load(f)
+        applications = contents['applications']
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+    return applications if isinstance(applications, dict) else {}
+
+
+def replace_applications(region, applications):
+    """
+    Records the complete set of applications in `region`, given as a dict of
+    application name to its list of version labels, or to None when the
+    labels are unknown. Applications that are absent are forgotten.
+    """
+    def update(cached):
+        refreshed = {}
+        for app_name, versions in applications.items():
+            entry = cached.get(app_name, _new_entry())
+            if versions is not None:
+                entry['versions'] = list(versions)[:MAX_VERSIONS]
+            refreshed[app_name] = entry
+        cached.clear()
+        cached.update(refreshed)
+
+    _update(region, update)
+
+
+def replace_environments(region, environments, app_name=None):
+    """
+    Records the complete set of live environments of `app_name`, or of every
+    application in `region` when `app_name` is None, given as a dict of
+    application name to its list of environment names.
+    """
+    def update(cached):
+        if app_name is None:
+            for entry in cached.values():
+                entry['environments'] = []
+        for name, environment_names in environments.items():
+            cached.setdefault(name, _new_entry())['environments'] = sorted(set(environment_names))
+        if app_name is not None:
+            cached.setdefault(app_name, _new_entry())['environments'] = sorted(set(environments.get(app_name, [])))
+
+    _update(region, update)
+
+
+def add_environment(region, app_name, env_name):
+    def update(cached):
+        entry = cached.setdefault(app_name, _new_entry())
+        entry['environments'] = sorted(set(entry['environments']) | {env_name})
+
+    _update(region, update)
+
+
+def remove_environment(region, env_name):
+    def update(cached):
+        for entry in cached.values():
+            entry['environments'] = [name for name in entry['environments'] if name != env_name]
+
+    _update(region, update)
+
+
+def remove_application(region, app_name):
+    _update(region, lambda cached: cached.pop(app_name, None))
+
+
+def add_versions(region, app_name, version_labels):
+    """
+    Records `version_labels`, newest first, ahead of the labels already cached
+    for `app_name`.
+    """
+    def update(cached):
+        entry = cached.setdefault(app_name, _new_entry())
+        labels = list(version_labels)
+        known = set(labels)
+        entry['versions'] = (labels + [label for label in entry['versions'] if label not in known])[:MAX_VERSIONS]
+
+    _update(region, update)
+
+
+def remove_version(region, app_name, version_label):
+    def update(cached):
+        entry = cached.get(app_name)
+        if entry:
+            entry['versions'] = [label for label in entry['versions'] if label != version_label]
+
+    _update(region, update)
+
+
+def _new_entry():
+    return {'environments': [], 'versions': []}
+
+
+def _update(region, update):
+    """
+    Applies `update` to the cached names of `region`. Updates are serialized within
+    the process, so those made by concurrent threads, such as the ones creating the
+    application versions of several modules, are not lost.
+    """
+    if not region:
+        return
+    with _update_lock:
+        try:
+            cached = load(region)
+            for entry in cached.values():
+                entry.setdefault('environments', [])
+                entry.setdefault('versions', [])
+            update(cached)
+            usercache.write_json(cache_location(region), {'applications': cached}, sort_keys=True)
+        except (OSError, ValueError, TypeError, AttributeError):
+            pass
@@ -11,6 +11,8 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+from ebcli.core import tracing  # imported first so that the time spent importing can be traced
+
 from argparse import SUPPRESS
 
 from cement.core import foundation, handler, hook
@@ -135,11 +137,13 @@ class EB(foundation.CementApp):
                      action='store_true', help=flag_text['base.noverify'])
         self.add_arg('--debugboto',  # show debug info for botocore
                      action='store_true', help=SUPPRESS)
+        self.add_arg('--trace', metavar='FILE', help=flag_text['base.trace'])
 
 
 utils.monkey_patch_warn()
 
 
 def main():
+    tracing.mark_imports_finished()
     app = EB()
     ebrun.run_app(app)
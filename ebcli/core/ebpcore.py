@@ -11,6 +11,8 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+from ebcli.core import tracing  # imported first so that the time spent importing can be traced
+
 from argparse import SUPPRESS
 import textwrap
 
@@ -115,6 +117,7 @@ class EBP(foundation.CementApp):
                      action='store_true', help=flag_text['base.noverify'])
         self.add_arg('--debugboto',  # show debug info for botocore
                      action='store_true', help=SUPPRESS)
+        self.add_arg('--trace', metavar='FILE', help=flag_text['base.trace'])
 
 
 def _partition_commands():
@@ -132,5 +135,6 @@ utils.monkey_patch_warn()
 
 
 def main():
+    tracing.mark_imports_finished()
     app = EBP()
     ebrun.run_app(app)
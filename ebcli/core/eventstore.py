@@ -0,0 +1,264 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+The on-disk archive of the Elastic Beanstalk events that `eb events` shows.
+
+There is one SQLite database per AWS profile and region, under
+`$XDG_CACHE_HOME/ebcli/events/<profile>`, so that different accounts never
+share events, holding the events of every application, environment and custom
+platform the EB CLI retrieved events for. Each of them is a stream, identified by its
+application and environment names, or by its platform ARN, and is synced
+incrementally: only the events logged since the latest archived event of the
+stream are requested from the service, and events already archived are
+ignored. Queries with filters on time, severity, request id and version label
+are then answered locally, through indexes.
+
+The archive of a stream is complete from the time recorded as its
+`synced_since` onwards; older events are only requested from the service when
+a query asks for events logged before that time.
+"""
+import calendar
+import os
+import sqlite3
+from urllib.parse import quote
+
+from cement.utils.misc import minimal_logger
+from dateutil import parser
+
+from ebcli.core import usercache
+from ebcli.objects.event import Event
+
+LOG = minimal_logger(__name__)
+
+STORE_DIRECTORY_NAME = 'events'
+SCHEMA_VERSION = 1
+SEVERITIES = ['TRACE', 'DEBUG', 'INFO', 'WARN', 'ERROR', 'FATAL']
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    stream TEXT NOT NULL,
+    event_time INTEGER NOT NULL,
+    event_date TEXT NOT NULL,
+    severity_rank INTEGER NOT NULL,
+    severity TEXT,
+    request_id TEXT NOT NULL DEFAULT '',
+    version_label TEXT NOT NULL DEFAULT '',
+    application_name TEXT,
+    environment_name TEXT,
+    platform_arn TEXT,
+    message TEXT NOT NULL DEFAULT '',
+    UNIQUE (stream, event_time, request_id, message)
+);
+CREATE INDEX IF NOT EXISTS events_by_time ON events (stream, event_time);
+CREATE INDEX IF NOT EXISTS events_by_request_id ON events (stream, request_id);
+CREATE INDEX IF NOT EXISTS events_by_version_label ON events (stream, version_label);
+CREATE TABLE IF NOT EXISTS streams (
+    stream TEXT PRIMARY KEY,
+    synced_since INTEGER NOT NULL
+);
+"""
+
+
+def store_directory(environ=None):
+    return usercache.cache_path(STORE_DIRECTORY_NAME, environ)
+
+
+def store_location(region, profile=None, environ=None):
+    return os.path.join(
+        store_directory(environ),
+        quote(profile or 'default', safe=''),
+        '{0}.sqlite3'.format(region or 'default')
+    )
+
+
+def stream_name(app_name=None, env_name=None, platform_arn=None):
+    """
+    Returns the name of the stream of events of the environment `env_name` of
+    the application `app_name`, or of the platform `platform_arn`.
+    """
+    if platform_arn:
+        return 'platform:{0}'.format(platform_arn)
+    return 'environment:{0}/{1}'.format(app_name or '', env_name or '')
+
+
+def event_time(event_date):
+    """
+    Returns `event_date` in microseconds since the epoch.
+    """
+    return calendar.timegm(event_date.utctimetuple()) * 1000000 + event_date.microsecond
+
+
+def severity_rank(severity):
+    try:
+        return SEVERITIES.index((severity or '').upper())
+    except ValueError:
+        return SEVERITIES.index('INFO')
+
+
+class EventStore(object):
+    def __init__(self, location):
+        """
+        :param location: path of the SQLite database, created if it does not exist
+        """
+        directory = os.path.dirname(location)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        self.connection = sqlite3.connect(location, timeout=10)
+        self.connection.executescript(_SCHEMA)
+        self.connection.execute('PRAGMA user_version = {0}'.format(SCHEMA_VERSION))
+
+    @classmethod
+    def for_region(cls, region, profile=None):
+        """
+        Returns the archive of the events of `region` retrieved with the
+        credentials of `profile`, or an archive kept in memory for the
+        duration of the command if it cannot be opened.
+        """
+        try:
+            return cls(store_location(region, profile))
+        except (OSError, sqlite3.Error) as e:
+            LOG.debug('Could not open the event archive of {0}: {1}'.format(region, e))
+            return cls(':memory:')
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, stream, events):
+        """
+        Archives `events` of `stream`, ignoring those already archived.
+        :return: the number of events which were not archived yet
+        """
+        rows = [
+            (
+                stream,
+                event_time(event.event_date),
+                event.event_date.isoformat(),
+                severity_rank(event.severity),
+                event.severity,
+                event.request_id or '',
+                event.version_label or '',
+                event.app_name,
+                event.environment_name,
+                event.platform,
+                event.message or '',
+            )
+            for event in events
+        ]
+        with self.connection:
+            before = self.connection.total_changes
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO events (stream, event_time, event_date, severity_rank, severity, request_id, '
+                'version_label, application_name, environment_name, platform_arn, message) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                rows
+            )
+            added = self.connection.total_changes - before
+        LOG.debug('Archived {0} new events of {1}'.format(added, stream))
+        return added
+
+    def synced_since(self, stream):
+        """
+        Returns the time, in microseconds since the epoch, from which every event
+        of `stream` is archived, or None if `stream` was never synced.
+        """
+        row = self.connection.execute('SELECT synced_since FROM streams WHERE stream = ?', (stream,)).fetchone()
+        return row[0] if row else None
+
+    def mark_synced_since(self, stream, since):
+        """
+        Records that every event of `stream` logged at or after `since` is archived.
+        """
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR IGNORE INTO streams (stream, synced_since) VALUES (?, ?)',
+                (stream, since)
+            )
+            self.connection.execute(
+                'UPDATE streams SET synced_since = MIN(synced_since, ?) WHERE stream = ?',
+                (since, stream)
+            )
+
+    def latest_row(self, stream):
+        """
+        Returns the position of the event of `stream` archived last, which
+        `query` accepts as `after_row` to return only events archived since.
+        """
+        row = self.connection.execute('SELECT MAX(rowid) FROM events WHERE stream = ?', (stream,)).fetchone()
+        return row[0] or 0
+
+    def latest_event_time(self, stream):
+        """
+        Returns the time of the latest archived event of `stream`, in
+        microseconds since the epoch, or None if none was archived.
+        """
+        row = self.connection.execute('SELECT MAX(event_time) FROM events WHERE stream = ?', (stream,)).fetchone()
+        return row[0]
+
+    def query(self, stream, since=None, after_row=None, severity=None, request_id=None, version_label=None,
+              limit=None):
+        """
+        Returns the archived events of `stream` which match all the given
+        filters, oldest first.
+        :param since: time in microseconds since the epoch at or after which events were logged
+        :param after_row: position returned by `latest_row` after which events were archived
+        :param severity: the lowest severity of the events, as in `SEVERITIES`
+        :param limit: return only the latest `limit` matching events
+        """
+        clauses = ['stream = ?']
+        parameters = [stream]
+        if since is not None:
+            clauses.append('event_time >= ?')
+            parameters.append(since)
+        if after_row is not None:
+            clauses.append('rowid > ?')
+            parameters.append(after_row)
+        if severity:
+            clauses.append('severity_rank >= ?')
+            parameters.append(severity_rank(severity))
+        if request_id:
+            clauses.append('request_id = ?')
+            parameters.append(request_id)
+        if version_label:
+            clauses.append('version_label = ?')
+            parameters.append(version_label)
+
+        statement = (
+            'SELECT event_date, severity, request_id, version_label, application_name, environment_name, '
+            'platform_arn, message FROM events WHERE {0} ORDER BY event_time DESC, rowid DESC'
+        ).format(' AND '.join(clauses))
+        if limit is not None:
+            statement += ' LIMIT ?'
+            parameters.append(limit)
+
+        rows = self.connection.execute(statement, parameters).fetchall()
+        return [_row_to_event(row) for row in reversed(rows)]
+
+
+def _row_to_event(row):
+    event_date, severity, request_id, version_label, app_name, env_name, platform_arn, message = row
+    return Event(
+        app_name=app_name,
+        environment_name=env_name,
+        event_date=parser.parse(event_date),
+        message=message,
+        platform=platform_arn,
+        request_id=request_id or None,
+        severity=severity,
+        version_label=version_label or None,
+    )
@@ -12,11 +12,13 @@
 # language governing permissions and limitations under the License.
 
 import codecs
+import copy
 import glob
 import json
 import os
 import shutil
 import stat
+import struct
 import sys
 import zipfile
 import yaml
@@ -36,6 +38,7 @@ except ImportError:
     import ConfigParser as configparser
 
 from ebcli.core import io
+from ebcli.core.workspace import Workspace, forget as forget_workspaces
 from ebcli.resources.strings import prompts, strings
 from ebcli.objects.exceptions import (
     NotInitializedError,
@@ -78,6 +81,13 @@ ebcli_section = 'profile eb-cli'
 app_version_folder = beanstalk_directory + 'app_versions'
 logs_folder = beanstalk_directory + 'logs' + os.path.sep
 env_yaml = 'env.yaml'
+UNZIP_BUFFER_SIZE = 64 * 1024
+_ZIP_FLAG_ENCRYPTED = 0x1
+_ZIP_FLAG_DATA_DESCRIPTOR = 0x8
+_ZIP_LOCAL_HEADER_SIZE = 30
+_ZIP64_EXTRA_HEADER_ID = 0x0001
+# Private state of `zipfile.ZipFile` which members are copied verbatim through
+_ZIP_RAW_COPY_ATTRIBUTES = ('fp', 'start_dir', 'filelist', 'NameToInfo', '_didModify', '_writecheck')
 
 _marker = object()
 
@@ -111,13 +121,10 @@ def is_git_directory_present():
     return os.path.isdir('.git')
 
 def clean_up():
-    cwd = os.getcwd()
-    try:
-        ProjectRoot.traverse()
-        if os.path.isdir(beanstalk_directory):
-            shutil.rmtree(beanstalk_directory, ignore_errors=True)
-    finally:
-        os.chdir(cwd)
+    workspace = Workspace.current()
+    if os.path.isdir(workspace.eb_directory):
+        shutil.rmtree(workspace.eb_directory, ignore_errors=True)
+    forget_workspaces()
 
 
 def _set_not_none(config, section, option, value):
@@ -126,17 +133,12 @@ def _set_not_none(config, section, option, value):
 
 
 def get_war_file_location():
-    cwd = os.getcwd()
+    lst = glob.glob(Workspace.current().path('build', 'libs', '*.war'))
     try:
-        ProjectRoot.traverse()
-        lst = glob.glob('{}'.format(os.path.join('build', 'libs', '*.war')))
-        try:
-            return os.path.join(os.getcwd(), lst[0])
-        except IndexError:
-            raise NotFoundError('Can not find .war artifact in build' +
-                                os.path.sep + 'libs' + os.path.sep)
-    finally:
-        os.chdir(cwd)
+        return lst[0]
+    except IndexError:
+        raise NotFoundError('Can not find .war artifact in build' +
+                            os.path.sep + 'libs' + os.path.sep)
 
 
 def config_file_present():
@@ -270,6 +272,7 @@ def touch_config_folder(dir_path=None):
         os.makedirs(os.path.join(dir_path, beanstalk_directory)
                     if dir_path
                     else beanstalk_directory)
+        forget_workspaces()
 
 
 def create_config_file(
@@ -297,6 +300,7 @@ def create_config_file(
         os.makedirs(os.path.join(dir_path, beanstalk_directory)
                     if dir_path
                     else beanstalk_directory)
+        forget_workspaces()
 
     write_config_setting('global', 'application_name', app_name, dir_path=dir_path)
     write_config_setting('global', 'default_region', region, dir_path=dir_path)
@@ -311,12 +315,7 @@ def create_config_file(
 
 
 def get_project_root():
-    cwd = os.getcwd()
-    try:
-        ProjectRoot.traverse()
-        return os.getcwd()
-    finally:
-        os.chdir(cwd)
+    return Workspace.current().root
 
 
 def inside_ebcli_project():
@@ -327,29 +326,19 @@ def inside_ebcli_project():
 
 
 def get_zip_location(file_name):
-    cwd = os.getcwd()
-    try:
-        ProjectRoot.traverse()
-        if not os.path.isdir(app_version_folder):
-            os.makedirs(app_version_folder)
+    app_versions_directory = Workspace.current().app_versions_directory
+    if not os.path.isdir(app_versions_directory):
+        os.makedirs(app_versions_directory, exist_ok=True)
 
-        return os.path.abspath(app_version_folder) + os.path.sep + file_name
-
-    finally:
-        os.chdir(cwd)
+    return app_versions_directory + os.path.sep + file_name
 
 
 def get_logs_location(folder_name):
-    cwd = os.getcwd()
-    try:
-        ProjectRoot.traverse()
-        if not os.path.isdir(logs_folder):
-            os.makedirs(logs_folder)
+    logs_directory = Workspace.current().logs_directory
+    if not os.path.isdir(logs_directory):
+        os.makedirs(logs_directory, exist_ok=True)
 
-        return os.path.abspath(os.path.join(logs_folder, folder_name))
-
-    finally:
-        os.chdir(cwd)
+    return os.path.join(logs_directory, folder_name)
 
 
 def program_is_installed(program):
@@ -377,63 +366,127 @@ def delete_directory(location):
 
 
 def delete_app_versions():
-    cwd = os.getcwd()
-    try:
-        ProjectRoot.traverse()
-        delete_directory(app_version_folder)
-    finally:
-        os.chdir(cwd)
+    delete_directory(Workspace.current().app_versions_directory)
 
 
 def zip_append_archive(target_file, source_file):
-    zip_source = zipfile.ZipFile(source_file, 'r', allowZip64=True)
-    zip_target = zipfile.ZipFile(target_file, 'a', allowZip64=True)
-    with warnings.catch_warnings():
-        # Ignore UserWarning raised by zip module for zipping modules.
-        warnings.simplefilter('ignore', category=UserWarning)
-        for filename in zip_source.namelist():
-            zf = zip_source.read(filename)
-            zip_target.writestr(filename, zf)
-    zip_target.close()
-    zip_source.close()
+    """
+    Appends the members of the zip archive, `source_file`, to `target_file`.
+
+    The compressed data of every member is copied verbatim, so appending an
+    archive costs a sequential read and write of its compressed bytes rather
+    than decompressing and recompressing each member. Only the local headers
+    and the central directory of `target_file` are rewritten. Encrypted members,
+    and every member on Python versions whose `zipfile` lacks the internals this
+    relies on, are recompressed through `ZipFile.writestr` instead.
+    """
+    with zipfile.ZipFile(source_file, 'r', allowZip64=True) as zip_source, \
+            zipfile.ZipFile(target_file, 'a', allowZip64=True) as zip_target:
+        with warnings.catch_warnings():
+            # Ignore UserWarning raised by zip module for duplicate names.
+            warnings.simplefilter('ignore', category=UserWarning)
+            for source_info in zip_source.infolist():
+                _copy_raw_zip_member(zip_source, zip_target, source_info)
+
+
+def _copy_raw_zip_member(zip_source, zip_target, source_info):
+    if source_info.flag_bits & _ZIP_FLAG_ENCRYPTED or not _supports_raw_zip_copy(zip_target):
+        zip_target.writestr(source_info, zip_source.read(source_info))
+        return
+
+    target_info = copy.copy(source_info)
+    # Sizes and CRC are known up front, so they are written into the local
+    # header and the member is not followed by a data descriptor
+    target_info.flag_bits &= ~_ZIP_FLAG_DATA_DESCRIPTOR
+    target_info.extra = _strip_zip64_extra(source_info.extra)
+    target_info.header_offset = zip_target.start_dir
+    # Performs the checks of `ZipFile.writestr`, including the warning about
+    # duplicate names
+    zip_target._writecheck(target_info)
+
+    zip64 = max(target_info.file_size, target_info.compress_size) > zipfile.ZIP64_LIMIT
+    source_fp = zip_source.fp
+    source_fp.seek(source_info.header_offset)
+    local_header = source_fp.read(_ZIP_LOCAL_HEADER_SIZE)
+    filename_length, extra_length = struct.unpack('<HH', local_header[26:30])
+    source_fp.seek(filename_length + extra_length, os.SEEK_CUR)
+
+    target_fp = zip_target.fp
+    target_fp.seek(zip_target.start_dir)
+    target_fp.write(target_info.FileHeader(zip64))
+    remaining = source_info.compress_size
+    while remaining > 0:
+        data = source_fp.read(min(UNZIP_BUFFER_SIZE, remaining))
+        if not data:
+            raise zipfile.BadZipfile('Truncated member {0}'.format(source_info.filename))
+        target_fp.write(data)
+        remaining -= len(data)
+
+    zip_target.start_dir = target_fp.tell()
+    zip_target.filelist.append(target_info)
+    zip_target.NameToInfo[target_info.filename] = target_info
+    zip_target._didModify = True
+
+
+def _supports_raw_zip_copy(zip_target):
+    return callable(getattr(zipfile.ZipInfo, 'FileHeader', None)) and all(
+        hasattr(zip_target, attribute) for attribute in _ZIP_RAW_COPY_ATTRIBUTES
+    )
+
+
+def _strip_zip64_extra(extra):
+    stripped = b''
+    offset = 0
+    while offset + 4 <= len(extra):
+        header_id, length = struct.unpack('<HH', extra[offset:offset + 4])
+        if header_id != _ZIP64_EXTRA_HEADER_ID:
+            stripped += extra[offset:offset + 4 + length]
+        offset += 4 + length
+    return stripped
 
 
 def zip_up_folder(directory, location, ignore_list=None):
-    cwd = os.getcwd()
-    try:
-        os.chdir(directory)
-        io.log_info('Zipping up folder at location: ' + str(os.getcwd()))
-        zipf = zipfile.ZipFile(location, 'w', zipfile.ZIP_DEFLATED, allowZip64=True)
-        _zipdir('./', zipf, ignore_list=ignore_list)
-        zipf.close()
-        LOG.debug('File size: ' + str(os.path.getsize(location)))
-    finally:
-        os.chdir(cwd)
+    directory = os.path.abspath(directory)
+    io.log_info('Zipping up folder at location: ' + directory)
+    with zipfile.ZipFile(location, 'w', zipfile.ZIP_DEFLATED, allowZip64=True) as zipf:
+        _zipdir('./', zipf, ignore_list=ignore_list, root=directory)
+    LOG.debug('File size: ' + str(os.path.getsize(location)))
 
 
-def zip_up_project(location, ignore_list=None):
-    cwd = os.getcwd()
+def zip_up_project(location, ignore_list=None, project_root=None):
+    """
+    Zips up the project containing the current working directory, or the one at
+    `project_root`, to `location`. The working directory is left alone, so
+    several projects can be zipped up concurrently.
+    """
+    zip_up_folder(project_root or Workspace.current().root, location, ignore_list=ignore_list)
 
-    try:
-        ProjectRoot.traverse()
 
-        zip_up_folder('./', location, ignore_list=ignore_list)
+def _zipdir(path, zipf, ignore_list=None, root=None):
+    """
+    Adds the files under `path` to `zipf`. `path` is relative to the directory
+    `root`, or to the current working directory if `root` is None, and so are
+    the names of the archive members.
+    """
+    base_directory = root
 
-    finally:
-        os.chdir(cwd)
+    def on_disk(relative_path):
+        return os.path.join(base_directory, relative_path) if base_directory else relative_path
 
-def _zipdir(path, zipf, ignore_list=None):
     if ignore_list is None:
         ignore_list = {'.gitignore'}
     ignore_list = {'./' + i for i in ignore_list}
     zipped_roots = []
-    for root, dirs, files in os.walk(path):
+    walk_root = on_disk(path)
+    for directory, dirs, files in os.walk(walk_root):
+        relative_directory = os.path.relpath(directory, walk_root)
+        root = path if relative_directory == os.curdir else os.path.join(path, relative_directory)
         if '.elasticbeanstalk' in root:
             io.log_info('  -skipping: {}'.format(root))
             continue
         for d in dirs:
             cur_dir = os.path.join(root, d)
-            if os.path.islink(cur_dir):
+            if os.path.islink(on_disk(cur_dir)):
                 # os.walk categorize symlinks-to-directories as dirs
                 # and we want to include symlinks in the zip
                 if cur_dir in ignore_list:
@@ -445,14 +498,14 @@ def _zipdir(path, zipf, ignore_list=None):
                     # 2716663808L is the "magic code" for symlinks
                     zipInfo.external_attr = 2716663808 if sys.version_info > (3,) else long(2716663808)
 
-                    zipf.writestr(zipInfo, os.readlink(cur_dir))
+                    zipf.writestr(zipInfo, os.readlink(on_disk(cur_dir)))
         for f in files:
             cur_file = os.path.join(root, f)
 
             if (
                 cur_file.endswith('~')
                 or cur_file in ignore_list
-                or not _validate_file_for_archive(cur_file)
+                or not _validate_file_for_archive(on_disk(cur_file))
             ):
                 # Ignore editor backup files (like file.txt~)
                 # Ignore anything in the .ebignore file
@@ -462,10 +515,10 @@ def _zipdir(path, zipf, ignore_list=None):
                 if root not in zipped_roots:
                     # Windows requires us to index the folders.
                     io.log_info(' +adding: {}/'.format(root))
-                    zipf.write(root)
+                    zipf.write(on_disk(root), root)
                     zipped_roots.append(root)
                 io.log_info('  +adding: {}'.format(cur_file))
-                if os.path.islink(cur_file):
+                if os.path.islink(on_disk(cur_file)):
                     zipInfo = zipfile.ZipInfo()
                     zipInfo.filename = os.path.join(root, f)
 
@@ -473,49 +526,42 @@ def _zipdir(path, zipf, ignore_list=None):
                         zipInfo.external_attr = 2716663808
                     else:
                         zipInfo.external_attr = long(2716663808)
-                    zipf.writestr(zipInfo, os.readlink(cur_file))
+                    zipf.writestr(zipInfo, os.readlink(on_disk(cur_file)))
                 else:
-                    zipf.write(cur_file)
+                    zipf.write(on_disk(cur_file), cur_file)
 
 
 def unzip_folder(file_location, directory):
     if not os.path.isdir(directory):
         os.makedirs(directory)
 
-    zip = zipfile.ZipFile(file_location, 'r', allowZip64=True)
-    for cur_file in zip.namelist():
-        if not cur_file.endswith('/'):
-            root, name = os.path.split(cur_file)
-            path = os.path.normpath(os.path.join(directory, root))
-            if not os.path.isdir(path):
-                os.makedirs(path)
-            open(os.path.join(path, name), 'wb').write(zip.read(cur_file))
+    with zipfile.ZipFile(file_location, 'r', allowZip64=True) as zip:
+        for cur_file in zip.namelist():
+            if not cur_file.endswith('/'):
+                root, name = os.path.split(cur_file)
+                path = os.path.normpath(os.path.join(directory, root))
+                if not os.path.isdir(path):
+                    os.makedirs(path)
+                # Stream members through a bounded buffer rather than reading
+                # each of them into memory in full
+                with zip.open(cur_file) as source, open(os.path.join(path, name), 'wb') as target:
+                    shutil.copyfileobj(source, target, UNZIP_BUFFER_SIZE)
 
 
 def delete_app_file(app_name):
-    cwd = os.getcwd()
-    file_name = beanstalk_directory + app_name
+    file_name = Workspace.current().eb_path(app_name)
 
-    try:
-        ProjectRoot.traverse()
-        for file_ext in ['.app.yml']:
-            path = file_name + file_ext
-            delete_file(path)
-    finally:
-        os.chdir(cwd)
+    for file_ext in ['.app.yml']:
+        path = file_name + file_ext
+        delete_file(path)
 
 
 def delete_env_file(env_name):
-    cwd = os.getcwd()
-    file_name = beanstalk_directory + env_name
+    file_name = Workspace.current().eb_path(env_name)
 
-    try:
-        ProjectRoot.traverse()
-        for file_ext in ['.ebe.yml', '.env.yml']:
-            path = file_name + file_ext
-            delete_file(path)
-    finally:
-        os.chdir(cwd)
+    for file_ext in ['.ebe.yml', '.env.yml']:
+        path = file_name + file_ext
+        delete_file(path)
 
 
 def get_editor():
@@ -534,83 +580,54 @@ def get_editor():
 
 
 def save_app_file(app):
-    cwd = os.getcwd()
     env_name = app['ApplicationName']
     file_name = env_name + '.app.yml'
 
-    file_name = beanstalk_directory + file_name
-    try:
-        ProjectRoot.traverse()
+    file_name = Workspace.current().eb_path(file_name)
 
-        file_name = os.path.abspath(file_name)
-
-        with codecs.open(file_name, 'w', encoding='utf8') as f:
-            f.write(safe_dump(app, default_flow_style=False,
-                              line_break=os.linesep))
-
-    finally:
-        os.chdir(cwd)
+    with codecs.open(file_name, 'w', encoding='utf8') as f:
+        f.write(safe_dump(app, default_flow_style=False,
+                          line_break=os.linesep))
 
     return file_name
 
 
 def save_env_file(env):
-    cwd = os.getcwd()
     env_name = env['EnvironmentName']
     file_name = env_name + '.env.yml'
 
-    file_name = beanstalk_directory + file_name
-    try:
-        ProjectRoot.traverse()
-
-        file_name = os.path.abspath(file_name)
+    file_name = Workspace.current().eb_path(file_name)
 
-        with codecs.open(file_name, 'w', encoding='utf8') as f:
-            f.write(safe_dump(env, default_flow_style=False,
-                              line_break=os.linesep))
-
-    finally:
-        os.chdir(cwd)
+    with codecs.open(file_name, 'w', encoding='utf8') as f:
+        f.write(safe_dump(env, default_flow_style=False,
+                          line_break=os.linesep))
 
     return file_name
 
 
 def get_environment_from_file(env_name, path=None):
-    cwd = os.getcwd()
-    file_name = beanstalk_directory + env_name
-
-    try:
-        if not path:
-            ProjectRoot.traverse()
-            file_ext = '.env.yml'
-            path = file_name + file_ext
-        if os.path.exists(path):
-            with codecs.open(path, 'r', encoding='utf8') as f:
+    if not path:
+        file_ext = '.env.yml'
+        path = Workspace.current().eb_path(env_name + file_ext)
+    if os.path.exists(path):
+        with codecs.open(path, 'r', encoding='utf8') as f:
+            try:
+                return safe_load(f)
+            except (ScannerError, ParserError):
+                f.seek(0)
                 try:
-                    return safe_load(f)
-                except (ScannerError, ParserError):
-                    f.seek(0)
-                    try:
-                        return load(f)
-                    except JSONDecodeError:
-                        raise InvalidSyntaxError('The environment configuration contains invalid syntax. Make sure your input '
-                                             'matches one of the supported formats: JSON, YAML.')
-        else:
-            raise NotFoundError('The file you specified in this configuration path cannot be found: '+path)
-
-
-    finally:
-        os.chdir(cwd)
+                    return load(f)
+                except JSONDecodeError:
+                    raise InvalidSyntaxError('The environment configuration contains invalid syntax. Make sure your input '
+                                         'matches one of the supported formats: JSON, YAML.')
+    else:
+        raise NotFoundError('The file you specified in this configuration path cannot be found: '+path)
 
 
 def get_application_from_file(app_name):
-    cwd = os.getcwd()
-    file_name = beanstalk_directory + app_name
-
     try:
-        ProjectRoot.traverse()
         file_ext = '.app.yml'
-        path = file_name + file_ext
+        path = Workspace.current().eb_path(app_name + file_ext)
         if os.path.exists(path):
             with codecs.open(path, 'r', encoding='utf8') as f:
                 return safe_load(f)
@@ -618,9 +635,6 @@ def get_application_from_file(app_name):
         raise InvalidSyntaxError('The application file contains '
                                  'invalid syntax.')
 
-    finally:
-        os.chdir(cwd)
-
 
 def update_platform_version(version):
     if version:
@@ -641,40 +655,37 @@ def get_keyname():
 
 
 def write_config_setting(section, key_name, value, dir_path=None, file=local_config_file):
-    cwd = os.getcwd()
-    if dir_path:
-        os.chdir(dir_path)
-    try:
-        ProjectRoot.traverse()
-
-        config = _get_yaml_dict(file)
-        if not config:
-            config = {}
-        # Value will be a dict when we are passing in branch config settings
-        if type(value) is dict:
-            for key in value.keys():
-                config.setdefault(section, {}).setdefault(key_name, {})[key] = value[key]
-        else:
-            if config.get(section) is None:
-                config[section] = {}
-            config.setdefault(section, {})[key_name] = value
-
-        with codecs.open(file, 'w', encoding='utf8') as f:
-            f.write(safe_dump(config, default_flow_style=False,
-                              line_break=os.linesep))
-
-    finally:
-        os.chdir(cwd)
+    workspace = Workspace.find(dir_path) if dir_path else Workspace.current()
+    file = workspace.path(file)
+
+    config = _get_yaml_dict(file)
+    if not config:
+        config = {}
+    # Value will be a dict when we are passing in branch config settings
+    if type(value) is dict:
+        for key in value.keys():
+            config.setdefault(section, {}).setdefault(key_name, {})[key] = value[key]
+    else:
+        if config.get(section) is None:
+            config[section] = {}
+        config.setdefault(section, {})[key_name] = value
 
+    with codecs.open(file, 'w', encoding='utf8') as f:
+        f.write(safe_dump(config, default_flow_style=False,
+                          line_break=os.linesep))
 
-def get_config_setting(section, key_name, default=_marker):
-    cwd = os.getcwd()
 
+def get_config_setting(section, key_name, default=_marker, workspace=None):
+    """
+    Returns the `key_name` setting of the `section` section of the configuration
+    of `workspace`, or of the workspace of the working directory if None. The
+    local configuration takes priority over the global one.
+    """
     try:
-        ProjectRoot.traverse()
+        workspace = workspace or Workspace.current()
 
-        config_global = _get_yaml_dict(global_config_file)
-        config_local = _get_yaml_dict(local_config_file)
+        config_global = _get_yaml_dict(workspace.global_config_path)
+        config_local = _get_yaml_dict(workspace.local_config_path)
 
         # Grab value, local gets priority
         try:
@@ -695,8 +706,6 @@ def get_config_setting(section, key_name, default=_marker):
             raise
         else:
             return default
-    finally:
-        os.chdir(cwd)
     return value
 
 
@@ -732,22 +741,11 @@ def file_exists(full_path):
 
 
 def eb_file_exists(location):
-    cwd = os.getcwd()
-    try:
-        ProjectRoot.traverse()
-        path = beanstalk_directory + location
-        return os.path.isfile(path)
-    finally:
-        os.chdir(cwd)
+    return os.path.isfile(Workspace.current().eb_path(location))
 
 
 def build_spec_exists():
-    cwd = os.getcwd()
-    try:
-        ProjectRoot.traverse()
-        return os.path.isfile(buildspec_name)
-    finally:
-        os.chdir(cwd)
+    return os.path.isfile(Workspace.current().path(buildspec_name))
 
 
 def get_build_configuration():
@@ -756,34 +754,27 @@ def get_build_configuration():
     compute_key = 'ComputeType'
     timeout_key = 'Timeout'
 
-    cwd = os.getcwd()
-
-    try:
-        ProjectRoot.traverse()
-
-        build_spec = _get_yaml_dict(buildspec_name)
+    build_spec = _get_yaml_dict(Workspace.current().path(buildspec_name))
 
-        if build_spec is None or buildspec_config_header not in build_spec.keys():
-            LOG.debug("Buildspec Keys: {0}".format(build_spec.keys()))
-            io.log_warning(strings['codebuild.noheader'].replace('{header}', buildspec_config_header))
-            return None
+    if build_spec is None or buildspec_config_header not in build_spec.keys():
+        LOG.debug("Buildspec Keys: {0}".format(build_spec.keys()))
+        io.log_warning(strings['codebuild.noheader'].replace('{header}', buildspec_config_header))
+        return None
 
-        beanstalk_build_configs = build_spec[buildspec_config_header]
+    beanstalk_build_configs = build_spec[buildspec_config_header]
 
-        if beanstalk_build_configs is None:
-            LOG.debug("No values for EB header in buildspec file")
-            return BuildConfiguration()
+    if beanstalk_build_configs is None:
+        LOG.debug("No values for EB header in buildspec file")
+        return BuildConfiguration()
 
-        LOG.debug("EB Config Keys: {0}".format(beanstalk_build_configs.keys()))
+    LOG.debug("EB Config Keys: {0}".format(beanstalk_build_configs.keys()))
 
-        build_configuration = BuildConfiguration(
-            compute_type=beanstalk_build_configs.get(compute_key),
-            image=beanstalk_build_configs.get(image_key),
-            service_role=beanstalk_build_configs.get(service_role_key),
-            timeout=beanstalk_build_configs.get(timeout_key)
-        )
-    finally:
-        os.chdir(cwd)
+    build_configuration = BuildConfiguration(
+        compute_type=beanstalk_build_configs.get(compute_key),
+        image=beanstalk_build_configs.get(image_key),
+        service_role=beanstalk_build_configs.get(service_role_key),
+        timeout=beanstalk_build_configs.get(timeout_key)
+    )
 
     return build_configuration
 
@@ -801,8 +792,8 @@ def directory_empty(location):
     return not os.listdir(location)
 
 
-def get_ebignore_list():
-    location = get_ebignore_location()
+def get_ebignore_list(workspace=None):
+    location = workspace.ebignore_path if workspace else get_ebignore_location()
 
     if not os.path.isfile(location):
         return None
@@ -810,7 +801,7 @@ def get_ebignore_list():
     with codecs.open(location, 'r', encoding='utf-8') as f:
         spec = PathSpec.from_lines('gitwildmatch', f)
 
-    matches = [f for f in spec.match_tree_entries(get_project_root())]
+    matches = [f for f in spec.match_tree_entries(workspace.root if workspace else get_project_root())]
     ignore_list = {match.path for match in matches}
     ignore_list.add('.ebignore')
 
@@ -818,24 +809,13 @@ def get_ebignore_list():
 
 
 def make_eb_dir(location):
-    cwd = os.getcwd()
-    try:
-        ProjectRoot.traverse()
-        path = beanstalk_directory + location
-        if not os.path.isdir(path):
-            os.makedirs(path)
-    finally:
-        os.chdir(cwd)
+    path = Workspace.current().eb_path(location)
+    if not os.path.isdir(path):
+        os.makedirs(path)
 
 
 def write_to_eb_data_file(location, data):
-    cwd = os.getcwd()
-    try:
-        ProjectRoot.traverse()
-        path = beanstalk_directory + location
-        write_to_data_file(path, data)
-    finally:
-        os.chdir(cwd)
+    write_to_data_file(Workspace.current().eb_path(location), data)
 
 
 def write_to_data_file(location, data):
@@ -869,13 +849,7 @@ def readlines_from_text_file(location):
 
 
 def get_project_file_full_location(location):
-    cwd = os.getcwd()
-    try:
-        ProjectRoot.traverse()
-        full_path = os.path.abspath(location)
-        return full_path
-    finally:
-        os.chdir(cwd)
+    return os.path.abspath(Workspace.current().path(location))
 
 
 def get_ebignore_location():
@@ -17,7 +17,7 @@ from cement.ext.ext_logging import LoggingLogHandler
 from cement.utils.misc import minimal_logger
 
 from ebcli import __version__
-from ebcli.core import fileoperations
+from ebcli.core import fileoperations, tracing
 from ebcli.lib import aws
 from ebcli.operations import commonops
 
@@ -26,18 +26,21 @@ LOG = minimal_logger(__name__)
 
 
 def pre_run_hook(app):
+    set_trace(app.pargs.trace)
+
     if app.pargs.verbose:
         LoggingLogHandler.set_level(app.log, 'INFO')
 
     LOG.debug('-- EBCLI Version: {}'.format(__version__))
     LOG.debug('-- Python Version: {}'.format(sys.version))
 
-    set_profile(app.pargs.profile)
-    set_region(app.pargs.region)
+    with tracing.span('resolve configuration', tracing.CONFIG):
+        set_profile(app.pargs.profile)
+        set_region(app.pargs.region)
 
-    set_endpoint(app.pargs.endpoint_url)
-    set_ssl(app.pargs.no_verify_ssl)
-    set_debugboto(app.pargs.debugboto)
+        set_endpoint(app.pargs.endpoint_url)
+        set_ssl(app.pargs.no_verify_ssl)
+        set_debugboto(app.pargs.debugboto)
 
 
 def set_profile(profile):
@@ -72,3 +75,8 @@ def set_endpoint(endpoint_url):
 def set_debugboto(debugboto):
     if debugboto:
         aws.set_debug()
+
+
+def set_trace(trace_location):
+    if trace_location:
+        tracing.start(trace_location)
@@ -12,6 +12,9 @@
 # language governing permissions and limitations under the License.
 
 import re
+import os
+import shutil
+import subprocess
 import warnings
 import getpass
 import sys
@@ -159,6 +162,66 @@ def echo_with_pager(output):
     pydoc.pager(output)
 
 
+def echo_with_pager_incrementally(chunks):
+    """
+    Pages the strings produced by the iterable, `chunks`, writing each to the pager as
+    soon as it is produced, so that the first chunks can be read while the rest are
+    still being computed. When the output is not a terminal the chunks are written
+    straight to stdout, and when no pager program is available they are joined and
+    handed to `echo_with_pager`. If the customer quits the pager early, the remaining
+    chunks are not produced.
+    """
+    try:
+        if not sys.stdin.isatty() or not sys.stdout.isatty():
+            for chunk in chunks:
+                sys.stdout.write(chunk)
+                sys.stdout.flush()
+            return
+
+        command = _pager_command()
+        if command is None:
+            echo_with_pager(''.join(chunks))
+            return
+
+        pager = subprocess.Popen(
+            command,
+            shell=True,
+            stdin=subprocess.PIPE,
+            universal_newlines=True,
+            errors='backslashreplace'
+        )
+        try:
+            for chunk in chunks:
+                pager.stdin.write(chunk)
+                pager.stdin.flush()
+            pager.stdin.close()
+        except (KeyboardInterrupt, OSError):
+            pass
+
+        while True:
+            try:
+                pager.wait()
+                break
+            except KeyboardInterrupt:
+                pass
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close:
+            close()
+
+
+def _pager_command():
+    if os.environ.get('TERM') in ('dumb', 'emacs'):
+        return None
+
+    command = os.environ.get('MANPAGER') or os.environ.get('PAGER')
+    if command:
+        return command
+    if shutil.which('less'):
+        return 'less'
+    return None
+
+
 def prompt(output, default=None):
     return get_input('(' + output + ')', default)
 
@@ -0,0 +1,194 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Span recorder behind the `--trace FILE` global option.
+
+When tracing is started, the phases of a command (startup, configuration
+resolution, bundling, uploads, API calls and the sleeps between polls) are
+recorded as spans. At exit the spans are written to FILE in the Chrome trace
+event format, which can be opened in Perfetto or chrome://tracing, and a short
+summary of where the time went is printed to stderr.
+
+When tracing is not started, `span` does nothing beyond entering and leaving
+its `with` block, so it can be left in hot paths.
+"""
+import atexit
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+
+IMPORTED_AT = time.time()
+
+STARTUP = 'startup'
+CONFIG = 'config'
+ZIP = 'zip'
+UPLOAD = 'upload'
+API_CALL = 'api'
+WAIT = 'wait'
+
+SUMMARY_ROW_LIMIT = 15
+
+_tracer = None
+_imports_finished_at = None
+
+
+class Tracer(object):
+    def __init__(self, location):
+        self.location = location
+        self.pid = os.getpid()
+        self.started_at = time.time()
+        self.events = []
+        self.thread_names = {}
+        self._lock = threading.Lock()
+
+    def add_span(self, name, category, start, end, args=None):
+        thread = threading.current_thread()
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': _to_microseconds(start),
+            'dur': _to_microseconds(end - start),
+            'pid': self.pid,
+            'tid': thread.ident,
+            'args': args or {},
+        }
+        with self._lock:
+            self.events.append(event)
+            self.thread_names.setdefault(thread.ident, thread.name)
+
+    def write(self):
+        with self._lock:
+            events = list(self.events)
+            thread_names = dict(self.thread_names)
+
+        metadata = [
+            {
+                'name': 'thread_name',
+                'ph': 'M',
+                'pid': self.pid,
+                'tid': tid,
+                'args': {'name': thread_name},
+            }
+            for tid, thread_name in thread_names.items()
+        ]
+        metadata.append({
+            'name': 'process_name',
+            'ph': 'M',
+            'pid': self.pid,
+            'args': {'name': 'eb ' + ' '.join(sys.argv[1:])},
+        })
+        with open(self.location, 'w') as f:
+            json.dump({'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}, f)
+
+    def summary(self, now=None):
+        """
+        :return: lines of a table of the total and maximum time spent in each kind of
+                 span, longest total first, capped at `SUMMARY_ROW_LIMIT` rows
+        """
+        now = now or time.time()
+        with self._lock:
+            events = list(self.events)
+
+        totals = {}
+        for event in events:
+            key = (event['cat'], event['name'])
+            count, total, longest = totals.get(key, (0, 0, 0))
+            totals[key] = (count + 1, total + event['dur'], max(longest, event['dur']))
+
+        rows = sorted(totals.items(), key=lambda item: item[1][1], reverse=True)
+        lines = [
+            'Trace written to {0} ({1} spans, {2:.2f}s)'.format(
+                self.location,
+                len(events),
+                now - IMPORTED_AT
+            ),
+            '{0:<8} {1:<44} {2:>6} {3:>11} {4:>10}'.format('Category', 'Span', 'Count', 'Total(ms)', 'Max(ms)'),
+        ]
+        for (category, name), (count, total, longest) in rows[:SUMMARY_ROW_LIMIT]:
+            lines.append(
+                '{0:<8} {1:<44} {2:>6} {3:>11.1f} {4:>10.1f}'.format(
+                    category, name[:44], count, total / 1000.0, longest / 1000.0
+                )
+            )
+        if len(rows) > SUMMARY_ROW_LIMIT:
+            lines.append('... {0} more'.format(len(rows) - SUMMARY_ROW_LIMIT))
+        return lines
+
+
+def mark_imports_finished():
+    global _imports_finished_at
+    _imports_finished_at = time.time()
+
+
+def start(location):
+    """
+    Starts recording spans, and arranges for them to be written to `location` when
+    the process exits. The time spent importing and setting up the CLI before this
+    call is recorded retroactively.
+    """
+    global _tracer
+    _tracer = Tracer(os.path.abspath(location))
+    imports_finished_at = _imports_finished_at or _tracer.started_at
+    _tracer.add_span('import', STARTUP, IMPORTED_AT, imports_finished_at)
+    _tracer.add_span('setup', STARTUP, imports_finished_at, _tracer.started_at)
+    atexit.register(finish)
+
+
+def is_enabled():
+    return _tracer is not None
+
+
+@contextlib.contextmanager
+def span(name, category, **args):
+    """
+    Records the time spent in the body of the `with` statement as a span. The
+    yielded dictionary holds the arguments of the span; callers may add to it
+    to attach results such as status codes or byte counts.
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield args
+        return
+
+    start_time = time.time()
+    try:
+        yield args
+    finally:
+        tracer.add_span(name, category, start_time, time.time(), args)
+
+
+def finish():
+    """
+    Writes the recorded spans to the trace file and prints the summary table.
+    Does nothing when tracing was not started.
+    """
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is None:
+        return
+
+    try:
+        tracer.write()
+    except (IOError, OSError) as e:
+        sys.stderr.write('Unable to write trace to {0}: {1}\n'.format(tracer.location, e))
+        return
+
+    sys.stderr.write(os.linesep.join(tracer.summary()) + os.linesep)
+
+
+def _to_microseconds(seconds):
+    return int(round(seconds * 1000000))
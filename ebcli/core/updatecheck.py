@@ -0,0 +1,113 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Check for a newer release of the EB CLI without delaying any command.
+
+The latest version published on PyPI is fetched at most once per
+`CHECK_INTERVAL` by a daemon thread started when a command launches, and
+recorded on disk together with the time of the check. Commands only ever read
+that record, so a slow or unreachable PyPI never stalls them: the result of a
+fetch that has not finished when the command exits is simply discarded, and
+failed fetches are recorded too, so that they are not retried on every
+command.
+
+The check is skipped altogether when the `check_for_updates` setting of the
+`global` section of the EB CLI configuration is false.
+"""
+import json
+import threading
+import time
+
+from cement.utils.misc import minimal_logger
+
+from ebcli.core import fileoperations, usercache
+from ebcli.lib import utils
+
+LOG = minimal_logger(__name__)
+
+PYPI_URL = 'https://pypi.python.org/pypi/awsebcli/json'
+FETCH_TIMEOUT = 5
+CHECK_INTERVAL = 24 * 60 * 60
+ENABLED_SETTING = 'check_for_updates'
+CACHE_FILE_NAME = 'update_check.json'
+
+
+def cache_location(environ=None):
+    return usercache.cache_path(CACHE_FILE_NAME, environ)
+
+
+def is_enabled():
+    """
+    Returns whether the update check is enabled by the EB CLI configuration.
+    """
+    setting = fileoperations.get_config_setting('global', ENABLED_SETTING, default=True)
+    if isinstance(setting, str):
+        return setting.strip().lower() not in ('false', 'no', 'off', '0')
+    return bool(setting)
+
+
+def start():
+    """
+    Starts fetching the latest version of the EB CLI in a daemon thread,
+    unless the check is disabled or the recorded check is recent enough.
+    :return: the started thread, or None
+    """
+    if not is_enabled() or _is_fresh(load()):
+        return None
+    thread = threading.Thread(target=refresh, name='ebcli-update-check')
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+def refresh():
+    """
+    Fetches the latest version of the EB CLI from PyPI and records it on disk.
+    A failed fetch is recorded without a version.
+    """
+    latest_version = None
+    try:
+        data = json.loads(utils.decode_bytes(utils.get_data_from_url(PYPI_URL, timeout=FETCH_TIMEOUT)))
+        latest_version = data['info']['version']
+    except Exception as e:
+        LOG.debug('Could not fetch the latest version of the EB CLI: {0}'.format(e))
+    try:
+        usercache.write_json(cache_location(), {'checked_at': time.time(), 'latest_version': latest_version})
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def load():
+    try:
+        with open(cache_location()) as f:
+            recorded = json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+    return recorded if isinstance(recorded, dict) else {}
+
+
+def update_available(current_version):
+    """
+    Returns whether the most recently recorded latest version of the EB CLI
+    differs from `current_version`. Never fetches anything.
+    """
+    latest_version = load().get('latest_version')
+    return bool(latest_version) and latest_version != current_version
+
+
+def _is_fresh(recorded, now=None):
+    checked_at = recorded.get('checked_at')
+    if not isinstance(checked_at, (int, float)):
+        return False
+    now = time.time() if now is None else now
+    return 0 <= now - checked_at < CHECK_INTERVAL
@@ -0,0 +1,57 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+The per-user cache directory of the EB CLI, `$XDG_CACHE_HOME/ebcli`, or
+`~/.cache/ebcli` when XDG_CACHE_HOME is not set, and atomic writes of the JSON
+files kept in it.
+
+This module is imported by `ebcli.core.completioncache` on every Tab press, so
+it must only import from the standard library.
+"""
+import json
+import os
+import tempfile
+
+CACHE_DIRECTORY_NAME = 'ebcli'
+
+
+def cache_path(name, environ=None):
+    """
+    Returns the path of `name` under the cache directory of the EB CLI.
+    :param environ: the environment variables to resolve XDG_CACHE_HOME from,
+                    `os.environ` by default
+    """
+    environ = os.environ if environ is None else environ
+    cache_home = environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, CACHE_DIRECTORY_NAME, name)
+
+
+def write_json(location, contents, sort_keys=False):
+    """
+    Replaces the file at `location` with `contents` serialized as JSON, so that
+    concurrent readers see either the previous or the new contents, never a
+    partial write. The directory of `location` is created, private to the
+    user, if it does not exist.
+    """
+    directory = os.path.dirname(location)
+    if not os.path.isdir(directory):
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+    descriptor, temporary_location = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'w') as f:
+            json.dump(contents, f, sort_keys=sort_keys)
+        os.replace(temporary_location, location)
+    except BaseException:
+        if os.path.exists(temporary_location):
+            os.remove(temporary_location)
+        raise
@@ -0,0 +1,123 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+The workspace an `eb` command operates on: the directory containing the
+`.elasticbeanstalk` directory which is nearest to the working directory.
+
+Unlike `fileoperations.ProjectRoot.traverse`, which changes the working
+directory to the project root, a `Workspace` only holds absolute paths, so
+the helpers built on it can run from worker threads and never change the
+working directory of the process. The workspace of a working directory is
+looked up once and reused until a `.elasticbeanstalk` directory is created or
+removed through `forget`:
+
+    workspace = Workspace.current()
+    config_path = workspace.local_config_path
+"""
+import os
+import threading
+
+from cement.utils.misc import minimal_logger
+
+from ebcli.objects.exceptions import NotInitializedError
+
+LOG = minimal_logger(__name__)
+
+EB_DIRECTORY_NAME = '.elasticbeanstalk'
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+class Workspace(object):
+    def __init__(self, root):
+        """
+        :param root: absolute path of the directory containing `.elasticbeanstalk`
+        """
+        self.root = root
+        self.eb_directory = os.path.join(root, EB_DIRECTORY_NAME)
+        self.local_config_path = os.path.join(self.eb_directory, 'config.yml')
+        self.global_config_path = os.path.join(self.eb_directory, 'config.global.yml')
+        self.app_versions_directory = os.path.join(self.eb_directory, 'app_versions')
+        self.logs_directory = os.path.join(self.eb_directory, 'logs')
+        self.ebignore_path = os.path.join(root, '.ebignore')
+
+    def __eq__(self, other):
+        return isinstance(other, Workspace) and self.root == other.root
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.root)
+
+    def __repr__(self):
+        return 'Workspace({0!r})'.format(self.root)
+
+    @classmethod
+    def find(cls, start=None):
+        """
+        Returns the workspace containing the directory `start`, or the working
+        directory, without changing the working directory.
+        :raises NotInitializedError: if no parent directory contains `.elasticbeanstalk`
+        """
+        directory = os.path.abspath(start or os.getcwd())
+        while True:
+            if os.path.isdir(os.path.join(directory, EB_DIRECTORY_NAME)):
+                LOG.debug('Project root found at: ' + directory)
+                return cls(directory)
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                raise NotInitializedError('EB is not yet initialized')
+            directory = parent
+
+    @classmethod
+    def current(cls):
+        """
+        Returns the workspace of the working directory. The lookup is cached per
+        working directory for as long as the `.elasticbeanstalk` directory it
+        found exists.
+        """
+        cwd = os.getcwd()
+        with _cache_lock:
+            workspace = _cache.get(cwd)
+        if workspace is not None and os.path.isdir(workspace.eb_directory):
+            return workspace
+
+        workspace = cls.find(cwd)
+        with _cache_lock:
+            _cache[cwd] = workspace
+        return workspace
+
+    def path(self, *relative_path):
+        """
+        Returns the absolute path of `relative_path`, relative to the root of
+        the workspace.
+        """
+        return os.path.join(self.root, *relative_path)
+
+    def eb_path(self, *relative_path):
+        """
+        Returns the absolute path of `relative_path`, relative to the
+        `.elasticbeanstalk` directory of the workspace.
+        """
+        return os.path.join(self.eb_directory, *relative_path)
+
+
+def forget():
+    """
+    Forgets the workspaces looked up so far. Must be called whenever a
+    `.elasticbeanstalk` directory is created or removed.
+    """
+    with _cache_lock:
+        _cache.clear()
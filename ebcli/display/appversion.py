@@ -13,9 +13,11 @@
 import errno
 import locale
 import sys
+import threading
 import time
 
-from datetime import datetime, timedelta
+from collections import namedtuple
+from datetime import datetime
 from cement.utils.misc import minimal_logger
 from botocore.compat import six
 
@@ -78,41 +80,40 @@ class VersionScreen(Screen):
 
     def start_version_screen(self, data, table):
         """"Turn on and populate table 'versions' in screen with data"""
-        pages = True
         term.hide_cursor()
         self.turn_on_table(table)
         self.data = data
-        if not pages:
-            self.draw('app_versions')
-            term.reset_terminal()
-        else:
-            # Timeout at 19 minutes of inactivity since API's NextToken disappears at 20
-            self.idle_time = datetime.now()
-            timediff = timedelta(minutes=19)
-            while (datetime.now() - self.idle_time) < timediff:
-                try:
-                    self.draw('app_versions')
-                    term.reset_terminal()
-                    should_exit = self.handle_input()
-                    if should_exit:
-                        return
-
-                except IOError as e:
-                    if e.errno == errno.EINTR:  # Sometimes thrown while sleeping
-                        continue
-                    else:
-                        raise
+        while True:
+            try:
+                self.draw('app_versions')
+                term.reset_terminal()
+                should_exit = self.handle_input()
+                if should_exit:
+                    return
+                # Versions keep arriving in the background; redraw them from memory
+                self.data = self.poller.get_table_data()
+
+            except IOError as e:
+                if e.errno == errno.EINTR:  # Sometimes thrown while sleeping
+                    continue
+                else:
+                    raise
 
     def show_help_line(self):
-        text = u' (Commands: {q}uit, {d}elete, {l}ifecycle, {down} {up} {left} {right})'.format(
-            q=io.bold('Q'),
-            d=io.bold('D'),
-            l=io.bold('L'),
-            down=term.DOWN_ARROW,
-            up=term.UP_ARROW,
-            left=term.LEFT_ARROW,
-            right=term.RIGHT_ARROW
-        )
+        text = u' (Commands: {q}uit, {d}elete, {l}ifecycle, {f}ilter, {c}lear filter, ' \
+               u'{s}ort by {sort_key}, {down} {up} {left} {right})'.format(
+                   q=io.bold('Q'),
+                   d=io.bold('D'),
+                   l=io.bold('L'),
+                   f=io.bold('F'),
+                   c=io.bold('C'),
+                   s=io.bold('S'),
+                   sort_key=self.poller.sort_key,
+                   down=term.DOWN_ARROW,
+                   up=term.UP_ARROW,
+                   left=term.LEFT_ARROW,
+                   right=term.RIGHT_ARROW
+               )
         term.echo_line(text)
 
     def handle_input(self):
@@ -133,6 +134,14 @@ class VersionScreen(Screen):
                     return self.delete(t)
                 elif char == 'L':
                     return self.interactive_lifecycle(t)
+                elif char == 'F':
+                    return self.filter_versions(t)
+                elif char == 'C':
+                    self.poller.set_filter(None)
+                    self.flusher(t)
+                elif char == 'S':
+                    self.poller.next_sort_key()
+                    self.flusher(t)
                 elif val.name == 'KEY_DOWN':  # Down arrow
                     self._get_more_pages(t)
                 elif val.name == 'KEY_UP':  # Up arrow
@@ -152,7 +161,7 @@ class VersionScreen(Screen):
             self.tables[0].shift_col -= self.LENGTH_SHIFT
         elif not reverse and table.shift_col < self.MAX_SHIFT:
             # check if "Description" column data is long enough for scrolling
-            if table.get_widest_data_length_in_column(table.columns[4]) > self.MAX_SHIFT - 10:
+            if table.get_widest_data_length_in_column(table.columns[-1]) > self.MAX_SHIFT - 10:
                 table.shift_col += self.LENGTH_SHIFT
 
     def _get_more_pages(self, t):
@@ -167,6 +176,8 @@ class VersionScreen(Screen):
 
     def delete(self, t):
         """Return true upon successful completion, false if there was an exception"""
+        # Versions are numbered from the oldest one, which may still be loading
+        self.poller.wait_until_loaded()
         save = self.prompt_and_action(
             prompts['appversion.delete.prompt'].format(
                 len(self.poller.all_app_versions)
@@ -176,6 +187,12 @@ class VersionScreen(Screen):
         self.flusher(t)
         return save
 
+    def filter_versions(self, t):
+        """Always return back to the table"""
+        save = self.prompt_and_action(prompts['appversion.filter.prompt'], self.poller.set_filter)
+        self.flusher(t)
+        return save
+
     def interactive_lifecycle(self, t):
         """Always return back to the table"""
         self.flusher(t)
@@ -209,118 +226,273 @@ class VersionScreen(Screen):
         return should_exit_table
 
 
+AppVersionRecord = namedtuple(
+    'AppVersionRecord',
+    ['label', 'description', 'date_created', 'status']
+)
+
+
+class VersionCatalog(object):
+    """
+    The application versions of an application, requested once, page by page,
+    from DescribeApplicationVersions and kept in memory as compact records,
+    most recent first, along with the names of the environments each version
+    is deployed to. The first page is requested upfront; the next ones are
+    requested in the background so that the first page can be shown at once.
+    """
+    PAGE_SIZE = 100
+
+    SORT_BY_DATE = 'date'
+    SORT_BY_LABEL = 'label'
+    SORT_BY_STATUS = 'status'
+    SORT_BY_IN_USE = 'in use'
+    SORT_KEYS = [SORT_BY_DATE, SORT_BY_LABEL, SORT_BY_STATUS, SORT_BY_IN_USE]
+
+    def __init__(self, app_name, app_versions=None):
+        """
+        :param app_name: name of the application
+        :param app_versions: the ApplicationVersions of the application, if they
+                             were already retrieved, in which case no page is
+                             requested
+        """
+        self.app_name = app_name
+        self.records = []
+        self.in_use = {}
+        self.complete = False
+        self._condition = threading.Condition()
+        if app_versions is not None:
+            self.records = [self._to_record(app_version) for app_version in app_versions]
+            self.complete = True
+
+    def start(self):
+        """
+        Requests the first page of application versions and starts requesting
+        the remaining ones, and the environments of the application, in the
+        background.
+        """
+        if self.complete:
+            return
+        next_token = self._load_page(None)
+        loader = threading.Thread(target=self._load_remaining, args=(next_token,))
+        loader.daemon = True
+        loader.start()
+
+    def wait(self, count=None, timeout=None):
+        """
+        Waits until all the application versions, or the first `count` of them,
+        are loaded.
+        :return: whether they are
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self.complete or (count is not None and len(self.records) >= count),
+                timeout=timeout
+            )
+
+    def deploy_number(self, index):
+        """
+        Returns the number of the version at `index` in `records`, counting
+        from the oldest one, or None until all versions are loaded.
+        """
+        return len(self.records) - index if self.complete else None
+
+    def view(self, filter_text=None, sort_key=SORT_BY_DATE):
+        """
+        Returns the pairs of deploy number and record of the loaded versions
+        which match `filter_text`, sorted by `sort_key`.
+
+        `filter_text` is made of space-separated terms which must all match:
+        `status:<status>` matches versions with that status, `in-use` matches
+        versions deployed to an environment, `since:<date>` matches versions
+        created on or after that date, and any other term matches versions
+        whose label or description contains it.
+        """
+        with self._condition:
+            records = list(self.records)
+            in_use = dict(self.in_use)
+        rows = [(self.deploy_number(index), record) for index, record in enumerate(records)]
+        matches = _version_filter(filter_text, in_use)
+        rows = [row for row in rows if matches(row[1])]
+
+        if sort_key == self.SORT_BY_LABEL:
+            rows.sort(key=lambda row: row[1].label.lower())
+        elif sort_key == self.SORT_BY_STATUS:
+            rows.sort(key=lambda row: row[1].status or '')
+        elif sort_key == self.SORT_BY_IN_USE:
+            rows.sort(key=lambda row: row[1].label not in in_use)
+        return rows
+
+    def _load_remaining(self, next_token):
+        try:
+            self._load_environments()
+            while next_token:
+                next_token = self._load_page(next_token)
+        except Exception as e:
+            LOG.debug('Could not retrieve all application versions of {0}: {1}'.format(self.app_name, e))
+        finally:
+            with self._condition:
+                self.complete = True
+                self._condition.notify_all()
+
+    def _load_page(self, next_token):
+        response = elasticbeanstalk.get_application_versions(self.app_name, None, self.PAGE_SIZE, next_token)
+        records = [self._to_record(app_version) for app_version in response['ApplicationVersions']]
+        with self._condition:
+            self.records.extend(records)
+            self._condition.notify_all()
+        return response.get('NextToken')
+
+    def _load_environments(self):
+        in_use = {}
+        for environment in elasticbeanstalk.get_app_environments(self.app_name):
+            if environment.version_label:
+                in_use.setdefault(environment.version_label, []).append(environment.name)
+        with self._condition:
+            self.in_use = in_use
+
+    @staticmethod
+    def _to_record(app_version):
+        return AppVersionRecord(
+            app_version.get(u'VersionLabel'),
+            app_version.get(u'Description'),
+            app_version.get(u'DateCreated'),
+            app_version.get(u'Status'),
+        )
+
+
+def _version_filter(filter_text, in_use):
+    terms = (filter_text or '').lower().split()
+
+    def matches(record):
+        for filter_term in terms:
+            if filter_term == 'in-use':
+                if record.label not in in_use:
+                    return False
+            elif filter_term.startswith('status:'):
+                if (record.status or '').lower() != filter_term[len('status:'):]:
+                    return False
+            elif filter_term.startswith('since:'):
+                date_created = record.date_created
+                if not isinstance(date_created, datetime) or \
+                        date_created.strftime('%Y-%m-%d') < filter_term[len('since:'):]:
+                    return False
+            elif filter_term not in (record.label or '').lower() and \
+                    filter_term not in (record.description or '').lower():
+                return False
+        return True
+
+    return matches
+
+
 class VersionDataPoller(DataPoller):
-    def __init__(self, app_name, env_name, all_app_versions):
+    def __init__(self, app_name, env_name, all_app_versions=None):
         super(VersionDataPoller, self).__init__(app_name, env_name)
-        self.next_token = None
-        self.history = []
         self.curr_page = 0
-
-        self.all_app_versions = all_app_versions
-        self.app_versions = []
-        self.list_len_left = len(all_app_versions)
+        self.filter_text = None
+        self.sort_key = VersionCatalog.SORT_BY_DATE
+        self.catalog = VersionCatalog(app_name, all_app_versions)
 
         self.env = None
-        self.curr_deploy_num = None
-        self.env_data = {}
-
         if self.env_name is not None:
-            # If we have a default environment, save current env status into env_data
             self.env = elasticbeanstalk.get_environment(app_name=self.app_name, env_name=self.env_name)
-            self.curr_deploy_num = self.get_curr_deploy_num()
-            self.env_data = self.get_env_data()
 
     PAGE_LENGTH = 10
 
+    @property
+    def all_app_versions(self):
+        return [
+            {
+                u'VersionLabel': record.label,
+                u'Description': record.description,
+                u'DateCreated': record.date_created,
+                u'Status': record.status,
+            }
+            for record in self.catalog.records
+        ]
+
     def get_version_data(self):
         """
-        Gets app_versions data by pages. Pages that were already accessed would be
-        stored in history
-
-        Then modifies app_versions: add SinceCreated field and format DateCreated
-        field for each version in app_versions. Paginates, so appends PAGE_LENGTH
-        versions with each call
+        Starts loading the application versions and returns the first page of
+        them, which is shown while the next ones are loaded in the background.
 
         :returns data object with two keys: environment and app_versions
         note: environment data would be None if no environment is specified
         """
-
-        if self.list_len_left <= 0:
-            return self.get_table_data()
-
-        if self.next_token:
-            response = elasticbeanstalk.get_application_versions(
-                self.app_name,
-                None,
-                self.PAGE_LENGTH,
-                self.next_token
-            )
-        else:
-            response = elasticbeanstalk.get_application_versions(
-                self.app_name,
-                None,
-                self.PAGE_LENGTH
-            )
-
-        new_page_versions = response['ApplicationVersions']
-        self.next_token = None
-        if u'NextToken' in response:
-            self.next_token = response['NextToken']
-
-        self.prep_version_data(new_page_versions)
-        self.history.append(self.app_versions)
-        self.curr_page += 1
-
+        self.catalog.start()
+        self.curr_page = 1
         return self.get_table_data()
 
-    def prep_version_data(self, page_table_data):
-        if self.list_len_left < self.PAGE_LENGTH:
-            page_range = self.list_len_left
-        else:
-            page_range = self.PAGE_LENGTH
-        for x in range(page_range):
-            page_table_data[x]['DeployNum'] = self.list_len_left - x
-            if isinstance(page_table_data[x][u'DateCreated'], datetime):
-                page_table_data[x][u'SinceCreated'] = format_time_since(page_table_data[x][u'DateCreated'])
-                page_table_data[x][u'DateCreated'] = get_local_time(page_table_data[x][u'DateCreated']) \
-                    .strftime("%Y/%m/%d %H:%M")
-            else:
-                page_table_data[x][u'SinceCreated'] = None
-                page_table_data[x][u'DateCreated'] = None
-        self.list_len_left -= page_range
-        self.app_versions = page_table_data
-
     def get_next_page_data(self):
-        if self.curr_page < len(self.history):  # page cached in local memory
+        self.catalog.wait(count=(self.curr_page + 1) * self.PAGE_LENGTH, timeout=5)
+        if self.curr_page * self.PAGE_LENGTH < len(self._view()):
             self.curr_page += 1
-            self.app_versions = self.history[self.curr_page - 1]
-            data = self.get_table_data()
-        else:  # must retrieve next page of paginated data
-            data = self.get_version_data()
-        return data
+        return self.get_table_data()
 
     def get_previous_page_data(self):
         if self.curr_page > 1:
             self.curr_page -= 1
-            self.app_versions = self.history[self.curr_page - 1]
         return self.get_table_data()
 
+    def set_filter(self, filter_text):
+        """
+        Shows the versions matching `filter_text`, from the first page.
+        :return: False, to remain in the versions table
+        """
+        self.filter_text = filter_text
+        self.curr_page = 1
+        return False
+
+    def next_sort_key(self):
+        """
+        Sorts the versions by the sort key following the current one.
+        """
+        keys = VersionCatalog.SORT_KEYS
+        self.sort_key = keys[(keys.index(self.sort_key) + 1) % len(keys)]
+        self.curr_page = 1
+
+    def wait_until_loaded(self):
+        self.catalog.wait()
+
     def get_env_data(self):
+        if self.env is None:
+            return {}
         return {'EnvironmentName': self.env.name,
                 'Color': self.env.health,
                 'Status': self.env.status,
-                'CurrDeployNum': self.curr_deploy_num,
+                'CurrDeployNum': self.get_curr_deploy_num(),
                 }
 
     def get_table_data(self):
-        return {'environment': self.env_data,
-                'app_versions': self.app_versions
+        start = max(self.curr_page - 1, 0) * self.PAGE_LENGTH
+        page = self._view()[start:start + self.PAGE_LENGTH]
+        return {'environment': self.get_env_data(),
+                'app_versions': [self._to_row(deploy_num, record) for deploy_num, record in page],
                 }
 
     def get_curr_deploy_num(self):
+        if not self.catalog.complete:
+            return None
         curr_deploy_num = 0
-        for x in range(len(self.all_app_versions)):
-            if self.all_app_versions[x][u'VersionLabel'] == self.env.version_label:
-                curr_deploy_num = len(self.all_app_versions) - x
+        for index, record in enumerate(self.catalog.records):
+            if record.label == self.env.version_label:
+                curr_deploy_num = self.catalog.deploy_number(index)
                 break
         return curr_deploy_num
+
+    def _view(self):
+        return self.catalog.view(self.filter_text, self.sort_key)
+
+    def _to_row(self, deploy_num, record):
+        row = {
+            'DeployNum': deploy_num,
+            u'VersionLabel': record.label,
+            u'Description': record.description,
+            u'Status': record.status,
+            u'InUse': ', '.join(self.catalog.in_use.get(record.label, [])),
+            u'SinceCreated': None,
+            u'DateCreated': None,
+        }
+        if isinstance(record.date_created, datetime):
+            row[u'SinceCreated'] = format_time_since(record.date_created)
+            row[u'DateCreated'] = get_local_time(record.date_created).strftime("%Y/%m/%d %H:%M")
+        return row
@@ -15,8 +15,8 @@ from operator import itemgetter
 
 from ebcli.core.abstractcontroller import AbstractBaseController
 from ebcli.resources.strings import strings
-from ebcli.lib import elasticbeanstalk, utils
-from ebcli.core import io
+from ebcli.lib import aws, elasticbeanstalk, utils
+from ebcli.core import completioncache, io
 from ebcli.objects.exceptions import ServiceError
 
 
@@ -83,6 +83,7 @@ class CleanupVersionsController(AbstractBaseController):
             label = version['VersionLabel']
             try:
                 elasticbeanstalk.delete_application_version(app_name, label)
+                completioncache.remove_version(aws.get_region_name(), app_name, label)
             except ServiceError as e:
                 io.log_warning('Error deleting version {0}. Error: {1}'
                                .format(label, e.message))
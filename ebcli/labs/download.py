@@ -18,7 +18,7 @@ from ebcli.core.abstractcontroller import AbstractBaseController
 from ebcli.resources.strings import strings
 from ebcli.objects.exceptions import NotFoundError
 from ebcli.core import io, fileoperations
-from ebcli.lib import elasticbeanstalk, s3, heuristics, cloudformation, utils
+from ebcli.lib import elasticbeanstalk, s3, heuristics, cloudformation, download
 
 
 class DownloadController(AbstractBaseController):
@@ -47,24 +47,20 @@ def download_source_bundle(app_name, env_name):
         source_bundle = app_version['SourceBundle']
         bucket_name = source_bundle['S3Bucket']
         key_name = source_bundle['S3Key']
-        io.echo('Downloading application version...')
-        data = s3.get_object(bucket_name, key_name)
         filename = get_filename(key_name)
+        location = _get_download_location(filename)
+        io.echo('Downloading application version...')
+        s3.download_object(bucket_name, key_name, location)
     else:
         template = cloudformation.get_template('awseb-' + env.id + '-stack')
         try:
             url = template['TemplateBody']['Parameters']['AppSource']['Default']
         except KeyError:
             raise NotFoundError('Can not find app source for environment')
-        utils.get_data_from_url(url)
+        location = _get_download_location('sample.zip')
         io.echo('Downloading application version...')
-        data = utils.get_data_from_url(url, timeout=30)
-        filename = 'sample.zip'
+        download.download_url(url, location, timeout=30)
 
-    fileoperations.make_eb_dir('downloads/')
-    location = fileoperations.get_eb_file_full_location(
-        'downloads/' + filename)
-    fileoperations.write_to_data_file(location, data)
     io.echo('Application version downloaded to:', location)
 
     cwd = os.getcwd()
@@ -78,6 +74,11 @@ def download_source_bundle(app_name, env_name):
         os.chdir(cwd)
 
 
+def _get_download_location(filename):
+    fileoperations.make_eb_dir('downloads/')
+    return fileoperations.get_eb_file_full_location('downloads/' + filename)
+
+
 def get_filename(url):
     pattern = re.compile('^(?:.*[/])*([^/]+)$')
     matcher = re.match(pattern, url)
@@ -25,7 +25,8 @@ from botocore.loaders import Loader
 from cement.utils.misc import minimal_logger
 
 from ebcli import __version__
-from ebcli.core import fileoperations
+from ebcli.core import fileoperations, tracing
+from ebcli.lib import debuglog
 from ebcli.lib.botopatch import apply_patches
 from ebcli.lib.utils import static_var
 from ebcli.objects.exceptions import ServiceError, NotAuthorizedError, \
@@ -39,15 +40,22 @@ LOG = minimal_logger(__name__)
 BOTOCORE_DATA_FOLDER_NAME = 'botocoredata'
 
 _api_clients = {}
+_session_cache = {}
+_client_cache = {}
 _profile = None
 _profile_env_var = 'AWS_EB_PROFILE'
 _id = None
 _key = None
 _region_name = None
 _verify_ssl = True
-_endpoint_url = None
+_endpoint_urls = {}
 _debug = False
 
+# The service whose endpoint `--endpoint-url` overrides when given a bare URL,
+# and the key of an endpoint overriding those of every service
+DEFAULT_ENDPOINT_SERVICE = 'elasticbeanstalk'
+ALL_SERVICES = '*'
+
 apply_patches()
 
 
@@ -56,11 +64,13 @@ def _flush():
     global _api_clients, _profile, _id, _key, _region_name, _verify_ssl
     _api_clients = {}
     _get_botocore_session.botocore_session = None
+    clear_session_cache()
     _profile = None
     _id = None
     _key = None
     _region_name = None
     _verify_ssl = True
+    _endpoint_urls.clear()
 
 
 def set_session_creds(id, key):
@@ -97,8 +107,41 @@ def set_region(region_name):
 
 
 def set_endpoint_url(endpoint_url):
-    global _endpoint_url
-    _endpoint_url = endpoint_url
+    """
+    Overrides the endpoints of the services the EB CLI calls.
+    :param endpoint_url: the URL of the Elastic Beanstalk endpoint, or a
+                         comma-separated list of `service=URL` pairs, such as
+                         `s3=http://127.0.0.1:8000,logs=http://127.0.0.1:8001`,
+                         where a service of `*` stands for every service without
+                         an endpoint of its own
+    """
+    global _api_clients
+    _endpoint_urls.update(parse_endpoint_urls(endpoint_url))
+
+    # invalidate all old clients
+    _api_clients = {}
+
+
+def parse_endpoint_urls(endpoint_url):
+    """
+    Returns the endpoint URL of each service given with `set_endpoint_url`.
+    :raises ValidationError: if a `service=URL` pair misses its service or URL
+    """
+    if '=' not in endpoint_url:
+        return {DEFAULT_ENDPOINT_SERVICE: endpoint_url}
+
+    endpoint_urls = {}
+    for pair in endpoint_url.split(','):
+        service_name, _, url = pair.partition('=')
+        if not service_name.strip() or not url.strip():
+            raise ValidationError('Invalid endpoint override "{0}". Specify endpoints as SERVICE=URL, '
+                                  'separated by commas.'.format(pair))
+        endpoint_urls[service_name.strip()] = url.strip()
+    return endpoint_urls
+
+
+def get_endpoint_url(service_name):
+    return _endpoint_urls.get(service_name) or _endpoint_urls.get(ALL_SERVICES)
 
 
 def no_verify_ssl():
@@ -117,19 +160,89 @@ def set_debug():
     _debug = True
 
 
+def get_session_settings():
+    """
+    :return: the settings which determine the session and clients used for API calls,
+             in a form that can be handed to `apply_session_settings`
+    """
+    return {
+        'profile': _profile,
+        'profile_env_var': _profile_env_var,
+        'region': _region_name,
+        'endpoint_urls': dict(_endpoint_urls),
+        'verify_ssl': _verify_ssl,
+        'debug': _debug,
+    }
+
+
+def apply_session_settings(settings):
+    global _api_clients, _profile, _profile_env_var, _region_name, _endpoint_urls, _verify_ssl, _debug
+    _profile = settings['profile']
+    _profile_env_var = settings['profile_env_var']
+    _region_name = settings['region']
+    _endpoint_urls = dict(settings['endpoint_urls'])
+    _verify_ssl = settings['verify_ssl']
+    _debug = settings['debug']
+    _get_botocore_session.botocore_session = None
+    _api_clients = {}
+
+
+def get_client_service_names():
+    return sorted(_api_clients)
+
+
+def warm_up(service_names):
+    """
+    Creates the session and the clients of `service_names` for the current settings
+    ahead of their use, and resolves or refreshes their credentials, so that commands
+    which later use the same settings in this process, or in processes forked from
+    it, do not pay for it.
+    """
+    for service_name in service_names:
+        _get_client(service_name)
+
+    credentials = _get_botocore_session().get_credentials()
+    if credentials is not None:
+        credentials.get_frozen_credentials()
+
+
+def clear_session_cache():
+    """
+    Forgets the sessions and clients kept for previously used settings, which is
+    needed when the shared AWS config or credentials files change.
+    """
+    _session_cache.clear()
+    _client_cache.clear()
+
+
+def _session_cache_key():
+    aws_environment = tuple(sorted(
+        (name, value) for name, value in os.environ.items() if name.startswith('AWS_')
+    ))
+    return _profile, _profile_env_var, _region_name, _debug, aws_environment
+
+
 def _set_user_agent_for_session(session):
     session.user_agent_name = 'eb-cli'
     session.user_agent_version = __version__
 
 
+@static_var('data_loader', None)
 def _get_data_loader():
     # Creates a botocore data loader that loads custom data files
-    # FIRST, creating a precedence for custom files.
+    # FIRST, creating a precedence for custom files. The loader is shared
+    # by all sessions so that service models are only read once.
+    if _get_data_loader.data_loader is not None:
+        return _get_data_loader.data_loader
+
     data_folder = os.path.join(os.path.dirname(os.path.realpath(__file__)),
                                BOTOCORE_DATA_FOLDER_NAME)
 
-    return Loader(extra_search_paths=[data_folder, Loader.BUILTIN_DATA_PATH],
-                  include_default_search_paths=False)
+    _get_data_loader.data_loader = Loader(
+        extra_search_paths=[data_folder, Loader.BUILTIN_DATA_PATH],
+        include_default_search_paths=False
+    )
+    return _get_data_loader.data_loader
 
 
 def _get_client(service_name):
@@ -139,10 +252,24 @@ def _get_client(service_name):
         return _api_clients[service_name]
 
     session = _get_botocore_session()
-    if service_name == 'elasticbeanstalk':
-        endpoint_url = _endpoint_url
-    else:
-        endpoint_url = None
+    endpoint_url = get_endpoint_url(service_name)
+    config = Config(signature_version='s3v4')
+    if endpoint_url and service_name == 's3':
+        # Bucket names can't be resolved as subdomains of a stand-in endpoint
+        config = config.merge(Config(s3={'addressing_style': 'path'}))
+
+    cache_key = (
+        _session_cache_key(),
+        service_name,
+        endpoint_url,
+        aws_access_key_id,
+        aws_secret_key,
+        _verify_ssl,
+    )
+    if cache_key in _client_cache:
+        _api_clients[service_name] = _client_cache[cache_key]
+        return _client_cache[cache_key]
+
     try:
         LOG.debug('Creating new Botocore Client for ' + str(service_name))
         client = session.create_client(service_name,
@@ -150,19 +277,25 @@ def _get_client(service_name):
                                        aws_access_key_id=aws_access_key_id,
                                        aws_secret_access_key=aws_secret_key,
                                        verify=_verify_ssl,
-                                       config=Config(signature_version='s3v4'))
+                                       config=config)
 
     except botocore.exceptions.ProfileNotFound as e:
         raise InvalidProfileError(e)
     LOG.debug('Successfully created session for ' + service_name)
 
     _api_clients[service_name] = client
+    _client_cache[cache_key] = client
     return client
 
 
 @static_var('botocore_session', None)
 def _get_botocore_session():
     if _get_botocore_session.botocore_session is None:
+        cache_key = _session_cache_key()
+        if cache_key in _session_cache:
+            _get_botocore_session.botocore_session = _session_cache[cache_key]
+            return _session_cache[cache_key]
+
         LOG.debug('Creating new Botocore Session')
         LOG.debug('Botocore version: {0}'.format(botocore.__version__))
         session = botocore.session.get_session({
@@ -173,6 +306,7 @@ def _get_botocore_session():
         session.register_component('data_loader', _get_data_loader())
         _set_user_agent_for_session(session)
         _get_botocore_session.botocore_session = session
+        _session_cache[cache_key] = session
         if _debug:
             session.set_debug_logger()
 
@@ -183,6 +317,13 @@ def get_region_name():
     return _region_name
 
 
+def get_session_profile():
+    """
+    :return: the name of the profile whose credentials API calls are made with
+    """
+    return _get_botocore_session().profile or 'default'
+
+
 def get_credentials():
     client_creds = _get_client('elasticbeanstalk')._request_signer._credentials
     return botocore.credentials.Credentials(
@@ -206,17 +347,22 @@ def make_api_call(service_name, operation_name, **operation_options):
     while True:
         attempt += 1
         if attempt > 1:
-            LOG.debug('Retrying -- attempt #' + str(attempt))
+            debuglog.debug(LOG, 'Retrying -- attempt #{0}', attempt)
         _sleep(_get_delay(attempt))
         try:
-            LOG.debug('Making api call: (' +
-                      service_name + ', ' + operation_name +
-                      ') to region: ' + region + ' with args:' + str(operation_options))
-            response_data = operation(**operation_options)
+            debuglog.debug(
+                LOG,
+                'Making api call: ({0}, {1}) to region: {2} with args:{3}',
+                service_name,
+                operation_name,
+                region,
+                debuglog.Payload(operation_options)
+            )
+            response_data = _traced_call(operation, service_name, operation_name, attempt, operation_options)
             status = response_data['ResponseMetadata']['HTTPStatusCode']
-            LOG.debug('API call finished, status = ' + str(status))
+            debuglog.debug(LOG, 'API call finished, status = {0}', status)
             if response_data:
-                LOG.debug('Response: ' + str(response_data))
+                debuglog.debug(LOG, 'Response: {0}', debuglog.Payload(response_data))
 
             return response_data
 
@@ -261,12 +407,47 @@ def make_api_call(service_name, operation_name, **operation_options):
             raise ServiceError(error)
 
 
+def _traced_call(operation, service_name, operation_name, attempt, operation_options):
+    with tracing.span(
+            '{0}.{1}'.format(service_name, operation_name),
+            tracing.API_CALL,
+            service=service_name,
+            operation=operation_name,
+            attempt=attempt,
+    ) as span_args:
+        if tracing.is_enabled():
+            span_args['request_bytes'] = _body_size(operation_options.get('Body'))
+        try:
+            response_data = operation(**operation_options)
+        except botocore.exceptions.ClientError as e:
+            span_args['status'] = e.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+            raise
+        metadata = response_data.get('ResponseMetadata', {})
+        span_args['status'] = metadata.get('HTTPStatusCode')
+        content_length = metadata.get('HTTPHeaders', {}).get('content-length')
+        span_args['response_bytes'] = int(content_length) if content_length else None
+        return response_data
+
+
+def _body_size(body):
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if hasattr(body, 'getbuffer'):
+        return body.getbuffer().nbytes
+    try:
+        return os.fstat(body.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
 def _handle_response_code(response_data, attempt, aggregated_error_message):
     max_attempts = 10
 
-    LOG.debug('Response: ' + str(response_data))
+    debuglog.debug(LOG, 'Response: {0}', debuglog.Payload(response_data))
     status = response_data['ResponseMetadata']['HTTPStatusCode']
-    LOG.debug('API call finished, status = ' + str(status))
+    debuglog.debug(LOG, 'API call finished, status = {0}', status)
     try:
         message = str(response_data['Error']['Message'])
     except KeyError:
@@ -337,7 +518,7 @@ def _get_delay(attempt_number):
     # Exponential backoff
     rand_int = random.randrange(0, 2**attempt_number)
     delay = rand_int * 0.05  # delay time is 50 ms
-    LOG.debug('Sleeping for ' + str(delay) + ' seconds.')
+    debuglog.debug(LOG, 'Sleeping for {0} seconds.', delay)
     return delay
 
 
@@ -372,7 +553,10 @@ def _handle_500_error(aggregated_error_message):
 
 
 def _sleep(delay):
-    time.sleep(delay)
+    if not delay:
+        return
+    with tracing.span('retry backoff', tracing.WAIT, seconds=delay):
+        time.sleep(delay)
 
 
 class InvalidParameterValueError(ServiceError):
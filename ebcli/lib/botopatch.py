@@ -16,11 +16,14 @@ Apply botocore fixes as monkey patches.
 This allows us to use any version of botocore.
 """
 import datetime
+import logging
 import time
 
 from dateutil import tz
 from botocore import parsers
 
+from ebcli.lib import debuglog
+
 
 def fix_botocore_to_pass_response_date():
     """
@@ -46,8 +49,13 @@ def fix_botocore_to_pass_response_date():
             always be present.
 
         """
-        LOG.debug('Response headers: %s', response['headers'])
-        LOG.debug('Response body:\n%s', response['body'])
+        # BEGIN PATCH
+        # Dump the response only when botocore debug logging is enabled, and
+        # cap and redact it
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug('Response headers: %s', response['headers'])
+            LOG.debug('Response body:\n%s', debuglog.Payload(response['body']))
+        # END PATCH
         if response['status_code'] >= 301:
             parsed = self._do_error_parse(response, shape)
         else:
@@ -27,34 +27,65 @@ def _make_api_call(operation_name, **operation_options):
 
 
 def events(stack_name, start_time=None):
+    """
+    Returns the events of `stack_name` logged after `start_time`, or all of
+    them, most recent first.
+    """
     LOG.debug('Inside describe_stack_events api wrapper')
+    return list(reversed(StackEventCursor(stack_name, start_time=start_time).poll()))
 
-    next_token = None
-    _events = []
 
+class StackEventCursor(object):
+    """
+    Polls the events of a CloudFormation stack, only ever requesting the pages
+    of DescribeStackEvents holding events it did not return yet: it remembers
+    the newest event it returned and stops paging as soon as it reaches it.
+    """
+    def __init__(self, stack_name, start_time=None):
+        """
+        :param stack_name: name or ID of the stack
+        :param start_time: datetime after which the events of the first poll were logged
+        """
+        self.stack_name = stack_name
+        self.start_time = start_time
+        self.last_event_id = None
+
+    def poll(self):
+        """
+        Returns the events logged since the last poll, oldest first.
+        """
+        new_events = []
+        for page in _stack_event_pages(self.stack_name):
+            seen_event = next((index for index, event in enumerate(page) if self._seen(event)), None)
+            new_events.extend(page[:seen_event])
+            if seen_event is not None:
+                break
+
+        if new_events:
+            self.last_event_id = new_events[0].event_id
+        return list(reversed(new_events))
+
+    def _seen(self, event):
+        if self.last_event_id is not None:
+            return event.event_id == self.last_event_id
+        return self.start_time is not None and not event.happened_after(self.start_time)
+
+
+def _stack_event_pages(stack_name):
+    """
+    Yields the pages of the events of `stack_name`, most recent first. The
+    next page is only requested if the previous one was consumed.
+    """
+    kwargs = {}
     while True:
-        if next_token:
-            result = _make_api_call(
-                'describe_stack_events',
-                StackName=stack_name,
-                NextToken=next_token
-            )
-        else:
-            result = _make_api_call('describe_stack_events', StackName=stack_name)
+        result = _make_api_call('describe_stack_events', StackName=stack_name, **kwargs)
+        yield CFNEvent.json_to_event_objects(result['StackEvents'])
 
-        _events.extend(CFNEvent.json_to_event_objects(result['StackEvents']))
         next_token = result.get('NextToken')
-
         if not next_token:
-            break
-
-        if start_time and _events and not _events[-1].happened_after(start_time):
-            break
+            return
         utils.prevent_throttling()
-
-    if start_time:
-        return [event for event in _events if event.happened_after(start_time)]
-    return _events
+        kwargs['NextToken'] = next_token
 
 
 def get_template(stack_name):
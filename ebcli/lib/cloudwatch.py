@@ -24,17 +24,25 @@ def get_all_stream_names(log_group_name, log_stream_name_prefix=None):
     Return all stream names under the log group.
     param: log_group_name: str
     """
-    streams = describe_log_streams(
-        log_group_name=log_group_name,
-        log_stream_name_prefix=log_stream_name_prefix,
-    )
-
-    streams = streams or {}
+    log_streams = []
+    next_token = None
+    while True:
+        streams = describe_log_streams(
+            log_group_name=log_group_name,
+            log_stream_name_prefix=log_stream_name_prefix,
+            next_token=next_token,
+        )
+
+        streams = streams or {}
+        log_streams.extend(streams.get('logStreams', []))
+        next_token = streams.get('nextToken')
+        if not next_token:
+            break
 
     return [
         log_stream.name
         for log_stream
-        in LogStream.log_stream_objects_from_json(streams.get('logStreams', []))
+        in LogStream.log_stream_objects_from_json(log_streams)
     ]
 
 
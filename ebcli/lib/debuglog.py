@@ -0,0 +1,147 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Debug logging for the API call path that costs nothing unless debug logging
+is enabled.
+
+`debug` only formats its message when the logger would emit it, and `Payload`
+wraps a request, response or raw body so that it is only rendered, with
+secrets redacted and its length capped, when the message is formatted:
+
+    debuglog.debug(LOG, 'Response: {0}', debuglog.Payload(response_data))
+"""
+import logging
+import re
+
+MAX_PAYLOAD_LENGTH = 8192
+REDACTED = '<redacted>'
+
+_SENSITIVE_KEY = re.compile(r'secret|password|passwd|token|credential|authorization|private.?key', re.IGNORECASE)
+_NOT_SENSITIVE_KEYS = {'NextToken', 'nextToken', 'ClientToken', 'ClientRequestToken'}
+_ENVIRONMENT_PROPERTIES_NAMESPACE = 'aws:elasticbeanstalk:application:environment'
+# Values of sensitive fields in raw XML and JSON bodies
+_SENSITIVE_XML_ELEMENT = re.compile(
+    r'<((?:\w*:)?(?!NextToken|ClientToken|ClientRequestToken)\w*(?:Secret|Password|Token|Credential)\w*)>[^<]*</\1>'
+)
+_SENSITIVE_JSON_FIELD = re.compile(
+    r'("(?!NextToken|nextToken|ClientToken|ClientRequestToken)\w*(?:[Ss]ecret|[Pp]assword|[Tt]oken|[Cc]redential)\w*"\s*:\s*)'
+    r'"(?:[^"\\]|\\.)*"'
+)
+
+
+def is_enabled(logger):
+    """
+    Returns whether `logger`, a logger returned by cement's `minimal_logger`
+    or a standard library logger, emits debug messages.
+    """
+    backend = getattr(logger, 'backend', logger)
+    if not backend.isEnabledFor(logging.DEBUG):
+        return False
+    return getattr(logger, 'logging_is_enabled', True)
+
+
+def debug(logger, message, *args):
+    """
+    Logs `message.format(*args)` at debug level, formatting it only when
+    `logger` emits debug messages.
+    """
+    if is_enabled(logger):
+        logger.debug(message.format(*args) if args else message)
+
+
+class Payload(object):
+    """
+    A value to log, rendered lazily like `str()` with sensitive fields
+    redacted, and cut to `limit` characters. Rendering stops as soon as the
+    limit is reached, so a huge response costs no more to log than its first
+    `limit` characters.
+    """
+
+    def __init__(self, value, limit=None):
+        self.value = value
+        self.limit = MAX_PAYLOAD_LENGTH if limit is None else limit
+
+    def __str__(self):
+        if isinstance(self.value, (bytes, bytearray)):
+            rendered = _redact_text(bytes(self.value[:self.limit + 1]).decode('utf-8', 'replace'))
+        elif isinstance(self.value, str):
+            rendered = _redact_text(self.value[:self.limit + 1])
+        else:
+            parts = []
+            try:
+                _render(self.value, parts, [self.limit + 1])
+            except _LimitReached:
+                pass
+            rendered = ''.join(parts)
+        if len(rendered) > self.limit:
+            rendered = '{0}... (truncated to {1} characters)'.format(rendered[:self.limit], self.limit)
+        return rendered
+
+    __repr__ = __str__
+
+
+class _LimitReached(Exception):
+    pass
+
+
+def _render(value, parts, budget, redact_value=False):
+    """
+    Appends the `str()` of `value`, with sensitive fields redacted, to
+    `parts` until `budget[0]` characters have been appended.
+    """
+    value_type = type(value)
+    if redact_value and value is not None:
+        _append(repr(REDACTED), parts, budget)
+    elif value_type is dict:
+        redact_environment_property = (
+            value.get('Namespace') == _ENVIRONMENT_PROPERTIES_NAMESPACE and 'Value' in value
+        )
+        _append('{', parts, budget)
+        for index, (key, item) in enumerate(value.items()):
+            if index:
+                _append(', ', parts, budget)
+            _append(repr(key) + ': ', parts, budget)
+            _render(
+                item,
+                parts,
+                budget,
+                _is_sensitive(key) or (redact_environment_property and key == 'Value')
+            )
+        _append('}', parts, budget)
+    elif value_type is list or value_type is tuple:
+        _append('[' if value_type is list else '(', parts, budget)
+        for index, item in enumerate(value):
+            if index:
+                _append(', ', parts, budget)
+            _render(item, parts, budget)
+        if value_type is tuple and len(value) == 1:
+            _append(',', parts, budget)
+        _append(']' if value_type is list else ')', parts, budget)
+    else:
+        _append(repr(value), parts, budget)
+
+
+def _append(text, parts, budget):
+    parts.append(text)
+    budget[0] -= len(text)
+    if budget[0] <= 0:
+        raise _LimitReached()
+
+
+def _is_sensitive(key):
+    return isinstance(key, str) and key not in _NOT_SENSITIVE_KEYS and bool(_SENSITIVE_KEY.search(key))
+
+
+def _redact_text(text):
+    text = _SENSITIVE_XML_ELEMENT.sub(lambda match: '<{0}>{1}</{0}>'.format(match.group(1), REDACTED), text)
+    return _SENSITIVE_JSON_FIELD.sub(lambda match: '{0}"{1}"'.format(match.group(1), REDACTED), text)
@@ -0,0 +1,157 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Download engine shared by the commands that pull application versions down to
+the user's machine.
+
+Objects are split into byte ranges which are fetched concurrently and written
+straight into their offsets in a preallocated file, so memory usage is bounded
+by `BUFFER_SIZE` per worker regardless of the size of the object.
+"""
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.compat import six
+from cement.utils.misc import minimal_logger
+
+from ebcli.objects.exceptions import DownloadError
+
+urllib = six.moves.urllib
+LOG = minimal_logger(__name__)
+
+PART_SIZE = 8 * 1024 * 1024
+BUFFER_SIZE = 64 * 1024
+THREAD_COUNT = 8
+
+
+class _RangeNotHonouredError(DownloadError):
+    """
+    Raised when a server that advertises support for byte ranges answers a
+    ranged request with anything but the requested range.
+    """
+
+
+def download_ranges(location, size, fetch_range, part_size=None, thread_count=None):
+    """
+    Downloads an object of `size` bytes to `location` by fetching its byte ranges
+    concurrently.
+
+    :param location: path of the file to write the object to
+    :param size: size of the object in bytes
+    :param fetch_range: callable accepting the first and last byte offsets (inclusive)
+                        of a range and returning a file-like object to read the range from
+    :param part_size: number of bytes to request per range; defaults to `PART_SIZE`
+    :param thread_count: maximum number of ranges to fetch at the same time; defaults to `THREAD_COUNT`
+    """
+    part_size = part_size or PART_SIZE
+    thread_count = thread_count or THREAD_COUNT
+    ranges = [
+        (start, min(start + part_size, size) - 1)
+        for start in range(0, size, part_size)
+    ]
+    LOG.debug('Downloading {0} bytes to {1} in {2} parts'.format(size, location, len(ranges)))
+
+    with open(location, 'wb') as f:
+        f.truncate(size)
+
+    if not ranges:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(thread_count, len(ranges))) as executor:
+        futures = [
+            executor.submit(_download_range, location, start, end, fetch_range)
+            for start, end in ranges
+        ]
+        for future in futures:
+            future.result()
+
+    downloaded_size = os.path.getsize(location)
+    if downloaded_size != size:
+        raise DownloadError(
+            'Downloaded {0} bytes to {1}, but expected {2} bytes.'.format(downloaded_size, location, size)
+        )
+
+
+def download_url(url, location, timeout=30, part_size=None, thread_count=None):
+    """
+    Downloads the resource at `url` to `location`. Servers that advertise support for
+    byte ranges are downloaded through concurrent ranged requests; other resources,
+    and those whose server ignores the ranges requested, are streamed to disk
+    through a single request.
+    """
+    size = _get_url_content_length(url, timeout)
+    if size is not None and size > (part_size or PART_SIZE):
+        def fetch_range(start, end):
+            request = urllib.request.Request(url, headers={'Range': 'bytes={0}-{1}'.format(start, end)})
+            response = urllib.request.urlopen(request, timeout=timeout)
+            content_range = response.headers.get('Content-Range') or ''
+            if response.status != 206 or not content_range.startswith('bytes {0}-{1}/'.format(start, end)):
+                response.close()
+                raise _RangeNotHonouredError(
+                    'Requested bytes {0}-{1}, but received status {2} with Content-Range "{3}".'.format(
+                        start, end, response.status, content_range)
+                )
+            return response
+
+        try:
+            download_ranges(location, size, fetch_range, part_size=part_size, thread_count=thread_count)
+            return
+        except _RangeNotHonouredError as e:
+            LOG.debug('Downloading {0} through a single request instead: {1}'.format(url, e))
+
+    response = urllib.request.urlopen(url, timeout=timeout)
+    try:
+        with open(location, 'wb') as f:
+            shutil.copyfileobj(response, f, BUFFER_SIZE)
+    finally:
+        response.close()
+
+
+def _download_range(location, start, end, fetch_range):
+    expected = end - start + 1
+    body = fetch_range(start, end)
+    written = 0
+    try:
+        with open(location, 'r+b') as f:
+            f.seek(start)
+            while written < expected:
+                data = body.read(min(BUFFER_SIZE, expected - written))
+                if not data:
+                    break
+                f.write(data)
+                written += len(data)
+    finally:
+        body.close()
+
+    if written != expected:
+        raise DownloadError(
+            'Received {0} bytes for range {1}-{2}, but expected {3} bytes.'.format(written, start, end, expected)
+        )
+
+
+def _get_url_content_length(url, timeout):
+    try:
+        response = urllib.request.urlopen(urllib.request.Request(url, method='HEAD'), timeout=timeout)
+    except (urllib.error.URLError, ValueError) as e:
+        LOG.debug('Unable to determine the size of {0}: {1}'.format(url, e))
+        return None
+
+    try:
+        if response.headers.get('Accept-Ranges') != 'bytes':
+            return None
+        return int(response.headers.get('Content-Length'))
+    except (TypeError, ValueError):
+        return None
+    finally:
+        response.close()
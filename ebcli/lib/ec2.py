@@ -130,6 +130,12 @@ def describe_security_group(security_group_id):
     return result['SecurityGroups'][0]
 
 
+def describe_security_groups(security_group_ids):
+    result = _make_api_call('describe_security_groups',
+                            GroupIds=security_group_ids)
+    return result['SecurityGroups']
+
+
 def terminate_instance(instance_id):
     return _make_api_call('terminate_instances',
                           InstanceIds=[instance_id])
@@ -728,6 +728,32 @@ def get_new_events(app_name, env_name, request_id,
     return Event.json_to_event_objects(result['Events'])
 
 
+def describe_events(app_name=None, env_name=None, platform_arn=None,
+                    start_time=None, max_records=None, next_token=None):
+    """
+    Returns one page of the events of an environment or platform, most recent
+    first, along with the `NextToken` of the next page if there is one.
+    :param start_time: datetime at or after which the events were logged
+    """
+    LOG.debug('Inside describe_events api wrapper')
+    kwargs = {}
+    if app_name:
+        kwargs['ApplicationName'] = app_name
+    if env_name:
+        kwargs['EnvironmentName'] = env_name
+    if platform_arn:
+        kwargs['PlatformArn'] = platform_arn
+    if start_time:
+        kwargs['StartTime'] = start_time
+    if max_records:
+        kwargs['MaxRecords'] = max_records
+    if next_token:
+        time.sleep(0.1)  # To avoid throttling we sleep for 100ms before requesting the next page
+        kwargs['NextToken'] = next_token
+    result = _make_api_call('describe_events', **kwargs)
+    return Event.json_to_event_objects(result['Events']), result.get('NextToken')
+
+
 def get_storage_location():
     LOG.debug('Inside get_storage_location api wrapper')
     response = _make_api_call('create_storage_location')
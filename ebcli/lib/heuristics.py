@@ -81,11 +81,11 @@ def has_index_html():
     return _contains_file_types('index.html')
 
 
-def directory_is_empty():
+def directory_is_empty(directory='./'):
     """
     Directory contains no files or folders (ignore dot-files)
     """
-    lst = [f for f in os.listdir('./') if not f.startswith('.')]
+    lst = [f for f in os.listdir(directory) if not f.startswith('.')]
     if len(lst) < 1:
         return True
     else:
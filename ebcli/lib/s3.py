@@ -11,6 +11,7 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import hashlib
 import os
 from io import BytesIO
 import math
@@ -19,14 +20,16 @@ import threading
 
 from cement.utils.misc import minimal_logger
 
-from ebcli.lib import aws
+from ebcli.lib import aws, download
 from ebcli.objects.exceptions import (
+    DownloadError,
     EndOfTestError,
     NotFoundError,
     FileTooLargeError,
     UploadError
 )
-from ebcli.core import fileoperations, io
+from ebcli.core import io, tracing
+from ebcli.core.workspace import Workspace
 from ebcli.lib.utils import static_var
 
 
@@ -107,6 +110,49 @@ def get_object(bucket, key):
     return result['Body'].read()
 
 
+def download_object(bucket, key, location):
+    """
+    Downloads the object, `key`, into the file at `location` through concurrent
+    ranged GETs, without holding the object in memory. Every range is requested
+    with the ETag of the object so that a concurrent overwrite fails the download
+    rather than corrupting it, and the ETag of objects uploaded in a single part
+    is verified against the MD5 digest of the downloaded file.
+
+    :param bucket: S3 bucket name
+    :param key: keyname of the object to download
+    :param location: full path of the file to write the object to
+    """
+    head = _make_api_call('head_object', Bucket=bucket, Key=key)
+    size = head['ContentLength']
+    etag = head['ETag']
+
+    def fetch_range(start, end):
+        return _make_api_call(
+            'get_object',
+            Bucket=bucket,
+            Key=key,
+            Range='bytes={0}-{1}'.format(start, end),
+            IfMatch=etag
+        )['Body']
+
+    download.download_ranges(location, size, fetch_range)
+
+    if '-' not in etag and head.get('ServerSideEncryption') != 'aws:kms':
+        digest = _md5_of_file(location)
+        if digest != etag.strip('"'):
+            raise DownloadError(
+                'The checksum of {0} does not match the ETag of s3://{1}/{2}.'.format(location, bucket, key)
+            )
+
+
+def _md5_of_file(location):
+    md5 = hashlib.md5()
+    with open(location, 'rb') as f:
+        for data in iter(lambda: f.read(download.BUFFER_SIZE), b''):
+            md5.update(data)
+    return md5.hexdigest()
+
+
 def delete_objects(bucket, keys):
     objects = [dict(Key=k) for k in keys]
     result = _make_api_call('delete_objects',
@@ -116,10 +162,10 @@ def delete_objects(bucket, keys):
 
 
 def upload_workspace_version(bucket, key, file_path, workspace_type='Application', relative_to_project_root=True):
-    cwd = os.getcwd()
+    given_file_path = file_path
+    if relative_to_project_root and not os.path.isabs(file_path):
+        file_path = Workspace.current().path(file_path)
     try:
-        if relative_to_project_root:
-            fileoperations.ProjectRoot.traverse()
         size = os.path.getsize(file_path)
     except OSError as err:
         if err.errno == 2:
@@ -127,21 +173,20 @@ def upload_workspace_version(bucket, key, file_path, workspace_type='Application
                 '{0} Version does not exist locally ({1}).'
                 ' Try uploading the Application Version again.'.format(
                     workspace_type,
-                    err.filename
+                    given_file_path
                 )
             )
         raise err
-    finally:
-        os.chdir(cwd)
 
     LOG.debug('Upload {0} Version. File size = {1}'.format(workspace_type, str(size)))
     if size > 536870912:
         raise FileTooLargeError('Archive cannot be any larger than 512MB')
-    if size < 7340032:
-        result = simple_upload(bucket, key, file_path)
+    with tracing.span('upload version', tracing.UPLOAD, key=key, bytes=size):
+        if size < 7340032:
+            result = simple_upload(bucket, key, file_path)
 
-    else:
-        result = multithreaded_upload(bucket, key, file_path)
+        else:
+            result = multithreaded_upload(bucket, key, file_path)
     return result
 
 
@@ -257,18 +302,19 @@ def _upload_chunk(f, lock, etaglist, total_parts, bucket, key, upload_id):
         # First check to see if s3 already has part
         for i in range(0, 5):
             try:
-                etag = _get_part_etag(bucket, key, part, upload_id)
-                if etag is None:
-                    b = BytesIO()
-                    b.write(data)
-                    b.seek(0)
-                    response = _make_api_call('upload_part',
-                                              Bucket=bucket,
-                                              Key=key,
-                                              UploadId=upload_id,
-                                              Body=b,
-                                              PartNumber=part)
-                    etag = response['ETag']
+                with tracing.span('upload part', tracing.UPLOAD, part=part, attempt=i + 1, bytes=len(data)):
+                    etag = _get_part_etag(bucket, key, part, upload_id)
+                    if etag is None:
+                        b = BytesIO()
+                        b.write(data)
+                        b.seek(0)
+                        response = _make_api_call('upload_part',
+                                                  Bucket=bucket,
+                                                  Key=key,
+                                                  UploadId=upload_id,
+                                                  Body=b,
+                                                  PartNumber=part)
+                        etag = response['ETag']
 
                 etaglist.append({'PartNumber': part, 'ETag': etag})
 
@@ -0,0 +1,211 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Concurrent, resumable downloads of many files over SFTP.
+
+A `TransferManager` downloads a list of `RemoteFile`s, whose size and SHA-256
+digest are known beforehand, over a small pool of SFTP channels. Files that
+are already present locally with the expected size and digest are skipped,
+and a download is written to a `.part` file next to its destination which is
+only renamed once its digest matches, so an interrupted transfer resumes
+where it stopped the next time it runs:
+
+    manager = TransferManager(lambda: connection.client.open_sftp())
+    summary = manager.download(remote_files, local_directory)
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from cement.utils.misc import minimal_logger
+
+LOG = minimal_logger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+PARTIAL_SUFFIX = '.part'
+_CHUNK_SIZE = 1024 * 1024
+
+RemoteFile = namedtuple('RemoteFile', ['path', 'relative_path', 'size', 'sha256'])
+"""
+A file to download: its path on the remote host, its '/'-separated path
+relative to the local directory to download it to, its size in bytes and
+its hex SHA-256 digest, which is None when it is not known.
+"""
+
+
+class TransferSummary(object):
+    def __init__(self):
+        self.downloaded = []
+        self.skipped = []
+        self.failed = []
+        self.bytes_transferred = 0
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self):
+        """
+        Bytes transferred per second.
+        """
+        return self.bytes_transferred / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __str__(self):
+        return (
+            'Downloaded {0} file(s), {1:.1f} MB in {2:.1f} seconds ({3:.1f} MB/s); '
+            '{4} file(s) already up to date, {5} failed'.format(
+                len(self.downloaded),
+                self.bytes_transferred / 1024.0 / 1024.0,
+                self.elapsed,
+                self.throughput / 1024.0 / 1024.0,
+                len(self.skipped),
+                len(self.failed),
+            )
+        )
+
+
+class TransferManager(object):
+    def __init__(self, open_channel, concurrency=DEFAULT_CONCURRENCY):
+        """
+        :param open_channel: callable returning a new SFTP channel, such as a
+                             `paramiko.SFTPClient`: an object with `open(path, mode)`
+                             and `close()`
+        :param concurrency: maximum number of channels to download over
+        """
+        self.open_channel = open_channel
+        self.concurrency = max(1, concurrency)
+        self._local = threading.local()
+        self._channels = []
+        self._lock = threading.Lock()
+
+    def download(self, remote_files, local_directory):
+        """
+        Downloads `remote_files` under `local_directory`, skipping those
+        already present there.
+        :return: a TransferSummary; files that could not be downloaded are
+                 listed with their error in its `failed` attribute
+        """
+        summary = TransferSummary()
+        started_at = time.time()
+        pending = []
+        for remote_file in remote_files:
+            local_path = local_path_of(remote_file, local_directory)
+            if is_up_to_date(remote_file, local_path):
+                summary.skipped.append(remote_file)
+            else:
+                pending.append((remote_file, local_path))
+
+        try:
+            if pending:
+                with ThreadPoolExecutor(max_workers=min(self.concurrency, len(pending))) as executor:
+                    futures = [
+                        (remote_file, executor.submit(self._download, remote_file, local_path))
+                        for remote_file, local_path in pending
+                    ]
+                    for remote_file, future in futures:
+                        try:
+                            summary.bytes_transferred += future.result()
+                            summary.downloaded.append(remote_file)
+                        except Exception as e:
+                            LOG.debug('Failed to download {0}: {1}'.format(remote_file.path, e))
+                            summary.failed.append((remote_file, e))
+        finally:
+            self._close_channels()
+        summary.elapsed = time.time() - started_at
+        return summary
+
+    def _channel(self):
+        channel = getattr(self._local, 'channel', None)
+        if channel is None:
+            channel = self.open_channel()
+            self._local.channel = channel
+            with self._lock:
+                self._channels.append(channel)
+        return channel
+
+    def _close_channels(self):
+        with self._lock:
+            channels, self._channels = self._channels, []
+        for channel in channels:
+            try:
+                channel.close()
+            except Exception:
+                pass
+        self._local = threading.local()
+
+    def _download(self, remote_file, local_path):
+        """
+        Downloads `remote_file` to `local_path`, resuming from what an earlier
+        attempt left in its partial file if that is a prefix of the expected
+        size, and restarting once from scratch if the result does not match
+        the expected digest.
+        :return: the number of bytes transferred
+        """
+        directory = os.path.dirname(local_path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        partial_path = local_path + PARTIAL_SUFFIX
+        transferred = 0
+        for attempt in range(2):
+            offset = os.path.getsize(partial_path) if os.path.isfile(partial_path) else 0
+            if attempt or offset > remote_file.size:
+                offset = 0
+            transferred += self._fetch(remote_file, partial_path, offset)
+
+            if remote_file.sha256 is None or file_sha256(partial_path) == remote_file.sha256.lower():
+                os.replace(partial_path, local_path)
+                return transferred
+            LOG.debug('Digest mismatch for {0}, downloading it again'.format(remote_file.path))
+
+        os.remove(partial_path)
+        raise IOError('The downloaded file does not match the digest of {0}'.format(remote_file.path))
+
+    def _fetch(self, remote_file, partial_path, offset):
+        transferred = 0
+        with self._channel().open(remote_file.path, 'rb') as remote, open(partial_path, 'ab' if offset else 'wb') as local:
+            if offset:
+                remote.seek(offset)
+            prefetch = getattr(remote, 'prefetch', None)
+            if prefetch:
+                prefetch(remote_file.size)
+            for chunk in iter(lambda: remote.read(_CHUNK_SIZE), b''):
+                local.write(chunk)
+                transferred += len(chunk)
+        return transferred
+
+
+def local_path_of(remote_file, local_directory):
+    return os.path.join(local_directory, *remote_file.relative_path.split('/'))
+
+
+def is_up_to_date(remote_file, local_path):
+    """
+    Returns whether `local_path` holds `remote_file`: it has the same size,
+    and the same digest if that is known.
+    """
+    try:
+        if os.path.getsize(local_path) != remote_file.size:
+            return False
+    except OSError:
+        return False
+    return remote_file.sha256 is None or file_sha256(local_path) == remote_file.sha256.lower()
+
+
+def file_sha256(location):
+    digest = hashlib.sha256()
+    with open(location, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -191,6 +191,10 @@ class UploadError(EBCLIException):
     """
 
 
+class DownloadError(EBCLIException):
+    pass
+
+
 class WorkerQueueNotFound(EBCLIException):
     """ A worker queue could not be found for a worker environment """
 
@@ -17,12 +17,14 @@ import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from cement.utils.misc import minimal_logger
 from cement.utils.shell import exec_cmd
 
 from ebcli.lib import utils
 from ebcli.core import fileoperations, io
+from ebcli.core.workspace import Workspace
 from ebcli.objects.exceptions import (
     CommandError,
     NotInitializedError,
@@ -31,6 +33,7 @@ from ebcli.objects.exceptions import (
 from ebcli.resources.strings import git_ignore, strings
 
 LOG = minimal_logger(__name__)
+SUBMODULE_ARCHIVE_THREAD_COUNT = 4
 
 
 class SourceControl(object):
@@ -45,7 +48,7 @@ class SourceControl(object):
     def get_current_branch(self):
         pass
 
-    def do_zip(self, location, staged=False):
+    def do_zip(self, location, staged=False, project_root=None, include_submodules=None):
         pass
 
     def set_up_ignore_file(self):
@@ -89,9 +92,12 @@ class NoSC(SourceControl):
     def get_current_branch(self):
         return 'default'
 
-    def do_zip(self, location, staged=False):
+    def do_zip(self, location, staged=False, project_root=None, include_submodules=None):
         io.log_info('Creating zip using systems zip')
-        fileoperations.zip_up_project(location)
+        if project_root:
+            fileoperations.zip_up_project(location, project_root=project_root)
+        else:
+            fileoperations.zip_up_project(location)
 
     def get_message(self):
         return NoSC.DEFAULT_MESSAGE
@@ -215,9 +221,22 @@ class Git(SourceControl):
         LOG.debug(stdout)
         return stdout
 
-    def do_zip_submodule(self, main_location, sub_location, staged=False, submodule_dir=None):
+    def do_zip_submodule(self, main_location, sub_location, staged=False, submodule_dir=None, project_root=None):
+        self.archive_submodule(sub_location, staged=staged, submodule_dir=submodule_dir, project_root=project_root)
+
+        fileoperations.zip_append_archive(main_location, sub_location)
+        fileoperations.delete_file(sub_location)
+
+    def archive_submodule(self, sub_location, staged=False, submodule_dir=None, project_root=None):
+        """
+        Creates a zip archive at `sub_location` of the submodule at `submodule_dir`,
+        whose members are prefixed with the path of the submodule. When `project_root`
+        is given, git runs inside the submodule instead of the current working
+        directory, which allows several submodules to be archived concurrently.
+        """
+        submodule_root = os.path.join(project_root, submodule_dir) if project_root else None
         if staged:
-            commit_id, stderr, exitcode = self._run_cmd(['git', 'write-tree'])
+            commit_id, stderr, exitcode = self._run_cmd(['git', 'write-tree'], cwd=submodule_root)
 
         else:
             commit_id = 'HEAD'
@@ -227,50 +246,78 @@ class Git(SourceControl):
         # individually zip submodules if there are any
         stdout, stderr, exitcode = self._run_cmd(['git', 'archive', '-v', '--format=zip',
                                                   '--prefix', os.path.join(submodule_dir, ''),
-                                                  '-o', sub_location, commit_id])
+                                                  '-o', sub_location, commit_id],
+                                                 cwd=submodule_root)
         io.log_info('git archive output: {0}'.format(stderr))
 
-        fileoperations.zip_append_archive(main_location, sub_location)
-        fileoperations.delete_file(sub_location)
+    def do_zip(self, location, staged=False, project_root=None, include_submodules=None):
+        """
+        Creates a zip archive at `location` of the project containing the current
+        working directory, or of the one at `project_root`. git runs in the
+        project and the working directory is left alone, which allows several
+        projects to be archived concurrently. `include_submodules` stands for the
+        `include_git_submodules` setting, which is read from the configuration
+        when it is None.
+        """
+        workspace = Workspace.find(project_root) if project_root else Workspace.current()
+        if include_submodules is None:
+            include_submodules = fileoperations.get_config_setting(
+                'global', 'include_git_submodules', workspace=workspace)
+        project_root = project_root or workspace.root
 
-    def do_zip(self, location, staged=False):
-        cwd = os.getcwd()
-        try:
-            fileoperations.ProjectRoot.traverse()
+        if staged:
+            commit_id, stderr, exitcode = self._run_cmd(['git', 'write-tree'], cwd=project_root)
+        else:
+            commit_id = 'HEAD'
 
-            if staged:
-                commit_id, stderr, exitcode = self._run_cmd(['git', 'write-tree'])
-            else:
-                commit_id = 'HEAD'
-
-            io.log_info('creating zip using git archive {0}'.format(commit_id))
-            stdout, stderr, exitcode = self._run_cmd(
-                ['git', 'archive', '-v', '--format=zip',
-                 '-o', location, commit_id])
-            io.log_info('git archive output: {0}'.format(stderr))
-
-            project_root = os.getcwd()
-
-            must_zip_submodules = fileoperations.get_config_setting('global', 'include_git_submodules')
-
-            if must_zip_submodules:
-                stdout, stderr, exitcode = self._run_cmd(['git', 'submodule', 'foreach', '--recursive'])
-
-                for index, line in enumerate(stdout.splitlines()):
-                    submodule_dir = line.split(' ')[1].strip('\'')
-                    os.chdir(os.path.join(project_root, submodule_dir))
-                    self.do_zip_submodule(
-                        location,
-                        "{0}_{1}".format(
-                            location,
-                            str(index)
-                        ),
+        io.log_info('creating zip using git archive {0}'.format(commit_id))
+        stdout, stderr, exitcode = self._run_cmd(
+            ['git', 'archive', '-v', '--format=zip',
+             '-o', location, commit_id],
+            cwd=project_root)
+        io.log_info('git archive output: {0}'.format(stderr))
+
+        if include_submodules:
+            stdout, stderr, exitcode = self._run_cmd(['git', 'submodule', 'foreach', '--recursive'],
+                                                     cwd=project_root)
+
+            submodule_dirs = [line.split(' ')[1].strip('\'') for line in stdout.splitlines()]
+            self._zip_submodules(location, project_root, submodule_dirs, staged=staged)
+
+    def _zip_submodules(self, location, project_root, submodule_dirs, staged=False):
+        """
+        Archives the submodules concurrently, then appends their members to the
+        archive at `location` in the order in which git listed the submodules.
+        """
+        if not submodule_dirs:
+            return
+
+        sub_locations = [
+            "{0}_{1}".format(location, str(index))
+            for index in range(len(submodule_dirs))
+        ]
+        try:
+            thread_count = min(SUBMODULE_ARCHIVE_THREAD_COUNT, len(submodule_dirs))
+            with ThreadPoolExecutor(max_workers=thread_count) as executor:
+                futures = [
+                    executor.submit(
+                        self.archive_submodule,
+                        sub_location,
                         staged=staged,
-                        submodule_dir=submodule_dir
+                        submodule_dir=submodule_dir,
+                        project_root=project_root
                     )
+                    for submodule_dir, sub_location in zip(submodule_dirs, sub_locations)
+                ]
+                for future in futures:
+                    future.result()
 
+            for sub_location in sub_locations:
+                fileoperations.zip_append_archive(location, sub_location)
         finally:
-            os.chdir(cwd)
+            for sub_location in sub_locations:
+                if os.path.exists(sub_location):
+                    fileoperations.delete_file(sub_location)
 
     def get_message(self):
         stdout, stderr, exitcode = self._run_cmd(
@@ -300,22 +347,15 @@ class Git(SourceControl):
                 f.write('{}\n'.format(line))
 
     def clean_up_ignore_file(self):
-        cwd = os.getcwd()
-        try:
-            fileoperations.ProjectRoot.traverse()
+        in_section = False
+        for line in fileinput.input(Workspace.current().path('.gitignore'), inplace=True):
+            if line.startswith(git_ignore[0]):
+                in_section = True
+            if not line.strip():
+                in_section = False
 
-            in_section = False
-            for line in fileinput.input('.gitignore', inplace=True):
-                if line.startswith(git_ignore[0]):
-                    in_section = True
-                if not line.strip():
-                    in_section = False
-
-                if not in_section:
-                    print(line, end='')
-
-        finally:
-            os.chdir(cwd)
+            if not in_section:
+                print(line, end='')
 
     def push_codecommit_code(self):
         io.log_info('Pushing local code to codecommit with git-push')
@@ -514,8 +554,8 @@ class Git(SourceControl):
         self._run_cmd(
             ['git', 'config', '--local', '--replace-all', 'credential.helper', credential_helper_command()])
 
-    def _run_cmd(self, cmd, handle_exitcode=True):
-        stdout, stderr, exitcode = exec_cmd(cmd)
+    def _run_cmd(self, cmd, handle_exitcode=True, cwd=None):
+        stdout, stderr, exitcode = exec_cmd(cmd, cwd=cwd)
 
         stdout = utils.decode_bytes(stdout).strip()
         stderr = utils.decode_bytes(stderr).strip()
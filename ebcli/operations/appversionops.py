@@ -12,11 +12,11 @@
 # language governing permissions and limitations under the License.
 from cement.utils.misc import minimal_logger
 
-from ebcli.core import io, fileoperations
+from ebcli.core import completioncache, io, fileoperations
 from ebcli.display.appversion import term, VersionScreen, VersionDataPoller
 from ebcli.display.table import Table, Column
 from ebcli.display.help import ViewlessHelpTable
-from ebcli.lib import elasticbeanstalk as elasticbeanstalk
+from ebcli.lib import aws, elasticbeanstalk as elasticbeanstalk
 from ebcli.objects.exceptions import ValidationError, NotFoundError
 from ebcli.operations import commonops, gitops, buildspecops
 from ebcli.resources.strings import prompts, strings
@@ -96,6 +96,7 @@ def delete_app_version_label(app_name, version_label):
             delete_successful = False
         else:
             elasticbeanstalk.delete_application_version(app_name, version_label)
+            completioncache.remove_version(aws.get_region_name(), app_name, version_label)
             io.echo('Application Version deleted successfully.')
             delete_successful = True
 
@@ -104,11 +105,11 @@ def delete_app_version_label(app_name, version_label):
         raise NotFoundError(strings['appversion.delete.none'])
 
 
-def display_versions(app_name, env_name, app_versions, timeout_in_minutes=5):
+def display_versions(app_name, env_name, app_versions=None, timeout_in_minutes=5):
     """Displays version history in birth order in a table.
     Creates poller, screen, and table.
-    Displays Deploy#, Version Label, Description, Date Created, Ago.
-    Returns the current version deployment number.
+    Displays Deploy#, Version Label, Date Created, Age, Status, In Use, Description.
+    Versions are retrieved once, in the background, unless `app_versions` are given.
     """
     poller = VersionDataPoller(app_name, env_name, app_versions)
     screen = VersionScreen(poller)
@@ -130,6 +131,8 @@ def _create_version_table(screen):
         Column('Version Label', None, 'VersionLabel', 'left'),
         Column('Date Created', None, 'DateCreated', 'left'),
         Column('Age', None, 'SinceCreated', 'left'),
+        Column('Status', None, 'Status', 'left'),
+        Column('In Use', None, 'InUse', 'left'),
         Column('Description', None, 'Description', 'left'),
     ]))
     screen.add_help_table(ViewlessHelpTable())
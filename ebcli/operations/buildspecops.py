@@ -15,8 +15,8 @@ import time
 
 from datetime import timedelta
 from cement.utils.misc import minimal_logger
-from ebcli.core import io
-from ebcli.lib import elasticbeanstalk, codebuild, utils
+from ebcli.core import completioncache, io, tracing
+from ebcli.lib import aws, elasticbeanstalk, codebuild, utils
 from ebcli.objects.exceptions import ServiceError, ValidationError
 
 from ebcli.resources.strings import strings
@@ -74,6 +74,7 @@ def stream_build_configuration_app_version_creation(app_name, app_version_label,
         LOG.debug("Caught service error while creating application version '{0}' "
                   "deleting the created application version as it is useless now.".format(app_version_label))
         elasticbeanstalk.delete_application_version(app_name, app_version_label)
+        completioncache.remove_version(aws.get_region_name(), app_name, app_version_label)
         raise exception
 
 
@@ -147,7 +148,8 @@ def wait_for_app_version_attribute(app_name, version_labels, timeout=5):
 
 
 def _sleep():
-    time.sleep(4)
+    with tracing.span('poll sleep', tracing.WAIT, seconds=4):
+        time.sleep(4)
 
 
 def _timeout_reached(start_time, timediff):
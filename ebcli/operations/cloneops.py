@@ -15,9 +15,9 @@ import re
 
 from cement.utils.misc import minimal_logger
 
-from ebcli.lib import elasticbeanstalk, utils
+from ebcli.lib import aws, elasticbeanstalk, utils
 from ebcli.lib.aws import InvalidParameterValueError
-from ebcli.core import io
+from ebcli.core import completioncache, io
 from ebcli.resources.strings import strings, responses, prompts
 from ebcli.operations import commonops
 
@@ -52,7 +52,9 @@ def make_cloned_env(clone_request, nohang=False, timeout=None):
 def clone_env(clone_request):
     while True:
         try:
-            return elasticbeanstalk.clone_environment(clone_request)
+            result, request_id = elasticbeanstalk.clone_environment(clone_request)
+            completioncache.add_environment(aws.get_region_name(), result.app_name, result.name)
+            return result, request_id
         except InvalidParameterValueError as e:
             LOG.debug('cloning env returned error: ' + e.message)
             if re.match(responses['env.cnamenotavailable'], e.message):
@@ -24,9 +24,10 @@ from cement.utils.misc import minimal_logger
 from cement.utils.shell import exec_cmd
 
 from ebcli.operations import buildspecops
-from ebcli.core import fileoperations, io
+from ebcli.core import artifactcache, completioncache, fileoperations, io, tracing
 from ebcli.core.ebglobals import Constants
-from ebcli.lib import aws, ec2, elasticbeanstalk, heuristics, iam, s3, utils, codecommit
+from ebcli.core.workspace import Workspace
+from ebcli.lib import aws, cloudformation, ec2, elasticbeanstalk, heuristics, iam, s3, utils, codecommit
 from ebcli.lib.aws import InvalidParameterValueError
 from ebcli.objects.exceptions import (
     CredentialsError,
@@ -52,11 +53,23 @@ from ebcli.resources.statics import iam_documents, iam_attributes
 
 LOG = minimal_logger(__name__)
 
+OPERATION_SUCCEEDED = 'Succeeded'
+OPERATION_FAILED = 'Failed'
+OPERATION_TIMED_OUT = 'TimedOut'
+ENVIRONMENT_STACK_NAME_FORMAT = 'awseb-{0}-stack'
+
 
 def wait_for_success_events(request_id, timeout_in_minutes=None,
                             sleep_time=5, stream_events=True, can_abort=False,
                             streamer=None, app_name=None, env_name=None, version_label=None,
-                            platform_arn=None, timeout_error_message=None, log_events=False):
+                            platform_arn=None, timeout_error_message=None, log_events=False,
+                            stack_events=False):
+    """
+    Streams the events of the request `request_id`, or of the environment
+    `env_name`, until one of them reports that the request succeeded.
+    :param stack_events: also stream the events of the CloudFormation stack
+                         of the environment, to show the progress of its resources
+    """
     if timeout_in_minutes == 0:
         return
     if timeout_in_minutes is None:
@@ -74,6 +87,7 @@ def wait_for_success_events(request_id, timeout_in_minutes=None,
         streamer.prompt += strings['events.abortmessage']
 
     events = []
+    stack_event_cursor = None
 
     safe_to_quit = True
     if version_label is not None and request_id is None:
@@ -146,6 +160,15 @@ def wait_for_success_events(request_id, timeout_in_minutes=None,
                 _raise_if_error_event(event.message)
                 if _is_success_event(event.message, log_events):
                     return
+
+            if stack_events and stream_events and env_name:
+                if stack_event_cursor is None:
+                    stack_event_cursor = _environment_stack_event_cursor(env_name, start)
+                stack_events = stack_event_cursor is not None and _stream_stack_events(
+                    stack_event_cursor,
+                    streamer,
+                    safe_to_quit
+                )
     finally:
         streamer.end_stream()
 
@@ -155,6 +178,42 @@ def wait_for_success_events(request_id, timeout_in_minutes=None,
     raise TimeoutError(timeout_error_message)
 
 
+def _environment_stack_event_cursor(env_name, start_time):
+    """
+    Returns a cursor over the events of the CloudFormation stack of the
+    environment `env_name` logged after `start_time`, or None if the
+    environment can't be described.
+    """
+    try:
+        environment = elasticbeanstalk.get_environment(env_name=env_name)
+    except (NotFoundError, NotAuthorizedError, ServiceError) as e:
+        LOG.debug('Not streaming the stack events of {0}: {1}'.format(env_name, e))
+        return None
+    return cloudformation.StackEventCursor(
+        ENVIRONMENT_STACK_NAME_FORMAT.format(environment.id),
+        start_time=start_time
+    )
+
+
+def _stream_stack_events(cursor, streamer, safe_to_quit):
+    """
+    Streams the stack events `cursor` returns since it was last polled.
+    :return: whether to keep polling `cursor`, which is not the case if
+             the stack events can't be described
+    """
+    try:
+        stack_events = cursor.poll()
+    except (NotAuthorizedError, ServiceError) as e:
+        if 'does not exist' in str(e):
+            return True
+        LOG.debug('Not streaming the events of {0} any more: {1}'.format(cursor.stack_name, e))
+        return False
+
+    for stack_event in stack_events:
+        streamer.stream_event(get_stack_event_string(stack_event), safe_to_quit=safe_to_quit)
+    return True
+
+
 def filter_events(events, version_label=None, request_id=None, env_name=None):
     """
     Method filters events by their version_label, request_id, or env_name if supplied,
@@ -246,6 +305,76 @@ def wait_for_compose_events(request_id, app_name, grouped_envs, timeout_in_minut
     io.log_error(strings['timeout.error'])
 
 
+def wait_for_multiple_success_events(app_name, request_ids, timeout_in_minutes=None,
+                                     sleep_time=5, stream_events=True, start_time=None):
+    """
+    Method waits for several concurrent environment operations through a single
+    multiplexed event stream: every poll issues one `DescribeEvents` call scoped to
+    the application, and each returned event is routed to the environment whose
+    request it belongs to.
+
+    :param app_name: name of the application the environments belong to
+    :param request_ids: a dict mapping environment names to the ids of the requests being waited on
+    :param timeout_in_minutes: time after which the environments still pending are reported as timed out
+    :param sleep_time: number of seconds to wait between polls
+    :param stream_events: whether to print the events of the environments as they arrive
+    :param start_time: time from which to stream events; defaults to the current time
+    :return: a dict mapping each environment name to a tuple of its final status and the
+             message of the event that determined it
+    """
+    if timeout_in_minutes is None:
+        timeout_in_minutes = 10
+
+    start = utils.datetime_utcnow()
+    timediff = timedelta(seconds=timeout_in_minutes * 60)
+    last_time = start_time or start
+
+    pending_environments = dict((request_id, env_name) for env_name, request_id in request_ids.items())
+    results = dict()
+
+    streamer = io.get_event_streamer()
+    try:
+        while pending_environments and not _timeout_reached(start, timediff):
+            _sleep(sleep_time)
+
+            events = elasticbeanstalk.get_new_events(
+                app_name,
+                None,
+                None,
+                last_event_time=last_time
+            )
+
+            for event in reversed(events):
+                last_time = max(last_time, event.event_date)
+                env_name = pending_environments.get(event.request_id)
+                if env_name is None:
+                    continue
+
+                if stream_events:
+                    streamer.stream_event(get_env_event_string(event, long_format=True))
+
+                try:
+                    _raise_if_error_event(event.message)
+                except (ServiceError, NotSupportedError):
+                    results[env_name] = (OPERATION_FAILED, event.message)
+                    del pending_environments[event.request_id]
+                    continue
+
+                if _is_success_event(event.message):
+                    results[env_name] = (OPERATION_SUCCEEDED, event.message)
+                    del pending_environments[event.request_id]
+    finally:
+        streamer.end_stream()
+
+    for env_name in pending_environments.values():
+        results[env_name] = (
+            OPERATION_TIMED_OUT,
+            strings['timeout.error'].format(timeout_in_minutes=timeout_in_minutes)
+        )
+
+    return results
+
+
 def _raise_if_error_event(message):
     if message == responses['event.redmessage']:
         raise ServiceError(message)
@@ -333,6 +462,21 @@ def get_event_string(event, long_format=False):
         return u'{0}: {1}'.format(severity, message)
 
 
+def get_stack_event_string(stack_event):
+    severity = 'ERROR' if (stack_event.resource_status or '').endswith('_FAILED') else 'INFO'
+    message = u'{0} ({1}) {2}'.format(
+        stack_event.logical_resource_id,
+        stack_event.resource_type,
+        stack_event.resource_status
+    )
+    if stack_event.resource_status_reason:
+        message += u': {0}'.format(stack_event.resource_status_reason)
+    return u'{0} {1} {2}'.format(
+        stack_event.timestamp.strftime("%Y-%m-%d %H:%M:%S").ljust(22),
+        severity.ljust(7),
+        message)
+
+
 def get_compose_event_string(event, long_format=False):
     app_name = event.app_name
     message = event.message
@@ -491,34 +635,15 @@ def create_dummy_app_version(app_name):
 
 
 def create_app_version(app_name, process=False, label=None, message=None, staged=False, build_config=None, source_bundle=None):
-    cwd = os.getcwd()
-
-    fileoperations.ProjectRoot.traverse()
-    try:
-        if heuristics.directory_is_empty():
-            io.echo('NOTE: {}'.format(strings['appversion.none']))
-            return None
-    finally:
-        os.chdir(cwd)
+    if heuristics.directory_is_empty(Workspace.current().root):
+        io.echo('NOTE: {}'.format(strings['appversion.none']))
+        return None
 
     source_control = SourceControl.get_source_control()
     if source_control.untracked_changes_exist():
         io.log_warning(strings['sc.unstagedchanges'])
 
-    if label:
-        version_label = label
-    else:
-        version_label = source_control.get_version_label()
-        if staged:
-            timestamp = datetime.now().strftime("%y%m%d_%H%M%S%f")
-            version_label = version_label + '-stage-' + timestamp
-    if message:
-        description = message
-    else:
-        description = source_control.get_message()
-
-    if len(description) > 200:
-        description = description[:195] + '...'
+    version_label, description = _get_version_label_and_description(source_control, label, message, staged)
     artifact = fileoperations.get_config_setting('deploy', 'artifact')
     if artifact:
         file_name, file_extension = os.path.splitext(artifact)
@@ -552,6 +677,154 @@ def create_app_version(app_name, process=False, label=None, message=None, staged
     )
 
 
+def _get_version_label_and_description(source_control, label, message, staged):
+    if label:
+        version_label = label
+    else:
+        version_label = source_control.get_version_label()
+        if staged:
+            timestamp = datetime.now().strftime("%y%m%d_%H%M%S%f")
+            version_label = version_label + '-stage-' + timestamp
+    if message:
+        description = message
+    else:
+        description = source_control.get_message()
+
+    if len(description) > 200:
+        description = description[:195] + '...'
+    return version_label, description
+
+
+class AppVersionPlan(object):
+    """
+    Everything about the application version of a project that depends on the
+    current working directory, resolved up front by `plan_app_version` so that
+    `create_planned_app_version` can zip, upload and create the application
+    version from any thread, concurrently with other projects.
+    """
+
+    def __init__(self, project_root, version_label, description, source_control,
+                 process=False, staged=False, artifact=None, ignore_list=None,
+                 include_submodules=False):
+        """
+        :param project_root: absolute path of the project
+        :param artifact: absolute path of the `deploy.artifact` to upload instead of a zip
+                         of the project, if one is configured
+        :param ignore_list: files excluded by the `.ebignore` of the project, or None if it
+                            has none
+        :param include_submodules: whether git submodules are added to the zip
+        """
+        self.project_root = project_root
+        self.version_label = version_label
+        self.description = description
+        self.source_control = source_control
+        self.process = process
+        self.staged = staged
+        self.artifact = artifact
+        self.ignore_list = ignore_list
+        self.include_submodules = include_submodules
+        self.zip_location = None
+        self.reuse_zip = False
+        self.zipped = False
+
+
+def plan_app_version(process=False, label=None, message=None, staged=False):
+    """
+    Resolves the version label, description and sources of the application
+    version of the project containing the current working directory.
+    :return: an AppVersionPlan, or None if the project is empty
+    """
+    project_root = Workspace.current().root
+    if heuristics.directory_is_empty(project_root):
+        io.echo('NOTE: {}'.format(strings['appversion.none']))
+        return None
+
+    source_control = SourceControl.get_source_control()
+    if source_control.untracked_changes_exist():
+        io.log_warning(strings['sc.unstagedchanges'])
+
+    version_label, description = _get_version_label_and_description(source_control, label, message, staged)
+    plan = AppVersionPlan(project_root, version_label, description, source_control, process=process, staged=staged)
+
+    artifact = fileoperations.get_config_setting('deploy', 'artifact')
+    if artifact:
+        plan.artifact = os.path.join(project_root, artifact)
+        return plan
+
+    plan.zip_location = fileoperations.get_zip_location(version_label + '.zip')
+    plan.reuse_zip = artifactcache.find_reusable_bundle(plan.zip_location, version_label) is not None
+    plan.ignore_list = fileoperations.get_ebignore_list()
+    if source_control.get_name() == 'git':
+        plan.include_submodules = bool(
+            fileoperations.get_config_setting('global', 'include_git_submodules', default=False)
+        )
+    return plan
+
+
+def create_planned_app_version(app_name, plan):
+    """
+    Zips up the project of `plan` unless its application version already exists
+    or an artifact is configured, uploads it and creates the application version.
+    Never depends on, or changes, the current working directory.
+    :return: the version label
+    """
+    if plan.artifact:
+        s3_bucket, s3_key = None, None
+        file_name = plan.version_label + os.path.splitext(plan.artifact)[1]
+        file_path = plan.artifact
+    else:
+        s3_bucket, s3_key = get_app_version_s3_location(app_name, plan.version_label)
+        file_name, file_path = None, None
+        if s3_bucket is None and s3_key is None:
+            file_name, file_path = _zip_up_planned_project(plan)
+
+    return handle_upload_target(
+        app_name,
+        s3_bucket,
+        s3_key,
+        file_name,
+        file_path,
+        plan.version_label,
+        plan.description,
+        plan.process,
+        None,
+    )
+
+
+def record_planned_artifact(plan):
+    """
+    Records the zip of the project of `plan`, if one was made, in the artifact
+    cache of the project. Unlike the rest of the planned work, this reads the
+    configuration, so it belongs on the main thread.
+    """
+    if plan.zipped and os.path.isfile(plan.zip_location):
+        artifactcache.record_artifact(plan.zip_location, label=plan.version_label, hash_contents=True)
+
+
+def _zip_up_planned_project(plan):
+    file_name = plan.version_label + '.zip'
+    file_path = plan.zip_location
+
+    if not plan.reuse_zip:
+        fileoperations.delete_file(file_path)
+        io.echo(strings['appversion.create'].replace('{version}', plan.version_label))
+        with tracing.span('zip project', tracing.ZIP, version_label=plan.version_label) as span_args:
+            if plan.ignore_list is None:
+                plan.source_control.do_zip(
+                    file_path,
+                    plan.staged,
+                    project_root=plan.project_root,
+                    include_submodules=plan.include_submodules
+                )
+            else:
+                io.log_info('Found .ebignore, using system zip.')
+                fileoperations.zip_up_project(file_path, ignore_list=plan.ignore_list, project_root=plan.project_root)
+            if tracing.is_enabled():
+                span_args['bytes'] = os.path.getsize(file_path)
+        plan.zipped = True
+    return file_name, file_path
+
+
 def handle_upload_target(
         app_name,
         s3_bucket,
@@ -644,14 +917,9 @@ def create_app_version_from_source(
         message=None,
         build_config=None
 ):
-    cwd = os.getcwd()
-    fileoperations.ProjectRoot.traverse()
-    try:
-        if heuristics.directory_is_empty():
-            io.echo('NOTE: {}'.format(strings['appversion.none']))
-            return None
-    finally:
-        os.chdir(cwd)
+    if heuristics.directory_is_empty(Workspace.current().root):
+        io.echo('NOTE: {}'.format(strings['appversion.none']))
+        return None
 
     source_control = SourceControl.get_source_control()
     if source_control.untracked_changes_exist():
@@ -732,6 +1000,7 @@ def _create_application_version(app_name, version_label, description,
                 commit_id,
                 build_config
             )
+            completioncache.add_versions(aws.get_region_name(), app_name, [version_label])
             return version_label
         except InvalidParameterValueError as e:
             if e.message.startswith('Application Version ') and \
@@ -750,15 +1019,20 @@ def _zip_up_project(version_label, source_control, staged=False):
     file_name = version_label + '.zip'
     file_path = fileoperations.get_zip_location(file_name)
 
-    if not fileoperations.file_exists(file_path):
+    if artifactcache.find_reusable_bundle(file_path, version_label) is None:
+        fileoperations.delete_file(file_path)
         io.echo(strings['appversion.create'].replace('{version}',
                                                      version_label))
-        ignore_files = fileoperations.get_ebignore_list()
-        if ignore_files is None:
-            source_control.do_zip(file_path, staged)
-        else:
-            io.log_info('Found .ebignore, using system zip.')
-            fileoperations.zip_up_project(file_path, ignore_list=ignore_files)
+        with tracing.span('zip project', tracing.ZIP, version_label=version_label) as span_args:
+            ignore_files = fileoperations.get_ebignore_list()
+            if ignore_files is None:
+                source_control.do_zip(file_path, staged)
+            else:
+                io.log_info('Found .ebignore, using system zip.')
+                fileoperations.zip_up_project(file_path, ignore_list=ignore_files)
+            if tracing.is_enabled():
+                span_args['bytes'] = os.path.getsize(file_path)
+        artifactcache.record_artifact(file_path, label=version_label, hash_contents=True)
     return file_name, file_path
 
 
@@ -1156,7 +1430,8 @@ def _create_instance_role(role_name, policy_arns):
 
 
 def _sleep(sleep_time):
-    time.sleep(sleep_time)
+    with tracing.span('poll sleep', tracing.WAIT, seconds=sleep_time):
+        time.sleep(sleep_time)
 
 
 def _timeout_reached(start, timediff):
@@ -10,10 +10,42 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
-from ebcli.lib import elasticbeanstalk
+from concurrent.futures import ThreadPoolExecutor
+
+from ebcli.lib import aws, elasticbeanstalk
 from ebcli.core import io
 from ebcli.operations import commonops
 
+MODULE_BUILD_CONCURRENCY = 4
+
+
+def create_module_app_versions(app_name, plans, max_concurrency=MODULE_BUILD_CONCURRENCY):
+    """
+    Zips up, uploads and creates the application versions of several modules
+    concurrently, with at most `max_concurrency` modules in progress at a time.
+    Each plan carries the project root of its module, so none of this depends on
+    the current working directory. The AWS session and clients are created up
+    front, on the calling thread, because creating them is not thread-safe.
+    :param plans: list of AppVersionPlan, or None for modules with nothing to deploy
+    :return: list of the version labels, or None, in the order of `plans`
+    """
+    planned = [plan for plan in plans if plan is not None]
+    version_labels = {}
+    if planned:
+        aws.warm_up(['s3', 'elasticbeanstalk'])
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(planned))) as executor:
+            futures = [
+                (plan, executor.submit(commonops.create_planned_app_version, app_name, plan))
+                for plan in planned
+            ]
+            for plan, future in futures:
+                version_labels[id(plan)] = future.result()
+
+        for plan in planned:
+            commonops.record_planned_artifact(plan)
+
+    return [None if plan is None else version_labels[id(plan)] for plan in plans]
+
 
 def compose(app_name, version_labels, grouped_env_names, group_name=None,
             nohang=False, timeout=None):
@@ -19,9 +19,9 @@ from cement.utils.misc import minimal_logger
 from ebcli.operations import gitops, buildspecops, commonops, statusops
 from ebcli.operations.tagops import tagops
 from ebcli.operations.tagops.taglist import TagList
-from ebcli.lib import cloudformation, elasticbeanstalk, heuristics, iam, utils
+from ebcli.lib import aws, cloudformation, download, elasticbeanstalk, heuristics, iam, utils
 from ebcli.lib.aws import InvalidParameterValueError
-from ebcli.core import io, fileoperations
+from ebcli.core import completioncache, io, fileoperations
 from ebcli.objects.exceptions import NotAuthorizedError
 from ebcli.resources.strings import strings, responses, prompts
 from ebcli.resources.statics import iam_attributes
@@ -133,7 +133,8 @@ def make_new_env(
     io.echo('Printing Status:')
 
     commonops.wait_for_success_events(request_id,
-                                      timeout_in_minutes=timeout)
+                                      timeout_in_minutes=timeout,
+                                      stack_events=True)
 
 
 def should_download_sample_app():
@@ -182,9 +183,7 @@ def download_application_version(url, zip_file_location):
     :param zip_file_location: path on the user's system to write the application version ZIP file to.
     :return: None
     """
-    data = utils.get_data_from_url(url, timeout=30)
-
-    fileoperations.write_to_data_file(zip_file_location, data)
+    download.download_url(url, zip_file_location, timeout=30)
 
 
 def retrieve_application_version_url(env_name):
@@ -199,7 +198,7 @@ def retrieve_application_version_url(env_name):
     :return: The URL of the application version.
     """
     env = elasticbeanstalk.get_environment(env_name=env_name)
-    cloudformation_stack_name = 'awseb-' + env.id + '-stack'
+    cloudformation_stack_name = commonops.ENVIRONMENT_STACK_NAME_FORMAT.format(env.id)
     cloudformation.wait_until_stack_exists(cloudformation_stack_name)
     template = cloudformation.get_template(cloudformation_stack_name)
 
@@ -220,7 +219,9 @@ def create_env(env_request, interactive=True):
         platform = None
     while True:
         try:
-            return elasticbeanstalk.create_environment(env_request)
+            result, request_id = elasticbeanstalk.create_environment(env_request)
+            completioncache.add_environment(aws.get_region_name(), result.app_name, result.name)
+            return result, request_id
 
         except InvalidParameterValueError as e:
             if e.message == responses['app.notexists'].replace(
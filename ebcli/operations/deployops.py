@@ -10,20 +10,67 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor
+
 from cement.utils.misc import minimal_logger
 
 from ebcli.operations import commonops
 from ebcli.core import io, fileoperations
-from ebcli.lib import elasticbeanstalk, aws
+from ebcli.lib import elasticbeanstalk, aws, utils
+from ebcli.objects.exceptions import NotFoundError, ServiceError
 from ebcli.operations import gitops, buildspecops
+from ebcli.operations.commonops import OPERATION_FAILED, OPERATION_SUCCEEDED
+from ebcli.resources.strings import strings
 
 LOG = minimal_logger(__name__)
 
 
+DEFAULT_MAX_CONCURRENCY = 5
+DEPLOYMENT_SKIPPED = 'Skipped'
+DEPLOYMENT_TRIGGERED = 'Triggered'
+ENVIRONMENT_NAME_WILDCARDS = ('*', '?', '[')
+
+
 def deploy(app_name, env_name, version, label, message, group_name=None,
            process_app_versions=False, staged=False, timeout=5, source=None,
            source_bundle=None):
     region_name = aws.get_region_name()
+    io.log_info('Deploying code to ' + env_name + " in region " + region_name)
+
+    app_version_label = build_app_version(
+        app_name,
+        version,
+        label,
+        message,
+        process_app_versions=process_app_versions,
+        staged=staged,
+        timeout=timeout,
+        source=source,
+        source_bundle=source_bundle
+    )
+    if app_version_label is None:
+        return
+
+    request_id = elasticbeanstalk.update_env_application_version(
+        env_name, app_version_label, group_name)
+
+    commonops.wait_for_success_events(request_id,
+                                      timeout_in_minutes=timeout,
+                                      can_abort=True,
+                                      env_name=env_name,
+                                      stack_events=True)
+
+
+def build_app_version(app_name, version, label, message, process_app_versions=False,
+                      staged=False, timeout=5, source=None, source_bundle=None):
+    """
+    Creates (zipping and uploading the workspace when necessary) the application
+    version to deploy and waits for it to be processed if required.
+
+    :return: the version label to deploy, or None if the application version
+             could not be processed
+    """
     build_config = None
     if source_bundle:
         file_name, file_path = label, source_bundle
@@ -44,8 +91,6 @@ def deploy(app_name, env_name, version, label, message, group_name=None,
             build_config = fileoperations.get_build_configuration()
             LOG.debug("Retrieved build configuration from buildspec: {0}".format(build_config.__str__()))
 
-    io.log_info('Deploying code to ' + env_name + " in region " + region_name)
-
     if version:
         app_version_label = version
     elif source is not None:
@@ -84,12 +129,157 @@ def deploy(app_name, env_name, version, label, message, group_name=None,
             timeout=timeout or 5
         )
         if not success:
-            return
+            return None
 
-    request_id = elasticbeanstalk.update_env_application_version(
-        env_name, app_version_label, group_name)
+    return app_version_label
 
-    commonops.wait_for_success_events(request_id,
-                                      timeout_in_minutes=timeout,
-                                      can_abort=True,
-                                      env_name=env_name)
+
+def deploy_to_environments(app_name, env_names, version, label, message, group_name=None,
+                           process_app_versions=False, staged=False, timeout=5, source=None,
+                           max_concurrency=DEFAULT_MAX_CONCURRENCY, wave_size=None):
+    """
+    Deploys a single build to several environments. The application version is
+    created and uploaded once, after which the environments are updated in waves
+    of at most `wave_size` environments, with at most `max_concurrency` update
+    requests in flight at a time. The environments of a wave are tracked through
+    one multiplexed event stream, and a wave is only started once the previous
+    one has completed successfully.
+
+    :param app_name: name of the application the environments belong to
+    :param env_names: list of environment names to deploy to
+    :param max_concurrency: maximum number of `UpdateEnvironment` calls issued concurrently
+    :param wave_size: maximum number of environments to update at a time; all at once if None
+    :return: dict mapping each environment name to a tuple of (status, message)
+    """
+    region_name = aws.get_region_name()
+    io.log_info('Deploying code to {0} in region {1}'.format(', '.join(env_names), region_name))
+
+    app_version_label = build_app_version(
+        app_name,
+        version,
+        label,
+        message,
+        process_app_versions=process_app_versions,
+        staged=staged,
+        timeout=timeout,
+        source=source
+    )
+    if app_version_label is None:
+        return
+
+    results = dict()
+    for wave_number, wave in enumerate(_split_into_waves(env_names, wave_size), start=1):
+        if any(status not in (OPERATION_SUCCEEDED, DEPLOYMENT_TRIGGERED) for status, _ in results.values()):
+            for env_name in wave:
+                results[env_name] = (DEPLOYMENT_SKIPPED, strings['deploy.multiple.skipped'])
+            continue
+
+        if wave_size:
+            io.echo(strings['deploy.multiple.wave'].format(number=wave_number, environments=', '.join(wave)))
+
+        start_time = utils.datetime_utcnow()
+        request_ids, trigger_failures = _trigger_environment_updates(
+            wave, app_version_label, group_name, max_concurrency
+        )
+        results.update(trigger_failures)
+
+        if timeout == 0:
+            for env_name in request_ids:
+                results[env_name] = (DEPLOYMENT_TRIGGERED, request_ids[env_name])
+            continue
+
+        if request_ids:
+            results.update(
+                commonops.wait_for_multiple_success_events(
+                    app_name,
+                    request_ids,
+                    timeout_in_minutes=timeout,
+                    start_time=start_time
+                )
+            )
+
+    _print_deployment_summary(env_names, results)
+
+    failures = [
+        env_name for env_name in env_names
+        if results[env_name][0] not in (OPERATION_SUCCEEDED, DEPLOYMENT_TRIGGERED)
+    ]
+    if failures:
+        raise ServiceError(strings['deploy.multiple.failed'].format(environments=', '.join(failures)))
+
+    return results
+
+
+def resolve_environment_names(app_name, names):
+    """
+    Expands shell-style patterns such as `web-*` among `names` into the names of
+    the matching environments of `app_name`, preserving the order in which the
+    names and patterns were specified and dropping duplicates.
+    """
+    patterns = [name for name in names if any(char in name for char in ENVIRONMENT_NAME_WILDCARDS)]
+    existing_env_names = sorted(elasticbeanstalk.get_environment_names(app_name)) if patterns else []
+
+    resolved = []
+    for name in names:
+        if name in patterns:
+            matches = fnmatch.filter(existing_env_names, name)
+            if not matches:
+                raise NotFoundError(strings['deploy.multiple.nomatch'].format(pattern=name))
+        else:
+            matches = [name]
+        for match in matches:
+            if match not in resolved:
+                resolved.append(match)
+
+    return resolved
+
+
+def _split_into_waves(env_names, wave_size):
+    if not wave_size:
+        return [env_names]
+
+    return [env_names[i:i + wave_size] for i in range(0, len(env_names), wave_size)]
+
+
+def _trigger_environment_updates(env_names, version_label, group_name, max_concurrency):
+    request_ids = dict()
+    failures = dict()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(env_names)))) as executor:
+        futures = [
+            (
+                env_name,
+                executor.submit(
+                    elasticbeanstalk.update_env_application_version,
+                    env_name,
+                    version_label,
+                    group_name
+                )
+            )
+            for env_name in env_names
+        ]
+        for env_name, future in futures:
+            try:
+                request_ids[env_name] = future.result()
+            except Exception as e:
+                LOG.debug('Unable to update environment {0}: {1}'.format(env_name, e))
+                failures[env_name] = (OPERATION_FAILED, str(e))
+
+    return request_ids, failures
+
+
+def _print_deployment_summary(env_names, results):
+    name_width = max(len(env_name) for env_name in env_names)
+    status_width = max(len(status) for status, _ in results.values())
+
+    io.echo()
+    io.echo(strings['deploy.multiple.summary'])
+    for env_name in env_names:
+        status, message = results[env_name]
+        io.echo(
+            u'  {0}  {1}  {2}'.format(
+                env_name.ljust(name_width),
+                status.ljust(status_width),
+                message or ''
+            )
+        )
@@ -11,48 +11,142 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import datetime
 import os
 
 import time
-from ebcli.core import io
-from ebcli.lib import elasticbeanstalk
+from dateutil import tz
+
+from ebcli.core import eventstore, io, tracing
+from ebcli.lib import aws, elasticbeanstalk
 from ebcli.objects.exceptions import EndOfTestError
-from ebcli.operations import commonops
+from ebcli.operations import commonops, logsops
+
+# `eb events` shows the most recent events, as many as a page of DescribeEvents
+# holds, unless it is given the time to show events from.
+MAX_EVENTS = 1000
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=tz.tzutc())
 
 
-def print_events(app_name, env_name, follow, platform_arn=None):
+def print_events(app_name, env_name, follow, platform_arn=None,
+                 since=None, severity=None, request_id=None, version_label=None):
+    """
+    Prints the events of the environment `env_name` of the application
+    `app_name`, or of the platform `platform_arn`, which match the given
+    filters. Events are first synced to the local event archive, which
+    then answers the query.
+    :param since: date and time, such as `2018-03-26T17:00:00Z`, from which to print events
+    :param severity: the lowest severity of the events to print
+    """
+    filters = dict(
+        since=None if since is None else logsops.parse_log_time(since) * 1000,
+        severity=severity,
+        request_id=request_id,
+        version_label=version_label,
+    )
     if follow:
-        follow_events(app_name, env_name, platform_arn)
+        follow_events(app_name, env_name, platform_arn, **filters)
     else:
-        events = elasticbeanstalk.get_new_events(
-            app_name, env_name, None, platform_arn=platform_arn)
+        stream = eventstore.stream_name(app_name, env_name, platform_arn)
+        with eventstore.EventStore.for_region(aws.get_region_name(), aws.get_session_profile()) as store:
+            sync_events(store, stream, app_name, env_name, platform_arn, since=filters['since'])
+            events = store.query(stream, limit=MAX_EVENTS if since is None else None, **filters)
 
-        data = []
-        for event in reversed(events):
-            data.append(commonops.get_event_string(event, long_format=True))
+        data = [commonops.get_event_string(event, long_format=True) for event in events]
         io.echo_with_pager(os.linesep.join(data))
 
 
-def follow_events(app_name, env_name, platform_arn=None):
-    last_time = None
+def follow_events(app_name, env_name, platform_arn=None,
+                  since=None, severity=None, request_id=None, version_label=None):
+    """
+    Streams the archived events matching the given filters, then every new
+    one, polling every few seconds for events logged since the latest
+    archived event. A restarted `eb events --follow` therefore only
+    requests the events logged since it last ran.
+    """
     streamer = io.get_event_streamer()
+    stream = eventstore.stream_name(app_name, env_name, platform_arn)
+    store = eventstore.EventStore.for_region(aws.get_region_name(), aws.get_session_profile())
+    last_row = None
     try:
         while True:
-            events = elasticbeanstalk.get_new_events(
-                app_name, env_name, None, platform_arn=platform_arn, last_event_time=last_time
+            sync_events(store, stream, app_name, env_name, platform_arn, since=since)
+            events = store.query(
+                stream,
+                since=since,
+                after_row=last_row,
+                severity=severity,
+                request_id=request_id,
+                version_label=version_label,
+                limit=MAX_EVENTS if last_row is None and since is None else None
             )
+            last_row = store.latest_row(stream)
 
-            for event in reversed(events):
+            for event in events:
                 message = commonops.get_event_string(event, long_format=True)
                 streamer.stream_event(message)
-                last_time = event.event_date
 
             _sleep()
     except EndOfTestError:
         pass
     finally:
         streamer.end_stream()
+        store.close()
+
+
+def sync_events(store, stream, app_name, env_name, platform_arn=None, since=None):
+    """
+    Archives the events of `stream` that are not archived yet: those logged
+    since its latest archived event, and those logged since `since` if the
+    archive does not go back that far. The first sync of a stream without
+    `since` only archives the most recent page of events.
+    :param since: time in microseconds since the epoch
+    :return: the number of events archived
+    """
+    synced_since = store.synced_since(stream)
+    if synced_since is not None and (since is None or since >= synced_since):
+        latest = store.latest_event_time(stream)
+        start = latest if latest is not None else synced_since
+        events, _ = _describe_events(app_name, env_name, platform_arn, start_time=start)
+        return store.add(stream, events)
+
+    # Pages arrive most recent first, so they are only archived once they all
+    # arrived: archiving some of them would leave a gap before the latest event.
+    events, next_token = _describe_events(app_name, env_name, platform_arn, start_time=since,
+                                          all_pages=since is not None)
+    added = store.add(stream, events)
+    if since is not None:
+        store.mark_synced_since(stream, since)
+    elif next_token and events:
+        store.mark_synced_since(stream, eventstore.event_time(events[-1].event_date) + 1)
+    else:
+        store.mark_synced_since(stream, 0)
+    return added
+
+
+def _describe_events(app_name, env_name, platform_arn, start_time=None, all_pages=True):
+    """
+    Returns the events logged at or after `start_time`, in microseconds since
+    the epoch, most recent first, along with the token of the next page if
+    they were not all retrieved.
+    """
+    start_date = _EPOCH + datetime.timedelta(microseconds=start_time) if start_time else None
+    events = []
+    next_token = None
+    while True:
+        page, next_token = elasticbeanstalk.describe_events(
+            app_name=app_name,
+            env_name=env_name,
+            platform_arn=platform_arn,
+            start_time=start_date,
+            max_records=MAX_EVENTS,
+            next_token=next_token
+        )
+        events.extend(page)
+        if not next_token or not all_pages:
+            return events, next_token
 
 
 def _sleep():
-    time.sleep(4)
+    with tracing.span('poll sleep', tracing.WAIT, seconds=4):
+        time.sleep(4)
@@ -12,7 +12,7 @@
 # language governing permissions and limitations under the License.
 
 from ebcli.lib import aws, utils, elasticbeanstalk
-from ebcli.core import io
+from ebcli.core import completioncache, io
 from ebcli.operations import commonops
 
 
@@ -23,8 +23,10 @@ def list_env_names(app_name, verbose, all_apps):
         io.echo('Region:', region)
 
     if all_apps:
-        for app_name in elasticbeanstalk.get_application_names():
-            list_env_names_for_app(app_name, verbose)
+        applications = elasticbeanstalk.get_all_applications()
+        completioncache.replace_applications(region, dict((app.name, app.versions) for app in applications))
+        for application in applications:
+            list_env_names_for_app(application.name, verbose)
     else:
         list_env_names_for_app(app_name, verbose)
 
@@ -33,6 +35,7 @@ def list_env_names_for_app(app_name, verbose):
     current_env = commonops.get_current_branch_environment()
     env_names = elasticbeanstalk.get_environment_names(app_name)
     env_names.sort()
+    completioncache.replace_environments(aws.get_region_name(), {app_name: list(env_names)}, app_name=app_name)
 
     if verbose:
         io.echo('Application:', app_name)
@@ -0,0 +1,372 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Search over the log bundles retrieved with `eb logs --all`.
+
+Every bundle carries an index under `.index/` which records, for each log file,
+the byte offset at which each of its lines starts and the time at which each
+line was logged, parsed from the timestamp at the start of the line or inherited
+from the closest preceding line which has one. The index is built when the
+bundle is extracted and is refreshed only for files which changed since, so
+repeated searches of a bundle do not parse its logs again.
+
+Searches scan memory-mapped files with a single regular expression rather than
+line by line, skip the parts of files outside the requested time window using
+the time index, and are spread over a pool of processes when the bundle is
+large. Matching lines are merged across files in timestamp order.
+"""
+import calendar
+import hashlib
+import heapq
+import json
+import mmap
+import os
+import re
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+from cement.utils.misc import minimal_logger
+
+from ebcli.objects.exceptions import InvalidOptionsError
+from ebcli.resources.strings import strings
+
+LOG = minimal_logger(__name__)
+
+INDEX_DIRECTORY_NAME = '.index'
+MANIFEST_FILE_NAME = 'manifest.json'
+INDEX_VERSION = 1
+PROCESS_POOL_THRESHOLD = 32 * 1024 * 1024
+TIMESTAMP_SCAN_LENGTH = 64
+BINARY_SNIFF_LENGTH = 1024
+
+_MONTHS = dict(
+    (month.encode('ascii'), number)
+    for number, month in enumerate(
+        ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
+        start=1
+    )
+)
+_ISO_TIMESTAMP = re.compile(
+    br'(\d{4})[-/](\d{2})[-/](\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:[.,](\d{1,6}))?(Z|[+-]\d{2}:?\d{2})?'
+)
+_COMMON_LOG_TIMESTAMP = re.compile(
+    br'(\d{2})/([A-Z][a-z]{2})/(\d{4}):(\d{2}):(\d{2}):(\d{2}) ([+-]\d{4})'
+)
+_SYSLOG_TIMESTAMP = re.compile(
+    br'([A-Z][a-z]{2}) +(\d{1,2}) (\d{2}):(\d{2}):(\d{2})'
+)
+
+
+class SearchHit(object):
+    def __init__(self, timestamp, path, line_number, text):
+        """
+        :param timestamp: time at which the line was logged, in milliseconds since the
+                          epoch, or 0 when it is unknown
+        :param path: path of the log file relative to the bundle
+        :param line_number: 1-based number of the line within the file
+        :param text: the line, without its line terminator
+        """
+        self.timestamp = timestamp
+        self.path = path
+        self.line_number = line_number
+        self.text = text
+
+    def __str__(self):
+        return '{0}:{1}: {2}'.format(self.path, self.line_number, self.text)
+
+
+def build_index(bundle_location):
+    """
+    Indexes the log files of the bundle at `bundle_location`, reusing the entries of
+    files which did not change since they were last indexed.
+    :return: the manifest of the index
+    """
+    manifest = _read_manifest(bundle_location)
+    current_entries = {}
+    stale_paths = []
+    stale_bytes = 0
+    for relative_path, size, mtime in _log_files(bundle_location):
+        entry = manifest['files'].get(relative_path)
+        if entry and entry['size'] == size and entry['mtime'] == mtime:
+            current_entries[relative_path] = entry
+        else:
+            stale_paths.append(relative_path)
+            stale_bytes += size
+
+    arguments = [(bundle_location, relative_path) for relative_path in stale_paths]
+    for entry in _map(_index_file, arguments, stale_bytes):
+        current_entries[entry['path']] = entry
+
+    for relative_path, entry in manifest['files'].items():
+        if relative_path not in current_entries and entry.get('index'):
+            _remove_index_files(bundle_location, entry['index'])
+
+    if stale_paths or set(current_entries) != set(manifest['files']):
+        LOG.debug('Indexed {0} log files of {1}'.format(len(stale_paths), bundle_location))
+        manifest['files'] = current_entries
+        _write_manifest(bundle_location, manifest)
+    return manifest
+
+
+def search(bundle_location, pattern, start_time=None, end_time=None, path_prefix=None):
+    """
+    Finds the lines of the log files of the bundle at `bundle_location` which match
+    the regular expression, `pattern`.
+
+    :param bundle_location: directory the bundle was extracted to
+    :param pattern: regular expression to search for
+    :param start_time: if specified, lines logged before this time, expressed in
+                       milliseconds since the epoch, are not searched
+    :param end_time: if specified, lines logged at or after this time, expressed in
+                     milliseconds since the epoch, are not searched
+    :param path_prefix: if specified, only the files under this directory of the
+                        bundle, such as the directory of an instance id, are searched
+    :return: an iterator over the `SearchHit`s in timestamp order
+    """
+    regex = pattern.encode('utf-8')
+    try:
+        re.compile(regex)
+    except re.error as e:
+        raise InvalidOptionsError(strings['logs.grep.invalid_pattern'].format(pattern=pattern, error=e))
+
+    manifest = build_index(bundle_location)
+    entries = [
+        entry for path, entry in sorted(manifest['files'].items())
+        if entry.get('index') and (not path_prefix or _is_under(path, path_prefix.rstrip('/')))
+    ]
+    total_bytes = sum(entry['size'] for entry in entries)
+    arguments = [(bundle_location, entry, regex, start_time, end_time) for entry in entries]
+    results = _map(_search_file, arguments, total_bytes)
+
+    return (
+        SearchHit(timestamp, path, line_number, text)
+        for timestamp, path, line_number, text in heapq.merge(*results)
+    )
+
+
+def _is_under(path, prefix):
+    return path == prefix or path.startswith(prefix + '/')
+
+
+def parse_timestamp(line, default_year=None):
+    """
+    Parses the timestamp logged at the start of `line`. ISO 8601-like timestamps as
+    written by the Elastic Beanstalk engine, timestamps of the common log format as
+    written by web servers, and syslog timestamps are recognized. Timestamps without
+    a timezone are assumed to be in UTC.
+
+    :param line: a line of a log file, as bytes
+    :param default_year: year of syslog timestamps, which omit it; defaults to the current year
+    :return: the time expressed in milliseconds since the epoch, or None
+    """
+    prefix = line[:TIMESTAMP_SCAN_LENGTH]
+
+    match = _ISO_TIMESTAMP.search(prefix)
+    if match:
+        year, month, day, hour, minute, second, fraction, zone = match.groups()
+        milliseconds = _to_milliseconds(year, month, day, hour, minute, second, fraction)
+        if milliseconds is not None:
+            return milliseconds - _zone_offset_in_milliseconds(zone)
+
+    match = _COMMON_LOG_TIMESTAMP.search(prefix)
+    if match and match.group(2) in _MONTHS:
+        day, month, year, hour, minute, second, zone = match.groups()
+        milliseconds = _to_milliseconds(year, _MONTHS[month], day, hour, minute, second)
+        if milliseconds is not None:
+            return milliseconds - _zone_offset_in_milliseconds(zone)
+
+    match = _SYSLOG_TIMESTAMP.match(prefix)
+    if match and match.group(1) in _MONTHS:
+        month, day, hour, minute, second = match.groups()
+        year = default_year or time.gmtime().tm_year
+        return _to_milliseconds(year, _MONTHS[month], day, hour, minute, second)
+
+    return None
+
+
+def _to_milliseconds(year, month, day, hour, minute, second, fraction=None):
+    try:
+        seconds = calendar.timegm(
+            (int(year), int(month), int(day), int(hour), int(minute), int(second))
+        )
+    except (ValueError, OverflowError):
+        return None
+    milliseconds = int((fraction or b'0').ljust(3, b'0')[:3])
+    return seconds * 1000 + milliseconds
+
+
+def _zone_offset_in_milliseconds(zone):
+    if not zone or zone == b'Z':
+        return 0
+    zone = zone.replace(b':', b'')
+    sign = -1 if zone[:1] == b'-' else 1
+    return sign * (int(zone[1:3]) * 60 + int(zone[3:5])) * 60 * 1000
+
+
+def _index_file(bundle_location, relative_path):
+    """
+    Records the line offsets and line timestamps of a single log file.
+    :return: the manifest entry of the file
+    """
+    location = os.path.join(bundle_location, relative_path)
+    stat = os.stat(location)
+    entry = {
+        'path': relative_path,
+        'size': stat.st_size,
+        'mtime': stat.st_mtime_ns,
+        'index': None,
+    }
+    if not stat.st_size:
+        return entry
+
+    default_year = time.gmtime(stat.st_mtime).tm_year
+    offsets = array('q')
+    timestamps = array('q')
+    with open(location, 'rb') as f:
+        if b'\0' in f.read(BINARY_SNIFF_LENGTH):
+            LOG.debug('Not indexing binary file {0}'.format(location))
+            return entry
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as contents:
+            timestamp = 0
+            position = 0
+            while position < stat.st_size:
+                offsets.append(position)
+                end_of_line = contents.find(b'\n', position)
+                next_position = stat.st_size if end_of_line == -1 else end_of_line + 1
+                parsed_timestamp = parse_timestamp(
+                    contents[position:min(next_position, position + TIMESTAMP_SCAN_LENGTH)],
+                    default_year
+                )
+                if parsed_timestamp is not None:
+                    timestamp = parsed_timestamp
+                timestamps.append(timestamp)
+                position = next_position
+    offsets.append(stat.st_size)
+
+    index_name = hashlib.sha1(relative_path.encode('utf-8')).hexdigest()
+    index_directory = os.path.join(bundle_location, INDEX_DIRECTORY_NAME)
+    with open(os.path.join(index_directory, index_name + '.offsets'), 'wb') as f:
+        offsets.tofile(f)
+    with open(os.path.join(index_directory, index_name + '.times'), 'wb') as f:
+        timestamps.tofile(f)
+
+    entry['index'] = index_name
+    entry['lines'] = len(timestamps)
+    entry['sorted'] = all(timestamps[i] <= timestamps[i + 1] for i in range(len(timestamps) - 1))
+    return entry
+
+
+def _search_file(bundle_location, entry, regex, start_time, end_time):
+    """
+    :return: a list of (timestamp, path, line number, line) tuples for the lines of a
+             single log file matching `regex`, in timestamp order
+    """
+    offsets = _load_array(bundle_location, entry['index'] + '.offsets')
+    timestamps = _load_array(bundle_location, entry['index'] + '.times')
+    first_line, last_line = 0, entry['lines']
+    if entry['sorted']:
+        if start_time is not None:
+            first_line = bisect_left(timestamps, start_time)
+        if end_time is not None:
+            last_line = bisect_left(timestamps, end_time)
+    if first_line >= last_line:
+        return []
+
+    hits = []
+    compiled_regex = re.compile(regex, re.MULTILINE)
+    with open(os.path.join(bundle_location, entry['path']), 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as contents:
+            previous_line = -1
+            for match in compiled_regex.finditer(contents, offsets[first_line], offsets[last_line]):
+                line = bisect_right(offsets, match.start()) - 1
+                if line == previous_line:
+                    continue
+                previous_line = line
+
+                timestamp = timestamps[line]
+                if start_time is not None and timestamp < start_time:
+                    continue
+                if end_time is not None and timestamp >= end_time:
+                    continue
+
+                text = contents[offsets[line]:offsets[line + 1]].rstrip(b'\r\n').decode('utf-8', 'replace')
+                hits.append((timestamp, entry['path'], line + 1, text))
+
+    hits.sort()
+    return hits
+
+
+def _map(function, arguments, total_bytes):
+    """
+    Applies `function` to each tuple of `arguments`, in a pool of processes when there
+    are several files totalling more than `PROCESS_POOL_THRESHOLD` bytes, in which case
+    starting the processes costs less than it saves.
+    """
+    if len(arguments) < 2 or total_bytes < PROCESS_POOL_THRESHOLD:
+        return [function(*argument) for argument in arguments]
+
+    with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(arguments))) as executor:
+        return list(executor.map(function, *zip(*arguments)))
+
+
+def _log_files(bundle_location):
+    for root, directories, files in os.walk(bundle_location):
+        directories[:] = sorted(
+            directory for directory in directories if directory != INDEX_DIRECTORY_NAME
+        )
+        for name in sorted(files):
+            location = os.path.join(root, name)
+            if os.path.islink(location):
+                continue
+            stat = os.stat(location)
+            relative_path = os.path.relpath(location, bundle_location).replace(os.path.sep, '/')
+            yield relative_path, stat.st_size, stat.st_mtime_ns
+
+
+def _read_manifest(bundle_location):
+    try:
+        with open(os.path.join(bundle_location, INDEX_DIRECTORY_NAME, MANIFEST_FILE_NAME)) as f:
+            manifest = json.load(f)
+    except (IOError, OSError, ValueError):
+        manifest = {}
+
+    if manifest.get('version') != INDEX_VERSION:
+        manifest = {'version': INDEX_VERSION, 'files': {}}
+    os.makedirs(os.path.join(bundle_location, INDEX_DIRECTORY_NAME), exist_ok=True)
+    return manifest
+
+
+def _write_manifest(bundle_location, manifest):
+    location = os.path.join(bundle_location, INDEX_DIRECTORY_NAME, MANIFEST_FILE_NAME)
+    temporary_location = '{0}.{1}.tmp'.format(location, os.getpid())
+    with open(temporary_location, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(temporary_location, location)
+
+
+def _load_array(bundle_location, name):
+    values = array('q')
+    with open(os.path.join(bundle_location, INDEX_DIRECTORY_NAME, name), 'rb') as f:
+        values.frombytes(f.read())
+    return values
+
+
+def _remove_index_files(bundle_location, index_name):
+    for extension in ('.offsets', '.times'):
+        try:
+            os.remove(os.path.join(bundle_location, INDEX_DIRECTORY_NAME, index_name + extension))
+        except OSError:
+            pass
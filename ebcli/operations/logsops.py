@@ -11,26 +11,155 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import calendar
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
 from datetime import datetime
+from http.client import HTTPException
 import os
-import threading
 import time
 import traceback
 
 from cement.utils.misc import minimal_logger
+from dateutil import parser, tz
 from six import iteritems
 
-from ebcli.core import fileoperations, io
+from ebcli.core import artifactcache, fileoperations, io
 from ebcli.lib import elasticbeanstalk, utils, cloudwatch
 from ebcli.lib.aws import MaxRetriesError
 from ebcli.resources.strings import strings, prompts
 from ebcli.resources.statics import namespaces, option_names, logs_operations_constants
 from ebcli.objects.exceptions import InvalidOptionsError, NotFoundError, ServiceError
-from ebcli.operations import commonops
+from ebcli.operations import commonops, logsearchops
 
 LOG = minimal_logger(__name__)
 TAIL_LOG_SIZE = 100
 BEANSTALK_LOG_PREFIX = '/aws/elasticbeanstalk'
+STREAM_POLL_INTERVAL = 1
+STREAM_DISCOVERY_INTERVAL = 30
+STREAM_BACKLOG = 5 * 60 * 1000
+STREAM_WORKER_COUNT = 8
+EXPORT_THREAD_COUNT = 8
+TAIL_FETCH_THREAD_COUNT = 8
+TAIL_FETCH_TIMEOUT = 20
+
+
+class CloudWatchLogTail(object):
+    """
+    Tails the logStreams of a CloudWatch logGroup from a single loop.
+
+    Every logStream has an entry in a table which holds the forward token of its
+    next page of events and the time at which it is next due to be polled. Streams
+    that returned events are polled again after `min_interval` seconds, while idle
+    streams back off exponentially up to `max_interval` seconds. Due streams are
+    fetched through a bounded pool of workers, new streams are discovered every
+    `discovery_interval` seconds, and the events of every poll are merged in
+    timestamp order. The number of threads and the rate of API calls therefore do
+    not grow with the time spent tailing.
+    """
+    def __init__(
+            self,
+            log_group,
+            log_stream_name_prefix=None,
+            min_interval=STREAM_POLL_INTERVAL,
+            max_interval=10,
+            discovery_interval=STREAM_DISCOVERY_INTERVAL,
+            worker_count=STREAM_WORKER_COUNT
+    ):
+        self.log_group = log_group
+        self.log_stream_name_prefix = log_stream_name_prefix
+        self.min_interval = min(min_interval, max_interval)
+        self.max_interval = max_interval
+        self.discovery_interval = discovery_interval
+        self.streams = {}
+        self._next_discovery = 0
+        self._executor = ThreadPoolExecutor(max_workers=worker_count)
+
+    def discover_streams(self):
+        """
+        Adds the logStreams created since the last discovery to the table. Events
+        of new streams are read starting `STREAM_BACKLOG` milliseconds in the past.
+        :return: the names of all the logStreams being tailed
+        """
+        start_time = _updated_start_time() - STREAM_BACKLOG
+        for stream_name in cloudwatch_log_stream_names(self.log_group, self.log_stream_name_prefix):
+            if stream_name not in self.streams:
+                LOG.debug('Tailing logStream {0} of {1}'.format(stream_name, self.log_group))
+                self.streams[stream_name] = {
+                    'next_token': None,
+                    'start_time': start_time,
+                    'interval': self.min_interval,
+                    'next_poll': 0,
+                }
+        self._next_discovery = time.time() + self.discovery_interval
+        return list(self.streams)
+
+    def poll(self):
+        """
+        Fetches the next page of events of every logStream which is due to be polled.
+        :return: a list of (timestamp, stream name, message) tuples sorted by timestamp
+        """
+        if time.time() >= self._next_discovery:
+            self.discover_streams()
+
+        now = time.time()
+        due_stream_names = sorted(
+            stream_name for stream_name, stream in self.streams.items()
+            if stream['next_poll'] <= now
+        )
+        futures = [
+            (stream_name, self._executor.submit(self._fetch, stream_name, dict(self.streams[stream_name])))
+            for stream_name in due_stream_names
+        ]
+
+        events = []
+        for stream_name, future in futures:
+            stream = self.streams[stream_name]
+            try:
+                response = future.result()
+            except NotFoundError:
+                LOG.debug('logStream {0} no longer exists'.format(stream_name))
+                del self.streams[stream_name]
+                continue
+            except ServiceError as e:
+                LOG.debug('Unable to poll logStream {0}: {1}'.format(stream_name, e))
+                stream['interval'] = self.max_interval
+                stream['next_poll'] = now + stream['interval']
+                continue
+
+            stream_events = response.get('events', [])
+            for event in stream_events:
+                events.append((event.get('timestamp', 0), stream_name, event.get('message', '').rstrip('\r\n')))
+
+            stream['next_token'] = response.get('nextForwardToken', stream['next_token'])
+            if stream_events:
+                stream['interval'] = self.min_interval
+            else:
+                stream['interval'] = min(max(stream['interval'], self.min_interval) * 2, self.max_interval)
+            stream['next_poll'] = now + stream['interval']
+
+        events.sort(key=lambda event: event[:2])
+        return events
+
+    def seconds_until_next_poll(self):
+        next_poll = min([self._next_discovery] + [stream['next_poll'] for stream in self.streams.values()])
+        return max(0, next_poll - time.time())
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    def _fetch(self, stream_name, stream):
+        if stream['next_token']:
+            return cloudwatch.get_log_events(
+                self.log_group,
+                stream_name,
+                next_token=stream['next_token'],
+                start_from_head=True
+            )
+        return cloudwatch.get_log_events(
+            self.log_group,
+            stream_name,
+            start_from_head=True,
+            start_time=stream['start_time']
+        )
 
 
 def beanstalk_log_group_builder(env_name, log_group_name=None):
@@ -230,6 +359,98 @@ def environment_health_streaming_enabled(app_name, env_name, config_settings=Non
     return stream_enabled == 'true'
 
 
+def export_cloudwatch_log_stream(log_group_name, stream_name, location, start_time=None, end_time=None):
+    """
+    Pages through the events of the logStream, `stream_name`, from the oldest to the
+    most recent one, writing them to the file at `location` as they are received, so
+    memory usage does not depend on the size of the logStream.
+
+    :param log_group_name: cloudwatch logGroup
+    :param stream_name: cloudwatch stream name
+    :param location: path of the file to write the events to, one per line, prefixed
+                     with the stream name
+    :param start_time: if specified, events older than this time, expressed in
+                       milliseconds since the epoch, are not exported
+    :param end_time: if specified, events at or after this time, expressed in
+                     milliseconds since the epoch, are not exported
+    :return: the number of events exported
+    """
+    event_count = 0
+    next_token = None
+    with open(location, 'w', encoding='utf-8') as log_file:
+        while True:
+            response = cloudwatch.get_log_events(
+                log_group_name,
+                stream_name,
+                next_token=next_token,
+                start_from_head=True,
+                start_time=start_time,
+                end_time=end_time
+            )
+            for event in response.get('events', []):
+                log_file.write('[{0}] {1}\n'.format(stream_name, event.get('message', '').rstrip('\r\n')))
+                event_count += 1
+
+            forward_token = response.get('nextForwardToken')
+            if not forward_token or forward_token == next_token:
+                break
+            next_token = forward_token
+
+    fileoperations.set_user_only_permissions(location)
+    LOG.debug('Exported {0} events of {1} to {2}'.format(event_count, stream_name, location))
+    return event_count
+
+
+def export_cloudwatch_logs(
+        log_group_name,
+        log_streams,
+        logs_location,
+        start_time=None,
+        end_time=None,
+        thread_count=None
+):
+    """
+    Exports the logStreams, `log_streams`, concurrently to a file per stream named
+    after the stream within the directory, `logs_location`. Streams which cannot be
+    exported are reported without interrupting the export of the others.
+
+    :param log_group_name: cloudwatch logGroup
+    :param log_streams: names of the logStreams to export
+    :param logs_location: directory to write the files to
+    :param start_time: if specified, events older than this time, expressed in
+                       milliseconds since the epoch, are not exported
+    :param end_time: if specified, events at or after this time, expressed in
+                     milliseconds since the epoch, are not exported
+    :param thread_count: maximum number of logStreams to export at the same time;
+                         defaults to `EXPORT_THREAD_COUNT`
+    """
+    if not log_streams:
+        return
+
+    thread_count = thread_count or EXPORT_THREAD_COUNT
+    with ThreadPoolExecutor(max_workers=min(thread_count, len(log_streams))) as executor:
+        futures = [
+            (
+                log_stream,
+                executor.submit(
+                    export_cloudwatch_log_stream,
+                    log_group_name,
+                    log_stream,
+                    __get_full_path_for_instance_logs(logs_location, log_stream),
+                    start_time,
+                    end_time
+                )
+            )
+            for log_stream in log_streams
+        ]
+        for log_stream, future in futures:
+            try:
+                future.result()
+            except ServiceError as e:
+                LOG.debug('Received service error {}'.format(e))
+                io.log_warning(strings['logs.export_failed'].format(log_stream=log_stream, error=e))
+
+
 def get_cloudwatch_log_stream_events(log_group_name, stream_name, num_log_events=None):
     """
     Gets log events from CloudWatch and appends them to a single string to output with each line prefixed with
@@ -431,6 +652,23 @@ def normalize_log_group_name(env_name, log_group=None, cloudwatch_log_source=Non
     return log_group
 
 
+def parse_log_time(value):
+    """
+    Parses a date and time such as `2018-03-26T17:00:00Z` given on the command line. Times
+    without a timezone are assumed to be in UTC.
+    :param value: the date and time to parse
+    :return: the time expressed as the number of milliseconds after Jan 1, 1970 00:00:00 UTC
+    """
+    try:
+        parsed_time = parser.parse(value)
+    except (ValueError, OverflowError):
+        raise InvalidOptionsError(strings['logs.invalid_time'].format(value))
+
+    if parsed_time.tzinfo is None:
+        parsed_time = parsed_time.replace(tzinfo=tz.tzutc())
+    return calendar.timegm(parsed_time.utctimetuple()) * 1000 + parsed_time.microsecond // 1000
+
+
 def paginate_cloudwatch_logs(platform_name, version, formatter=None):
     """
     Method periodically polls CloudWatch get_log_events to retrieve the logs for the
@@ -525,7 +763,9 @@ def retrieve_cloudwatch_instance_logs(
         log_group,
         info_type,
         do_zip=False,
-        specific_log_stream=None
+        specific_log_stream=None,
+        start_time=None,
+        end_time=None
 ):
     """
     Retrieves CloudWatch logs for all the environment instances for the `log_group`
@@ -537,19 +777,25 @@ def retrieve_cloudwatch_instance_logs(
         .elasticbeanstalk/logs/
     :param do_zip: If True, zip the logs for the user
     :param specific_log_stream: Get logs for specific stream
+    :param start_time: when bundling, the time in milliseconds since the epoch of the oldest event to retrieve
+    :param end_time: when bundling, the time in milliseconds since the epoch before which events are retrieved
     """
     retrieve_cloudwatch_logs(
         log_group,
         info_type,
         do_zip,
-        specific_log_stream=specific_log_stream
+        specific_log_stream=specific_log_stream,
+        start_time=start_time,
+        end_time=end_time
     )
 
 
 def retrieve_cloudwatch_environment_health_logs(
         log_group,
         info_type,
-        do_zip=False
+        do_zip=False,
+        start_time=None,
+        end_time=None
 ):
     """
     Retrieves the environment health information identified by the `log_group` from CloudWatch
@@ -558,6 +804,8 @@ def retrieve_cloudwatch_environment_health_logs(
         tail: to get the last 100 lines and returns the result to the terminal
         'bundle': get all of the logs and save them to a dir under .elasticbeanstalk/logs/
     :param do_zip: If True, zip the logs for the user
+    :param start_time: when bundling, the time in milliseconds since the epoch of the oldest event to retrieve
+    :param end_time: when bundling, the time in milliseconds since the epoch before which events are retrieved
     :return:
     """
     retrieve_cloudwatch_logs(
@@ -565,7 +813,9 @@ def retrieve_cloudwatch_environment_health_logs(
         info_type,
         do_zip,
         specific_log_stream=None,
-        cloudwatch_log_source=logs_operations_constants.LOG_SOURCES.ENVIRONMENT_HEALTH_LOG_SOURCE
+        cloudwatch_log_source=logs_operations_constants.LOG_SOURCES.ENVIRONMENT_HEALTH_LOG_SOURCE,
+        start_time=start_time,
+        end_time=end_time
     )
 
 
@@ -574,7 +824,9 @@ def retrieve_cloudwatch_logs(
         info_type,
         do_zip=False,
         specific_log_stream=None,
-        cloudwatch_log_source=logs_operations_constants.LOG_SOURCES.INSTANCE_LOG_SOURCE
+        cloudwatch_log_source=logs_operations_constants.LOG_SOURCES.INSTANCE_LOG_SOURCE,
+        start_time=None,
+        end_time=None
 ):
     """
     Retrieves CloudWatch logs for every stream under `log_group` unless `specific_log_stream` is specified.
@@ -585,6 +837,8 @@ def retrieve_cloudwatch_logs(
     :param do_zip: If True, zip the logs for the user
     :param specific_log_stream: Get logs for specific stream
     :param cloudwatch_log_source: the cloudwatch-log-source to pull from: instance or environment-health
+    :param start_time: when bundling, the time in milliseconds since the epoch of the oldest event to retrieve
+    :param end_time: when bundling, the time in milliseconds since the epoch before which events are retrieved
     """
     log_streams = cloudwatch.get_all_stream_names(
         log_group_name=log_group,
@@ -594,51 +848,70 @@ def retrieve_cloudwatch_logs(
     if info_type == logs_operations_constants.INFORMATION_FORMAT.BUNDLE:
         logs_location = _setup_logs_folder(cloudwatch_log_source)
 
-        for log_stream in log_streams:
-            full_logs = get_cloudwatch_log_stream_events(log_group, log_stream)
-            _write_full_logs_to_file(full_logs, logs_location, log_stream)
+        export_cloudwatch_logs(log_group, log_streams, logs_location, start_time=start_time, end_time=end_time)
 
         if do_zip:
             _zip_logs_location(logs_location)
         else:
+            _index_logs_location(logs_location)
             _attempt_update_symlink_to_latest_logs_retrieved(logs_location)
+            artifactcache.record_artifact(logs_location)
     else:
         stream_logs_in_terminal(log_group, log_streams)
 
 
+def search_retrieved_logs(pattern, start_time=None, end_time=None, instance_id=None):
+    """
+    Prints the lines of the logs last retrieved with `eb logs --all` which match the
+    regular expression, `pattern`, in the order in which they were logged.
+    :param pattern: regular expression to search for
+    :param start_time: if specified, the time in milliseconds since the epoch of the oldest line to print
+    :param end_time: if specified, the time in milliseconds since the epoch before which lines are printed
+    :param instance_id: if specified, only the logs of this instance are searched
+    """
+    bundle_location = fileoperations.get_logs_location('latest')
+    if not os.path.isdir(bundle_location):
+        raise NotFoundError(strings['logs.grep.no_logs_retrieved'])
+
+    hits = logsearchops.search(
+        os.path.realpath(bundle_location),
+        pattern,
+        start_time=start_time,
+        end_time=end_time,
+        path_prefix=instance_id
+    )
+
+    hit_count = 0
+    for hit in hits:
+        io.echo(str(hit))
+        hit_count += 1
+
+    if not hit_count:
+        io.echo(strings['logs.grep.no_matches'])
+
+
 def stream_environment_health_logs_from_cloudwatch(
         sleep_time=10,
         log_group=None,
         specific_log_stream=None
 ):
     """
-    Method streams CloudWatch logs to the terminal for the logGroup given. Since it
-    is possible that the logGroup might match multiple logGroups, multiple threads
-    can be spawned to switch between streams to display all of them on the same terminal.
+    Method streams CloudWatch logs to the terminal for the logGroup given. The
+    events of all the logStreams of the logGroup are merged in timestamp order
+    and displayed on the same terminal.
 
-    :param sleep_time: sleep time to refresh the logs from cloudwatch
+    :param sleep_time: longest time to wait between polls of an idle logStream
     :param log_group: cloudwatch logGroup
     :param specific_log_stream: since all of our log streams are instance ids we require
                                 this if we want a single stream
     """
-    streamer = io.get_event_streamer()
-    streamer.prompt = ' -- {0} -- (Ctrl+C to exit)'.format(log_group)
-    start_time = None
-    log_stream_names = cloudwatch_log_stream_names(log_group, specific_log_stream)
+    tail = CloudWatchLogTail(log_group, specific_log_stream, max_interval=sleep_time)
 
-    if not log_stream_names:
+    if not tail.discover_streams():
+        tail.close()
         return
 
-    latest_log_stream_name = log_stream_names[-1]
-    other_log_stream_names = log_stream_names[:-1]
-
-    for log_stream_name in other_log_stream_names:
-        _create_log_stream_for_log_group(log_group, log_stream_name, streamer, sleep_time, start_time)
-        _delay_subsequent_stream_creation()
-
-    while True:
-        _create_log_stream_for_log_group(log_group, latest_log_stream_name, streamer, sleep_time, start_time)
-        _wait_to_poll_cloudwatch()
+    _stream_log_tail(tail)
 
 
 def stream_instance_logs_from_cloudwatch(
@@ -648,56 +921,45 @@ def stream_instance_logs_from_cloudwatch(
 ):
     """
     Method streams CloudWatch logs to the terminal for the logGroup given.
-    Since it is possible that the logGroup might match multiple logGroups,
-    multiple threads can be spawned to switch between streams to display
-    all of them on the same terminal.
+    The events of all the logStreams of the logGroup, including those created
+    while streaming, are merged in timestamp order and displayed on the same
+    terminal.
 
-    :param sleep_time: sleep time to refresh the logs from cloudwatch
+    :param sleep_time: longest time to wait between polls of an idle logStream
     :param log_group: cloudwatch logGroup
     :param specific_log_stream: since all of our log streams are instance ids
                                 we require this if we want a single stream
     """
-    streamer = io.get_event_streamer()
-    streamer.prompt = ' -- {0} -- (Ctrl+C to exit)'.format(log_group)
-
-    start_time = None
-    while True:
-        log_group_names = set(cloudwatch_log_stream_names(log_group, specific_log_stream))
-
-        for log_group_name in log_group_names:
-            _create_log_stream_for_log_group(log_group, log_group_name, streamer, sleep_time, start_time)
-            _delay_subsequent_stream_creation()
-
-        _wait_to_poll_cloudwatch()
-
-        start_time = _updated_start_time()
+    _stream_log_tail(CloudWatchLogTail(log_group, specific_log_stream, max_interval=sleep_time))
 
 
 def stream_logs_in_terminal(log_group, log_streams):
     """
     Prints logs of each of the `log_streams` to terminal using a scoll-able pager as opposed to printing all
-    available information at once.
+    available information at once. The logs of each stream are handed to the pager as soon as they are
+    retrieved.
     :param log_group: name of the CloudWatch log group within which to find `stream_name`
     :param log_streams: the list of log streams belonging to the `log_group` whose events to print to terminal
     :return: None
     """
-    all_logs = ''
+    io.echo_with_pager_incrementally(_log_stream_tails(log_group, log_streams))
+
+
+def _log_stream_tails(log_group, log_streams):
     for log_stream in log_streams:
         tail_logs = get_cloudwatch_log_stream_events(
             log_group,
             log_stream,
             num_log_events=TAIL_LOG_SIZE
         )
-        all_logs += '{linesep}{linesep}============= ' \
-                    '{log_stream} - {log_group} ==============' \
-                    '{linesep}{linesep}'.format(
-                        log_stream=str(log_stream),
-                        log_group=log_group,
-                        linesep=os.linesep
-                    )
-        all_logs += tail_logs
-
-    io.echo_with_pager(all_logs)
+        yield '{linesep}{linesep}============= ' \
+              '{log_stream} - {log_group} ==============' \
+              '{linesep}{linesep}'.format(
+                  log_stream=str(log_stream),
+                  log_group=log_group,
+                  linesep=os.linesep
+              )
+        yield tail_logs
 
 
 def stream_platform_logs(platform_name, version, streamer=None, sleep_time=4, log_name=None, formatter=None):
@@ -783,19 +1045,6 @@ def _attempt_update_symlink_to_latest_logs_retrieved(logs_location):
         pass
 
 
-def _create_log_stream_for_log_group(log_group, stream_name, streamer, sleep_time, start_time=None):
-    cloudwatch_log_stream = threading.Thread(
-        target=stream_single_stream,
-        args=(log_group, stream_name, sleep_time, start_time,),
-    )
-    cloudwatch_log_stream.daemon = True
-    cloudwatch_log_stream.start()
-
-
-def _delay_subsequent_stream_creation():
-    time.sleep(0.2)
-
-
 def _download_logs_for_all_instances(instance_id_list, logs_location):
     for instance_id, url in iteritems(instance_id_list):
         zip_location = utils.save_file_from_url(
@@ -897,9 +1146,11 @@ def _handle_bundle_logs(instance_id_list, do_zip):
     if do_zip:
         _handle_log_zipping(logs_location)
     else:
+        _index_logs_location(logs_location)
         io.echo(strings['logs.location'].replace('{location}',
                                                  logs_location))
         _attempt_update_symlink_to_latest_logs_retrieved(logs_location)
+        artifactcache.record_artifact(logs_location)
 
 
 def _handle_log_zipping(logs_location):
@@ -914,15 +1165,63 @@ def _handle_log_zipping(logs_location):
             logs_zip
         )
     )
+    artifactcache.record_artifact(logs_zip)
 
 
 def _handle_tail_logs(instance_id_list):
-    data = []
-    for instance_id, url in iteritems(instance_id_list):
-        data.append('============= ' + str(instance_id) + ' ==============')
-        log_result = utils.get_data_from_url(url)
-        data.append(utils.decode_bytes(log_result))
-    io.echo_with_pager(os.linesep.join(data))
+    io.echo_with_pager_incrementally(_fetch_tail_logs(instance_id_list))
+
+
+def _fetch_tail_logs(instance_id_list):
+    """
+    Downloads the tail logs of all the instances of `instance_id_list` concurrently
+    and yields them in the order of `instance_id_list`, each as soon as it and the
+    ones before it are available. A download which fails, or which takes more than
+    `TAIL_FETCH_TIMEOUT` seconds after it started, is reported in place of the logs
+    of its instance without holding up the others. Downloads which have not started
+    by the time the generator is closed are cancelled.
+    :param instance_id_list: an ordered mapping of instance ids to the URLs of their tail logs
+    """
+    started_at = {}
+
+    def fetch(instance_id, url):
+        started_at[instance_id] = time.time()
+        return utils.decode_bytes(utils.get_data_from_url(url, timeout=TAIL_FETCH_TIMEOUT))
+
+    executor = ThreadPoolExecutor(max_workers=TAIL_FETCH_THREAD_COUNT)
+    futures = [
+        (instance_id, executor.submit(fetch, instance_id, url))
+        for instance_id, url in iteritems(instance_id_list)
+    ]
+    try:
+        for index, (instance_id, future) in enumerate(futures):
+            if index:
+                yield os.linesep
+            yield '============= ' + str(instance_id) + ' ==============' + os.linesep
+            yield _tail_log_result(instance_id, future, started_at)
+    finally:
+        for _, future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _tail_log_result(instance_id, future, started_at):
+    while True:
+        fetch_started_at = started_at.get(instance_id)
+        if fetch_started_at is None:
+            wait_time = TAIL_FETCH_TIMEOUT
+        else:
+            wait_time = fetch_started_at + TAIL_FETCH_TIMEOUT - time.time()
+
+        try:
+            return future.result(timeout=max(wait_time, 0))
+        except TimeoutError:
+            if fetch_started_at is not None:
+                LOG.debug('Timed out retrieving the tail logs of {0}'.format(instance_id))
+                return strings['logs.tail_timed_out'].format(timeout=TAIL_FETCH_TIMEOUT)
+        except (OSError, HTTPException) as e:
+            LOG.debug('Unable to retrieve the tail logs of {0}: {1}'.format(instance_id, e))
+            return strings['logs.tail_failed'].format(error=e)
 
 
 def _handle_analyze_logs(instance_id_list):
@@ -931,6 +1230,13 @@ def _handle_analyze_logs(instance_id_list):
         io.echo(utils.decode_bytes(log_result))
 
 
+def _index_logs_location(logs_location):
+    try:
+        logsearchops.build_index(logs_location)
+    except (IOError, OSError, ValueError) as e:
+        LOG.debug('Unable to index the logs in {0}: {1}'.format(logs_location, e))
+
+
 def _instance_log_streaming_option_setting(disable=False):
     return elasticbeanstalk.create_option_setting(
         namespaces.CLOUDWATCH_LOGS,
@@ -980,6 +1286,19 @@ def _setup_logs_folder(cloudwatch_log_source):
     return fileoperations.get_logs_location(logs_folder_name)
 
 
+def _stream_log_tail(tail):
+    streamer = io.get_event_streamer()
+    streamer.prompt = ' -- {0} -- (Ctrl+C to exit)'.format(tail.log_group)
+    try:
+        while True:
+            for _, stream_name, message in tail.poll():
+                streamer.stream_event('[{0}] {1}'.format(stream_name, message))
+            _wait_to_poll_cloudwatch(tail.seconds_until_next_poll())
+    finally:
+        tail.close()
+        streamer.end_stream()
+
+
 def _timestamped_directory_name():
     return datetime.now().strftime("%y%m%d_%H%M%S")
 
@@ -1001,14 +1320,6 @@ def _wait_to_poll_cloudwatch(sleep_time=10):
     time.sleep(sleep_time)
 
 
-def _write_full_logs_to_file(full_logs, logs_location, instance_id):
-    full_filepath = __get_full_path_for_instance_logs(logs_location, instance_id)
-    with open(full_filepath, 'w+') as log_file:
-        log_file.write(full_logs)
-
-    fileoperations.set_user_only_permissions(full_filepath)
-
-
 def _zip_logs_location(logs_location):
     fileoperations.zip_up_folder(logs_location, logs_location + '.zip')
     fileoperations.delete_directory(logs_location)
@@ -1016,3 +1327,4 @@ def _zip_logs_location(logs_location):
     logs_location += '.zip'
     fileoperations.set_user_only_permissions(logs_location)
     io.echo(strings['logs.location'].replace('{location}', logs_location))
+    artifactcache.record_artifact(logs_location)
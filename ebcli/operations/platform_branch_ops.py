@@ -10,10 +10,10 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
-from ebcli.lib import elasticbeanstalk
+from ebcli.lib import aws, elasticbeanstalk
 from ebcli.objects.platform import PlatformBranch, PlatformVersion
 
-_non_retired_platform_branches_cache = None
+_non_retired_platform_branches_cache = {}
 
 
 def collect_families_from_branches(branches):
@@ -51,20 +51,20 @@ def list_nonretired_platform_branches():
     """
     Provides a list of all platform branches that are not retired.
     This includes deprecated and beta platform branches.
-    Return value is cached preventing redundant http requests on
+    Return value is cached per region preventing redundant http requests on
     subsequent calls.
     """
-    global _non_retired_platform_branches_cache
-    if not _non_retired_platform_branches_cache:
+    region = aws.get_region_name()
+    if not _non_retired_platform_branches_cache.get(region):
         noretired_filter = {
             'Attribute': 'LifecycleState',
             'Operator': '!=',
             'Values': ['Retired']
         }
-        _non_retired_platform_branches_cache = elasticbeanstalk.list_platform_branches(
+        _non_retired_platform_branches_cache[region] = elasticbeanstalk.list_platform_branches(
             filters=[noretired_filter])
 
-    return _non_retired_platform_branches_cache
+    return _non_retired_platform_branches_cache[region]
 
 
 def _resolve_conflicting_platform_branches(branches):
@@ -13,6 +13,8 @@
 
 import subprocess
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from cement.utils.misc import minimal_logger
 
@@ -24,6 +26,7 @@ from ebcli.operations import commonops
 
 
 LOG = minimal_logger(__name__)
+FANOUT_CONCURRENCY = 10
 
 
 def prepare_for_ssh(env_name, instance, keep_open, force, setup, number,
@@ -99,32 +102,19 @@ def ssh_into_instance(instance_id, keep_open=False, force_open=False, custom_ssh
         else:
             raise NotFoundError(strings['ssh.noip'])
     security_groups = instance['SecurityGroups']
+    described_groups = dict(
+        (group['GroupId'], ec2.describe_security_group(group['GroupId'])) for group in security_groups
+    )
 
     user = 'ec2-user'
 
-    ssh_group = None
-    has_restriction = False
-    rule_existed_before = False
-    group_id = None
-    for group in security_groups:
-        group_id = group['GroupId']
-        group = ec2.describe_security_group(group_id)
-        for permission in group.get('IpPermissions', []):
-            if permission.get('ToPort', None) == 22:
-                ssh_group = group_id
-                for rng in permission.get('IpRanges', []):
-                    ip_restriction = rng.get('CidrIp', None)
-                    if ip_restriction is not None:
-                        if ip_restriction != '0.0.0.0/0':
-                            has_restriction = True
-                        elif ip_restriction == '0.0.0.0/0':
-                            rule_existed_before = True
+    ssh_group, has_restriction, rule_existed_before = _find_ssh_ingress(security_groups, described_groups)
 
     if has_restriction and not force_open:
         io.log_warning(strings['ssh.notopening'])
-    elif group_id and not rule_existed_before:
+    elif ssh_group and not rule_existed_before:
         io.echo(strings['ssh.openingport'])
-        ec2.authorize_ssh(ssh_group or group_id)
+        ec2.authorize_ssh(ssh_group)
         io.echo(strings['ssh.portopen'])
 
     try:
@@ -149,11 +139,168 @@ def ssh_into_instance(instance_id, keep_open=False, force_open=False, custom_ssh
     finally:
         if keep_open:
             pass
-        elif (not has_restriction or force_open) and group_id and not rule_existed_before:
-            ec2.revoke_ssh(ssh_group or group_id)
+        elif (not has_restriction or force_open) and ssh_group and not rule_existed_before:
+            ec2.revoke_ssh(ssh_group)
             io.echo(strings['ssh.closeport'])
 
 
+def _find_ssh_ingress(security_groups, described_groups):
+    """
+    Inspects the port 22 rules of the security groups of an instance.
+    :param security_groups: the `SecurityGroups` of the instance
+    :param described_groups: a dict of security group id to described security group
+    :return: a tuple of the id of the group to open port 22 in, whether
+             ingress is restricted to specific addresses, and whether port 22
+             is already open to 0.0.0.0/0
+    """
+    ssh_group = None
+    has_restriction = False
+    rule_existed_before = False
+    group_id = None
+    for group in security_groups:
+        group_id = group['GroupId']
+        group = described_groups.get(group_id, {})
+        for permission in group.get('IpPermissions', []):
+            if permission.get('ToPort', None) == 22:
+                ssh_group = group_id
+                for rng in permission.get('IpRanges', []):
+                    ip_restriction = rng.get('CidrIp', None)
+                    if ip_restriction is not None:
+                        if ip_restriction != '0.0.0.0/0':
+                            has_restriction = True
+                        elif ip_restriction == '0.0.0.0/0':
+                            rule_existed_before = True
+
+    return ssh_group or group_id, has_restriction, rule_existed_before
+
+
+def run_on_all_instances(env_name, command, keep_open=False, force_open=False, custom_ssh=None,
+                         concurrency=FANOUT_CONCURRENCY):
+    """
+    Runs `command` over SSH on every instance of `env_name`, at most
+    `concurrency` instances at a time, echoing each line of output prefixed
+    with the id of the instance that produced it, and then a summary of the
+    exit codes.
+
+    The instances and their security groups are described in one call each,
+    and port 22 is opened in each security group which needs it once before
+    the command starts anywhere and closed once after it has finished
+    everywhere.
+    :raises CommandError: when the command failed on any instance
+    """
+    instance_ids = commonops.get_instance_ids(env_name)
+    if not instance_ids:
+        raise InvalidOptionsError(strings['ssh.noinstance'])
+    instances = ec2.describe_instances(instance_ids)
+    if any('KeyName' not in instance for instance in instances):
+        raise NoKeypairError()
+
+    described_groups = dict(
+        (group['GroupId'], group)
+        for group in ec2.describe_security_groups(
+            sorted(set(group['GroupId'] for instance in instances for group in instance['SecurityGroups']))
+        )
+    )
+    groups_to_open = []
+    for instance in instances:
+        ssh_group, has_restriction, rule_existed_before = _find_ssh_ingress(
+            instance['SecurityGroups'],
+            described_groups
+        )
+        if has_restriction and not force_open:
+            io.log_warning(strings['ssh.notopening'])
+        elif ssh_group and not rule_existed_before and ssh_group not in groups_to_open:
+            groups_to_open.append(ssh_group)
+
+    opened_groups = []
+    try:
+        for group_id in groups_to_open:
+            io.echo(strings['ssh.openingport'])
+            ec2.authorize_ssh(group_id)
+            opened_groups.append(group_id)
+            io.echo(strings['ssh.portopen'])
+
+        exit_codes = _run_concurrently(instances, command, custom_ssh, concurrency)
+    finally:
+        if not keep_open:
+            for group_id in opened_groups:
+                ec2.revoke_ssh(group_id)
+                io.echo(strings['ssh.closeport'])
+
+    io.echo()
+    io.echo(strings['ssh.all.summary'])
+    for instance in instances:
+        exit_code = exit_codes[instance['InstanceId']]
+        io.echo('  {0}: {1}'.format(
+            instance['InstanceId'],
+            strings['ssh.all.noip'] if exit_code is None else exit_code
+        ))
+
+    failures = len([exit_code for exit_code in exit_codes.values() if exit_code != 0])
+    if failures:
+        raise CommandError(
+            strings['ssh.all.failed'].format(failures=failures, total=len(instances))
+        )
+
+
+def _run_concurrently(instances, command, custom_ssh, concurrency):
+    """
+    :return: a dict of instance id to the exit code of the command on it, or
+             to None when the instance has no address to connect to
+    """
+    output_lock = threading.Lock()
+    processes = []
+    stopping = threading.Event()
+
+    def run(instance):
+        ip = instance.get('PublicIpAddress') or instance.get('PrivateIpAddress')
+        if not ip:
+            return None
+        if custom_ssh:
+            ssh_command = custom_ssh.split()
+        else:
+            ssh_command = [
+                'ssh', '-i', _get_ssh_file(instance['KeyName']), '-o', 'IdentitiesOnly yes', '-o', 'BatchMode yes'
+            ]
+        ssh_command.extend(['ec2-user@' + ip] + command.split())
+
+        prefix = '[{0}] '.format(instance['InstanceId'])
+        with output_lock:
+            if stopping.is_set():
+                return None
+            io.echo(prefix + 'INFO: Running ' + ' '.join(ssh_command))
+            try:
+                process = subprocess.Popen(
+                    ssh_command,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT
+                )
+            except OSError:
+                raise CommandError(strings['ssh.notpresent'])
+            processes.append(process)
+
+        for line in iter(process.stdout.readline, b''):
+            with output_lock:
+                io.echo(prefix + line.decode('utf-8', 'replace').rstrip('\r\n'))
+        process.stdout.close()
+        returncode = process.wait()
+        LOG.debug('{0} returned exitcode {1} for {2}'.format(ssh_command[0], returncode, instance['InstanceId']))
+        return returncode
+
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    try:
+        futures = [(instance['InstanceId'], executor.submit(run, instance)) for instance in instances]
+        return dict((instance_id, future.result()) for instance_id, future in futures)
+    finally:
+        with output_lock:
+            stopping.set()
+            for process in processes:
+                if process.poll() is None:
+                    process.terminate()
+        executor.shutdown(wait=True)
+
+
 def _get_ssh_file(keypair_name):
     key_file = fileoperations.get_ssh_folder() + keypair_name
     if not os.path.exists(key_file):
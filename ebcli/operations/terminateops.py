@@ -14,9 +14,9 @@ from collections import defaultdict
 
 from botocore.compat import six
 
-from ebcli.lib import elasticbeanstalk, s3
+from ebcli.lib import aws, elasticbeanstalk, s3
 from ebcli.resources.strings import prompts
-from ebcli.core import io, fileoperations
+from ebcli.core import completioncache, io, fileoperations
 from ebcli.objects.sourcecontrol import SourceControl
 from ebcli.objects.exceptions import NotAuthorizedError
 from ebcli.operations import commonops
@@ -33,6 +33,7 @@ def terminate(
         env_name,
         force_terminate=force_terminate
     )
+    completioncache.remove_environment(aws.get_region_name(), env_name)
 
     dissociate_environment_from_branch(env_name)
 
@@ -62,6 +63,7 @@ def delete_app(
     cleanup_application_versions(app_name)
 
     request_id = elasticbeanstalk.delete_application_and_envs(app_name)
+    completioncache.remove_application(aws.get_region_name(), app_name)
 
     if cleanup:
         cleanup_ignore_file()
@@ -205,6 +205,11 @@ To get started enter "eb platform init". Then enter "eb platform create".""",
     'create.valid_spot_instances': 'For Spot Instance types, specify a comma-separated list of two or more valid EC2 instance',
     'create.missing_enable_spot': 'Specify the "--enable-spot" argument with any spot-related arguments.',
     'ssh.instanceandnumber': 'You cannot use the "--instance" and "--number" options together.',
+    'ssh.allandinstance': 'You cannot use the "--all" option with the "--instance", "--number", or "--setup" options.',
+    'ssh.allwithoutcommand': 'You must specify the command to run on all instances with the "--command" option.',
+    'ssh.all.summary': 'Exit codes:',
+    'ssh.all.noip': 'not run, the instance has no IP address',
+    'ssh.all.failed': 'The command failed on {failures} of {total} instances.',
     'ssh.noinstance': "You tried to connect to an environment with no running instances.  SSH can only connect to "
                       "running instances.  Use 'eb health' to display the status of instances in this environment.",
     'terminate.noenv': 'To delete the application and all application versions, type "eb terminate '
@@ -301,6 +306,8 @@ To get started enter "eb platform init". Then enter "eb platform create".""",
     'local.invalidjson': 'The Dockerrun.aws.json file is not in valid JSON format.',
     'local.run.noportexposed': 'The Dockerfile must list ports to expose on the Docker container. Specify '
                                'at least one port, and then try again.',
+    'local.run.imagecached': 'Using image {0}, which was built from the same Dockerfile, configuration '
+                             'and application files. Skipping docker build.',
     'local.run.nobaseimg': 'The Dockerfile or Dockerrun.aws.json file does not specify a base image. '
                            'Specify a base image, and then try again.',
     'local.run.socketperms': 'If you are on Ubuntu, ensure that you have added yourself into the Unix '
@@ -338,6 +345,13 @@ To get started enter "eb platform init". Then enter "eb platform create".""",
     'deploy.archivewithsource': 'You cannot use the "--archive" option with the "--source" option for environment updates. '
                                'These are mutually exclusive methods for specifying application code.',
     'deploy.archive_must_be_dir_or_zip': 'The "--archive" option requires a directory or ZIP file as an argument.',
+    'deploy.archivewithmultipleenvs': 'You cannot use the "--archive" option when deploying to multiple environments.',
+    'deploy.invalidwavesize': 'The "--wave-size" option requires a positive number of environments.',
+    'deploy.multiple.nomatch': 'No environments match the pattern "{pattern}".',
+    'deploy.multiple.wave': '--- Deploying wave {number}: {environments} ---',
+    'deploy.multiple.skipped': 'Not deployed because an earlier wave did not succeed.',
+    'deploy.multiple.summary': 'Deployment summary:',
+    'deploy.multiple.failed': 'Deployment did not succeed for the following environments: {environments}',
     'compose.noenvyaml':
         'The module {module} does not contain an env.yaml file. This module will be skipped.',
     'compose.novalidmodules': 'No valid modules were found. No environments will be created.',
@@ -401,7 +415,23 @@ To get started enter "eb platform init". Then enter "eb platform create".""",
     'logs.instance_log_streaming_disabled':
         'Can\'t retrieve instance logs for environment {}. Instance '
         'log streaming is disabled.',
+    'agent.connection_lost': 'The connection to the eb agent was lost before the command finished. '
+                             'Set AWS_EB_AGENT=0 to run commands without the agent.',
     'logs.location': 'Logs were saved to {location}',
+    'logs.export_failed': 'Unable to retrieve the logs of {log_stream}: {error}',
+    'logs.tail_failed': 'Unable to retrieve the tail logs of this instance: {error}',
+    'logs.tail_timed_out': 'Timed out after {timeout} seconds retrieving the tail logs of this instance.',
+    'logs.grep.invalid_pattern': 'The "--grep" pattern "{pattern}" isn\'t a valid regular expression: {error}',
+    'logs.grep.no_logs_retrieved': 'No retrieved logs to search. Run "eb logs --all" to retrieve logs first.',
+    'logs.grep.no_matches': 'No log lines match.',
+    'logs.grep_argument_and_retrieval_argument':
+        'You can\'t use the "--grep" option with options that retrieve, stream or analyze logs. '
+        '"--grep" searches the logs last retrieved with "eb logs --all".',
+    'logs.invalid_time': 'Can\'t parse the date and time "{}". Specify a date and time such as '
+                         '2018-03-26T17:00:00Z.',
+    'logs.time_range_requires_cloudwatch_bundle':
+        'You can use the "--start-time" and "--end-time" options only when retrieving all '
+        'logs from CloudWatch Logs with "--all" or "--zip", or with "--grep".',
     'logs.log_group_and_environment_health_log_source':
         'You can\'t use the "--log-group" option when retrieving environment-health '
         'logs. These logs are in a specific, implied log group.',
@@ -696,6 +726,7 @@ prompts = {
     'appversion.delete.validate': 'Do you want to delete the application '
                                   'version with label: {}?',
     'appversion.delete.prompt': 'Select a version # to delete (1 to {}).',
+    'appversion.filter.prompt': 'Filter versions by label, status:<status>, since:<YYYY-MM-DD> or in-use:',
 
     'codecommit.usecc': 'Do you wish to continue with CodeCommit?',
 
@@ -771,6 +802,7 @@ flag_text = {
     'base.region': 'use a specific region',
     'general.timeout': 'timeout period in minutes',
     'base.noverify': "don't verify AWS SSL certificates",
+    'base.trace': 'record a Chrome trace of where the command spends its time to FILE',
 
     'clone.env': 'name of environment to clone',
     'clone.name': 'desired name for environment clone',
@@ -823,7 +855,9 @@ flag_text = {
     'create.shared_lb': 'ARN of shared load balancer',
     'create.shared_lb_port': 'Port number for shared load balancer listener',
 
-    'deploy.env': 'environment name',
+    'deploy.env': 'environment name; specify several names or shell-style patterns to deploy one build to multiple environments',
+    'deploy.max_concurrency': 'maximum number of environments to start updating at the same time when deploying to multiple environments',
+    'deploy.wave_size': 'number of environments to deploy to per wave; each wave starts after the previous one succeeds',
     'deploy.modules': 'modules to deploy',
     'deploy.version': 'existing version label to deploy',
     'deploy.label': 'label name which version will be given',
@@ -837,6 +871,10 @@ flag_text = {
 
     'platformevents.version': 'version to retrieve events for',
     'events.follow': 'wait and continue to print events as they come',
+    'events.since': 'print events logged at or after this date and time, such as 2018-03-26T17:00:00Z',
+    'events.severity': 'print only events of this severity or higher',
+    'events.request_id': 'print only events of the request with this ID',
+    'events.version_label': 'print only events about the application version with this label',
 
     'init.name': 'application name',
     'init.platform': 'default Platform',
@@ -865,6 +903,11 @@ flag_text = {
     'logs.analyze': 'AI-powered analysis of logs, events, and environment health',
     'logs.instance': 'retrieve logs only for this instance',
     'logs.log-group': 'retrieve logs only for this log group',
+    'logs.start_time': 'with --all or --zip, retrieve only CloudWatch log events logged at or after this time;\n'
+                       'with --grep, search only lines logged at or after this time',
+    'logs.end_time': 'with --all or --zip, retrieve only CloudWatch log events logged before this time;\n'
+                     'with --grep, search only lines logged before this time',
+    'logs.grep': 'search the logs last retrieved with --all for lines matching this regular expression',
     'logs.stream': 'enable/disable log streaming to CloudWatch Logs',
     'logs.environment': 'environment from which to download logs',
     'logs.cloudwatch_logs': 'enable/disable log streaming to CloudWatch Logs',
@@ -954,6 +997,9 @@ a string. In both cases, config must have the format:
     'ssh.custom': "Specify an SSH command to use instead of 'ssh -i keyfile'. Do not "
                   "include the remote user and hostname.",
     'ssh.force': 'force port 22 open to 0.0.0.0',
+    'ssh.all': 'Run the command given with "--command" on all instances of the environment '
+               'at once instead of one instance.',
+    'ssh.concurrency': 'The maximum number of instances to run the command on at a time with "--all".',
     'ssh.setup': 'setup SSH for the environment',
     'ssh.timeout': "Specify the timeout period in minutes. Can only be used with the "
                    "'--setup' argument.",
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Benchmarks the end-to-end latency of `eb status` and `eb list`, as seen by a
+process which shells out to `eb`, with and without the warm agent enabled by
+`AWS_EB_AGENT=1`.
+
+The commands run in PROJECT_DIR, a directory initialized with `eb init` and
+with a default environment selected with `eb use`, using the credentials and
+region that `eb` would use there. Pass --endpoint-url to run them against a
+stand-in for the Elastic Beanstalk API instead of the real service.
+
+Usage: python scripts/benchmarks/agent_latency.py PROJECT_DIR [--runs N] [--endpoint-url URL]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+REPOSITORY_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir))
+sys.path.insert(0, REPOSITORY_ROOT)
+
+from ebcli.core import agent  # noqa: E402
+
+EB = os.path.join(REPOSITORY_ROOT, 'bin', 'eb')
+COMMANDS = (['status'], ['list'])
+
+
+def _environment(use_agent):
+    environ = dict(os.environ)
+    environ['PYTHONPATH'] = os.pathsep.join(filter(None, [REPOSITORY_ROOT, environ.get('PYTHONPATH')]))
+    environ[agent.AGENT_ENV_VAR] = '1' if use_agent else '0'
+    return environ
+
+
+def _run(command, environ, project_dir):
+    start = time.time()
+    process = subprocess.run(
+        [sys.executable, EB] + command,
+        cwd=project_dir,
+        env=environ,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+    elapsed = time.time() - start
+    if process.returncode:
+        raise RuntimeError('`eb {0}` exited with {1}: {2}'.format(
+            ' '.join(command), process.returncode, process.stderr.decode('utf-8', 'replace')))
+    return elapsed
+
+
+def _start_agent(environ, project_dir, extra_args):
+    _run(['list'] + extra_args, environ, project_dir)
+    location = agent.socket_location(environ)
+    deadline = time.time() + 30
+    while not os.path.exists(location):
+        if time.time() > deadline:
+            raise RuntimeError('The agent did not start listening on {0}'.format(location))
+        time.sleep(0.1)
+
+
+def _percentile(timings, fraction):
+    timings = sorted(timings)
+    return timings[min(len(timings) - 1, int(round(fraction * (len(timings) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('project_dir')
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--endpoint-url', help='Elastic Beanstalk endpoint to send requests to')
+    args = parser.parse_args()
+
+    extra_args = ['--endpoint-url', args.endpoint_url] if args.endpoint_url else []
+    project_dir = os.path.abspath(args.project_dir)
+    agent.stop(os.environ)
+    try:
+        for use_agent in (False, True):
+            environ = _environment(use_agent)
+            if use_agent:
+                _start_agent(environ, project_dir, extra_args)
+
+            for command in COMMANDS:
+                timings = [_run(command + extra_args, environ, project_dir) for _ in range(args.runs)]
+                print('eb {0:<8} {1:<14} median {2:6.3f}s  p90 {3:6.3f}s  min {4:6.3f}s  ({5} runs)'.format(
+                    command[0],
+                    'with agent' if use_agent else 'without agent',
+                    _percentile(timings, 0.5),
+                    _percentile(timings, 0.9),
+                    min(timings),
+                    args.runs
+                ))
+    finally:
+        agent.stop(os.environ)
+
+
+if __name__ == '__main__':
+    main()
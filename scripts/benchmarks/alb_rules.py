@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Benchmarks compiling the bindings and rewrite rules of a large IIS estate
+into ALB listener rules with `migrate.ALBRuleCompiler`, merging and packing
+them as `compile_alb_rules` does, or emitting one rule per binding and
+rewrite rule as `create_alb_rules` does, without the per-listener limit so
+that the number of rules each approach needs is reported. Translating the
+rewrite patterns is also timed against uncached, uncompiled regular
+expressions, as `translate_iis_to_alb` used to.
+
+The synthetic estate spreads the bindings over a few ports and host names,
+and gives every site a handful of rewrite rules drawn from a shared pool,
+as sites deployed from the same code base do.
+
+Usage: python scripts/benchmarks/alb_rules.py [--bindings N] [--ports N] [--rules N]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.path.pardir, os.path.pardir))
+
+from ebcli.controllers import migrate  # noqa: E402
+
+PATTERN_POOL = [
+    '^/api/v{0}/(.+)$',
+    '^/products/{{id:int}}/details/{0}$',
+    '^/users/([a-zA-Z0-9]+)/profile/{0}$',
+    '^/static/[0-9]+/assets{0}/(.*)',
+    '^/blog/([a-z\\-]+)/([0-9]{{4}})/{0}/?$',
+]
+
+
+def synthetic_site_configs(bindings, ports, rules_per_site):
+    site_configs = []
+    for index in range(bindings):
+        port = 80 if index % ports == 0 else 8000 + index % ports
+        site = migrate.SiteConfig(
+            name='site-{0}'.format(index),
+            binding_info='*:{0}:site{1}.example.com'.format(port, index % (bindings // 4 or 1)),
+            physical_path='C:\\inetpub\\site{0}'.format(index),
+            protocol='https' if index % 10 == 0 else 'http',
+        )
+        site.rewrite_rules = [
+            {'name': 'rule-{0}'.format(rule), 'pattern': PATTERN_POOL[rule % len(PATTERN_POOL)].format((index + rule) % 40)}
+            for rule in range(rules_per_site)
+        ]
+        site_configs.append(site)
+    return site_configs
+
+
+def previous_translate_iis_to_alb(iis_pattern):
+    alb_pattern = iis_pattern.strip("^$")
+    alb_pattern = re.sub(r"\.\+", "?*", alb_pattern)
+    alb_pattern = re.sub(r"\.\*", "*", alb_pattern)
+    alb_pattern = re.sub("({.*})", "*", alb_pattern)
+    alb_pattern = alb_pattern.lstrip("^")
+    alb_pattern = re.sub(r"\[.*?\]\+", "*", alb_pattern)
+    alb_pattern = re.sub(r"\[.*?\]\*", "*", alb_pattern)
+    alb_pattern = re.sub(r"\([^()]*\)", "*", alb_pattern)
+    if not alb_pattern.startswith("/"):
+        alb_pattern = "/" + alb_pattern
+    return alb_pattern.replace("**", "*").rstrip("$")
+
+
+def _time(call):
+    start = time.perf_counter()
+    result = call()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bindings', type=int, default=5000, help='number of site bindings')
+    parser.add_argument('--ports', type=int, default=8, help='number of distinct ports, hence target groups')
+    parser.add_argument('--rules', type=int, default=4, help='number of rewrite rules per site')
+    args = parser.parse_args()
+
+    site_configs = synthetic_site_configs(args.bindings, args.ports, args.rules)
+    patterns = [rule['pattern'] for site in site_configs for rule in site.rewrite_rules]
+
+    elapsed, _ = _time(lambda: [previous_translate_iis_to_alb(pattern) for pattern in patterns])
+    print('{0:<32} {1:8.1f} ms  ({2} patterns)'.format('translate, uncompiled', elapsed * 1e3, len(patterns)))
+    migrate.translate_iis_to_alb.cache_clear()
+    elapsed, _ = _time(lambda: [migrate.translate_iis_to_alb(pattern) for pattern in patterns])
+    print('{0:<32} {1:8.1f} ms  ({2} patterns)'.format('translate, compiled + memoized', elapsed * 1e3, len(patterns)))
+
+    for name, merge in [('one rule per route', False), ('merged and packed', True)]:
+        migrate.translate_iis_to_alb.cache_clear()
+        compiler = migrate.ALBRuleCompiler(merge=merge, max_rules_per_listener=None)
+        elapsed, rules = _time(lambda: compiler.compile(site_configs))
+        per_listener = {}
+        for rule in rules:
+            per_listener[rule['Protocol']] = per_listener.get(rule['Protocol'], 0) + 1
+        print('{0:<32} {1:8.1f} ms  {2} rules, per listener: {3}'.format(
+            name, elapsed * 1e3, len(rules), per_listener))
+
+
+if __name__ == '__main__':
+    main()
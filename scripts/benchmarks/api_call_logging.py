@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Benchmarks the per-call overhead of the debug logging in `aws.make_api_call`
+on a large `describe_events` response, with logging at WARNING and at DEBUG,
+against the previous implementation which formatted the request and the
+whole response on every call regardless of the log level.
+
+The operation is replaced by a function which returns a canned response, so
+the timings are those of the EB CLI's own work around the call.
+
+Usage: python scripts/benchmarks/api_call_logging.py [--events N] [--calls N]
+"""
+import argparse
+import datetime
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.path.pardir, os.path.pardir))
+
+from ebcli.lib import aws  # noqa: E402
+
+
+def _describe_events_response(events):
+    return {
+        'Events': [
+            {
+                'EventDate': datetime.datetime(2026, 1, 1, 0, 0, index % 60),
+                'Message': 'Environment health has transitioned from Ok to Info. Instance {0} is running.'.format(index),
+                'ApplicationName': 'my-application',
+                'EnvironmentName': 'my-environment',
+                'RequestId': '00000000-0000-0000-0000-{0:012d}'.format(index),
+                'Severity': 'INFO',
+            }
+            for index in range(events)
+        ],
+        'ResponseMetadata': {'HTTPStatusCode': 200, 'RequestId': 'request-id', 'HTTPHeaders': {}},
+    }
+
+
+def previous_logging(service_name, operation_name, region, operation_options, response_data):
+    aws.LOG.debug('Making api call: (' +
+                  service_name + ', ' + operation_name +
+                  ') to region: ' + region + ' with args:' + str(operation_options))
+    aws.LOG.debug('API call finished, status = ' + str(response_data['ResponseMetadata']['HTTPStatusCode']))
+    aws.LOG.debug('Response: ' + str(response_data))
+
+
+def _time_calls(calls, call):
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=1000, help='number of events in the response')
+    parser.add_argument('--calls', type=int, default=200)
+    args = parser.parse_args()
+
+    response = _describe_events_response(args.events)
+    aws._set_operation = lambda service_name, operation_name: lambda **kwargs: response
+    aws.set_region('us-east-1')
+    options = {'ApplicationName': 'my-application', 'EnvironmentName': 'my-environment', 'MaxRecords': 1000}
+
+    handler = logging.StreamHandler(open(os.devnull, 'w'))
+    aws.LOG.backend.handlers = [handler]
+    aws.LOG.backend.propagate = False
+
+    def current():
+        aws.make_api_call('elasticbeanstalk', 'describe_events', **options)
+
+    def previous():
+        aws._set_operation('elasticbeanstalk', 'describe_events')(**options)
+        previous_logging('elasticbeanstalk', 'describe_events', 'us-east-1', options, response)
+
+    for level in (logging.WARNING, logging.DEBUG):
+        aws.LOG.backend.setLevel(level)
+        for name, call in [('previous', previous), ('lazy', current)]:
+            call()
+            per_call = _time_calls(args.calls, call)
+            print('{0:<8} {1:<8} {2:9.1f} us/call  ({3} events, {4} calls)'.format(
+                logging.getLevelName(level), name, per_call * 1e6, args.events, args.calls))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,921 @@
+#!/usr/bin/env python
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+A local stand-in for the AWS services the EB CLI calls, implementing the
+subset of the Elastic Beanstalk, S3 (including multipart uploads), CloudWatch
+Logs, EC2, ELBv2 and CloudFormation operations that `eb deploy`, `eb logs`,
+`eb health` and `eb list` use, over an in-memory fleet of applications,
+environments, application versions and instances.
+
+Every service is served from the same port: requests are routed by the
+service named in the credential scope of their signature, so the EB CLI is
+pointed at the stand-in with `--endpoint-url '*=http://127.0.0.1:PORT'`.
+Responses are serialized from the botocore models of the services, and each
+response can be delayed by a fixed latency, and every Nth request throttled,
+to reproduce the behaviour of the real services under load. Operations which
+are not implemented fail with an `UnsupportedOperation` error, and are logged.
+
+Usage: python scripts/benchmarks/standin.py [--port PORT] [--versions N] [--instances N] [--latency SECONDS]
+                                            [--throttle-every N]
+"""
+import argparse
+import datetime
+import hashlib
+import io
+import itertools
+import json
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+import zipfile
+from xml.sax.saxutils import escape
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+REPOSITORY_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir))
+sys.path.insert(0, REPOSITORY_ROOT)
+
+from botocore.model import ServiceModel  # noqa: E402
+
+from ebcli.lib import aws  # noqa: E402
+
+REGION = 'us-east-1'
+ACCOUNT_ID = '123456789012'
+BUCKET = 'elasticbeanstalk-{0}-{1}'.format(REGION, ACCOUNT_ID)
+PLATFORM_ARN = 'arn:aws:elasticbeanstalk:{0}::platform/Python 3.11 running on 64bit Amazon Linux 2023/4.0.0'.format(
+    REGION)
+SOLUTION_STACK = '64bit Amazon Linux 2023 v4.0.0 running Python 3.11'
+INSTANCE_HEALTH_PAGE_SIZE = 50
+LOG_EVENTS_PAGE_SIZE = 1000
+
+_CREDENTIAL_SCOPE = re.compile(r'Credential=[^/]+/[^/]+/[^/]+/([^/]+)/')
+_EC2_SERVICES = {'ec2'}
+_JSON_SERVICES = {'logs'}
+
+
+class ServiceError(Exception):
+    def __init__(self, code, message, status=400):
+        super(ServiceError, self).__init__(message)
+        self.code = code
+        self.message = message
+        self.status = status
+
+
+class Fleet(object):
+    """
+    The resources the stand-in serves: `applications` applications, each
+    with `environments` environments of `instances` instances and with
+    `versions` application versions. Instance logs are streamed to CloudWatch
+    Logs when `log_streaming` is set, and bundled from the instances otherwise.
+    """
+    def __init__(self, applications=1, environments=1, versions=1000, instances=100, log_streaming=True):
+        self.lock = threading.Lock()
+        self.log_streaming = log_streaming
+        self.created = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+        self.applications = ['app-{0:03d}'.format(number) for number in range(1, applications + 1)]
+        self.environments = {}
+        self.versions = {}
+        self.instances = {}
+        self.objects = {}
+        self.uploads = {}
+        self.requests = {}
+        for app_name in self.applications:
+            self.versions[app_name] = [
+                self._version(app_name, 'v{0}'.format(number), self.created + datetime.timedelta(minutes=number))
+                for number in range(versions, 0, -1)
+            ]
+            for number in range(1, environments + 1):
+                env_name = '{0}-env-{1:03d}'.format(app_name, number)
+                self.environments[env_name] = {
+                    'ApplicationName': app_name,
+                    'EnvironmentName': env_name,
+                    'EnvironmentId': 'e-{0}'.format(hashlib.md5(env_name.encode('utf-8')).hexdigest()[:10]),
+                    'VersionLabel': 'v{0}'.format(versions) if versions else None,
+                    'SolutionStackName': SOLUTION_STACK,
+                    'PlatformArn': PLATFORM_ARN,
+                    'CNAME': '{0}.{1}.elasticbeanstalk.com'.format(env_name, REGION),
+                    'DateCreated': self.created,
+                    'DateUpdated': self.created,
+                    'Status': 'Ready',
+                    'Health': 'Green',
+                    'HealthStatus': 'Ok',
+                    'Tier': {'Name': 'WebServer', 'Type': 'Standard', 'Version': '1.0'},
+                }
+                self.instances[env_name] = [
+                    'i-{0:017x}'.format(len(self.instances) * 100000 + index) for index in range(instances)
+                ]
+
+    @staticmethod
+    def _version(app_name, label, date_created):
+        return {
+            'ApplicationName': app_name,
+            'VersionLabel': label,
+            'Description': 'release {0}'.format(label),
+            'DateCreated': date_created,
+            'DateUpdated': date_created,
+            'SourceBundle': {'S3Bucket': BUCKET, 'S3Key': '{0}/{1}.zip'.format(app_name, label)},
+            'Status': 'PROCESSED',
+        }
+
+    def environment(self, env_name):
+        try:
+            return self.environments[env_name]
+        except KeyError:
+            raise ServiceError('InvalidParameterValue', 'No Environment found for EnvironmentName = \'{0}\'.'.format(
+                env_name))
+
+    def record_request(self, message, **fields):
+        request_id = str(uuid.uuid4())
+        with self.lock:
+            self.requests[request_id] = dict(fields, Message=message, RequestId=request_id)
+        return request_id
+
+
+def _list_parameter(parameters, name):
+    prefix = name + '.member.'
+    values = [(int(key[len(prefix):]), value) for key, value in parameters.items() if key.startswith(prefix)]
+    return [value for _, value in sorted(values)]
+
+
+def _page(items, parameters, max_records, token_name='NextToken'):
+    start = int(parameters.get(token_name) or 0)
+    end = start + max_records
+    return items[start:end], (str(end) if end < len(items) else None)
+
+
+class ElasticBeanstalk(object):
+    def __init__(self, fleet, base_url):
+        self.fleet = fleet
+        self.base_url = base_url
+
+    def DescribeApplications(self, parameters):
+        names = _list_parameter(parameters, 'ApplicationNames') or self.fleet.applications
+        return {
+            'Applications': [
+                {
+                    'ApplicationName': name,
+                    'DateCreated': self.fleet.created,
+                    'DateUpdated': self.fleet.created,
+                    'Versions': [version['VersionLabel'] for version in self.fleet.versions[name][:10]],
+                    'ConfigurationTemplates': [],
+                }
+                for name in names if name in self.fleet.versions
+            ]
+        }
+
+    def DescribeEnvironments(self, parameters):
+        names = _list_parameter(parameters, 'EnvironmentNames')
+        environments = [
+            environment for environment in self.fleet.environments.values()
+            if (not names or environment['EnvironmentName'] in names)
+            and parameters.get('ApplicationName') in (None, environment['ApplicationName'])
+        ]
+        return {'Environments': environments}
+
+    def DescribeApplicationVersions(self, parameters):
+        versions = self.fleet.versions.get(parameters.get('ApplicationName'), [])
+        labels = _list_parameter(parameters, 'VersionLabels')
+        if labels:
+            versions = [version for version in versions if version['VersionLabel'] in labels]
+        page, next_token = _page(versions, parameters, int(parameters.get('MaxRecords') or 1000))
+        return {'ApplicationVersions': page, 'NextToken': next_token}
+
+    def CreateStorageLocation(self, parameters):
+        return {'S3Bucket': BUCKET}
+
+    def CreateApplicationVersion(self, parameters):
+        app_name = parameters['ApplicationName']
+        version = self.fleet._version(
+            app_name,
+            parameters['VersionLabel'],
+            datetime.datetime.now(datetime.timezone.utc)
+        )
+        version['Description'] = parameters.get('Description', '')
+        if 'SourceBundle.S3Key' in parameters:
+            version['SourceBundle'] = {
+                'S3Bucket': parameters['SourceBundle.S3Bucket'],
+                'S3Key': parameters['SourceBundle.S3Key'],
+            }
+        with self.fleet.lock:
+            self.fleet.versions.setdefault(app_name, []).insert(0, version)
+        return {'ApplicationVersion': version}
+
+    def UpdateEnvironment(self, parameters):
+        environment = self.fleet.environment(parameters['EnvironmentName'])
+        if parameters.get('VersionLabel'):
+            environment['VersionLabel'] = parameters['VersionLabel']
+        environment['DateUpdated'] = datetime.datetime.now(datetime.timezone.utc)
+        request_id = self.fleet.record_request(
+            'Environment update completed successfully.',
+            ApplicationName=environment['ApplicationName'],
+            EnvironmentName=environment['EnvironmentName'],
+            VersionLabel=environment['VersionLabel'],
+        )
+        return dict(environment, ResponseMetadata={'RequestId': request_id})
+
+    def DescribeEvents(self, parameters):
+        request = self.fleet.requests.get(parameters.get('RequestId'))
+        if request:
+            return {'Events': [dict(request, EventDate=datetime.datetime.now(datetime.timezone.utc), Severity='INFO')]}
+        return {'Events': []}
+
+    def RequestEnvironmentInfo(self, parameters):
+        environment = self.fleet.environment(parameters['EnvironmentName'])
+        request_id = self.fleet.record_request(
+            'Successfully finished {0} logs.'.format(
+                'bundling' if parameters.get('InfoType') == 'bundle' else 'tailing'),
+            ApplicationName=environment['ApplicationName'],
+            EnvironmentName=environment['EnvironmentName'],
+        )
+        return {'ResponseMetadata': {'RequestId': request_id}}
+
+    def RetrieveEnvironmentInfo(self, parameters):
+        env_name = parameters['EnvironmentName']
+        self.fleet.environment(env_name)
+        info_type = parameters.get('InfoType', 'tail')
+        return {
+            'EnvironmentInfo': [
+                {
+                    'InfoType': info_type,
+                    'Ec2InstanceId': instance_id,
+                    'SampleTimestamp': datetime.datetime.now(datetime.timezone.utc),
+                    'Message': '{0}/logs/{1}/{2}.{3}'.format(
+                        self.base_url, info_type, instance_id, 'zip' if info_type == 'bundle' else 'txt'),
+                }
+                for instance_id in self.fleet.instances[env_name]
+            ]
+        }
+
+    def DescribeEnvironmentResources(self, parameters):
+        env_name = parameters['EnvironmentName']
+        self.fleet.environment(env_name)
+        return {
+            'EnvironmentResources': {
+                'EnvironmentName': env_name,
+                'AutoScalingGroups': [{'Name': 'awseb-{0}-asg'.format(env_name)}],
+                'Instances': [{'Id': instance_id} for instance_id in self.fleet.instances[env_name]],
+                'LaunchConfigurations': [],
+                'LaunchTemplates': [],
+                'LoadBalancers': [{'Name': _load_balancer_arn(env_name)}],
+                'Triggers': [],
+                'Queues': [],
+            }
+        }
+
+    def DescribeConfigurationSettings(self, parameters):
+        environment = self.fleet.environment(parameters['EnvironmentName'])
+        return {
+            'ConfigurationSettings': [
+                {
+                    'ApplicationName': environment['ApplicationName'],
+                    'EnvironmentName': environment['EnvironmentName'],
+                    'SolutionStackName': SOLUTION_STACK,
+                    'PlatformArn': PLATFORM_ARN,
+                    'DeploymentStatus': 'deployed',
+                    'OptionSettings': [
+                        {
+                            'Namespace': 'aws:elasticbeanstalk:environment',
+                            'OptionName': 'LoadBalancerType',
+                            'Value': 'application',
+                        },
+                        {
+                            'Namespace': 'aws:elasticbeanstalk:cloudwatch:logs',
+                            'OptionName': 'StreamLogs',
+                            'Value': 'true' if self.fleet.log_streaming else 'false',
+                        },
+                        {
+                            'Namespace': 'aws:elasticbeanstalk:healthreporting:system',
+                            'OptionName': 'SystemType',
+                            'Value': 'enhanced',
+                        },
+                    ],
+                }
+            ]
+        }
+
+    def DescribePlatformVersion(self, parameters):
+        return {
+            'PlatformDescription': {
+                'PlatformArn': parameters.get('PlatformArn', PLATFORM_ARN),
+                'PlatformName': 'Python 3.11 running on 64bit Amazon Linux 2023',
+                'PlatformVersion': '4.0.0',
+                'PlatformStatus': 'Ready',
+                'PlatformCategory': 'Language',
+                'PlatformBranchName': 'Python 3.11 running on 64bit Amazon Linux 2023',
+                'PlatformLifecycleState': 'Recommended',
+                'SolutionStackName': SOLUTION_STACK,
+                'OperatingSystemName': 'Amazon Linux 2023',
+            }
+        }
+
+    def ListPlatformBranches(self, parameters):
+        return {
+            'PlatformBranchSummaryList': [
+                {
+                    'PlatformName': 'Python',
+                    'BranchName': 'Python 3.11 running on 64bit Amazon Linux 2023',
+                    'LifecycleState': 'Supported',
+                    'BranchOrder': 1,
+                    'SupportedTierList': ['WebServer/Standard', 'Worker/SQS/HTTP'],
+                }
+            ]
+        }
+
+    def DescribeEnvironmentHealth(self, parameters):
+        environment = self.fleet.environment(parameters['EnvironmentName'])
+        return {
+            'EnvironmentName': environment['EnvironmentName'],
+            'HealthStatus': 'Ok',
+            'Status': 'Ready',
+            'Color': 'Green',
+            'Causes': [],
+            'ApplicationMetrics': _application_metrics(),
+            'InstancesHealth': {'Ok': len(self.fleet.instances[environment['EnvironmentName']])},
+            'RefreshedAt': datetime.datetime.now(datetime.timezone.utc),
+        }
+
+    def DescribeInstancesHealth(self, parameters):
+        env_name = parameters['EnvironmentName']
+        environment = self.fleet.environment(env_name)
+        instance_ids, next_token = _page(self.fleet.instances[env_name], parameters, INSTANCE_HEALTH_PAGE_SIZE)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return {
+            'InstanceHealthList': [
+                {
+                    'InstanceId': instance_id,
+                    'HealthStatus': 'Ok',
+                    'Color': 'Green',
+                    'Causes': [],
+                    'LaunchedAt': self.fleet.created,
+                    'ApplicationMetrics': _application_metrics(),
+                    'System': {
+                        'CPUUtilization': {'User': 3.5, 'System': 1.2, 'Idle': 95.3},
+                        'LoadAverage': [0.1, 0.05, 0.01],
+                    },
+                    'Deployment': {
+                        'VersionLabel': environment['VersionLabel'],
+                        'DeploymentId': 1,
+                        'Status': 'Deployed',
+                        'DeploymentTime': environment['DateUpdated'],
+                    },
+                    'AvailabilityZone': '{0}{1}'.format(REGION, 'abc'[index % 3]),
+                    'InstanceType': 't3.micro',
+                }
+                for index, instance_id in enumerate(instance_ids)
+            ],
+            'RefreshedAt': now,
+            'NextToken': next_token,
+        }
+
+
+class CloudFormation(object):
+    def __init__(self, fleet, base_url):
+        self.fleet = fleet
+
+    def DescribeStackEvents(self, parameters):
+        return {'StackEvents': []}
+
+
+class EC2(object):
+    def __init__(self, fleet, base_url):
+        self.fleet = fleet
+
+    def DescribeInstances(self, parameters):
+        instance_ids = set(_flat_list_parameter(parameters, 'InstanceId'))
+        instances = [
+            {
+                'InstanceId': instance_id,
+                'InstanceType': 't3.micro',
+                'ImageId': 'ami-0123456789abcdef0',
+                'State': {'Code': 16, 'Name': 'running'},
+                'PrivateIpAddress': '10.0.{0}.{1}'.format(index // 250, index % 250 + 1),
+                'LaunchTime': self.fleet.created,
+                'SecurityGroups': [{'GroupId': 'sg-0123456789abcdef0', 'GroupName': env_name}],
+                'Tags': [{'Key': 'elasticbeanstalk:environment-name', 'Value': env_name}],
+            }
+            for env_name, env_instance_ids in self.fleet.instances.items()
+            for index, instance_id in enumerate(env_instance_ids)
+            if not instance_ids or instance_id in instance_ids
+        ]
+        return {'Reservations': [{'ReservationId': 'r-0123456789abcdef0', 'Instances': instances}]}
+
+    def DescribeSecurityGroups(self, parameters):
+        return {'SecurityGroups': [{'GroupId': 'sg-0123456789abcdef0', 'GroupName': 'default', 'IpPermissions': []}]}
+
+
+class ELBv2(object):
+    def __init__(self, fleet, base_url):
+        self.fleet = fleet
+
+    def DescribeLoadBalancers(self, parameters):
+        arns = _list_parameter(parameters, 'LoadBalancerArns')
+        return {
+            'LoadBalancers': [
+                {
+                    'LoadBalancerArn': _load_balancer_arn(env_name),
+                    'LoadBalancerName': 'awseb-{0}'.format(env_name)[:32],
+                    'DNSName': '{0}.{1}.elb.amazonaws.com'.format(env_name, REGION),
+                    'Type': 'application',
+                    'Scheme': 'internet-facing',
+                    'State': {'Code': 'active'},
+                }
+                for env_name in self.fleet.environments
+                if not arns or _load_balancer_arn(env_name) in arns
+            ]
+        }
+
+    def DescribeListeners(self, parameters):
+        load_balancer_arn = parameters.get('LoadBalancerArn')
+        return {
+            'Listeners': [
+                {
+                    'ListenerArn': load_balancer_arn.replace(':loadbalancer/', ':listener/') + '/80',
+                    'LoadBalancerArn': load_balancer_arn,
+                    'Port': 80,
+                    'Protocol': 'HTTP',
+                }
+            ]
+        }
+
+    def DescribeTargetGroups(self, parameters):
+        load_balancer_arn = parameters.get('LoadBalancerArn')
+        return {
+            'TargetGroups': [
+                {
+                    'TargetGroupArn': load_balancer_arn.replace(':loadbalancer/app/', ':targetgroup/'),
+                    'Port': 80,
+                    'Protocol': 'HTTP',
+                    'LoadBalancerArns': [load_balancer_arn],
+                }
+            ]
+        }
+
+    def DescribeTargetHealth(self, parameters):
+        env_name = parameters['TargetGroupArn'].split(':targetgroup/')[-1].split('/')[0]
+        return {
+            'TargetHealthDescriptions': [
+                {'Target': {'Id': instance_id, 'Port': 80}, 'TargetHealth': {'State': 'healthy'}}
+                for instance_id in self.fleet.instances.get(env_name, [])
+            ]
+        }
+
+
+class CloudWatchLogs(object):
+    def __init__(self, fleet, base_url):
+        self.fleet = fleet
+
+    def DescribeLogGroups(self, parameters):
+        prefix = parameters.get('logGroupNamePrefix', '')
+        return {
+            'logGroups': [
+                {'logGroupName': name, 'creationTime': 0, 'storedBytes': 0}
+                for env_name in self.fleet.environments
+                for name in _log_group_names(env_name)
+                if name.startswith(prefix)
+            ]
+        }
+
+    def DescribeLogStreams(self, parameters):
+        env_name = _log_group_environment(parameters['logGroupName'])
+        streams, next_token = _page(self.fleet.instances.get(env_name, []), parameters, 50, token_name='nextToken')
+        now = int(time.time() * 1000)
+        return {
+            'logStreams': [
+                {'logStreamName': instance_id, 'creationTime': 0, 'lastEventTimestamp': now}
+                for instance_id in streams
+            ],
+            'nextToken': next_token,
+        }
+
+    def GetLogEvents(self, parameters):
+        return {
+            'events': _log_events(parameters['logStreamName'], int(parameters.get('limit') or 100)),
+            'nextForwardToken': 'f/0',
+            'nextBackwardToken': 'b/0',
+        }
+
+    def FilterLogEvents(self, parameters):
+        env_name = _log_group_environment(parameters['logGroupName'])
+        stream_names = parameters.get('logStreamNames') or self.fleet.instances.get(env_name, [])[:10]
+        limit = int(parameters.get('limit') or LOG_EVENTS_PAGE_SIZE)
+        events = [
+            dict(event, logStreamName=stream_name, eventId=str(index))
+            for stream_name in stream_names
+            for index, event in enumerate(_log_events(stream_name, 10))
+        ]
+        return {'events': events[:limit]}
+
+
+class S3(object):
+    """
+    The S3 REST operations the EB CLI uses to upload and download
+    application versions, including multipart uploads.
+    """
+    def __init__(self, fleet):
+        self.fleet = fleet
+
+    def handle(self, method, path, query, body):
+        bucket, _, key = path.lstrip('/').partition('/')
+        key = unquote(key)
+        if method == 'HEAD':
+            data = self._object(bucket, key)
+            return 200, {'Content-Length': str(len(data)), 'ETag': _etag(data)}, b''
+        if method == 'GET' and 'uploads' in query:
+            uploads = ''.join(
+                '<Upload><Key>{0}</Key><UploadId>{1}</UploadId></Upload>'.format(escape(upload_key), upload_id)
+                for upload_id, (upload_bucket, upload_key, _) in self.fleet.uploads.items()
+                if upload_bucket == bucket and upload_key.startswith(query.get('prefix', ''))
+            )
+            return _xml('ListMultipartUploadsResult', '<Bucket>{0}</Bucket>{1}'.format(bucket, uploads))
+        if method == 'GET' and 'uploadId' in query:
+            parts = ''.join(
+                '<Part><PartNumber>{0}</PartNumber><ETag>{1}</ETag><Size>{2}</Size></Part>'.format(
+                    number, _etag(data), len(data))
+                for number, data in sorted(self._upload(query['uploadId'])[2].items())
+            )
+            return _xml('ListPartsResult', parts)
+        if method == 'GET':
+            data = self._object(bucket, key)
+            return 200, {'ETag': _etag(data), 'Content-Type': 'application/zip'}, data
+        if method == 'POST' and 'uploads' in query:
+            upload_id = uuid.uuid4().hex
+            with self.fleet.lock:
+                self.fleet.uploads[upload_id] = (bucket, key, {})
+            return _xml(
+                'InitiateMultipartUploadResult',
+                '<Bucket>{0}</Bucket><Key>{1}</Key><UploadId>{2}</UploadId>'.format(bucket, escape(key), upload_id)
+            )
+        if method == 'PUT' and 'uploadId' in query:
+            self._upload(query['uploadId'])[2][int(query['partNumber'])] = body
+            return 200, {'ETag': _etag(body)}, b''
+        if method == 'POST' and 'uploadId' in query:
+            with self.fleet.lock:
+                _, _, parts = self.fleet.uploads.pop(query['uploadId'])
+            data = b''.join(part for _, part in sorted(parts.items()))
+            self.fleet.objects[(bucket, key)] = data
+            return _xml(
+                'CompleteMultipartUploadResult',
+                '<Bucket>{0}</Bucket><Key>{1}</Key><ETag>{2}</ETag>'.format(bucket, escape(key), _etag(data))
+            )
+        if method == 'PUT':
+            self.fleet.objects[(bucket, key)] = body
+            return 200, {'ETag': _etag(body)}, b''
+        raise ServiceError('NotImplemented', '{0} {1} is not supported'.format(method, path), status=501)
+
+    def _object(self, bucket, key):
+        try:
+            return self.fleet.objects[(bucket, key)]
+        except KeyError:
+            raise ServiceError('NoSuchKey', 'The specified key does not exist.', status=404)
+
+    def _upload(self, upload_id):
+        try:
+            return self.fleet.uploads[upload_id]
+        except KeyError:
+            raise ServiceError('NoSuchUpload', 'The specified upload does not exist.', status=404)
+
+
+SERVICES = {
+    'elasticbeanstalk': ElasticBeanstalk,
+    'cloudformation': CloudFormation,
+    'ec2': EC2,
+    'elasticloadbalancing': ELBv2,
+    'logs': CloudWatchLogs,
+}
+MODEL_NAMES = {'elasticloadbalancing': 'elbv2'}
+
+
+def _flat_list_parameter(parameters, name):
+    prefix = name + '.'
+    values = [(int(key[len(prefix):]), value) for key, value in parameters.items()
+              if key.startswith(prefix) and key[len(prefix):].isdigit()]
+    return [value for _, value in sorted(values)]
+
+
+def _application_metrics():
+    return {
+        'Duration': 10,
+        'RequestCount': 1200,
+        'StatusCodes': {'Status2xx': 1180, 'Status3xx': 10, 'Status4xx': 8, 'Status5xx': 2},
+        'Latency': {
+            'P999': 0.9, 'P99': 0.5, 'P95': 0.2, 'P90': 0.1, 'P85': 0.08, 'P75': 0.05, 'P50': 0.02, 'P10': 0.005,
+        },
+    }
+
+
+def _load_balancer_arn(env_name):
+    return 'arn:aws:elasticloadbalancing:{0}:{1}:loadbalancer/app/{2}/0123456789abcdef'.format(
+        REGION, ACCOUNT_ID, env_name)
+
+
+def _log_group_names(env_name):
+    return [
+        '/aws/elasticbeanstalk/{0}/var/log/eb-engine.log'.format(env_name),
+        '/aws/elasticbeanstalk/{0}/var/log/web.stdout.log'.format(env_name),
+        '/aws/elasticbeanstalk/{0}/environment-health.log'.format(env_name),
+    ]
+
+
+def _log_group_environment(log_group_name):
+    return log_group_name.split('/')[3] if log_group_name.count('/') >= 3 else None
+
+
+def _log_events(stream_name, count):
+    now = int(time.time() * 1000)
+    return [
+        {
+            'timestamp': now - (count - index) * 1000,
+            'ingestionTime': now,
+            'message': '[{0}] request {1} served in 20ms'.format(stream_name, index),
+        }
+        for index in range(count)
+    ]
+
+
+def _log_bundle(instance_id):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as bundle:
+        for name in ('var/log/eb-engine.log', 'var/log/web.stdout.log', 'var/log/nginx/access.log'):
+            bundle.writestr(
+                name,
+                ''.join('{0} {1} line {2}\n'.format(instance_id, name, line) for line in range(200))
+            )
+    return buffer.getvalue()
+
+
+def _etag(data):
+    return '"{0}"'.format(hashlib.md5(data).hexdigest())
+
+
+def _xml(root, content, status=200):
+    body = '<?xml version="1.0" encoding="UTF-8"?><{0}>{1}</{0}>'.format(root, content)
+    return status, {'Content-Type': 'text/xml'}, body.encode('utf-8')
+
+
+def _serialize(shape, value, name):
+    """
+    Serializes `value` as the XML element `name` of the botocore `shape`, the
+    way the query and EC2 protocols do.
+    """
+    if value is None:
+        return ''
+    name = shape.serialization.get('name', name)
+    if shape.type_name == 'structure':
+        content = _serialize_members(shape, value)
+    elif shape.type_name == 'list':
+        member_name = shape.member.serialization.get('name', 'member')
+        items = ''.join(_serialize(shape.member, item, member_name) for item in value)
+        if shape.serialization.get('flattened'):
+            return items
+        content = items
+    elif shape.type_name == 'map':
+        content = ''.join(
+            '<entry>{0}{1}</entry>'.format(_serialize(shape.key, key, 'key'), _serialize(shape.value, item, 'value'))
+            for key, item in value.items()
+        )
+    elif shape.type_name == 'timestamp':
+        content = value.strftime('%Y-%m-%dT%H:%M:%S.%fZ') if hasattr(value, 'strftime') else str(value)
+    elif shape.type_name == 'boolean':
+        content = 'true' if value else 'false'
+    else:
+        content = escape(str(value))
+    return '<{0}>{1}</{0}>'.format(name, content)
+
+
+def _serialize_members(shape, value):
+    return ''.join(
+        _serialize(member_shape, value.get(member_name), member_name)
+        for member_name, member_shape in shape.members.items()
+        if member_name in value
+    )
+
+
+def _json_default(value):
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    raise TypeError(value)
+
+
+class StandIn(object):
+    """
+    Serves the `fleet` on 127.0.0.1:`port`, delaying every response by
+    `latency` seconds and throttling every `throttle_every`th request.
+    """
+    def __init__(self, fleet, port=0, latency=0, throttle_every=0):
+        self.fleet = fleet
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.counter = itertools.count(1)
+        self.calls = {}
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), _Handler)
+        self.server.daemon_threads = True
+        self.server.standin = self
+        self.url = 'http://127.0.0.1:{0}'.format(self.server.server_address[1])
+        self.handlers = {service_name: cls(fleet, self.url) for service_name, cls in SERVICES.items()}
+        self.models = {}
+        self.s3 = S3(fleet)
+        self.log_bundles = {}
+
+    def start(self):
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def count(self, operation):
+        with self.fleet.lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+
+    def should_throttle(self):
+        return self.throttle_every and next(self.counter) % self.throttle_every == 0
+
+    def model(self, service_name):
+        if service_name not in self.models:
+            model_name = MODEL_NAMES.get(service_name, service_name)
+            loader = aws._get_data_loader()
+            self.models[service_name] = ServiceModel(
+                loader.load_service_model(model_name, 'service-2'),
+                service_name=model_name
+            )
+        return self.models[service_name]
+
+    def log_bundle(self, instance_id):
+        if instance_id not in self.log_bundles:
+            self.log_bundles[instance_id] = _log_bundle(instance_id)
+        return self.log_bundles[instance_id]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch()
+
+    def do_HEAD(self):
+        self._dispatch()
+
+    def do_PUT(self):
+        self._dispatch()
+
+    def do_POST(self):
+        self._dispatch()
+
+    def _dispatch(self):
+        standin = self.server.standin
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        url = urlsplit(self.path)
+        query = dict(parse_qsl(url.query, keep_blank_values=True))
+        match = _CREDENTIAL_SCOPE.search(self.headers.get('Authorization', ''))
+        service_name = match.group(1) if match else None
+
+        if standin.latency:
+            time.sleep(standin.latency)
+
+        try:
+            if service_name is None and url.path.startswith('/logs/'):
+                standin.count('GetLogBundle')
+                status, headers, content = self._log_file(url.path)
+            elif service_name == 's3':
+                standin.count('S3:{0}'.format(self.command))
+                if standin.should_throttle():
+                    raise ServiceError('SlowDown', 'Please reduce your request rate.', status=503)
+                status, headers, content = standin.s3.handle(self.command, url.path, query, body)
+            elif service_name in _JSON_SERVICES:
+                status, headers, content = self._json(service_name, body)
+            elif service_name in SERVICES:
+                status, headers, content = self._query(service_name, body)
+            else:
+                raise ServiceError('UnknownService', 'Unsupported request {0} {1}'.format(self.command, self.path))
+        except ServiceError as e:
+            status, headers, content = self._error(service_name, e)
+
+        self.send_response(status)
+        for header, value in headers.items():
+            self.send_header(header, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('x-amzn-RequestId', str(uuid.uuid4()))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(content)
+
+    def _log_file(self, path):
+        _, _, info_type, name = path.split('/', 3)
+        instance_id = name.rsplit('.', 1)[0]
+        if info_type == 'bundle':
+            return 200, {'Content-Type': 'application/zip'}, self.server.standin.log_bundle(instance_id)
+        return 200, {'Content-Type': 'text/plain'}, ''.join(
+            '{0} tail line {1}\n'.format(instance_id, line) for line in range(100)).encode('utf-8')
+
+    def _handler(self, service_name, operation_name):
+        standin = self.server.standin
+        standin.count(operation_name)
+        handler = getattr(standin.handlers[service_name], operation_name, None)
+        if handler is None:
+            sys.stderr.write('stand-in: {0}.{1} is not implemented\n'.format(service_name, operation_name))
+            raise ServiceError('UnsupportedOperation', '{0} is not implemented by the stand-in'.format(operation_name))
+        if standin.should_throttle():
+            raise ServiceError(
+                'RequestLimitExceeded' if service_name in _EC2_SERVICES else 'Throttling',
+                'Rate exceeded'
+            )
+        return handler
+
+    def _query(self, service_name, body):
+        parameters = dict(parse_qsl(body.decode('utf-8'), keep_blank_values=True))
+        operation_name = parameters.pop('Action', None)
+        result = self._handler(service_name, operation_name)(parameters)
+        request_id = result.pop('ResponseMetadata', {}).get('RequestId', str(uuid.uuid4()))
+
+        output_shape = self.server.standin.model(service_name).operation_model(operation_name).output_shape
+        content = _serialize_members(output_shape, result) if output_shape else ''
+        if service_name in _EC2_SERVICES:
+            # EC2 responses have no result wrapper around the members of the output
+            return _xml('{0}Response'.format(operation_name), '{0}<requestId>{1}</requestId>'.format(
+                content, request_id))
+        if output_shape:
+            wrapper = output_shape.serialization.get('resultWrapper', '{0}Result'.format(operation_name))
+            content = '<{0}>{1}</{0}>'.format(wrapper, content)
+        return _xml(
+            '{0}Response'.format(operation_name),
+            '{0}<ResponseMetadata><RequestId>{1}</RequestId></ResponseMetadata>'.format(content, request_id)
+        )
+
+    def _json(self, service_name, body):
+        operation_name = self.headers.get('X-Amz-Target', '').rpartition('.')[2]
+        result = self._handler(service_name, operation_name)(json.loads(body.decode('utf-8') or '{}'))
+        content = json.dumps({key: value for key, value in result.items() if value is not None}, default=_json_default)
+        return 200, {'Content-Type': 'application/x-amz-json-1.1'}, content.encode('utf-8')
+
+    def _error(self, service_name, error):
+        if service_name in _JSON_SERVICES:
+            content = json.dumps({'__type': error.code, 'message': error.message})
+            return error.status, {'Content-Type': 'application/x-amz-json-1.1'}, content.encode('utf-8')
+        if service_name in _EC2_SERVICES:
+            return _xml(
+                'Response',
+                '<Errors><Error><Code>{0}</Code><Message>{1}</Message></Error></Errors><RequestID>{2}</RequestID>'.format(
+                    error.code, escape(error.message), uuid.uuid4()),
+                status=error.status
+            )
+        if service_name == 's3':
+            return _xml('Error', '<Code>{0}</Code><Message>{1}</Message><RequestId>{2}</RequestId>'.format(
+                error.code, escape(error.message), uuid.uuid4()), status=error.status)
+        return _xml(
+            'ErrorResponse',
+            '<Error><Type>Sender</Type><Code>{0}</Code><Message>{1}</Message></Error><RequestId>{2}</RequestId>'.format(
+                error.code, escape(error.message), uuid.uuid4()),
+            status=error.status
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--applications', type=int, default=1)
+    parser.add_argument('--environments', type=int, default=1, help='environments of each application')
+    parser.add_argument('--versions', type=int, default=1000, help='application versions of each application')
+    parser.add_argument('--instances', type=int, default=100, help='instances of each environment')
+    parser.add_argument('--latency', type=float, default=0, help='seconds to delay every response by')
+    parser.add_argument('--throttle-every', type=int, default=0, help='throttle every Nth request')
+    parser.add_argument('--without-log-streaming', action='store_true',
+                        help='bundle instance logs instead of streaming them to CloudWatch Logs')
+    args = parser.parse_args()
+
+    fleet = Fleet(args.applications, args.environments, args.versions, args.instances,
+                  log_streaming=not args.without_log_streaming)
+    standin = StandIn(fleet, args.port, args.latency, args.throttle_every)
+    print('Serving {0} applications with {1} environments each on {2}; use --endpoint-url "*={2}"'.format(
+        args.applications, args.environments, standin.url))
+    try:
+        standin.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        standin.server.server_close()
+
+
+if __name__ == '__main__':
+    main()
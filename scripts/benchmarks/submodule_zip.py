@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Benchmarks `Git.do_zip` on a repository with several large submodules when
+`include_git_submodules` is enabled, against the previous implementation which
+archived the submodules one at a time and rewrote every member through
+`ZipFile.writestr` while merging.
+
+Usage: python scripts/benchmarks/submodule_zip.py [--submodules N] [--size-mb M]
+"""
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.path.pardir, os.path.pardir))
+
+from ebcli.core import fileoperations, io  # noqa: E402
+from ebcli.objects import sourcecontrol  # noqa: E402
+
+
+def _git(*args, cwd=None):
+    subprocess.check_call(
+        ['git', '-c', 'protocol.file.allow=always'] + list(args),
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+
+def _init_repo(path):
+    os.makedirs(path)
+    _git('init', '-q', cwd=path)
+    _git('config', 'user.email', 'bench@example.com', cwd=path)
+    _git('config', 'user.name', 'bench', cwd=path)
+
+
+def _write_vendored_files(path, size_mb):
+    words = ['lorem', 'ipsum', 'dolor', 'sit', 'amet', 'consectetur', 'adipiscing', 'elit']
+    for index in range(size_mb):
+        with open(os.path.join(path, 'module_{}.js'.format(index)), 'w') as f:
+            while f.tell() < 1024 * 1024:
+                f.write(' '.join(random.choice(words) for _ in range(64)) + '\n')
+
+
+def create_project(root, submodules, size_mb):
+    project = os.path.join(root, 'project')
+    _init_repo(project)
+    with open(os.path.join(project, 'application.py'), 'w') as f:
+        f.write('print("hello")\n')
+    _git('add', '.', cwd=project)
+    _git('commit', '-q', '-m', 'Initial', cwd=project)
+
+    for index in range(submodules):
+        submodule = os.path.join(root, 'submodule-{}'.format(index))
+        _init_repo(submodule)
+        _write_vendored_files(submodule, size_mb)
+        _git('add', '.', cwd=submodule)
+        _git('commit', '-q', '-m', 'Initial', cwd=submodule)
+        _git('submodule', 'add', '-q', submodule, os.path.join('vendor', 'lib-{}'.format(index)), cwd=project)
+
+    _git('commit', '-q', '-m', 'Add submodules', cwd=project)
+    return project
+
+
+def previous_do_zip(location):
+    git = sourcecontrol.Git()
+    git._run_cmd(['git', 'archive', '-v', '--format=zip', '-o', location, 'HEAD'])
+    project_root = os.getcwd()
+    stdout, _, _ = git._run_cmd(['git', 'submodule', 'foreach', '--recursive'])
+    for index, line in enumerate(stdout.splitlines()):
+        submodule_dir = line.split(' ')[1].strip('\'')
+        sub_location = '{0}_{1}'.format(location, index)
+        os.chdir(os.path.join(project_root, submodule_dir))
+        git._run_cmd(['git', 'archive', '-v', '--format=zip',
+                      '--prefix', os.path.join(submodule_dir, ''), '-o', sub_location, 'HEAD'])
+        with zipfile.ZipFile(sub_location, 'r') as zip_source, zipfile.ZipFile(location, 'a') as zip_target:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', category=UserWarning)
+                for filename in zip_source.namelist():
+                    zip_target.writestr(filename, zip_source.read(filename))
+        os.remove(sub_location)
+    os.chdir(project_root)
+
+
+def _timed(function, location):
+    if os.path.exists(location):
+        os.remove(location)
+    start = time.time()
+    function(location)
+    elapsed = time.time() - start
+    with zipfile.ZipFile(location) as archive:
+        members = len(archive.namelist())
+    return elapsed, members, os.path.getsize(location)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--submodules', type=int, default=6)
+    parser.add_argument('--size-mb', type=int, default=40, help='size of each submodule in MB')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    # `do_zip` echoes the output of every `git archive`
+    io.log_info = lambda *args: None
+
+    root = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    try:
+        project = create_project(root, args.submodules, args.size_mb)
+        os.chdir(project)
+        fileoperations.create_config_file('bench-app', 'us-east-1', 'python')
+        fileoperations.write_config_setting('global', 'include_git_submodules', True)
+        location = os.path.join(root, 'bundle.zip')
+
+        for name, function in [
+            ('sequential archive, writestr merge', previous_do_zip),
+            ('parallel archive, raw member copy', sourcecontrol.Git().do_zip),
+        ]:
+            timings = [_timed(function, location) for _ in range(args.repeat)]
+            best = min(elapsed for elapsed, _, _ in timings)
+            _, members, size = timings[0]
+            print('{0:<42} best of {1}: {2:7.2f}s  ({3} members, {4:.1f} MB)'.format(
+                name, args.repeat, best, members, size / 1024.0 / 1024.0))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
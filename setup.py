@@ -91,7 +91,8 @@ setup_options = dict(
     ),
     entry_points={
         'console_scripts': [
-            'eb=ebcli.core.ebcore:main',
+            'eb=ebcli.core.agent:main',
+            'eb_completer=ebcli.core.completer:main',
             'ebp=ebcli.core.ebpcore:main'
         ]
     },
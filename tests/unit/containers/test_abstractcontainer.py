@@ -96,6 +96,36 @@ class TestAbstractContainer(TestCase):
                                                        IMG_ID,
                                                        envvars_map=EXPECTED_ENVVARS_MAP)
 
+    @patch('ebcli.containers.abstractcontainer.imagecache.image_tag')
+    @patch('ebcli.containers.abstractcontainer.commands')
+    def test_start_build_skipped_when_image_of_same_inputs_exists(self, commands, image_tag):
+        image_tag.return_value = 'eb-local-abc:0123'
+        commands.get_base_img_id.return_value = 'base-id'
+        commands.get_img_id.return_value = IMG_ID
+
+        self.cnt.start()
+
+        image_tag.assert_called_once_with(self.cnt.get_name(), dummy.DOCKER_PROJ_PATH, dummy.DOCKERFILE_PATH,
+                                          dummy.DOCKERRUN_DICT, 'base-id')
+        commands.get_img_id.assert_called_once_with('eb-local-abc:0123')
+        self.assertFalse(commands.build_img.called)
+        commands.rm_superseded_imgs.assert_called_once_with('eb-local-' + self.cnt.get_name()[:12],
+                                                            'eb-local-abc:0123')
+        self.assertEqual(IMG_ID, commands.run_container.call_args[1]['image_id'])
+
+    @patch('ebcli.containers.abstractcontainer.imagecache.image_tag')
+    @patch('ebcli.containers.abstractcontainer.commands')
+    def test_start_build_with_deterministic_tag(self, commands, image_tag):
+        image_tag.return_value = 'eb-local-abc:0123'
+        commands.get_img_id.return_value = None
+        commands.build_img.return_value = IMG_ID
+
+        self.cnt.start()
+
+        commands.build_img.assert_called_once_with(dummy.DOCKER_PROJ_PATH, dummy.DOCKERFILE_PATH,
+                                                   img_tag='eb-local-abc:0123')
+        self.assertEqual(IMG_ID, commands.run_container.call_args[1]['image_id'])
+
     def test_get_name(self):
         self.pathconfig.docker_proj_path = lambda: ''
         # This is the result of sha1('')
@@ -118,6 +118,38 @@ class TestCommands(TestCase):
         actual_args, _ = exec_cmd_live_output.call_args
         self.assertEqual(len(actual_args[0]), len(expected_args))
 
+    @patch('ebcli.containers.commands.utils.exec_cmd_live_output')
+    def test_build_img_with_tag(self, exec_cmd_live_output):
+        with patch('ebcli.containers.commands._get_img_id_from_img_tag') as _get_img_id_from_img_tag_mock:
+            _get_img_id_from_img_tag_mock.return_value = EXPECTED_BUILD_IMG_ID
+            commands.build_img(MOCK_DOCKER_PATH, MOCK_SKELETON_DOCKER_PATH, img_tag='eb-local-abc:0123')
+
+        exec_cmd_live_output.assert_called_once_with(
+            ['docker', 'build', '-t', 'eb-local-abc:0123', '-f', MOCK_SKELETON_DOCKER_PATH, MOCK_DOCKER_PATH]
+        )
+        _get_img_id_from_img_tag_mock.assert_called_once_with('eb-local-abc:0123')
+
+    @patch('ebcli.containers.commands.utils.exec_cmd_quiet')
+    def test_get_img_id(self, exec_cmd_quiet):
+        exec_cmd_quiet.side_effect = ['89b8fbeca24e\n', '']
+
+        self.assertEqual(EXPECTED_BUILD_IMG_ID, commands.get_img_id('eb-local-abc:0123'))
+        self.assertIsNone(commands.get_img_id('eb-local-abc:4567'))
+        exec_cmd_quiet.assert_called_with(['docker', 'images', '-q', 'eb-local-abc:4567'])
+
+    @patch('ebcli.containers.commands.utils.exec_cmd_quiet')
+    def test_rm_superseded_imgs(self, exec_cmd_quiet):
+        def exec_cmd(args):
+            if args[1] == 'images':
+                return '0123\n4567\n<none>\n89ab\n'
+            if args[2] == 'eb-local-abc:89ab':
+                raise CommandError('image is being used by running container', '', 1)
+            return ''
+        exec_cmd_quiet.side_effect = exec_cmd
+
+        self.assertEqual(['eb-local-abc:4567'], commands.rm_superseded_imgs('eb-local-abc', 'eb-local-abc:0123'))
+        exec_cmd_quiet.assert_any_call(['docker', 'rmi', 'eb-local-abc:4567'])
+
     @patch('ebcli.containers.commands.utils.exec_cmd_live_output')
     @patch('ebcli.containers.commands.fileoperations.readlines_from_text_file')
     def test_run_container_happy_case(self, readlines_file, exec_cmd_live_output):
@@ -224,6 +256,48 @@ class TestCommands(TestCase):
         get_container_lowlvl_info.side_effect = CommandError
         self.assertListEqual([], commands.get_exposed_hostports(MOCK_CONTAINER_NAME))
 
+    @patch('ebcli.containers.commands.utils.exec_cmd_quiet')
+    def test_inspect_containers(self, exec_cmd_quiet):
+        exec_cmd_quiet.return_value = (
+            '{"Id": "0123abcd", "Name": "/elasticbeanstalk_web_1", "State": {"Running": true}}\n'
+            '{"Id": "4567ef01", "Name": "/elasticbeanstalk_db_1", "State": {"Running": false}}\n'
+        )
+
+        snapshot = commands.inspect_containers(['elasticbeanstalk_db_1', '0123'])
+
+        self.assertEqual({'elasticbeanstalk_db_1': '4567ef01', '0123': '0123abcd'},
+                         {cid: info['Id'] for cid, info in snapshot.items()})
+        exec_cmd_quiet.assert_called_once_with(
+            ['docker', 'inspect', '--type', 'container', '--format', '{{json .}}',
+             'elasticbeanstalk_db_1', '0123']
+        )
+
+    @patch('ebcli.containers.commands.utils.exec_cmd_quiet')
+    def test_inspect_containers__some_containers_do_not_exist(self, exec_cmd_quiet):
+        exec_cmd_quiet.side_effect = CommandError(
+            message='',
+            output='{"Id": "0123abcd", "Name": "/web"}\nError: No such container: db\n',
+            code=1
+        )
+
+        self.assertEqual(['web'], list(commands.inspect_containers(['web', 'db'])))
+
+    @patch('ebcli.containers.commands.utils.exec_cmd_quiet')
+    def test_inspect_containers__no_containers_exist(self, exec_cmd_quiet):
+        exec_cmd_quiet.side_effect = CommandError(message='', output='Error: No such container: web\n', code=1)
+
+        self.assertEqual({}, commands.inspect_containers(['web']))
+        self.assertEqual({}, commands.inspect_containers([]))
+        exec_cmd_quiet.assert_called_once()
+
+    def test_is_running_from_info_and_exposed_hostports_from_info(self):
+        info = dict(MOCK_CONTAINER_INFO, **MOCK_CONTAINER_NETWORK)
+
+        self.assertTrue(commands.is_running_from_info(info))
+        self.assertEqual([MOCK_HOST_PORT], commands.exposed_hostports_from_info(info))
+        self.assertFalse(commands.is_running_from_info(None))
+        self.assertEqual([], commands.exposed_hostports_from_info(None))
+
     @patch('ebcli.containers.commands.get_container_lowlvl_info')
     def test_is_container_existent_happy_case(self, get_container_lowlvl_info):
         self.assertTrue(commands.is_container_existent(MOCK_CONTAINER_NAME))
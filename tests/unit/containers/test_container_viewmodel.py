@@ -82,6 +82,25 @@ class TestContainerViewModel(TestCase):
         self.cnt_viewmodel.service_infos = []
         self.assertEqual(0, self.cnt_viewmodel.num_exposed_hostports())
 
+    @patch('ebcli.containers.container_viewmodel.commands.utils.exec_cmd_quiet')
+    def test_from_container__inspects_all_services_at_once(self, exec_cmd_quiet):
+        container = Mock(soln_stk='soln-stk')
+        container.list_services.return_value = ['eb_web_1', 'eb_db_1', 'eb_cache_1']
+        exec_cmd_quiet.return_value = (
+            '{"Id": "1", "Name": "/eb_web_1", "State": {"Running": true}, '
+            '"NetworkSettings": {"Ports": {"80/tcp": [{"HostPort": "8080"}], "443/tcp": null}}}\n'
+            '{"Id": "2", "Name": "/eb_db_1", "State": {"Running": false}, "NetworkSettings": {"Ports": null}}\n'
+        )
+
+        cnt_viewmodel = ContainerViewModel.from_container(container)
+
+        self.assertEqual('soln-stk', cnt_viewmodel.soln_stk)
+        self.assertEqual(
+            [('eb_web_1', True, ['8080']), ('eb_db_1', False, []), ('eb_cache_1', False, [])],
+            [(s.cid, s.is_running, s.hostports) for s in cnt_viewmodel.service_infos]
+        )
+        exec_cmd_quiet.assert_called_once()
+
 
 class TestServiceInfo(TestCase):
     def test_get_urls(self):
@@ -0,0 +1,107 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import os
+import shutil
+from unittest import TestCase
+
+from ebcli.containers import imagecache
+
+DOCKERRUN = {'AWSEBDockerrunVersion': '1'}
+
+
+class TestImageCache(TestCase):
+    def setUp(self):
+        self.root_dir = os.getcwd()
+        if os.path.isdir('testDir'):
+            shutil.rmtree('testDir')
+        self.project = os.path.abspath(os.path.join('testDir', 'project'))
+        self._write('Dockerfile', 'FROM python:3.11\nEXPOSE 8080\n')
+        self._write('.dockerignore', '.elasticbeanstalk/*\n# build output\n**/*.pyc\nnode_modules\n!node_modules/keep.js\n')
+        self._write('application.py', 'print("hello")\n')
+        self._write('lib/util.pyc', 'compiled')
+        self._write('node_modules/left-pad/index.js', 'module.exports = 1;')
+        self._write('node_modules/keep.js', 'kept')
+        self._write('.elasticbeanstalk/logs/local/app.log', 'log line')
+
+    def tearDown(self):
+        os.chdir(self.root_dir)
+        shutil.rmtree('testDir')
+
+    def _write(self, relative_path, contents):
+        location = os.path.join(self.project, *relative_path.split('/'))
+        if not os.path.isdir(os.path.dirname(location)):
+            os.makedirs(os.path.dirname(location))
+        with open(location, 'w') as f:
+            f.write(contents)
+
+    def _tag(self, dockerrun=DOCKERRUN, base_image_id='base-id'):
+        return imagecache.image_tag(
+            'abcdef0123456789',
+            self.project,
+            os.path.join(self.project, 'Dockerfile'),
+            dockerrun,
+            base_image_id
+        )
+
+    def test_is_ignored(self):
+        patterns = imagecache.read_dockerignore(self.project)
+
+        self.assertTrue(imagecache.is_ignored('.elasticbeanstalk/logs/local/app.log', patterns))
+        self.assertTrue(imagecache.is_ignored('lib/util.pyc', patterns))
+        self.assertTrue(imagecache.is_ignored('util.pyc', patterns))
+        self.assertTrue(imagecache.is_ignored('node_modules/left-pad/index.js', patterns))
+        self.assertFalse(imagecache.is_ignored('node_modules/keep.js', patterns))
+        self.assertFalse(imagecache.is_ignored('.elasticbeanstalk', patterns))
+        self.assertFalse(imagecache.is_ignored('lib/util.py', patterns))
+
+    def test_translate(self):
+        for pattern, path, matches in [
+            ('*.md', 'README.md', True),
+            ('*.md', 'docs/README.md', False),
+            ('docs/**', 'docs/a/b.md', True),
+            ('**/tmp', 'a/b/tmp', True),
+            ('**/tmp', 'tmp', True),
+            ('file?.txt', 'file1.txt', True),
+            ('file[0-3].txt', 'file4.txt', False),
+            ('file[^0-3].txt', 'file4.txt', True),
+        ]:
+            regex = imagecache.re.compile(imagecache._translate(pattern))
+            self.assertEqual(matches, bool(regex.match(path)), (pattern, path))
+
+    def test_context_manifest(self):
+        self.assertEqual(
+            ['.dockerignore', 'Dockerfile', 'application.py', 'node_modules/keep.js'],
+            [relative_path for relative_path, _, _ in imagecache.context_manifest(self.project)]
+        )
+
+    def test_image_tag__is_deterministic(self):
+        tag = self._tag()
+
+        self.assertTrue(tag.startswith('eb-local-abcdef012345:'))
+        self.assertEqual(16, len(tag.split(':')[1]))
+        self.assertEqual(tag, self._tag())
+
+    def test_image_tag__ignores_changes_to_excluded_files(self):
+        tag = self._tag()
+        self._write('.elasticbeanstalk/logs/local/app.log', 'another log line')
+        self._write('node_modules/left-pad/index.js', 'module.exports = 2;')
+
+        self.assertEqual(tag, self._tag())
+
+    def test_image_tag__changes_with_any_input(self):
+        tag = self._tag()
+
+        self.assertNotEqual(tag, self._tag(base_image_id='newer-base-id'))
+        self.assertNotEqual(tag, self._tag(dockerrun={'AWSEBDockerrunVersion': '1', 'Ports': [{'ContainerPort': 80}]}))
+        self._write('application.py', 'print("hello, world")\n')
+        self.assertNotEqual(tag, self._tag())
@@ -56,27 +56,17 @@ class TestAppVersions(unittest.TestCase):
         appversionops_mock.delete_app_version_label.assert_called_with(self.app_name, 'version-label-1')
 
     @mock.patch('ebcli.controllers.appversion.appversionops')
-    @mock.patch('ebcli.controllers.appversion.elasticbeanstalk.get_application_versions')
     def test_enter_interactive_mode(
             self,
-            get_application_versions_mock,
             appversionops_mock
     ):
-        app_versions = [
-            {u'ApplicationName': self.app_name, u'VersionLabel': 'v13'},
-            {u'ApplicationName': self.app_name, u'VersionLabel': 'v8'}
-        ]
-        get_app_versions_response = {u'ApplicationVersions': app_versions}
-
-        get_application_versions_mock.return_value = get_app_versions_response
-
         EB.Meta.exit_on_close = False
         self.app = EB(argv=['appversion'])
         self.app.setup()
         self.app.run()
         self.app.close()
 
-        appversionops_mock.display_versions.assert_called_with(self.app_name, None, app_versions)
+        appversionops_mock.display_versions.assert_called_with(self.app_name, None)
 
     @mock.patch('ebcli.controllers.appversion.AppVersionController.get_app_name')
     @mock.patch('ebcli.controllers.appversion.AppVersionController.get_env_name')
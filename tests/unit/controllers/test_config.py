@@ -34,6 +34,10 @@ class TestConfig(unittest.TestCase):
 
         os.chdir('testDir')
 
+        patcher = mock.patch('ebcli.core.abstractcontroller.updatecheck.start')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
         fileoperations.create_config_file(
             'my-application',
             'us-west-2',
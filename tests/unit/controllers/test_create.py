@@ -63,6 +63,10 @@ class TestCreateBase(unittest.TestCase):
 
         os.chdir('testDir')
 
+        patcher = mock.patch('ebcli.core.abstractcontroller.updatecheck.start')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
         fileoperations.create_config_file(
             self.app_name,
             'us-west-2',
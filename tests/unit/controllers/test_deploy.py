@@ -38,6 +38,10 @@ class TestDeploy(unittest.TestCase):
 
         os.chdir('testDir')
 
+        patcher = mock.patch('ebcli.core.abstractcontroller.updatecheck.start')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
         fileoperations.create_config_file(
             'my-application',
             'us-west-2',
@@ -530,6 +534,84 @@ class TestDeployNormal(TestDeploy):
             source_bundle=os.path.join('path', 'to', 'generated', 'archive.zip')
         )
 
+    @mock.patch('ebcli.controllers.deploy.statusops.alert_environment_status')
+    @mock.patch('ebcli.controllers.deploy.elasticbeanstalk.get_environments')
+    @mock.patch('ebcli.controllers.deploy.DeployController.get_app_name')
+    @mock.patch('ebcli.controllers.deploy.deployops.resolve_environment_names')
+    @mock.patch('ebcli.controllers.deploy.deployops.deploy_to_environments')
+    def test_deploy__multiple_environments(
+            self,
+            deploy_to_environments_mock,
+            resolve_environment_names_mock,
+            get_app_name_mock,
+            get_environments_mock,
+            alert_environment_status_mock,
+    ):
+        get_app_name_mock.return_value = 'my-application'
+        resolve_environment_names_mock.return_value = ['environment-1', 'web-1', 'web-2']
+        environments = [Environment(name=name) for name in resolve_environment_names_mock.return_value]
+        get_environments_mock.return_value = environments
+
+        app = EB(argv=['deploy', 'environment-1', 'web-*', '--max-concurrency', '2', '--wave-size', '2'])
+        app.setup()
+        app.run()
+
+        resolve_environment_names_mock.assert_called_once_with('my-application', ['environment-1', 'web-*'])
+        get_environments_mock.assert_called_once_with(['environment-1', 'web-1', 'web-2'])
+        self.assertEqual(3, alert_environment_status_mock.call_count)
+        deploy_to_environments_mock.assert_called_once_with(
+            'my-application',
+            ['environment-1', 'web-1', 'web-2'],
+            None,
+            None,
+            None,
+            group_name=None,
+            process_app_versions=False,
+            staged=False,
+            timeout=None,
+            source=None,
+            max_concurrency=2,
+            wave_size=2
+        )
+
+    @mock.patch('ebcli.controllers.deploy.deployops.deploy_to_environments')
+    def test_deploy__multiple_environments__wave_size_must_be_positive(
+            self,
+            deploy_to_environments_mock
+    ):
+        for wave_size in ('0', '-2'):
+            app = EB(argv=['deploy', 'environment-1', 'environment-2', '--wave-size', wave_size])
+            app.setup()
+
+            with self.assertRaises(InvalidOptionsError) as context_manager:
+                app.run()
+
+            self.assertEqual(
+                'The "--wave-size" option requires a positive number of environments.',
+                str(context_manager.exception)
+            )
+        deploy_to_environments_mock.assert_not_called()
+
+    def test_deploy__multiple_environments_with_archive(self):
+        app = EB(
+            argv=[
+                'deploy',
+                'environment-1',
+                'environment-2',
+                '--archive', 'my-source-directory',
+                '--region', 'us-east-1'
+            ]
+        )
+        app.setup()
+
+        with self.assertRaises(InvalidOptionsError) as context_manager:
+            app.run()
+
+        self.assertEqual(
+            'You cannot use the "--archive" option when deploying to multiple environments.',
+            str(context_manager.exception)
+        )
+
     def test_deploy_with_archive__fails_without_environment_name(self):
         app = EB(
             argv=[
@@ -569,6 +651,10 @@ class TestDeployNormal(TestDeploy):
 
         os.chdir('testDir')
 
+        patcher = mock.patch('ebcli.core.abstractcontroller.updatecheck.start')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def tearDown(self):
         os.chdir(self.root_dir)
         shutil.rmtree('testDir')
@@ -585,6 +671,10 @@ class TestGetOrCreateSourceBundle(unittest.TestCase):
             os.mkdir('testDir')
 
         os.chdir('testDir')
+
+        patcher = mock.patch('ebcli.core.abstractcontroller.updatecheck.start')
+        patcher.start()
+        self.addCleanup(patcher.stop)
         
         # Create test files and directories
         if not os.path.exists('source_dir'):
@@ -824,23 +914,27 @@ class TestGetOrCreateSourceBundle(unittest.TestCase):
 
     @mock.patch('ebcli.controllers.deploy.DeployController.get_app_name')
     @mock.patch('ebcli.controllers.deploy.io.echo')
-    @mock.patch('ebcli.controllers.deploy.commonops.create_app_version')
+    @mock.patch('ebcli.controllers.deploy.commonops.plan_app_version')
+    @mock.patch('ebcli.operations.composeops.commonops.create_planned_app_version')
+    @mock.patch('ebcli.operations.composeops.commonops.record_planned_artifact')
     @mock.patch('ebcli.controllers.deploy.composeops.compose_no_events')
     @mock.patch('ebcli.controllers.deploy.commonops.wait_for_compose_events')
     def test_multiple_modules(
             self,
             wait_for_compose_events_mock,
             compose_no_events_mock,
-            create_app_version_mock,
+            record_planned_artifact_mock,
+            create_planned_app_version_mock,
+            plan_app_version_mock,
             echo_mock,
             get_app_name_mock
     ):
         get_app_name_mock.return_value = 'my-application'
-        create_app_version_mock.side_effect = [
-            'app-version-1',
-            'app-version-2',
-            'app-version-3'
-        ]
+        plan_app_version_mock.side_effect = lambda process: os.path.basename(os.getcwd())
+        create_planned_app_version_mock.side_effect = lambda app_name, plan: {
+            'module-1': 'app-version-1',
+            'module-2': 'app-version-2',
+        }[plan]
         compose_no_events_mock.return_value = 'request-id'
 
         os.mkdir('module-1')
@@ -884,6 +978,7 @@ EnvironmentName: back+
 
         )
 
+        self.assertEqual(2, create_planned_app_version_mock.call_count)
         compose_no_events_mock.assert_called_once_with(
             'my-application',
             [
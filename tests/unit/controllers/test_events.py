@@ -47,7 +47,15 @@ class TestDeploy(unittest.TestCase):
         app.setup()
         app.run()
 
-        print_events_mock.assert_called_once_with('my-application', 'environment-1', False)
+        print_events_mock.assert_called_once_with(
+            'my-application',
+            'environment-1',
+            False,
+            since=None,
+            severity=None,
+            request_id=None,
+            version_label=None
+        )
 
     @mock.patch('ebcli.controllers.events.EventsController.get_app_name')
     @mock.patch('ebcli.controllers.events.EventsController.get_env_name')
@@ -65,4 +73,44 @@ class TestDeploy(unittest.TestCase):
         app.setup()
         app.run()
 
-        print_events_mock.assert_called_once_with('my-application', 'environment-1', True)
+        print_events_mock.assert_called_once_with(
+            'my-application',
+            'environment-1',
+            True,
+            since=None,
+            severity=None,
+            request_id=None,
+            version_label=None
+        )
+
+    @mock.patch('ebcli.controllers.events.EventsController.get_app_name')
+    @mock.patch('ebcli.controllers.events.EventsController.get_env_name')
+    @mock.patch('ebcli.controllers.events.eventsops.print_events')
+    def test_events__filters(
+            self,
+            print_events_mock,
+            get_env_name_mock,
+            get_app_name_mock
+    ):
+        get_app_name_mock.return_value = 'my-application'
+        get_env_name_mock.return_value = 'environment-1'
+
+        app = EB(argv=[
+            'events',
+            '--since', '2018-07-19T21:00:00Z',
+            '--severity', 'warn',
+            '--request-id', 'a28c2685-b6a0-4785-82bf-45de6451bd01',
+            '--version-label', 'v1',
+        ])
+        app.setup()
+        app.run()
+
+        print_events_mock.assert_called_once_with(
+            'my-application',
+            'environment-1',
+            False,
+            since='2018-07-19T21:00:00Z',
+            severity='WARN',
+            request_id='a28c2685-b6a0-4785-82bf-45de6451bd01',
+            version_label='v1'
+        )
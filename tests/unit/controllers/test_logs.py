@@ -69,6 +69,30 @@ class TestTrivialInvalidArgumentCombinations(TestLogs):
             str(context_manager.exception)
         )
 
+    def test_logs__invalid_options_combination__time_range_without_all_or_zip(self):
+        self.app = EB(argv=['logs', '--start-time', '2018-03-26T17:00:00Z'])
+        self.app.setup()
+
+        with self.assertRaises(InvalidOptionsError) as context_manager:
+            self.app.run()
+
+        self.assertEqual(
+            """You can use the "--start-time" and "--end-time" options only when retrieving all logs from CloudWatch Logs with "--all" or "--zip", or with "--grep".""",
+            str(context_manager.exception)
+        )
+
+    def test_logs__invalid_options_combination__grep_and_all(self):
+        self.app = EB(argv=['logs', '--grep', 'error', '--all'])
+        self.app.setup()
+
+        with self.assertRaises(InvalidOptionsError) as context_manager:
+            self.app.run()
+
+        self.assertEqual(
+            """You can't use the "--grep" option with options that retrieve, stream or analyze logs. "--grep" searches the logs last retrieved with "eb logs --all".""",
+            str(context_manager.exception)
+        )
+
     def test_logs__invalid_options_combination__all_and_instance_id_logs(self):
         # TODO: consider not making this an error
         self.app = EB(argv=['logs', '--all', '--instance', 'i-123456789'])
@@ -385,6 +409,63 @@ class TestGetLogsWithCloudWatchLogStreamingEnabled(TestLogs):
             specific_log_stream=None
         )
 
+    @mock.patch('ebcli.controllers.logs.logsops.normalize_log_group_name')
+    @mock.patch('ebcli.controllers.logs.logsops.instance_log_streaming_enabled')
+    @mock.patch('ebcli.controllers.logs.logsops.retrieve_cloudwatch_instance_logs')
+    def test_logs__all__time_range__retrieves_cloudwatch_logs_within_time_range(
+            self,
+            retrieve_cloudwatch_instance_logs_mock,
+            instance_log_streaming_enabled_mock,
+            normalize_log_group_name
+    ):
+        instance_log_streaming_enabled_mock.return_value = True
+        normalize_log_group_name.return_value = '/aws/elasticbeanstalk/MyFooEnv/var/log/eb-activity.log'
+
+        self.app = EB(argv=[
+            'logs', '--all', '--start-time', '2018-03-26T17:00:00Z', '--end-time', '2018-03-26 18:00:00.500'
+        ])
+        self.app.setup()
+        self.app.run()
+
+        retrieve_cloudwatch_instance_logs_mock.assert_called_with(
+            '/aws/elasticbeanstalk/MyFooEnv/var/log/eb-activity.log',
+            'bundle',
+            do_zip=False,
+            specific_log_stream=None,
+            start_time=1522083600000,
+            end_time=1522087200500
+        )
+
+    @mock.patch('ebcli.controllers.logs.logsops.search_retrieved_logs')
+    def test_logs__grep(
+            self,
+            search_retrieved_logs_mock
+    ):
+        self.app = EB(argv=[
+            'logs', '--grep', 'Traceback', '--instance', 'i-123', '--start-time', '2018-03-26T17:00:00Z'
+        ])
+        self.app.setup()
+        self.app.run()
+
+        search_retrieved_logs_mock.assert_called_once_with(
+            'Traceback',
+            instance_id='i-123',
+            start_time=1522083600000
+        )
+
+    @mock.patch('ebcli.controllers.logs.logsops.instance_log_streaming_enabled')
+    def test_logs__all__time_range__cloudwatch_log_streaming_disabled(
+            self,
+            instance_log_streaming_enabled_mock
+    ):
+        instance_log_streaming_enabled_mock.return_value = False
+
+        self.app = EB(argv=['logs', '--all', '--end-time', '2018-03-26T18:00:00Z'])
+        self.app.setup()
+
+        with self.assertRaises(InvalidOptionsError):
+            self.app.run()
+
     @mock.patch('ebcli.controllers.logs.logsops.normalize_log_group_name')
     @mock.patch('ebcli.controllers.logs.logsops.raise_if_instance_log_streaming_is_not_enabled')
     @mock.patch('ebcli.controllers.logs.logsops.retrieve_cloudwatch_instance_logs')
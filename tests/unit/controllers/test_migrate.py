@@ -13,6 +13,10 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import hashlib
+import json
+import os
+import shutil
 import unittest
 import sys
 from unittest import skipIf
@@ -21,10 +25,10 @@ import mock
 from typing import List, Dict, Any
 import xml.etree.ElementTree as ET
 
+from ebcli.controllers import migrate
 from ebcli.controllers.migrate import (
     translate_iis_to_alb,
     create_alb_rules,
-    _sort_rules_by_specificity,
     get_site_configs,
     SiteConfig,
     convert_alb_rules_to_option_settings,
@@ -108,165 +112,6 @@ class TestMigrateController(unittest.TestCase):
         )
 
 
-@skipIf(not sys.platform.startswith("win"), "`eb migrate` only supports Windows with IIS installed")
-class TestSortRulesBySpecificity(unittest.TestCase):
-    """Tests for the _sort_rules_by_specificity function."""
-
-    def test_sort_rules_by_specificity_empty_list(self):
-        """Test sorting an empty list of rules."""
-        rules = []
-        sorted_rules = _sort_rules_by_specificity(rules)
-        self.assertEqual(sorted_rules, [])
-
-    def test_sort_rules_by_specificity_no_conditions(self):
-        """Test sorting rules with no conditions."""
-        rules = [
-            {"Actions": [{"Type": "forward"}], "Protocol": "http"},
-            {"Actions": [{"Type": "forward"}], "Protocol": "https"},
-        ]
-        sorted_rules = _sort_rules_by_specificity(rules)
-        # Order should remain the same since no conditions to sort by
-        self.assertEqual(sorted_rules, rules)
-
-    def test_sort_rules_by_specificity_host_header_only(self):
-        """Test sorting rules with only host-header conditions."""
-        rules = [
-            {
-                "Actions": [{"Type": "forward"}],
-                "Protocol": "http",
-                "Conditions": [{"Field": "host-header", "Values": ["example.com"]}],
-            },
-            {
-                "Actions": [{"Type": "forward"}],
-                "Protocol": "http",
-                "Conditions": [{"Field": "host-header", "Values": ["api.example.com"]}],
-            },
-        ]
-        sorted_rules = _sort_rules_by_specificity(rules)
-        # Both rules have the same specificity (host-header only), so order should remain
-        self.assertEqual(sorted_rules, rules)
-
-    def test_sort_rules_by_specificity_path_pattern_only(self):
-        """Test sorting rules with only path-pattern conditions."""
-        rules = [
-            {
-                "Actions": [{"Type": "forward"}],
-                "Protocol": "http",
-                "Conditions": [{"Field": "path-pattern", "Values": ["/api/*"]}],
-            },
-            {
-                "Actions": [{"Type": "forward"}],
-                "Protocol": "http",
-                "Conditions": [{"Field": "path-pattern", "Values": ["/users/*"]}],
-            },
-        ]
-        sorted_rules = _sort_rules_by_specificity(rules)
-        # Both rules have the same specificity (path-pattern only), so order should remain
-        self.assertEqual(sorted_rules, rules)
-
-    def test_sort_rules_by_specificity_mixed_conditions(self):
-        """Test sorting rules with mixed condition types."""
-        # Define rules with different specificity levels
-        path_only_rule = {
-            "Actions": [{"Type": "forward"}],
-            "Protocol": "http",
-            "Conditions": [{"Field": "path-pattern", "Values": ["/api/*"]}],
-        }
-        host_only_rule = {
-            "Actions": [{"Type": "forward"}],
-            "Protocol": "http",
-            "Conditions": [{"Field": "host-header", "Values": ["example.com"]}],
-        }
-        both_conditions_rule = {
-            "Actions": [{"Type": "forward"}],
-            "Protocol": "http",
-            "Conditions": [
-                {"Field": "host-header", "Values": ["api.example.com"]},
-                {"Field": "path-pattern", "Values": ["/v1/*"]},
-            ],
-        }
-        no_conditions_rule = {"Actions": [{"Type": "forward"}], "Protocol": "http"}
-
-        # Test with rules in different orders
-        rules = [
-            path_only_rule,
-            host_only_rule,
-            both_conditions_rule,
-            no_conditions_rule,
-        ]
-        sorted_rules = _sort_rules_by_specificity(rules)
-
-        # Verify the sorting order: both_conditions > path_only > host_only > no_conditions
-        # Instead of comparing entire rule objects, check their specificity scores
-        self.assertEqual(sorted_rules[0]["Protocol"], both_conditions_rule["Protocol"])
-        self.assertEqual(
-            len(sorted_rules[0]["Conditions"]), 2
-        )  # Both host and path conditions
-        self.assertEqual(sorted_rules[1]["Protocol"], path_only_rule["Protocol"])
-        self.assertEqual(sorted_rules[1]["Conditions"][0]["Field"], "path-pattern")
-        self.assertEqual(sorted_rules[2]["Protocol"], host_only_rule["Protocol"])
-        self.assertEqual(sorted_rules[2]["Conditions"][0]["Field"], "host-header")
-        self.assertEqual(
-            sorted_rules[3], no_conditions_rule
-        )  # No conditions rule can be compared directly
-
-        # Test with a different initial order
-        rules = [
-            no_conditions_rule,
-            host_only_rule,
-            path_only_rule,
-            both_conditions_rule,
-        ]
-        sorted_rules = _sort_rules_by_specificity(rules)
-
-        # Verify the sorting order remains consistent
-        self.assertEqual(
-            len(sorted_rules[0]["Conditions"]), 2
-        )  # Both host and path conditions
-        self.assertEqual(sorted_rules[1]["Conditions"][0]["Field"], "path-pattern")
-        self.assertEqual(sorted_rules[2]["Conditions"][0]["Field"], "host-header")
-        self.assertEqual(sorted_rules[3], no_conditions_rule)
-
-    def test_sort_rules_by_specificity_multiple_same_type(self):
-        """Test sorting rules with multiple conditions of the same type."""
-        # Rule with multiple path patterns
-        multiple_paths_rule = {
-            "Actions": [{"Type": "forward"}],
-            "Protocol": "http",
-            "Conditions": [
-                {"Field": "path-pattern", "Values": ["/api/*"]},
-                {"Field": "path-pattern", "Values": ["/v1/*"]},
-            ],
-        }
-
-        # Rule with multiple host headers
-        multiple_hosts_rule = {
-            "Actions": [{"Type": "forward"}],
-            "Protocol": "http",
-            "Conditions": [
-                {"Field": "host-header", "Values": ["api.example.com"]},
-                {"Field": "host-header", "Values": ["dev.example.com"]},
-            ],
-        }
-
-        # Rule with both types
-        mixed_rule = {
-            "Actions": [{"Type": "forward"}],
-            "Protocol": "http",
-            "Conditions": [
-                {"Field": "host-header", "Values": ["example.com"]},
-                {"Field": "path-pattern", "Values": ["/users/*"]},
-            ],
-        }
-
-        rules = [multiple_paths_rule, multiple_hosts_rule, mixed_rule]
-        sorted_rules = _sort_rules_by_specificity(rules)
-
-        self.assertEqual(multiple_paths_rule, sorted_rules[0])
-        self.assertEqual(mixed_rule, sorted_rules[1])
-        self.assertEqual(multiple_hosts_rule, sorted_rules[2])
-
-
 @skipIf(not sys.platform.startswith("win"), "`eb migrate` only supports Windows with IIS installed")
 class TestCreateAlbRules(unittest.TestCase):
     """Tests for the create_alb_rules function."""
@@ -929,3 +774,315 @@ class MockServerManager:
 
     def __init__(self, sites: List[MockSite]):
         self.Sites = sites
+
+
+class FakeRemoteConnection:
+    """Stand-in for a fabric Connection that answers every command with `stdout`."""
+
+    def __init__(self, stdout: str):
+        self.stdout = stdout
+        self.commands = []
+
+    def run(self, command, hide=False):
+        self.commands.append(command)
+        return mock.MagicMock(stdout=self.stdout)
+
+
+REMOTE_WEB_CONFIG = """\ufeff<?xml version="1.0" encoding="UTF-8"?>
+<configuration>
+  <system.webServer>
+    <rewrite>
+      <rules>
+        <rule name="Products">
+          <match url="^products/([0-9]+)$" />
+          <action type="Rewrite" url="product.aspx?id={R:1}" />
+        </rule>
+      </rules>
+    </rewrite>
+  </system.webServer>
+</configuration>
+"""
+
+
+def remote_site_document(name, physical_path, bindings, applications=None, web_config=None):
+    return {
+        "Name": name,
+        "Attributes": [{"Name": "id", "Value": "1"}],
+        "Bindings": [
+            {
+                "BindingInformation": binding_information,
+                "Protocol": protocol,
+                "CertificateHash": None,
+                "CertificateStoreName": None,
+                "Host": binding_information.split(":")[2] or "*",
+                "EndPoint": {"Port": int(binding_information.split(":")[1]), "Address": "*"},
+            }
+            for binding_information, protocol in bindings
+        ],
+        "Applications": [
+            {
+                "Path": "/",
+                "ApplicationPoolName": "DefaultAppPool",
+                "PhysicalPath": physical_path,
+                "EnabledProtocols": "http",
+                "VirtualDirectories": [
+                    {"Path": "/", "PhysicalPath": physical_path, "LogonMethod": "ClearText",
+                     "UserName": "", "HasPassword": False}
+                ],
+            }
+        ] + (applications or []),
+        "HSTS": {"Enabled": False, "MaxAge": None},
+        "WebConfig": web_config,
+    }
+
+
+class TestIISInventoryRemote(unittest.TestCase):
+    """Tests for reading the inventory of a remote IIS server."""
+
+    def setUp(self):
+        api_site = remote_site_document(
+            "API",
+            "C:\\sites\\api",
+            [("*:8080:api.example.com", "http")],
+            applications=[{
+                "Path": "/v1",
+                "ApplicationPoolName": "ApiPool",
+                "PhysicalPath": "C:\\sites\\api\\v1",
+                "EnabledProtocols": "http",
+                # PowerShell may render a single-element collection as the element itself
+                "VirtualDirectories": {"Path": "/", "PhysicalPath": "C:\\sites\\api\\v1"},
+            }],
+        )
+        self.document = {
+            "Sites": [
+                remote_site_document(
+                    "Default Web Site",
+                    "%SystemDrive%\\inetpub\\wwwroot",
+                    [("*:80:", "http"), ("*:443:www.example.com", "https")],
+                    web_config=REMOTE_WEB_CONFIG,
+                ),
+                api_site,
+            ],
+            "ArrEnabled": True,
+            "Users": {"Name": "Administrator", "HomeDirectory": ""},
+        }
+        self.connection = FakeRemoteConnection("#< CLIXML\n" + json.dumps(self.document))
+
+    def tearDown(self):
+        migrate._iis_inventories.clear()
+
+    def test_inventory_is_read_in_a_single_round_trip(self):
+        site_names = migrate.establish_candidate_sites_remote(self.connection, None)
+        sites = migrate.populate_site_data_remote(self.connection, site_names)
+        site_configs = migrate.get_site_configs_remote(self.connection, sites)
+
+        self.assertTrue(migrate._arr_enabled_remote(self.connection))
+        self.assertEqual(1, len(self.connection.commands))
+        self.assertEqual(["Default Web Site", "API"], site_names)
+        self.assertEqual(
+            ["*:80:", "*:443:www.example.com", "*:8080:api.example.com"],
+            [config_binding for site in sites for config_binding in
+             (binding.BindingInformation for binding in site.get_Bindings())]
+        )
+        self.assertEqual(["/", "/v1"], [app.Path for app in sites[1].Applications])
+        self.assertEqual("C:\\sites\\api\\v1", sites[1].Applications[1].VirtualDirectories[0].PhysicalPath)
+        self.assertEqual(8080, sites[1].Bindings[0].get_EndPoint().Port)
+        self.assertEqual(
+            [
+                ("Default Web Site", 80, None, "http"),
+                ("Default Web Site", 443, "www.example.com", "https"),
+                ("API", 8080, "api.example.com", "http"),
+            ],
+            [(config.name, config.port, config.host_header, config.protocol) for config in site_configs]
+        )
+        self.assertEqual("%SystemDrive%\\inetpub\\wwwroot", site_configs[0].physical_path)
+        self.assertEqual(
+            [{
+                "name": "Products",
+                "pattern": "^products/([0-9]+)$",
+                "action_type": "Rewrite",
+                "action_url": "product.aspx?id={R:1}",
+            }],
+            site_configs[1].rewrite_rules
+        )
+        self.assertEqual([], site_configs[2].rewrite_rules)
+
+    def test_establish_candidate_sites_remote__unknown_site(self):
+        with self.assertRaises(ValueError) as context_manager:
+            migrate.establish_candidate_sites_remote(self.connection, "Default Web Site,Missing")
+
+        self.assertEqual(
+            "Specified site, 'Missing', does not exist. Available sites: [Default Web Site, API]",
+            str(context_manager.exception)
+        )
+
+    @mock.patch("ebcli.controllers.migrate.io.echo")
+    def test_list_sites_verbosely_remote(self, echo_mock):
+        migrate.list_sites_verbosely_remote(self.connection)
+
+        echoed = [call[0][0] for call in echo_mock.call_args_list]
+        self.assertEqual("1: Default Web Site:", echoed[0])
+        self.assertIn("  - Application '/v1':", echoed)
+        self.assertIn("        - Logon Method: ClearText", echoed)
+        self.assertEqual(["  - Administrator", "    - Home: None"], echoed[-2:])
+        self.assertEqual(1, len(self.connection.commands))
+
+
+class TestImportPackagedSitesFromRemote(unittest.TestCase):
+    """Tests for downloading the packaged sites of a remote server."""
+
+    def setUp(self):
+        self.root_dir = os.getcwd()
+        if os.path.isdir("testDir"):
+            shutil.rmtree("testDir")
+        self.remote_root = os.path.abspath(os.path.join("testDir", "remote"))
+        self.upload_target_dir = os.path.abspath(os.path.join("testDir", "upload_target"))
+        os.makedirs(os.path.join(self.remote_root, "Default Web Site"))
+        os.makedirs(self.upload_target_dir)
+        listing = []
+        for relative_path, contents in [
+            ("DefaultWebSite.zip", b"site"),
+            ("Default Web Site\\api.zip", b"application"),
+        ]:
+            with open(os.path.join(self.remote_root, *relative_path.split("\\")), "wb") as f:
+                f.write(contents)
+            listing.append({
+                "RelativePath": relative_path,
+                "Size": len(contents),
+                "Sha256": hashlib.sha256(contents).hexdigest().upper(),
+            })
+        self.connection = FakeRemoteConnection(json.dumps(listing))
+        self.connection.open = mock.MagicMock()
+        self.connection.client = mock.MagicMock()
+        self.requested_paths = []
+        self.connection.client.open_sftp.side_effect = self._open_sftp
+
+    def tearDown(self):
+        os.chdir(self.root_dir)
+        shutil.rmtree("testDir")
+
+    def _open_sftp(self):
+        channel = mock.MagicMock()
+
+        def open_remote_file(path, mode):
+            self.requested_paths.append(path)
+            relative_path = path[len("/C:/migrations/latest/upload_target/"):]
+            return open(os.path.join(self.remote_root, *relative_path.split("/")), mode)
+
+        channel.open.side_effect = open_remote_file
+        return channel
+
+    @mock.patch("ebcli.controllers.migrate.io.echo")
+    def test_import_packaged_sites_from_remote(self, echo_mock):
+        migrate.import_packaged_sites_from_remote(self.connection, "C:\\migrations\\latest", self.upload_target_dir)
+
+        self.assertEqual(1, len(self.connection.commands))
+        self.assertEqual(
+            [
+                "/C:/migrations/latest/upload_target/Default Web Site/api.zip",
+                "/C:/migrations/latest/upload_target/DefaultWebSite.zip",
+            ],
+            sorted(self.requested_paths)
+        )
+        with open(os.path.join(self.upload_target_dir, "Default Web Site", "api.zip"), "rb") as f:
+            self.assertEqual(b"application", f.read())
+        self.assertTrue(echo_mock.call_args[0][0].startswith("Downloaded 2 file(s)"))
+
+        migrate.import_packaged_sites_from_remote(self.connection, "C:\\migrations\\latest", self.upload_target_dir)
+
+        self.assertEqual(2, len(self.requested_paths))
+        self.assertIn("2 file(s) already up to date", echo_mock.call_args[0][0])
+
+
+class TestCompileAlbRules(unittest.TestCase):
+    """Tests for compiling site configurations into merged ALB rules."""
+
+    def _site(self, binding_info, protocol="http", patterns=()):
+        site = SiteConfig(
+            name=binding_info,
+            binding_info=binding_info,
+            physical_path="C:\\inetpub\\wwwroot",
+            protocol=protocol,
+        )
+        site.rewrite_rules = [{"name": pattern, "pattern": pattern} for pattern in patterns]
+        return site
+
+    def _conditions(self, rules):
+        return [
+            (
+                rule["Protocol"],
+                rule["Actions"][0]["ForwardConfig"]["TargetGroups"][0]["TargetGroupArn"].split("/")[-1],
+                [(condition["Field"], condition["Values"]) for condition in rule.get("Conditions", [])],
+            )
+            for rule in rules
+        ]
+
+    def test_compile_alb_rules__merges_routes_to_the_same_target_group(self):
+        rules = migrate.compile_alb_rules([
+            self._site("*:80:a.example.com", patterns=["^/api/(.+)", "^/docs/(.*)"]),
+            self._site("*:80:b.example.com"),
+            self._site("*:80:a.example.com", patterns=["^/api/(.+)"]),
+            self._site("*:8080:", patterns=["^/health$"]),
+            self._site("*:443:secure.example.com", protocol="https"),
+            self._site("*:21:ftp.example.com", protocol="ftp"),
+        ])
+
+        self.assertEqual(
+            [
+                ("http", "80", [("host-header", ["a.example.com"]), ("path-pattern", ["/api/*", "/docs/*"])]),
+                ("http", "8080", [("path-pattern", ["/health"])]),
+                ("http", "80", [("host-header", ["a.example.com", "b.example.com"])]),
+                ("https", "443", [("host-header", ["secure.example.com"])]),
+                ("http", "8080", []),
+            ],
+            self._conditions(rules)
+        )
+        self.assertEqual([1, 2, 3, 4, 5], [rule["Priority"] for rule in rules])
+
+    def test_compile_alb_rules__packs_condition_values_and_listener_rules(self):
+        site_configs = [self._site("*:80:site{0}.example.com".format(index)) for index in range(12)]
+        site_configs[0].rewrite_rules = [{"pattern": "^/p{0}/(.*)".format(index)} for index in range(6)]
+
+        with mock.patch("ebcli.controllers.migrate.io.log_warning") as log_warning_mock:
+            rules = migrate.ALBRuleCompiler(max_rules_per_listener=4).compile(site_configs)
+
+        self.assertEqual(
+            [
+                [("host-header", ["site0.example.com"]), ("path-pattern", ["/p0/*", "/p1/*", "/p2/*", "/p3/*"])],
+                [("host-header", ["site0.example.com"]), ("path-pattern", ["/p4/*", "/p5/*"])],
+                [("host-header", ["site{0}.example.com".format(index) for index in range(5)])],
+                [("host-header", ["site{0}.example.com".format(index) for index in range(5, 10)])],
+            ],
+            [conditions for _, _, conditions in self._conditions(rules)]
+        )
+        log_warning_mock.assert_called_once_with(
+            "1 HTTP listener rule(s) exceed the limit of 4 rules per listener and were not created."
+        )
+
+    def test_create_alb_rules__emits_one_rule_per_route(self):
+        rules = migrate.create_alb_rules([
+            self._site("*:80:a.example.com", patterns=["^/api/(.+)", "^/docs/(.*)", "^/api/(.+)"]),
+            self._site("*:80:b.example.com"),
+        ])
+
+        self.assertEqual(
+            [
+                [("host-header", ["a.example.com"]), ("path-pattern", ["/api/*"])],
+                [("host-header", ["a.example.com"]), ("path-pattern", ["/docs/*"])],
+                [("host-header", ["a.example.com"])],
+                [("host-header", ["b.example.com"])],
+            ],
+            [conditions for _, _, conditions in self._conditions(rules)]
+        )
+
+    def test_convert_alb_rules_to_option_settings__joins_condition_values(self):
+        rules = migrate.compile_alb_rules([
+            self._site("*:8080:a.example.com", patterns=["^/api/(.+)", "^/docs/(.*)"]),
+        ])
+
+        converted = convert_alb_rules_to_option_settings(rules, None)
+
+        self.assertIn(
+            {"Namespace": "aws:elbv2:listenerrule:rule1", "OptionName": "PathPatterns", "Value": "/api/*,/docs/*"},
+            converted.http_listener_rule_option_settings
+        )
@@ -131,3 +131,53 @@ class TestInit(unittest.TestCase):
             str(context_manager.exception)
         )
         prepare_for_ssh_mock.assert_not_called()
+
+    @mock.patch('ebcli.controllers.ssh.SSHController.get_env_name')
+    @mock.patch('ebcli.controllers.ssh.sshops.run_on_all_instances')
+    @mock.patch('ebcli.controllers.ssh.sshops.prepare_for_ssh')
+    def test_ssh__all(
+            self,
+            prepare_for_ssh_mock,
+            run_on_all_instances_mock,
+            get_env_name_mock
+    ):
+        get_env_name_mock.return_value = 'my-environment'
+
+        app = EB(argv=['ssh', '--all', '--command', 'uptime', '--concurrency', '4'])
+        app.setup()
+        app.run()
+
+        run_on_all_instances_mock.assert_called_once_with(
+            'my-environment',
+            'uptime',
+            keep_open=False,
+            force_open=False,
+            custom_ssh=None,
+            concurrency=4
+        )
+        prepare_for_ssh_mock.assert_not_called()
+
+    @mock.patch('ebcli.controllers.ssh.SSHController.get_env_name')
+    @mock.patch('ebcli.controllers.ssh.sshops.run_on_all_instances')
+    def test_ssh__all__invalid_options(
+            self,
+            run_on_all_instances_mock,
+            get_env_name_mock
+    ):
+        get_env_name_mock.return_value = 'my-environment'
+
+        for argv, message in [
+            (['ssh', '--all'], 'You must specify the command to run on all instances with the "--command" option.'),
+            (
+                ['ssh', '--all', '--command', 'uptime', '--number', '1'],
+                'You cannot use the "--all" option with the "--instance", "--number", or "--setup" options.'
+            ),
+        ]:
+            app = EB(argv=argv)
+            app.setup()
+
+            with self.assertRaises(ssh.InvalidOptionsError) as context_manager:
+                app.run()
+
+            self.assertEqual(message, str(context_manager.exception))
+        run_on_all_instances_mock.assert_not_called()
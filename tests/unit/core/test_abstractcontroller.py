@@ -61,6 +61,16 @@ class TestAbstractBaseController(unittest.TestCase):
 
         self.test_target.check_for_cli_update.assert_called_once_with('0.0.0')
 
+    @mock.patch('ebcli.core.abstractcontroller.updatecheck.start')
+    def test_start_cli_update_check__only_for_whitelisted_commands(self, start_mock):
+        self.test_target.Meta.label = 'tags'
+        self.test_target.start_cli_update_check()
+        start_mock.assert_not_called()
+
+        self.test_target.Meta.label = 'status'
+        self.test_target.start_cli_update_check()
+        start_mock.assert_called_once_with()
+
     @mock.patch('ebcli.core.abstractcontroller.io.log_alert')
     @mock.patch('ebcli.core.abstractcontroller.cli_update_exists')
     def test_check_for_cli_update__skips_when_label_not_in_whitelist(
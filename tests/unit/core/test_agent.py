@@ -0,0 +1,150 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import os
+import shutil
+import socket
+import threading
+import time
+
+import mock
+from pytest_socket import disable_socket, enable_socket
+import unittest
+
+from ebcli.core import agent
+
+
+def _fake_execute(request):
+    os.write(1, 'ran {0} in {1}\n'.format(' '.join(request['args']), os.getcwd()).encode('utf-8'))
+    return 3
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX') and hasattr(os, 'fork'), 'requires Unix domain sockets and fork')
+class TestAgent(unittest.TestCase):
+    def setUp(self):
+        enable_socket()
+        self.root_dir = os.getcwd()
+        if os.path.isdir('testDir'):
+            shutil.rmtree('testDir')
+        os.mkdir('testDir')
+        self.runtime_directory = os.path.abspath(os.path.join('testDir', 'run'))
+        os.mkdir(self.runtime_directory)
+        self.environ = {
+            agent.AGENT_ENV_VAR: '1',
+            'XDG_RUNTIME_DIR': self.runtime_directory,
+        }
+        self.agent_thread = None
+
+    def tearDown(self):
+        if self.agent_thread:
+            agent.stop(self.environ)
+            self.agent_thread.join(10)
+        os.chdir(self.root_dir)
+        shutil.rmtree('testDir')
+        disable_socket()
+
+    def _start_agent(self, idle_timeout=30):
+        self.agent = agent.Agent(agent.socket_location(self.environ), idle_timeout=idle_timeout)
+        self.agent_thread = threading.Thread(target=self.agent.serve, kwargs={'warm_up': False})
+        self.agent_thread.start()
+        for _ in range(100):
+            if os.path.exists(self.agent.location) or not self.agent_thread.is_alive():
+                return
+            time.sleep(0.05)
+        self.fail('The agent did not start')
+
+    def _open_streams(self):
+        self.streams = [
+            open(os.path.join('testDir', name), mode)
+            for name, mode in [('stdin', 'w+'), ('stdout', 'w+'), ('stderr', 'w+')]
+        ]
+        self.addCleanup(lambda: [stream.close() for stream in self.streams])
+        return tuple(stream.fileno() for stream in self.streams)
+
+    def test_forward__disabled(self):
+        self.assertIsNone(agent.forward(['status'], environ={}))
+        self.assertIsNone(agent.forward(['status'], environ={agent.AGENT_ENV_VAR: '0'}))
+
+    @mock.patch('ebcli.core.agent._start_agent')
+    def test_forward__commands_that_need_the_terminal_run_locally(self, _start_agent_mock):
+        self.assertIsNone(agent.forward(['ssh', 'my-env'], environ=self.environ))
+        _start_agent_mock.assert_not_called()
+
+    @mock.patch('ebcli.core.agent._start_agent')
+    def test_forward__starts_agent_and_runs_locally_when_none_is_listening(self, _start_agent_mock):
+        os.makedirs(os.path.dirname(agent.socket_location(self.environ)), mode=0o700)
+
+        self.assertIsNone(agent.forward(['status'], environ=self.environ))
+
+        _start_agent_mock.assert_called_once_with(self.environ)
+
+    @mock.patch('ebcli.core.agent._start_agent')
+    def test_forward__refuses_directory_accessible_to_other_users(self, _start_agent_mock):
+        os.makedirs(os.path.dirname(agent.socket_location(self.environ)))
+        os.chmod(os.path.dirname(agent.socket_location(self.environ)), 0o777)
+
+        self.assertIsNone(agent.forward(['status'], environ=self.environ))
+        agent.Agent(agent.socket_location(self.environ)).serve(warm_up=False)
+
+        self.assertFalse(os.path.exists(agent.socket_location(self.environ)))
+
+    @mock.patch('ebcli.core.agent.Agent._warm_up')
+    @mock.patch('ebcli.core.agent._execute', _fake_execute)
+    def test_forward__runs_command_in_agent_with_forwarded_streams(self, _warm_up_mock):
+        self._start_agent()
+        fds = self._open_streams()
+        os.chdir('testDir')
+
+        exit_code = agent.forward(['status', 'my-env'], environ=self.environ, fds=fds)
+
+        self.assertEqual(3, exit_code)
+        self.streams[1].seek(0)
+        self.assertEqual('ran status my-env in {0}\n'.format(os.getcwd()), self.streams[1].read())
+        for _ in range(100):
+            if _warm_up_mock.called:
+                break
+            time.sleep(0.05)
+        report = _warm_up_mock.call_args[0][0]
+        self.assertEqual({'settings', 'environment', 'services', 'platform_branches'}, set(report))
+
+    def test_serve__agent_stops_when_client_of_different_version_connects(self):
+        self._start_agent()
+        fds = self._open_streams()
+        request = agent._run_request(['status'], self.environ)
+        request['version'] = '0.0.0'
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(self.agent.location)
+            agent._send_message(connection, request, fds)
+            response = agent._read_message(connection.makefile('rb'))
+
+        self.assertEqual({'status': agent.INCOMPATIBLE}, response)
+        self.agent_thread.join(10)
+        self.assertFalse(self.agent_thread.is_alive())
+        self.assertFalse(os.path.exists(self.agent.location))
+
+    def test_serve__only_one_agent_serves_a_location(self):
+        self._start_agent()
+
+        second_agent = agent.Agent(self.agent.location)
+        second_agent.serve(warm_up=False)
+
+        self.assertTrue(self.agent_thread.is_alive())
+        self.assertTrue(agent.stop(self.environ))
+
+    def test_serve__exits_when_idle(self):
+        self._start_agent(idle_timeout=0.2)
+
+        self.agent_thread.join(10)
+
+        self.assertFalse(self.agent_thread.is_alive())
+        self.assertFalse(agent.stop(self.environ))
@@ -0,0 +1,193 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import json
+import os
+import shutil
+import threading
+
+import mock
+import unittest
+
+from ebcli.core import artifactcache
+
+
+class TestArtifactCache(unittest.TestCase):
+    def setUp(self):
+        self.root_dir = os.getcwd()
+        if os.path.exists('testDir'):
+            shutil.rmtree('testDir')
+        self.eb_directory = os.path.abspath(os.path.join('testDir', '.elasticbeanstalk'))
+        os.makedirs(os.path.join(self.eb_directory, 'app_versions'))
+        os.makedirs(os.path.join(self.eb_directory, 'logs'))
+
+    def tearDown(self):
+        os.chdir(self.root_dir)
+        shutil.rmtree('testDir')
+
+    def _create_bundle(self, name, size):
+        path = os.path.join(self.eb_directory, 'app_versions', name)
+        with open(path, 'wb') as f:
+            f.write(b'x' * size)
+        return path
+
+    def _record_bundle(self, cache, name, size, label):
+        bundle = self._create_bundle(name, size)
+        cache.record(bundle, label=label, content_hash=artifactcache.content_hash_of_file(bundle))
+        return bundle
+
+    def test_record__indexes_bundle_by_label(self):
+        cache = artifactcache.ArtifactCache(self.eb_directory, 1000)
+        bundle = self._record_bundle(cache, 'app-v1.zip', 10, 'app-v1')
+
+        self.assertEqual(bundle, cache.find_by_label('app-v1'))
+        self.assertIsNone(cache.find_by_label('app-v2'))
+        with open(os.path.join(self.eb_directory, 'artifact_cache.json')) as f:
+            index = json.load(f)
+        self.assertEqual(10, index['entries']['app_versions/app-v1.zip']['size'])
+
+    def test_record__evicts_least_recently_used_artifacts(self):
+        cache = artifactcache.ArtifactCache(self.eb_directory, 250)
+
+        with mock.patch('ebcli.core.artifactcache.time.time') as time_mock:
+            time_mock.return_value = 1
+            self._record_bundle(cache, 'app-v1.zip', 100, 'app-v1')
+            time_mock.return_value = 2
+            self._record_bundle(cache, 'app-v2.zip', 100, 'app-v2')
+            time_mock.return_value = 3
+            self.assertIsNotNone(cache.find_by_label('app-v1'))
+            time_mock.return_value = 4
+            self._record_bundle(cache, 'app-v3.zip', 100, 'app-v3')
+
+        self.assertIsNotNone(cache.find_by_label('app-v1'))
+        self.assertIsNone(cache.find_by_label('app-v2'))
+        self.assertFalse(os.path.exists(os.path.join(self.eb_directory, 'app_versions', 'app-v2.zip')))
+        self.assertIsNotNone(cache.find_by_label('app-v3'))
+
+    def test_record__never_evicts_the_artifact_being_recorded(self):
+        cache = artifactcache.ArtifactCache(self.eb_directory, 50)
+        bundle = self._create_bundle('app-v1.zip', 100)
+
+        cache.record(bundle, label='app-v1')
+
+        self.assertTrue(os.path.exists(bundle))
+
+    def test_record__adopts_artifacts_created_before_the_cache_and_logs_directories(self):
+        legacy_bundle = self._create_bundle('app-legacy.zip', 100)
+        os.utime(legacy_bundle, (1, 1))
+        logs = os.path.join(self.eb_directory, 'logs', '180404_044924')
+        os.makedirs(os.path.join(logs, 'i-123'))
+        with open(os.path.join(logs, 'i-123', 'eb-engine.log'), 'wb') as f:
+            f.write(b'x' * 100)
+        os.symlink(logs, os.path.join(self.eb_directory, 'logs', 'latest'))
+        cache = artifactcache.ArtifactCache(self.eb_directory, 150)
+
+        cache.record(logs)
+
+        self.assertFalse(os.path.exists(legacy_bundle))
+        self.assertTrue(os.path.exists(logs))
+
+    def test_eviction_is_disabled_without_budget(self):
+        cache = artifactcache.ArtifactCache(self.eb_directory, 0)
+        bundles = [self._create_bundle('app-v{}.zip'.format(i), 100) for i in range(3)]
+
+        for bundle in bundles:
+            cache.record(bundle)
+
+        self.assertTrue(all(os.path.exists(bundle) for bundle in bundles))
+
+    def test_find_by_label__forgets_bundles_deleted_by_other_means(self):
+        cache = artifactcache.ArtifactCache(self.eb_directory, 1000)
+        bundle = self._record_bundle(cache, 'app-v1.zip', 10, 'app-v1')
+        os.remove(bundle)
+
+        self.assertIsNone(cache.find_by_label('app-v1'))
+
+    def test_find_by_label__does_not_reuse_modified_or_unhashed_bundles(self):
+        cache = artifactcache.ArtifactCache(self.eb_directory, 1000)
+        bundle = self._record_bundle(cache, 'app-v1.zip', 10, 'app-v1')
+        cache.record(self._create_bundle('app-v2.zip', 10), label='app-v2')
+        with open(bundle, 'ab') as f:
+            f.write(b'truncated zip')
+
+        self.assertIsNone(cache.find_by_label('app-v1'))
+        self.assertIsNone(cache.find_by_label('app-v2'))
+        with open(os.path.join(self.eb_directory, 'artifact_cache.json')) as f:
+            index = json.load(f)
+        self.assertNotIn('app-v1', index['labels'])
+        self.assertEqual({}, index['hashes'])
+
+    def test_find_by_label__does_not_reuse_bundles_rewritten_with_the_same_size(self):
+        cache = artifactcache.ArtifactCache(self.eb_directory, 1000)
+        bundle = self._record_bundle(cache, 'app-v1.zip', 10, 'app-v1')
+        with open(bundle, 'wb') as f:
+            f.write(b'y' * 10)
+        os.utime(bundle, (1, 1))
+
+        with mock.patch('ebcli.core.artifactcache.content_hash_of_file') as content_hash_of_file_mock:
+            self.assertIsNone(cache.find_by_label('app-v1'))
+            content_hash_of_file_mock.assert_not_called()
+
+    def test_find_by_content_hash(self):
+        cache = artifactcache.ArtifactCache(self.eb_directory, 1000)
+        bundle = self._record_bundle(cache, 'app-v1.zip', 10, 'app-v1')
+        content_hash = artifactcache.content_hash_of_file(bundle)
+
+        self.assertEqual(bundle, cache.find_by_content_hash(content_hash))
+        self.assertIsNone(cache.find_by_content_hash('0' * 64))
+
+        os.remove(bundle)
+
+        self.assertIsNone(cache.find_by_content_hash(content_hash))
+        self.assertIsNone(cache.find_by_label('app-v1'))
+
+    def test_concurrent_records_are_all_indexed(self):
+        cache = artifactcache.ArtifactCache(self.eb_directory, 100000)
+        bundles = [self._create_bundle('app-v{}.zip'.format(i), 10) for i in range(20)]
+        threads = [
+            threading.Thread(
+                target=cache.record,
+                args=(bundle,),
+                kwargs={
+                    'label': os.path.basename(bundle),
+                    'content_hash': artifactcache.content_hash_of_file(bundle),
+                }
+            )
+            for bundle in bundles
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for bundle in bundles:
+            self.assertEqual(bundle, cache.find_by_label(os.path.basename(bundle)))
+
+    @mock.patch('ebcli.core.artifactcache.fileoperations.get_config_setting')
+    def test_record_artifact(self, get_config_setting_mock):
+        get_config_setting_mock.return_value = 1
+        bundle = self._create_bundle('app-v1.zip', 10)
+
+        artifactcache.record_artifact(bundle, label='app-v1', hash_contents=True)
+
+        self.assertEqual(bundle, artifactcache.find_reusable_bundle(bundle, 'app-v1'))
+        self.assertIsNone(artifactcache.find_reusable_bundle(bundle, 'app-v2'))
+        get_config_setting_mock.assert_called_with('global', 'artifact_cache_max_size', default=2048)
+
+    def test_record_artifact__outside_of_workspace(self):
+        os.makedirs(os.path.join('testDir', 'elsewhere'))
+        path = os.path.join('testDir', 'elsewhere', 'app.zip')
+        open(path, 'w').close()
+
+        artifactcache.record_artifact(path)
+
+        self.assertFalse(os.path.exists(os.path.join(self.eb_directory, 'artifact_cache.json')))
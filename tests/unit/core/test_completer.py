@@ -0,0 +1,139 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+from cement.core import handler
+import mock
+import unittest
+
+from ebcli.core import completer, completioncache
+from ebcli.core.ebcore import EB
+
+
+class TestCompleter(unittest.TestCase):
+    def setUp(self):
+        self.root_dir = os.getcwd()
+        if os.path.isdir('testDir'):
+            shutil.rmtree('testDir')
+        os.mkdir('testDir')
+        self.environ = {'XDG_CACHE_HOME': os.path.abspath(os.path.join('testDir', 'cache'))}
+        self.project_dir = os.path.abspath(os.path.join('testDir', 'project'))
+        os.makedirs(os.path.join(self.project_dir, '.elasticbeanstalk'))
+        with open(os.path.join(self.project_dir, '.elasticbeanstalk', 'config.yml'), 'w') as f:
+            f.write(
+                'branch-defaults:\n'
+                '  default:\n'
+                '    environment: my-env\n'
+                'global:\n'
+                '  application_name: my-app\n'
+                "  default_region: 'us-west-2'\n"
+                '  profile: null\n'
+            )
+
+        for region, app_name, environments, versions in [
+            ('us-west-2', 'my-app', ['my-env', 'my-other-env'], ['v2', 'v1']),
+            ('us-west-2', 'their-app', ['their-env'], ['v3']),
+            ('us-east-1', 'east-app', ['east-env'], []),
+        ]:
+            with mock.patch.dict(os.environ, self.environ):
+                completioncache.replace_environments(region, {app_name: environments}, app_name=app_name)
+                completioncache.add_versions(region, app_name, versions)
+
+    def tearDown(self):
+        os.chdir(self.root_dir)
+        shutil.rmtree('testDir')
+
+    def _complete(self, line, cwd=None):
+        return completer.complete(line, len(line), environ=self.environ, cwd=cwd or self.root_dir)
+
+    def test_complete__commands_and_subcommands(self):
+        self.assertEqual(['scale', 'setenv', 'ssh', 'status', 'swap'], self._complete('eb s'))
+        self.assertEqual(['status'], self._complete('eb --region us-west-2 stat'))
+        self.assertEqual(['run'], self._complete('eb local r'))
+        self.assertEqual([], self._complete('eb nonsense '))
+        self.assertEqual([], self._complete('eb status --verb'))
+
+    def test_complete__environment_names_of_the_project_application(self):
+        self.assertEqual(['my-env', 'my-other-env'], self._complete('eb status ', cwd=self.project_dir))
+        self.assertEqual(['my-other-env'], self._complete('eb deploy --verbose my-o', cwd=self.project_dir))
+        self.assertEqual(['my-env', 'my-other-env'], self._complete('eb swap my-env -n ', cwd=self.project_dir))
+        self.assertEqual(['my-env'], self._complete('eb labs download my-e', cwd=self.project_dir))
+        self.assertEqual(['my-other-env'], self._complete('eb setenv KEY=value -e my-o', cwd=self.project_dir))
+        self.assertEqual([], self._complete('eb status my-env ', cwd=self.project_dir))
+        self.assertEqual([], self._complete('eb create ', cwd=self.project_dir))
+        self.assertEqual([], self._complete('eb scale ', cwd=self.project_dir))
+        self.assertEqual(['my-env', 'my-other-env'], self._complete('eb scale 2 ', cwd=self.project_dir))
+
+    def test_complete__environment_names_outside_a_project(self):
+        self.assertEqual(['east-env', 'my-env', 'my-other-env', 'their-env'], self._complete('eb terminate '))
+        self.assertEqual(['east-env'], self._complete('eb terminate --region us-east-1 '))
+        self.environ['AWS_DEFAULT_REGION'] = 'us-west-2'
+        self.assertEqual(['their-env'], self._complete('eb use t'))
+
+    def test_complete__application_names_versions_and_regions(self):
+        self.assertEqual(['my-app', 'their-app'], self._complete('eb init ', cwd=self.project_dir))
+        self.assertEqual(['v1', 'v2'], self._complete('eb deploy --version ', cwd=self.project_dir))
+        self.assertEqual(['v1', 'v2'], self._complete('eb create --version v', cwd=self.project_dir))
+        self.assertEqual(['their-app'], self._complete('eb appversion --application th', cwd=self.project_dir))
+        self.assertEqual(['us-east-1', 'us-west-2'], self._complete('eb status --region us-'))
+
+    def test_complete__honours_cursor_position_and_unterminated_quotes(self):
+        self.assertEqual(['status'], completer.complete('eb stat my-env', 7, environ=self.environ))
+        self.assertEqual(['my-env'], self._complete('eb status "my-e', cwd=self.project_dir))
+
+    def test_tables_match_controllers(self):
+        app = EB(argv=[])
+        app.setup()
+        controllers = [controller() for controller in handler.list('controller')]
+
+        top_level = dict((c._meta.label, c) for c in controllers if c._meta.stacked_on == 'base' and c._meta.label != 'base')
+        self.assertEqual(sorted(top_level), completer.COMMANDS)
+        for command, subcommands in completer.SUBCOMMANDS.items():
+            nested = [name for c in controllers if c._meta.stacked_on == command for name in _names(c)]
+            self.assertEqual(sorted(nested), subcommands, command)
+
+        argument_names = {completer.ENVIRONMENT: 'environment_name', completer.APPLICATION: 'application_name'}
+        for command, kinds in completer.POSITIONAL_KINDS.items():
+            controller = top_level[command[0]]
+            if len(command) == 2:
+                controller = [c for c in controllers if c._meta.stacked_on == command[0] and command[1] in _names(c)][0]
+            positionals = [options[0] for options, _ in controller._meta.arguments if not options[0].startswith('-')]
+            for position, kind in enumerate(kinds):
+                if kind:
+                    self.assertEqual(argument_names[kind], positionals[position], command)
+
+    def test_main__responds_quickly_without_importing_the_cli(self):
+        environ = dict(os.environ, COMP_LINE='eb status my-', COMP_POINT='13', **self.environ)
+        environ['PYTHONPATH'] = self.root_dir
+        start = time.time()
+        output = subprocess.check_output(
+            [sys.executable, '-c', 'import sys; from ebcli.core import completer; completer.main();'
+                                   'sys.stdout.write(" ".join(sorted(m for m in sys.modules if m.startswith(("ebcli", "cement", "botocore", "yaml")))))'],
+            cwd=self.project_dir,
+            env=environ
+        )
+        elapsed = time.time() - start
+
+        candidates, imported = output.decode('utf-8').rsplit('\n', 1)
+        self.assertEqual(['my-env', 'my-other-env'], candidates.split('\n'))
+        self.assertEqual('ebcli ebcli.core ebcli.core.completer ebcli.core.completioncache ebcli.core.usercache', imported)
+        self.assertLess(elapsed, 2)
+
+
+def _names(controller):
+    names = controller._meta.aliases if controller._meta.aliases_only else [controller._meta.label] + controller._meta.aliases
+    return [name.replace('_', '-') for name in names]
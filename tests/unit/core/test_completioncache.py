@@ -0,0 +1,112 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import os
+import shutil
+import threading
+
+import mock
+import unittest
+
+from ebcli.core import completioncache
+
+
+class TestCompletionCache(unittest.TestCase):
+    def setUp(self):
+        self.root_dir = os.getcwd()
+        if os.path.isdir('testDir'):
+            shutil.rmtree('testDir')
+        os.mkdir('testDir')
+        patcher = mock.patch.dict(os.environ, {'XDG_CACHE_HOME': os.path.abspath(os.path.join('testDir', 'cache'))})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        os.chdir(self.root_dir)
+        shutil.rmtree('testDir')
+
+    def test_environments_are_replaced_added_and_removed(self):
+        completioncache.replace_environments('us-west-2', {'app-1': ['env-1', 'env-2'], 'app-2': ['env-3']})
+        completioncache.replace_environments('us-west-2', {'app-1': ['env-2']}, app_name='app-1')
+        completioncache.add_environment('us-west-2', 'app-2', 'env-4')
+        completioncache.remove_environment('us-west-2', 'env-3')
+
+        self.assertEqual(
+            {
+                'app-1': {'environments': ['env-2'], 'versions': []},
+                'app-2': {'environments': ['env-4'], 'versions': []},
+            },
+            completioncache.load('us-west-2')
+        )
+        self.assertEqual({}, completioncache.load('us-east-1'))
+        self.assertEqual(['us-west-2'], completioncache.cached_regions())
+
+    def test_applications_are_replaced_and_versions_kept_newest_first(self):
+        completioncache.add_versions('us-west-2', 'app-1', ['v2', 'v1'])
+        completioncache.add_versions('us-west-2', 'app-1', ['v3', 'v1'])
+        completioncache.add_versions('us-west-2', 'app-2', ['v1'])
+        completioncache.replace_applications('us-west-2', {'app-1': None, 'app-3': ['v9']})
+
+        self.assertEqual(
+            {
+                'app-1': {'environments': [], 'versions': ['v3', 'v1', 'v2']},
+                'app-3': {'environments': [], 'versions': ['v9']},
+            },
+            completioncache.load('us-west-2')
+        )
+
+    @mock.patch('ebcli.core.completioncache.MAX_VERSIONS', 2)
+    def test_add_versions__caps_the_versions_kept(self):
+        completioncache.add_versions('us-west-2', 'app-1', ['v3', 'v2', 'v1'])
+
+        self.assertEqual(['v3', 'v2'], completioncache.load('us-west-2')['app-1']['versions'])
+
+    def test_update__ignores_unusable_cache(self):
+        os.makedirs(completioncache.cache_directory())
+        with open(completioncache.cache_location('us-west-2'), 'w') as f:
+            f.write('{not json')
+        os.mkdir(completioncache.cache_location('us-east-1'))
+
+        completioncache.add_environment('us-west-2', 'app-1', 'env-1')
+        completioncache.add_environment('us-east-1', 'app-1', 'env-1')
+        completioncache.add_environment(None, 'app-1', 'env-1')
+
+        self.assertEqual({'app-1': {'environments': ['env-1'], 'versions': []}}, completioncache.load('us-west-2'))
+        self.assertEqual({}, completioncache.load('us-east-1'))
+
+    def test_remove_version(self):
+        completioncache.add_versions('us-west-2', 'app-1', ['v3', 'v2', 'v1'])
+        completioncache.remove_version('us-west-2', 'app-1', 'v2')
+        completioncache.remove_version('us-west-2', 'app-2', 'v1')
+
+        self.assertEqual(
+            {'app-1': {'environments': [], 'versions': ['v3', 'v1']}},
+            completioncache.load('us-west-2')
+        )
+
+    def test_concurrent_updates_are_all_kept(self):
+        threads = [
+            threading.Thread(
+                target=completioncache.add_versions,
+                args=('us-west-2', 'app-1', ['v{}'.format(i)])
+            )
+            for i in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(
+            {'v{}'.format(i) for i in range(20)},
+            set(completioncache.load('us-west-2')['app-1']['versions'])
+        )
@@ -0,0 +1,108 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+import os
+import shutil
+from unittest import TestCase
+
+import mock
+
+from dateutil import tz
+
+from ebcli.core import eventstore
+from ebcli.objects.event import Event
+
+
+def _event(minute, severity='INFO', request_id=None, version_label=None, message='message'):
+    return Event(
+        app_name='my-application',
+        environment_name='environment-1',
+        event_date=datetime.datetime(2018, 7, 19, 21, minute, 0, 123000, tzinfo=tz.tzutc()),
+        message='{0} {1}'.format(message, minute),
+        platform=None,
+        request_id=request_id,
+        severity=severity,
+        version_label=version_label,
+    )
+
+
+class TestEventStore(TestCase):
+    def setUp(self):
+        self.root_dir = os.getcwd()
+        if os.path.isdir('testDir'):
+            shutil.rmtree('testDir')
+        self.location = os.path.join(os.path.abspath('testDir'), 'events', 'us-west-2.sqlite3')
+        self.stream = eventstore.stream_name('my-application', 'environment-1')
+
+    def tearDown(self):
+        os.chdir(self.root_dir)
+        shutil.rmtree('testDir')
+
+    def test_add__ignores_archived_events_and_persists(self):
+        events = [_event(minute) for minute in range(5)]
+
+        with eventstore.EventStore(self.location) as store:
+            self.assertEqual(5, store.add(self.stream, events))
+            self.assertEqual(1, store.add(self.stream, events[3:] + [_event(5)]))
+            store.mark_synced_since(self.stream, 1000)
+            store.mark_synced_since(self.stream, 2000)
+
+        with eventstore.EventStore(self.location) as store:
+            self.assertEqual(
+                ['message {0}'.format(minute) for minute in range(6)],
+                [event.message for event in store.query(self.stream)]
+            )
+            self.assertEqual(eventstore.event_time(_event(5).event_date), store.latest_event_time(self.stream))
+            self.assertEqual(_event(5).event_date, store.query(self.stream)[-1].event_date)
+            self.assertEqual(1000, store.synced_since(self.stream))
+            self.assertIsNone(store.latest_event_time(eventstore.stream_name(platform_arn='arn:platform')))
+
+    def test_for_region__keeps_the_events_of_each_profile_apart(self):
+        environ = {'XDG_CACHE_HOME': os.path.abspath(os.path.join('testDir', 'cache'))}
+        self.assertEqual(
+            os.path.join(environ['XDG_CACHE_HOME'], 'ebcli', 'events', 'team%2Fprod', 'us-west-2.sqlite3'),
+            eventstore.store_location('us-west-2', 'team/prod', environ)
+        )
+
+        with mock.patch.dict(os.environ, environ):
+            with eventstore.EventStore.for_region('us-west-2', 'account-1') as store:
+                store.add(self.stream, [_event(0)])
+            with eventstore.EventStore.for_region('us-west-2', 'account-2') as store:
+                self.assertIsNone(store.latest_event_time(self.stream))
+            with eventstore.EventStore.for_region('us-west-2', 'account-1') as store:
+                self.assertEqual(eventstore.event_time(_event(0).event_date), store.latest_event_time(self.stream))
+
+    def test_query__filters(self):
+        with eventstore.EventStore(self.location) as store:
+            store.add(
+                self.stream,
+                [
+                    _event(0, severity='DEBUG', version_label='v1'),
+                    _event(1, severity='WARN', request_id='request-1', version_label='v1'),
+                    _event(2, severity='ERROR', request_id='request-1'),
+                    _event(3, severity='INFO', request_id='request-2', version_label='v2'),
+                ]
+            )
+            row = store.latest_row(self.stream)
+            store.add(self.stream, [_event(4, severity='FATAL')])
+
+            def minutes(**filters):
+                return [event.event_date.minute for event in store.query(self.stream, **filters)]
+
+            self.assertEqual([1, 2, 4], minutes(severity='WARN'))
+            self.assertEqual([1, 2], minutes(request_id='request-1'))
+            self.assertEqual([0, 1], minutes(version_label='v1'))
+            self.assertEqual([2, 3, 4], minutes(since=eventstore.event_time(_event(2).event_date)))
+            self.assertEqual([3, 4], minutes(limit=2))
+            self.assertEqual([4], minutes(after_row=row))
+            self.assertEqual([1], minutes(severity='warn', request_id='request-1', version_label='v1'))
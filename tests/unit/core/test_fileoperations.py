@@ -465,6 +465,74 @@ class TestFileOperations(unittest.TestCase):
         target_file_zip = zipfile.ZipFile('target_file.zip', 'r', allowZip64=True)
         self.assertEqual(['source_file.txt', 'target_file.txt'], sorted(target_file_zip.namelist()))
 
+    def test_zip_append_archive__copies_compressed_members_verbatim(self):
+        os.chdir(self.test_root)
+        os.chdir('testDir')
+
+        with zipfile.ZipFile('target_file.zip', 'w', zipfile.ZIP_DEFLATED) as target_zip:
+            target_zip.writestr('target_file.txt', 'target' * 1000)
+        with zipfile.ZipFile('source_file.zip', 'w', zipfile.ZIP_DEFLATED) as source_zip:
+            source_zip.writestr('submodule/source_file.txt', 'source' * 1000)
+            source_zip.writestr('submodule/stored_file.txt', 'stored', compress_type=zipfile.ZIP_STORED)
+
+        with patch('ebcli.core.fileoperations.zipfile.ZipFile.writestr') as writestr_mock:
+            fileoperations.zip_append_archive('target_file.zip', 'source_file.zip')
+            writestr_mock.assert_not_called()
+
+        with zipfile.ZipFile('target_file.zip', 'r') as target_zip:
+            self.assertIsNone(target_zip.testzip())
+            self.assertEqual(
+                ['submodule/source_file.txt', 'submodule/stored_file.txt', 'target_file.txt'],
+                sorted(target_zip.namelist())
+            )
+            self.assertEqual(b'source' * 1000, target_zip.read('submodule/source_file.txt'))
+            self.assertEqual(zipfile.ZIP_DEFLATED, target_zip.getinfo('submodule/source_file.txt').compress_type)
+            self.assertEqual(b'stored', target_zip.read('submodule/stored_file.txt'))
+
+    def _create_archives_with_duplicate_name(self):
+        with zipfile.ZipFile('target_file.zip', 'w', zipfile.ZIP_DEFLATED) as target_zip:
+            target_zip.writestr('shared.txt', 'target')
+            target_zip.writestr('target_file.txt', 'target' * 1000)
+        with zipfile.ZipFile('source_file.zip', 'w', zipfile.ZIP_DEFLATED) as source_zip:
+            source_zip.writestr('shared.txt', 'source')
+            source_zip.writestr('submodule/source_file.txt', 'source' * 1000)
+
+    def test_zip_append_archive__round_trips_with_and_without_raw_copies(self):
+        os.chdir(self.test_root)
+        os.chdir('testDir')
+
+        for raw_copy_attributes in [
+            fileoperations._ZIP_RAW_COPY_ATTRIBUTES,
+            fileoperations._ZIP_RAW_COPY_ATTRIBUTES + ('attribute_of_another_python_version',),
+        ]:
+            with self.subTest(raw_copy_attributes=raw_copy_attributes):
+                self._create_archives_with_duplicate_name()
+
+                with patch('ebcli.core.fileoperations._ZIP_RAW_COPY_ATTRIBUTES', raw_copy_attributes):
+                    fileoperations.zip_append_archive('target_file.zip', 'source_file.zip')
+
+                with zipfile.ZipFile('target_file.zip', 'r') as target_zip:
+                    self.assertIsNone(target_zip.testzip())
+                    self.assertEqual(
+                        ['shared.txt', 'target_file.txt', 'shared.txt', 'submodule/source_file.txt'],
+                        target_zip.namelist()
+                    )
+                    self.assertEqual(
+                        [b'target', b'target' * 1000, b'source', b'source' * 1000],
+                        [target_zip.read(info) for info in target_zip.infolist()]
+                    )
+                    self.assertEqual(b'source', target_zip.read('shared.txt'))
+
+    def test_copy_raw_zip_member__warns_about_duplicate_names(self):
+        os.chdir(self.test_root)
+        os.chdir('testDir')
+        self._create_archives_with_duplicate_name()
+
+        with zipfile.ZipFile('source_file.zip', 'r') as source_zip, \
+                zipfile.ZipFile('target_file.zip', 'a') as target_zip:
+            with self.assertWarnsRegex(UserWarning, 'Duplicate name'):
+                fileoperations._copy_raw_zip_member(source_zip, target_zip, source_zip.getinfo('shared.txt'))
+
     @patch('ebcli.core.fileoperations.get_editor')
     @patch('ebcli.core.fileoperations.os.system')
     def test_open_file_for_editing(self, system_mock, get_editor_mock):
@@ -901,7 +969,7 @@ aws_secret_access_key = my-secret-key""",
             fileoperations.make_eb_dir('saved_configs')
 
             makedirs_mock.assert_called_once_with(
-                os.path.join('.elasticbeanstalk', 'saved_configs')
+                os.path.join(os.getcwd(), '.elasticbeanstalk', 'saved_configs')
             )
 
     def test_clean_up(self):
@@ -390,6 +390,52 @@ class TestIo(unittest.TestCase):
         io.echo_with_pager('some text')
         pager_mock.assert_called_once_with('some text')
 
+    @mock.patch('ebcli.core.io.sys')
+    def test_echo_with_pager_incrementally__not_a_terminal(self, sys_mock):
+        sys_mock.stdin.isatty.return_value = True
+        sys_mock.stdout.isatty.return_value = False
+
+        io.echo_with_pager_incrementally(iter(['some ', 'text']))
+
+        sys_mock.stdout.write.assert_has_calls([mock.call('some '), mock.call('text')])
+
+    @mock.patch.dict('ebcli.core.io.os.environ', {'PAGER': 'less -R', 'TERM': 'xterm'})
+    @mock.patch('ebcli.core.io.subprocess.Popen')
+    @mock.patch('ebcli.core.io.sys')
+    def test_echo_with_pager_incrementally__stops_producing_chunks_when_pager_quits(
+            self,
+            sys_mock,
+            popen_mock
+    ):
+        produced_chunks = []
+
+        def chunks():
+            for chunk in ['first', 'second', 'third']:
+                produced_chunks.append(chunk)
+                yield chunk
+
+        sys_mock.stdin.isatty.return_value = True
+        sys_mock.stdout.isatty.return_value = True
+        pager = popen_mock.return_value
+        pager.stdin.write.side_effect = [None, BrokenPipeError()]
+
+        io.echo_with_pager_incrementally(chunks())
+
+        self.assertEqual('less -R', popen_mock.call_args[0][0])
+        self.assertEqual(['first', 'second'], produced_chunks)
+        pager.wait.assert_called_once_with()
+
+    @mock.patch.dict('ebcli.core.io.os.environ', {'TERM': 'dumb'})
+    @mock.patch('ebcli.core.io.pydoc.pager')
+    @mock.patch('ebcli.core.io.sys')
+    def test_echo_with_pager_incrementally__no_pager_program(self, sys_mock, pager_mock):
+        sys_mock.stdin.isatty.return_value = True
+        sys_mock.stdout.isatty.return_value = True
+
+        io.echo_with_pager_incrementally(iter(['some ', 'text']))
+
+        pager_mock.assert_called_once_with('some text')
+
     @mock.patch('ebcli.core.io.get_input')
     def test_prompt(self, get_input_mock):
         get_input_mock.return_value = '10'
@@ -0,0 +1,136 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import json
+import os
+import shutil
+import threading
+
+import mock
+import unittest
+
+from ebcli.core import tracing
+from ebcli.lib import aws
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        if os.path.exists('testDir'):
+            shutil.rmtree('testDir')
+        os.mkdir('testDir')
+        self.trace_location = os.path.abspath(os.path.join('testDir', 'trace.json'))
+
+    def tearDown(self):
+        tracing._tracer = None
+        shutil.rmtree('testDir')
+
+    def _read_trace(self):
+        with open(self.trace_location) as f:
+            return json.load(f)
+
+    def test_span__does_nothing_when_tracing_is_not_started(self):
+        with tracing.span('poll sleep', tracing.WAIT, seconds=4) as span_args:
+            span_args['extra'] = True
+
+        self.assertFalse(tracing.is_enabled())
+        tracing.finish()
+        self.assertFalse(os.path.exists(self.trace_location))
+
+    @mock.patch('ebcli.core.tracing.atexit.register')
+    def test_start__registers_finish_at_exit(self, register_mock):
+        tracing.start(self.trace_location)
+
+        self.assertTrue(tracing.is_enabled())
+        register_mock.assert_called_once_with(tracing.finish)
+
+    @mock.patch('ebcli.core.tracing.atexit.register', mock.MagicMock())
+    @mock.patch('ebcli.core.tracing.sys.stderr')
+    def test_finish__writes_chrome_trace_and_prints_summary(self, stderr_mock):
+        tracing.start(self.trace_location)
+        with tracing.span('zip project', tracing.ZIP, version_label='v1') as span_args:
+            span_args['bytes'] = 10
+
+        def upload_part():
+            with tracing.span('upload part', tracing.UPLOAD, part=1):
+                pass
+
+        thread = threading.Thread(target=upload_part, name='uploader')
+        thread.start()
+        thread.join()
+
+        tracing.finish()
+
+        trace = self._read_trace()
+        spans = [event for event in trace['traceEvents'] if event['ph'] == 'X']
+        self.assertEqual(
+            ['import', 'setup', 'zip project', 'upload part'],
+            [event['name'] for event in spans]
+        )
+        self.assertEqual({'version_label': 'v1', 'bytes': 10}, spans[2]['args'])
+        self.assertNotEqual(spans[2]['tid'], spans[3]['tid'])
+        thread_names = [
+            event['args']['name'] for event in trace['traceEvents'] if event['name'] == 'thread_name'
+        ]
+        self.assertIn('uploader', thread_names)
+
+        summary = ''.join(call[0][0] for call in stderr_mock.write.call_args_list)
+        self.assertIn('Trace written to {0} (4 spans'.format(self.trace_location), summary)
+        self.assertIn('zip project', summary)
+        self.assertFalse(tracing.is_enabled())
+
+    @mock.patch('ebcli.core.tracing.atexit.register', mock.MagicMock())
+    def test_span__records_span_when_body_raises(self):
+        tracing.start(self.trace_location)
+
+        with self.assertRaises(ValueError):
+            with tracing.span('resolve configuration', tracing.CONFIG):
+                raise ValueError()
+
+        self.assertEqual('resolve configuration', tracing._tracer.events[-1]['name'])
+
+    def test_summary__aggregates_spans_and_caps_rows(self):
+        tracer = tracing.Tracer(self.trace_location)
+        for i in range(tracing.SUMMARY_ROW_LIMIT + 2):
+            tracer.add_span('elasticbeanstalk.op{0}'.format(i), tracing.API_CALL, 0, 0.001 * (i + 1))
+        tracer.add_span('elasticbeanstalk.op0', tracing.API_CALL, 0, 1)
+
+        lines = tracer.summary()
+
+        self.assertEqual(2 + tracing.SUMMARY_ROW_LIMIT + 1, len(lines))
+        self.assertEqual(['api', 'elasticbeanstalk.op0', '2'], lines[2].split()[:3])
+        self.assertEqual('... 2 more', lines[-1])
+
+    @mock.patch('ebcli.core.tracing.atexit.register', mock.MagicMock())
+    def test_make_api_call__records_attempt_status_and_bytes(self):
+        tracing.start(self.trace_location)
+        operation = mock.MagicMock(return_value={
+            'ResponseMetadata': {
+                'HTTPStatusCode': 200,
+                'HTTPHeaders': {'content-length': '52'},
+            }
+        })
+
+        aws._traced_call(operation, 's3', 'put_object', 1, {'Body': b'12345'})
+
+        event = tracing._tracer.events[-1]
+        self.assertEqual('s3.put_object', event['name'])
+        self.assertEqual(
+            {
+                'service': 's3',
+                'operation': 'put_object',
+                'attempt': 1,
+                'request_bytes': 5,
+                'status': 200,
+                'response_bytes': 52,
+            },
+            event['args']
+        )
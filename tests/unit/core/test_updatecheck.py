@@ -0,0 +1,93 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import os
+import shutil
+import time
+
+import mock
+import unittest
+
+from ebcli.core import updatecheck
+
+
+class TestUpdateCheck(unittest.TestCase):
+    def setUp(self):
+        self.root_dir = os.getcwd()
+        if os.path.isdir('testDir'):
+            shutil.rmtree('testDir')
+        os.mkdir('testDir')
+        patcher = mock.patch.dict(os.environ, {'XDG_CACHE_HOME': os.path.abspath(os.path.join('testDir', 'cache'))})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        os.chdir(self.root_dir)
+        shutil.rmtree('testDir')
+
+    @mock.patch('ebcli.core.updatecheck.fileoperations.get_config_setting', return_value=True)
+    @mock.patch('ebcli.core.updatecheck.utils.get_data_from_url')
+    def test_start__fetches_in_the_background_and_records_the_latest_version(
+            self,
+            get_data_from_url_mock,
+            get_config_setting_mock
+    ):
+        get_data_from_url_mock.return_value = b'{"info": {"version": "9.9.9"}}'
+
+        thread = updatecheck.start()
+        thread.join()
+
+        self.assertTrue(thread.daemon)
+        self.assertEqual('9.9.9', updatecheck.load()['latest_version'])
+        self.assertTrue(updatecheck.update_available('3.20.0'))
+        self.assertFalse(updatecheck.update_available('9.9.9'))
+        get_data_from_url_mock.assert_called_once_with(updatecheck.PYPI_URL, timeout=updatecheck.FETCH_TIMEOUT)
+        get_config_setting_mock.assert_called_once_with('global', 'check_for_updates', default=True)
+
+    @mock.patch('ebcli.core.updatecheck.fileoperations.get_config_setting', return_value=True)
+    @mock.patch('ebcli.core.updatecheck.utils.get_data_from_url')
+    def test_start__does_not_fetch_again_before_the_check_interval_elapses(
+            self,
+            get_data_from_url_mock,
+            get_config_setting_mock
+    ):
+        get_data_from_url_mock.side_effect = IOError('timed out')
+        updatecheck.start().join()
+
+        self.assertIsNone(updatecheck.start())
+        self.assertFalse(updatecheck.update_available('3.20.0'))
+        get_data_from_url_mock.assert_called_once()
+
+        with mock.patch('ebcli.core.updatecheck.time.time', return_value=time.time() + updatecheck.CHECK_INTERVAL):
+            thread = updatecheck.start()
+        thread.join()
+
+        self.assertEqual(2, get_data_from_url_mock.call_count)
+
+    @mock.patch('ebcli.core.updatecheck.threading.Thread')
+    @mock.patch('ebcli.core.updatecheck.fileoperations.get_config_setting')
+    def test_start__respects_the_opt_out_setting(self, get_config_setting_mock, thread_mock):
+        for setting in (False, 'false', 'No'):
+            get_config_setting_mock.return_value = setting
+            self.assertIsNone(updatecheck.start())
+
+        thread_mock.assert_not_called()
+
+    def test_update_available__ignores_unusable_records(self):
+        self.assertFalse(updatecheck.update_available('3.20.0'))
+
+        os.makedirs(os.path.dirname(updatecheck.cache_location()))
+        with open(updatecheck.cache_location(), 'w') as f:
+            f.write('{not json')
+
+        self.assertFalse(updatecheck.update_available('3.20.0'))
+        self.assertFalse(updatecheck._is_fresh(updatecheck.load()))
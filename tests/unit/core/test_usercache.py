@@ -0,0 +1,64 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import json
+import os
+import shutil
+
+import mock
+import unittest
+
+from ebcli.core import usercache
+
+
+class TestUserCache(unittest.TestCase):
+    def setUp(self):
+        self.root_dir = os.getcwd()
+        if os.path.isdir('testDir'):
+            shutil.rmtree('testDir')
+        os.mkdir('testDir')
+        self.cache_home = os.path.abspath(os.path.join('testDir', 'cache'))
+
+    def tearDown(self):
+        os.chdir(self.root_dir)
+        shutil.rmtree('testDir')
+
+    @mock.patch('ebcli.core.usercache.os.path.expanduser', return_value='/home/user')
+    def test_cache_path(self, expanduser_mock):
+        self.assertEqual(
+            os.path.join(self.cache_home, 'ebcli', 'completion'),
+            usercache.cache_path('completion', {'XDG_CACHE_HOME': self.cache_home})
+        )
+        self.assertEqual(
+            os.path.join('/home/user', '.cache', 'ebcli', 'update_check.json'),
+            usercache.cache_path('update_check.json', {'XDG_CACHE_HOME': ''})
+        )
+
+    def test_write_json__replaces_the_file_and_leaves_no_temporary_files(self):
+        location = usercache.cache_path(os.path.join('completion', 'us-west-2.json'), {'XDG_CACHE_HOME': self.cache_home})
+
+        usercache.write_json(location, {'b': 1, 'a': 2}, sort_keys=True)
+        usercache.write_json(location, {'b': 3, 'a': 4}, sort_keys=True)
+
+        with open(location) as f:
+            self.assertEqual('{"a": 4, "b": 3}', f.read())
+        self.assertEqual(['us-west-2.json'], os.listdir(os.path.dirname(location)))
+
+    def test_write_json__keeps_the_previous_contents_when_serialization_fails(self):
+        location = os.path.join(self.cache_home, 'update_check.json')
+        usercache.write_json(location, {'latest_version': '3.20.0'})
+
+        self.assertRaises(TypeError, usercache.write_json, location, {'latest_version': object()})
+
+        with open(location) as f:
+            self.assertEqual({'latest_version': '3.20.0'}, json.load(f))
+        self.assertEqual(['update_check.json'], os.listdir(self.cache_home))
@@ -0,0 +1,79 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+import mock
+
+from ebcli.core import fileoperations, workspace
+from ebcli.core.workspace import Workspace
+from ebcli.objects.exceptions import NotInitializedError
+
+
+class TestWorkspace(TestCase):
+    def setUp(self):
+        self.root_dir = os.getcwd()
+        if os.path.isdir('testDir'):
+            shutil.rmtree('testDir')
+        self.project = os.path.abspath(os.path.join('testDir', 'project'))
+        self.deep_directory = os.path.join(self.project, 'src', 'app', 'views')
+        os.makedirs(self.deep_directory)
+        os.chdir(self.project)
+        fileoperations.create_config_file('my-application', 'us-west-2', 'php-7.1')
+        os.chdir(self.deep_directory)
+
+    def tearDown(self):
+        os.chdir(self.root_dir)
+        shutil.rmtree('testDir')
+        workspace.forget()
+
+    def test_find__from_a_nested_directory(self):
+        found = Workspace.find()
+
+        self.assertEqual(Workspace(self.project), found)
+        self.assertEqual(os.path.join(self.project, '.elasticbeanstalk', 'config.yml'), found.local_config_path)
+        self.assertEqual(self.deep_directory, os.getcwd())
+
+    def test_find__not_initialized(self):
+        outside = os.path.join(self.root_dir, 'testDir')
+
+        with mock.patch('ebcli.core.workspace.os.path.isdir', return_value=False):
+            with self.assertRaises(NotInitializedError):
+                Workspace.find(outside)
+
+    def test_current__is_cached_until_forgotten(self):
+        self.assertEqual(Workspace(self.project), Workspace.current())
+        nested_project = os.path.join(self.project, 'src')
+        os.makedirs(os.path.join(nested_project, '.elasticbeanstalk'))
+
+        self.assertEqual(Workspace(self.project), Workspace.current())
+        workspace.forget()
+        self.assertEqual(Workspace(nested_project), Workspace.current())
+
+    def test_helpers_never_change_the_working_directory(self):
+        def read_application_name(_):
+            return fileoperations.get_config_setting('global', 'application_name')
+
+        with mock.patch('ebcli.core.fileoperations.os.chdir', side_effect=AssertionError('chdir')):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                names = list(executor.map(read_application_name, range(8)))
+            self.assertEqual(self.project, fileoperations.get_project_root())
+            self.assertEqual(
+                os.path.join(self.project, '.elasticbeanstalk', 'app_versions', 'v1.zip'),
+                fileoperations.get_zip_location('v1.zip')
+            )
+
+        self.assertEqual(['my-application'] * 8, names)
+        self.assertEqual(self.deep_directory, os.getcwd())
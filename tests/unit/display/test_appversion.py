@@ -0,0 +1,133 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+from dateutil import tz
+
+import unittest
+import mock
+
+from ebcli.display import appversion
+from ebcli.objects.environment import Environment
+
+
+def _app_version(number, status='PROCESSED'):
+    return {
+        u'ApplicationName': 'my-application',
+        u'VersionLabel': 'v{0}'.format(number),
+        u'Description': 'release {0}'.format(number),
+        u'DateCreated': datetime.datetime(2018, 7, 1, tzinfo=tz.tzutc()) + datetime.timedelta(days=number),
+        u'Status': status,
+    }
+
+
+class TestVersionDataPoller(unittest.TestCase):
+    def setUp(self):
+        # 25 versions, most recent first, served in pages of 10
+        self.app_versions = [_app_version(number) for number in range(25, 0, -1)]
+        self.app_versions[3][u'Status'] = 'FAILED'
+        self.pages = [
+            {u'ApplicationVersions': self.app_versions[0:10], u'NextToken': 'token-1'},
+            {u'ApplicationVersions': self.app_versions[10:20], u'NextToken': 'token-2'},
+            {u'ApplicationVersions': self.app_versions[20:25]},
+        ]
+        self.environments = [
+            Environment(name='environment-1', version_label='v7'),
+            Environment(name='environment-2', version_label='v7'),
+            Environment(name='environment-3', version_label='v24'),
+        ]
+
+    @mock.patch('ebcli.display.appversion.elasticbeanstalk.get_app_environments')
+    @mock.patch('ebcli.display.appversion.elasticbeanstalk.get_application_versions')
+    def test_versions_are_requested_once_and_paged_from_memory(
+            self,
+            get_application_versions_mock,
+            get_app_environments_mock
+    ):
+        get_application_versions_mock.side_effect = self.pages
+        get_app_environments_mock.return_value = self.environments
+        poller = appversion.VersionDataPoller('my-application', None)
+
+        first_page = poller.get_version_data()['app_versions']
+        self.assertEqual(['v{0}'.format(number) for number in range(25, 15, -1)],
+                         [row[u'VersionLabel'] for row in first_page])
+        poller.wait_until_loaded()
+
+        self.assertEqual([25, 24], [row['DeployNum'] for row in poller.get_table_data()['app_versions'][:2]])
+        self.assertEqual('environment-3', poller.get_table_data()['app_versions'][1][u'InUse'])
+        third_page = None
+        for _ in range(4):
+            third_page = poller.get_next_page_data()['app_versions']
+        self.assertEqual(['v5', 'v4', 'v3', 'v2', 'v1'], [row[u'VersionLabel'] for row in third_page])
+        self.assertEqual('v6', poller.get_previous_page_data()['app_versions'][-1][u'VersionLabel'])
+        self.assertEqual(25, len(poller.all_app_versions))
+
+        get_application_versions_mock.assert_has_calls(
+            [
+                mock.call('my-application', None, appversion.VersionCatalog.PAGE_SIZE, None),
+                mock.call('my-application', None, appversion.VersionCatalog.PAGE_SIZE, 'token-1'),
+                mock.call('my-application', None, appversion.VersionCatalog.PAGE_SIZE, 'token-2'),
+            ]
+        )
+        self.assertEqual(3, get_application_versions_mock.call_count)
+        get_app_environments_mock.assert_called_once_with('my-application')
+
+    @mock.patch('ebcli.display.appversion.elasticbeanstalk.get_app_environments')
+    @mock.patch('ebcli.display.appversion.elasticbeanstalk.get_application_versions')
+    def test_filter_and_sort_without_requests(
+            self,
+            get_application_versions_mock,
+            get_app_environments_mock
+    ):
+        get_application_versions_mock.side_effect = self.pages
+        get_app_environments_mock.return_value = self.environments
+        poller = appversion.VersionDataPoller('my-application', None)
+        poller.get_version_data()
+        poller.wait_until_loaded()
+
+        def labels():
+            return [row[u'VersionLabel'] for row in poller.get_table_data()['app_versions']]
+
+        self.assertFalse(poller.set_filter('in-use'))
+        self.assertEqual(['v24', 'v7'], labels())
+        poller.set_filter('status:failed')
+        self.assertEqual(['v22'], labels())
+        poller.set_filter('since:2018-07-24 release')
+        self.assertEqual(['v25', 'v24', 'v23'], labels())
+        poller.set_filter('v1')
+        self.assertEqual(['v19', 'v18', 'v17', 'v16', 'v15', 'v14', 'v13', 'v12', 'v11', 'v10'], labels())
+        self.assertEqual(['v1'], [row[u'VersionLabel'] for row in poller.get_next_page_data()['app_versions']])
+
+        poller.set_filter(None)
+        poller.next_sort_key()
+        self.assertEqual(appversion.VersionCatalog.SORT_BY_LABEL, poller.sort_key)
+        self.assertEqual(['v1', 'v10', 'v11'], labels()[:3])
+        poller.next_sort_key()
+        self.assertEqual('v22', labels()[0])
+        poller.next_sort_key()
+        self.assertEqual(['v24', 'v7'], labels()[:2])
+        self.assertEqual([24, 7], [row['DeployNum'] for row in poller.get_table_data()['app_versions'][:2]])
+
+        self.assertEqual(3, get_application_versions_mock.call_count)
+
+    @mock.patch('ebcli.display.appversion.elasticbeanstalk.get_application_versions')
+    def test_given_versions_are_not_requested(
+            self,
+            get_application_versions_mock
+    ):
+        poller = appversion.VersionDataPoller('my-application', None, self.app_versions[:3])
+
+        data = poller.get_version_data()
+
+        self.assertEqual([3, 2, 1], [row['DeployNum'] for row in data['app_versions']])
+        self.assertTrue(all(row[u'DateCreated'] and row[u'SinceCreated'] for row in data['app_versions']))
+        get_application_versions_mock.assert_not_called()
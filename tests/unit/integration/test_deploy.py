@@ -32,6 +32,12 @@ class TestDeploy(unittest.TestCase):
         self._delete_testDir_if_exists()
         os.mkdir("testDir")
         os.chdir("testDir")
+        patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": os.path.abspath("cache")})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch("ebcli.core.abstractcontroller.updatecheck.start")
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
         # Create a basic .elasticbeanstalk/config.yml file
         fileoperations.create_config_file("my-application", "us-west-2", "php-7.2")
@@ -171,6 +177,7 @@ class TestDeploy(unittest.TestCase):
             timeout_in_minutes=None,
             can_abort=True,
             env_name="environment-1",
+            stack_events=True,
         )
 
     @mock.patch(
@@ -255,7 +262,8 @@ class TestDeploy(unittest.TestCase):
 
         # Should use nohang (timeout=0)
         wait_for_success_events_mock.assert_called_once_with(
-            "request-id", timeout_in_minutes=0, can_abort=True, env_name="environment-2"
+            "request-id", timeout_in_minutes=0, can_abort=True, env_name="environment-2",
+            stack_events=True,
         )
 
     @mock.patch(
@@ -325,6 +333,7 @@ class TestDeploy(unittest.TestCase):
             timeout_in_minutes=None,
             can_abort=True,
             env_name="environment-1",
+            stack_events=True,
         )
 
     @mock.patch(
@@ -401,6 +410,7 @@ class TestDeploy(unittest.TestCase):
             timeout_in_minutes=None,
             can_abort=True,
             env_name="environment-1",
+            stack_events=True,
         )
 
     @mock.patch(
@@ -465,7 +475,8 @@ class TestDeploy(unittest.TestCase):
 
         # Should not wait for success events (timeout=0)
         wait_for_success_events_mock.assert_called_once_with(
-            "request-id", timeout_in_minutes=0, can_abort=True, env_name="environment-1"
+            "request-id", timeout_in_minutes=0, can_abort=True, env_name="environment-1",
+            stack_events=True,
         )
 
     @mock.patch(
@@ -532,6 +543,7 @@ class TestDeploy(unittest.TestCase):
             timeout_in_minutes=10,
             can_abort=True,
             env_name="environment-1",
+            stack_events=True,
         )
 
     @mock.patch(
@@ -616,6 +628,7 @@ class TestDeploy(unittest.TestCase):
             timeout_in_minutes=None,
             can_abort=True,
             env_name="environment-1",
+            stack_events=True,
         )
 
     @mock.patch("ebcli.operations.deployops.commonops.create_app_version_from_source")
@@ -658,6 +671,7 @@ class TestDeploy(unittest.TestCase):
             timeout_in_minutes=None,
             can_abort=True,
             env_name="environment-1",
+            stack_events=True,
         )
         wait_for_processed_app_versions_mock.assert_called_once_with(
             "my-application",
@@ -805,6 +819,7 @@ class TestDeploy(unittest.TestCase):
             timeout_in_minutes=None,
             can_abort=True,
             env_name="environment-1",
+            stack_events=True,
         )
         wait_for_processed_app_versions_mock.assert_called_once_with(
             "my-application", ["version-label"], timeout=5
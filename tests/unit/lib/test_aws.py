@@ -52,6 +52,61 @@ class TestAws(unittest.TestCase):
             )
         )
 
+    def test_get_client__reuses_clients_of_previously_used_settings(self):
+        aws._flush()
+        aws.set_session_creds('access-id', 'secret-key')
+        aws.set_region('us-east-1')
+        us_east_1_client = aws._get_client('elasticbeanstalk')
+        settings = aws.get_session_settings()
+
+        aws.apply_session_settings(dict(settings, region='us-west-2'))
+        us_west_2_client = aws._get_client('elasticbeanstalk')
+        aws.apply_session_settings(settings)
+
+        self.assertIsNot(us_east_1_client, us_west_2_client)
+        self.assertIs(us_east_1_client, aws._get_client('elasticbeanstalk'))
+        self.assertEqual(['elasticbeanstalk'], aws.get_client_service_names())
+
+        aws.clear_session_cache()
+        aws.apply_session_settings(settings)
+        self.assertIsNot(us_east_1_client, aws._get_client('elasticbeanstalk'))
+        aws._flush()
+
+    def test_get_client__endpoint_overrides(self):
+        aws._flush()
+        aws.set_session_creds('access-id', 'secret-key')
+        aws.set_region('us-east-1')
+
+        aws.set_endpoint_url('http://127.0.0.1:8000')
+        self.assertEqual('http://127.0.0.1:8000', aws._get_client('elasticbeanstalk').meta.endpoint_url)
+        self.assertEqual('https://ec2.us-east-1.amazonaws.com', aws._get_client('ec2').meta.endpoint_url)
+
+        aws.set_endpoint_url('*=http://127.0.0.1:9000,logs=http://127.0.0.1:9001')
+        self.assertEqual('http://127.0.0.1:8000', aws._get_client('elasticbeanstalk').meta.endpoint_url)
+        self.assertEqual('http://127.0.0.1:9000', aws._get_client('ec2').meta.endpoint_url)
+        self.assertEqual('http://127.0.0.1:9001', aws._get_client('logs').meta.endpoint_url)
+        self.assertEqual('path', aws._get_client('s3').meta.config.s3['addressing_style'])
+        self.assertEqual(
+            {'elasticbeanstalk': 'http://127.0.0.1:8000', '*': 'http://127.0.0.1:9000', 'logs': 'http://127.0.0.1:9001'},
+            aws.get_session_settings()['endpoint_urls']
+        )
+        aws._flush()
+
+    def test_get_session_profile(self):
+        aws._flush()
+        with mock.patch.dict(os.environ, {'AWS_EB_PROFILE': 'from-environment'}):
+            self.assertEqual('from-environment', aws.get_session_profile())
+            aws.set_profile('my-profile')
+            self.assertEqual('my-profile', aws.get_session_profile())
+        aws._flush()
+        with mock.patch.dict(os.environ):
+            os.environ.pop('AWS_EB_PROFILE', None)
+            self.assertEqual('default', aws.get_session_profile())
+
+    def test_parse_endpoint_urls__invalid_pair(self):
+        with self.assertRaises(aws.ValidationError):
+            aws.parse_endpoint_urls('s3=http://127.0.0.1:8000,logs=')
+
     def test_handle_response_code__500x_code__max_attempts_reached(self):
         aggregated_response_message = [r"""Received 5XX error during attempt #11
    500 Internal Server Error
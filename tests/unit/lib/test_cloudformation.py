@@ -157,3 +157,60 @@ class TestCloudFormation(unittest.TestCase):
                 )
             ]
         )
+
+    @mock.patch('ebcli.lib.cloudformation.aws.make_api_call')
+    @mock.patch('ebcli.lib.cloudformation.utils.prevent_throttling')
+    def test_stack_event_cursor__stops_paging_at_the_newest_event_returned(
+            self,
+            prevent_throttling_mock,
+            make_api_call_mock
+    ):
+        def page(event_ids, next_token=None):
+            result = {
+                'StackEvents': [
+                    {
+                        'EventId': event_id,
+                        'Timestamp': datetime.datetime(2018, 8, 12, 18, 37, int(event_id[1:]), tzinfo=tz.tzutc())
+                    }
+                    for event_id in event_ids
+                ]
+            }
+            if next_token:
+                result['NextToken'] = next_token
+            return result
+
+        make_api_call_mock.side_effect = [
+            page(['e3', 'e2'], 'next-token-1'),
+            page(['e1', 'e0']),
+            page(['e5', 'e4', 'e3', 'e2'], 'next-token-2'),
+            page(['e7', 'e6', 'e5', 'e4'], 'next-token-3'),
+        ]
+        cursor = cloudformation.StackEventCursor('awseb-e-12345-stack')
+
+        self.assertEqual(['e0', 'e1', 'e2', 'e3'], [event.event_id for event in cursor.poll()])
+        self.assertEqual(['e4', 'e5'], [event.event_id for event in cursor.poll()])
+        self.assertEqual(['e6', 'e7'], [event.event_id for event in cursor.poll()])
+
+        self.assertEqual(4, make_api_call_mock.call_count)
+        self.assertEqual(1, prevent_throttling_mock.call_count)
+
+    @mock.patch('ebcli.lib.cloudformation.aws.make_api_call')
+    def test_stack_event_cursor__first_poll_returns_events_after_start_time(
+            self,
+            make_api_call_mock
+    ):
+        make_api_call_mock.return_value = mock_responses.DESCRIBE_STACK_EVENTS_RESPONSE
+        cursor = cloudformation.StackEventCursor(
+            'sam-cfn-stack',
+            start_time=datetime.datetime(2018, 8, 12, 18, 36, 58, 294000, tzinfo=tz.tzutc())
+        )
+
+        self.assertEqual(
+            [
+                'HelloWorldFunctionHelloWorldPermissionProd-CREATE_COMPLETE-2018-08-12T18:36:58.371Z',
+                'b31b10d0-9e5e-11e8-8eb0-02c3ece5f9fa',
+            ],
+            [event.event_id for event in cursor.poll()]
+        )
+        self.assertEqual([], cursor.poll())
+        self.assertEqual('b31b10d0-9e5e-11e8-8eb0-02c3ece5f9fa', cursor.last_event_id)
@@ -32,6 +32,33 @@ class TestCloudWatch(unittest.TestCase):
             cloudwatch.get_all_stream_names('some-log-group')
         )
 
+    @mock.patch('ebcli.lib.cloudwatch.aws.make_api_call')
+    def test_get_all_stream_names__follows_next_token(self, make_api_call_mock):
+        make_api_call_mock.side_effect = [
+            {
+                'logStreams': [{'logStreamName': 'i-2', 'creationTime': 2}],
+                'nextToken': 'page-2',
+            },
+            {
+                'logStreams': [{'logStreamName': 'i-1', 'creationTime': 1}],
+            },
+        ]
+
+        self.assertEqual(['i-1', 'i-2'], cloudwatch.get_all_stream_names('some-log-group', 'i-'))
+
+        make_api_call_mock.assert_has_calls(
+            [
+                mock.call('logs', 'describe_log_streams', logGroupName='some-log-group', logStreamNamePrefix='i-'),
+                mock.call(
+                    'logs',
+                    'describe_log_streams',
+                    logGroupName='some-log-group',
+                    logStreamNamePrefix='i-',
+                    nextToken='page-2'
+                ),
+            ]
+        )
+
     @mock.patch('ebcli.lib.cloudwatch.aws.make_api_call')
     def test_get_log_events(self, make_api_call_mock):
         cloudwatch.get_log_events(
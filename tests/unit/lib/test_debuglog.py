@@ -0,0 +1,78 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+import logging
+
+from cement.utils.misc import minimal_logger
+import mock
+import unittest
+
+from ebcli.lib import debuglog
+
+
+class TestDebugLog(unittest.TestCase):
+    def setUp(self):
+        self.logger = minimal_logger('ebcli.tests.debuglog')
+        self.logger.backend.setLevel(logging.WARNING)
+
+    def test_debug__does_not_format_when_debug_logging_is_disabled(self):
+        class Unformattable(object):
+            def __format__(self, format_spec):
+                raise AssertionError('formatted')
+
+        with mock.patch.object(self.logger, 'debug') as debug_mock:
+            debuglog.debug(self.logger, 'Response: {0}', Unformattable())
+
+        debug_mock.assert_not_called()
+
+    def test_debug__formats_when_debug_logging_is_enabled(self):
+        self.logger.backend.setLevel(logging.DEBUG)
+
+        with mock.patch.object(self.logger, 'debug') as debug_mock:
+            debuglog.debug(self.logger, 'API call finished, status = {0}', 200)
+
+        debug_mock.assert_called_once_with('API call finished, status = 200')
+
+    def test_payload__renders_like_str_with_sensitive_values_redacted(self):
+        value = {
+            'OptionSettings': [
+                {'Namespace': 'aws:elasticbeanstalk:application:environment', 'OptionName': 'DB_PASS', 'Value': 'hunter2'},
+                {'Namespace': 'aws:autoscaling:asg', 'OptionName': 'MaxSize', 'Value': '4'},
+            ],
+            'Credentials': {'SessionToken': 'abc'},
+            'NextToken': 'page-2',
+            'Created': datetime.datetime(2026, 1, 1),
+            'Pair': ('a',),
+        }
+
+        self.assertEqual(
+            "{'OptionSettings': [{'Namespace': 'aws:elasticbeanstalk:application:environment', "
+            "'OptionName': 'DB_PASS', 'Value': '<redacted>'}, {'Namespace': 'aws:autoscaling:asg', "
+            "'OptionName': 'MaxSize', 'Value': '4'}], 'Credentials': '<redacted>', 'NextToken': 'page-2', "
+            "'Created': datetime.datetime(2026, 1, 1, 0, 0), 'Pair': ('a',)}",
+            str(debuglog.Payload(value))
+        )
+
+    def test_payload__redacts_raw_bodies(self):
+        self.assertEqual(
+            '<R><SessionToken><redacted></SessionToken><NextToken>n</NextToken></R>',
+            str(debuglog.Payload(b'<R><SessionToken>abc</SessionToken><NextToken>n</NextToken></R>'))
+        )
+        self.assertEqual(
+            '{"secretAccessKey": "<redacted>", "nextToken": "n"}',
+            str(debuglog.Payload('{"secretAccessKey": "a\\"b", "nextToken": "n"}'))
+        )
+
+    def test_payload__is_capped(self):
+        self.assertEqual('[0, 1, 2, 3,... (truncated to 12 characters)', str(debuglog.Payload(list(range(10000)), limit=12)))
+        self.assertEqual('xxxx... (truncated to 4 characters)', str(debuglog.Payload(b'x' * 10000, limit=4)))
@@ -0,0 +1,122 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from io import BytesIO
+import os
+import shutil
+
+import mock
+import unittest
+
+from ebcli.lib import download
+from ebcli.objects.exceptions import DownloadError
+
+
+class TestDownload(unittest.TestCase):
+    content = b'0123456789abcdefghijklmnopqrstuvwxyz'
+
+    def setUp(self):
+        self.root_dir = os.getcwd()
+        if os.path.exists('testDir'):
+            shutil.rmtree('testDir')
+        os.mkdir('testDir')
+        os.chdir('testDir')
+
+    def tearDown(self):
+        os.chdir(self.root_dir)
+        shutil.rmtree('testDir')
+
+    def _fetch_range(self, start, end):
+        return BytesIO(self.content[start:end + 1])
+
+    def _ranged_response(self, start, end):
+        response = self._fetch_range(start, end)
+        response.status = 206
+        response.headers = {'Content-Range': 'bytes {0}-{1}/{2}'.format(start, end, len(self.content))}
+        return response
+
+    def test_download_ranges(self):
+        fetch_range = mock.MagicMock(side_effect=self._fetch_range)
+
+        download.download_ranges('object', len(self.content), fetch_range, part_size=10, thread_count=3)
+
+        with open('object', 'rb') as f:
+            self.assertEqual(self.content, f.read())
+        fetch_range.assert_has_calls(
+            [mock.call(0, 9), mock.call(10, 19), mock.call(20, 29), mock.call(30, 35)],
+            any_order=True
+        )
+
+    def test_download_ranges__empty_object(self):
+        fetch_range = mock.MagicMock()
+
+        download.download_ranges('object', 0, fetch_range)
+
+        self.assertEqual(0, os.path.getsize('object'))
+        fetch_range.assert_not_called()
+
+    def test_download_ranges__truncated_range_raises(self):
+        with self.assertRaises(DownloadError):
+            download.download_ranges('object', 20, lambda start, end: BytesIO(b'short'), part_size=10)
+
+    @mock.patch('ebcli.lib.download.urllib.request.urlopen')
+    def test_download_url__server_does_not_support_ranges(self, urlopen_mock):
+        head_response = mock.MagicMock(headers={'Content-Length': str(len(self.content))})
+        urlopen_mock.side_effect = [head_response, BytesIO(self.content)]
+
+        download.download_url('https://example.com/sample.zip', 'sample.zip', part_size=10)
+
+        with open('sample.zip', 'rb') as f:
+            self.assertEqual(self.content, f.read())
+        self.assertEqual(2, urlopen_mock.call_count)
+
+    @mock.patch('ebcli.lib.download.urllib.request.urlopen')
+    def test_download_url__ranged(self, urlopen_mock):
+        head_response = mock.MagicMock(
+            headers={'Content-Length': str(len(self.content)), 'Accept-Ranges': 'bytes'}
+        )
+
+        def urlopen(request, timeout=None):
+            if request.get_method() == 'HEAD':
+                return head_response
+            start, end = request.get_header('Range')[len('bytes='):].split('-')
+            return self._ranged_response(int(start), int(end))
+        urlopen_mock.side_effect = urlopen
+
+        download.download_url('https://example.com/sample.zip', 'sample.zip', part_size=10)
+
+        with open('sample.zip', 'rb') as f:
+            self.assertEqual(self.content, f.read())
+        self.assertEqual(5, urlopen_mock.call_count)
+
+    @mock.patch('ebcli.lib.download.urllib.request.urlopen')
+    def test_download_url__ranges_ignored_by_the_server(self, urlopen_mock):
+        head_response = mock.MagicMock(
+            headers={'Content-Length': str(len(self.content)), 'Accept-Ranges': 'bytes'}
+        )
+
+        def urlopen(request, timeout=None):
+            if isinstance(request, str):
+                return BytesIO(self.content)
+            if request.get_method() == 'HEAD':
+                return head_response
+            response = BytesIO(self.content)
+            response.status = 200
+            response.headers = {}
+            return response
+        urlopen_mock.side_effect = urlopen
+
+        download.download_url('https://example.com/sample.zip', 'sample.zip', part_size=10, thread_count=1)
+
+        with open('sample.zip', 'rb') as f:
+            self.assertEqual(self.content, f.read())
+        urlopen_mock.assert_called_with('https://example.com/sample.zip', timeout=30)
@@ -1270,6 +1270,40 @@ class TestElasticbeanstalk(unittest.TestCase):
             VersionLabel='v1'
         )
 
+    @mock.patch('ebcli.lib.elasticbeanstalk.time.sleep')
+    @mock.patch('ebcli.lib.elasticbeanstalk.aws.make_api_call')
+    def test_describe_events(
+            self,
+            make_api_call_mock,
+            sleep_mock
+    ):
+        response = dict(mock_responses.DESCRIBE_EVENTS_RESPONSE, NextToken='next-page')
+        make_api_call_mock.return_value = response
+        start_time = datetime.datetime(2018, 3, 27, 23, 47, 41, 830000, tzinfo=tz.tzutc())
+
+        events, next_token = elasticbeanstalk.describe_events(
+            app_name='my-application',
+            env_name='environment-1',
+            start_time=start_time,
+            max_records=1000,
+            next_token='this-page'
+        )
+
+        self.assertEqual(
+            set(elasticbeanstalk.Event.json_to_event_objects(response['Events'])),
+            set(events)
+        )
+        self.assertEqual('next-page', next_token)
+        make_api_call_mock.assert_called_once_with(
+            'elasticbeanstalk',
+            'describe_events',
+            ApplicationName='my-application',
+            EnvironmentName='environment-1',
+            StartTime=start_time,
+            MaxRecords=1000,
+            NextToken='this-page'
+        )
+
     @mock.patch('ebcli.lib.elasticbeanstalk.aws.make_api_call')
     def test_get_storage_location(
             self,
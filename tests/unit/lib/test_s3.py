@@ -12,6 +12,8 @@
 # language governing permissions and limitations under the License.
 from copy import deepcopy
 import datetime
+import hashlib
+from io import BytesIO
 import os
 import shutil
 import threading
@@ -144,6 +146,66 @@ class TestS3(unittest.TestCase):
             Prefix='absent-application/app-171205_194441.zip'
         )
 
+    @mock.patch('ebcli.lib.s3.download.PART_SIZE', 4)
+    @mock.patch('ebcli.lib.s3.aws.make_api_call')
+    def test_download_object(
+            self,
+            make_api_call_mock
+    ):
+        content = b'0123456789abcdefghij'
+
+        def make_api_call(service, operation, **kwargs):
+            if operation == 'head_object':
+                return {
+                    'ContentLength': len(content),
+                    'ETag': '"{}"'.format(hashlib.md5(content).hexdigest())
+                }
+            start, end = [int(offset) for offset in kwargs['Range'][len('bytes='):].split('-')]
+            return {'Body': BytesIO(content[start:end + 1])}
+        make_api_call_mock.side_effect = make_api_call
+
+        s3.download_object('bucket', 'key', 'bundle.zip')
+
+        with open('bundle.zip', 'rb') as f:
+            self.assertEqual(content, f.read())
+        make_api_call_mock.assert_any_call(
+            's3',
+            'get_object',
+            Bucket='bucket',
+            Key='key',
+            Range='bytes=16-19',
+            IfMatch='"{}"'.format(hashlib.md5(content).hexdigest())
+        )
+        self.assertEqual(6, make_api_call_mock.call_count)
+
+    @mock.patch('ebcli.lib.s3.aws.make_api_call')
+    def test_download_object__checksum_mismatch(
+            self,
+            make_api_call_mock
+    ):
+        def make_api_call(service, operation, **kwargs):
+            if operation == 'head_object':
+                return {'ContentLength': 5, 'ETag': '"0123456789abcdef0123456789abcdef"'}
+            return {'Body': BytesIO(b'hello')}
+        make_api_call_mock.side_effect = make_api_call
+
+        with self.assertRaises(s3.DownloadError):
+            s3.download_object('bucket', 'key', 'bundle.zip')
+
+    @mock.patch('ebcli.lib.s3.aws.make_api_call')
+    def test_download_object__short_range_read(
+            self,
+            make_api_call_mock
+    ):
+        def make_api_call(service, operation, **kwargs):
+            if operation == 'head_object':
+                return {'ContentLength': 10, 'ETag': '"abc-2"'}
+            return {'Body': BytesIO(b'hello')}
+        make_api_call_mock.side_effect = make_api_call
+
+        with self.assertRaises(s3.DownloadError):
+            s3.download_object('bucket', 'key', 'bundle.zip')
+
     @mock.patch('ebcli.lib.s3.aws.make_api_call')
     def test_get_object(
             self,
@@ -296,7 +358,7 @@ class TestS3(unittest.TestCase):
             )
 
         self.assertEqual(cwd, os.getcwd())
-        simple_upload_mock.assert_called_once_with('bucket', 'file', 'non-existent-file.py')
+        simple_upload_mock.assert_called_once_with('bucket', 'file', os.path.join(cwd, 'non-existent-file.py'))
 
     @mock.patch('ebcli.lib.s3.multithreaded_upload')
     def test_upload_workspace_version__file_requires_multithreaded_upload(
@@ -323,7 +385,7 @@ class TestS3(unittest.TestCase):
             )
 
         self.assertEqual(cwd, os.getcwd())
-        multithreaded_upload_mock.assert_called_once_with('bucket', 'file', 'non-existent-file.py')
+        multithreaded_upload_mock.assert_called_once_with('bucket', 'file', os.path.join(cwd, 'non-existent-file.py'))
 
     @mock.patch('ebcli.lib.s3.upload_workspace_version')
     def test_upload_application_version(
@@ -58,10 +58,8 @@ class TestUploadWorkspaceVersion(unittest.TestCase):
     @mock.patch('ebcli.lib.s3.aws.make_api_call')
     @mock.patch('ebcli.lib.s3.os.path.getsize')
     @mock.patch('ebcli.lib.s3.simple_upload')
-    @mock.patch('ebcli.lib.s3.fileoperations.ProjectRoot.traverse')
     def test_upload_workspace_version_with_relative_to_project_root_true(
             self,
-            mock_traverse,
             mock_simple_upload,
             mock_getsize,
             mock_make_api_call
@@ -89,5 +87,4 @@ class TestUploadWorkspaceVersion(unittest.TestCase):
         
         # Verify
         self.assertEqual('upload_result', result)
-        mock_traverse.assert_called()
-        mock_simple_upload.assert_called_once_with('bucket', 'key', 'test_file.txt')
+        mock_simple_upload.assert_called_once_with('bucket', 'key', os.path.join(os.getcwd(), 'test_file.txt'))
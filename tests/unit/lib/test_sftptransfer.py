@@ -0,0 +1,127 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import hashlib
+import os
+import shutil
+import threading
+from unittest import TestCase
+
+from ebcli.lib import sftptransfer
+
+
+class LocalSFTPChannel(object):
+    """
+    Stand-in for a paramiko SFTPClient serving the files of a local directory.
+    """
+    def __init__(self, root, opened_files):
+        self.root = root
+        self.opened_files = opened_files
+        self.closed = False
+
+    def open(self, path, mode='r'):
+        self.opened_files.append((threading.current_thread().name, path))
+        return open(os.path.join(self.root, *path.strip('/').split('/')), mode)
+
+    def close(self):
+        self.closed = True
+
+
+class TestTransferManager(TestCase):
+    def setUp(self):
+        self.root_dir = os.getcwd()
+        if os.path.isdir('testDir'):
+            shutil.rmtree('testDir')
+        self.remote_root = os.path.abspath(os.path.join('testDir', 'remote'))
+        self.local_root = os.path.abspath(os.path.join('testDir', 'local'))
+        os.makedirs(self.local_root)
+        self.opened_files = []
+        self.channels = []
+        self.remote_files = [
+            self._remote_file('site{0}.zip'.format(index), os.urandom(1024 * (index + 1)))
+            for index in range(6)
+        ] + [self._remote_file('Default Web Site/app.zip', b'application')]
+
+    def tearDown(self):
+        os.chdir(self.root_dir)
+        shutil.rmtree('testDir')
+
+    def _remote_file(self, relative_path, contents):
+        location = os.path.join(self.remote_root, *relative_path.split('/'))
+        if not os.path.isdir(os.path.dirname(location)):
+            os.makedirs(os.path.dirname(location))
+        with open(location, 'wb') as f:
+            f.write(contents)
+        return sftptransfer.RemoteFile(
+            '/' + relative_path,
+            relative_path,
+            len(contents),
+            hashlib.sha256(contents).hexdigest().upper()
+        )
+
+    def _open_channel(self):
+        channel = LocalSFTPChannel(self.remote_root, self.opened_files)
+        self.channels.append(channel)
+        return channel
+
+    def _read_local(self, relative_path):
+        with open(os.path.join(self.local_root, *relative_path.split('/')), 'rb') as f:
+            return f.read()
+
+    def _read_remote(self, relative_path):
+        with open(os.path.join(self.remote_root, *relative_path.split('/')), 'rb') as f:
+            return f.read()
+
+    def test_download(self):
+        summary = sftptransfer.TransferManager(self._open_channel, concurrency=3).download(
+            self.remote_files,
+            self.local_root
+        )
+
+        self.assertEqual(7, len(summary.downloaded))
+        self.assertEqual([], summary.failed)
+        self.assertEqual(sum(remote_file.size for remote_file in self.remote_files), summary.bytes_transferred)
+        for remote_file in self.remote_files:
+            self.assertEqual(self._read_remote(remote_file.relative_path), self._read_local(remote_file.relative_path))
+        self.assertLessEqual(len(self.channels), 3)
+        self.assertTrue(all(channel.closed for channel in self.channels))
+        self.assertFalse(any(name.endswith(sftptransfer.PARTIAL_SUFFIX) for name in os.listdir(self.local_root)))
+        self.assertIn('Downloaded 7 file(s)', str(summary))
+
+    def test_download__skips_up_to_date_files_and_resumes_partial_ones(self):
+        shutil.copy(os.path.join(self.remote_root, 'site0.zip'), os.path.join(self.local_root, 'site0.zip'))
+        with open(os.path.join(self.local_root, 'site1.zip'), 'wb') as f:
+            f.write(b'stale contents of the same size'.ljust(self.remote_files[1].size, b'.'))
+        with open(os.path.join(self.local_root, 'site2.zip' + sftptransfer.PARTIAL_SUFFIX), 'wb') as f:
+            f.write(self._read_remote('site2.zip')[:1000])
+
+        summary = sftptransfer.TransferManager(self._open_channel).download(self.remote_files, self.local_root)
+
+        self.assertEqual([self.remote_files[0]], summary.skipped)
+        self.assertEqual(6, len(summary.downloaded))
+        self.assertEqual(
+            sum(remote_file.size for remote_file in self.remote_files[1:]) - 1000,
+            summary.bytes_transferred
+        )
+        self.assertNotIn('/site0.zip', [path for _, path in self.opened_files])
+        for remote_file in self.remote_files:
+            self.assertEqual(self._read_remote(remote_file.relative_path), self._read_local(remote_file.relative_path))
+
+    def test_download__reports_files_that_do_not_match_their_digest(self):
+        corrupted = self.remote_files[0]._replace(sha256='0' * 64)
+
+        summary = sftptransfer.TransferManager(self._open_channel).download([corrupted], self.local_root)
+
+        self.assertEqual([], summary.downloaded)
+        self.assertEqual([corrupted], [remote_file for remote_file, _ in summary.failed])
+        self.assertEqual([], os.listdir(self.local_root))
+        self.assertEqual(2, len(self.opened_files))
@@ -15,6 +15,7 @@ import unittest
 import sys
 import os
 import shutil
+import zipfile
 import subprocess
 import mock
 
@@ -120,6 +121,20 @@ class TestGitSourceControl(unittest.TestCase):
     def test_do_zip(self):
         sourcecontrol.Git().do_zip(os.getcwd() + os.path.sep + 'file.zip')
 
+    @unittest.skipIf(not fileoperations.program_is_installed('git'), "Skipped because git is not installed")
+    def test_do_zip__given_project_root(self):
+        project_root = os.getcwd()
+        location = os.path.join(project_root, 'file.zip')
+        os.chdir(os.path.pardir)
+        try:
+            sourcecontrol.Git().do_zip(location, project_root=project_root, include_submodules=False)
+
+            self.assertEqual(os.path.dirname(project_root), os.getcwd())
+        finally:
+            os.chdir(project_root)
+        with zipfile.ZipFile(location) as zip:
+            self.assertIn('myFile2', zip.namelist())
+
     @unittest.skipIf(not fileoperations.program_is_installed('git'), "Skipped because git is not installed")
     def test_get_message(self):
         self.assertEqual(sourcecontrol.Git().get_message(), 'Hello')
@@ -300,3 +315,48 @@ class TestGitSourceControl(unittest.TestCase):
             ['git', 'fetch', 'develop'],
             handle_exitcode=False)
         self.assertFalse(actual)
+
+    @mock.patch('ebcli.objects.sourcecontrol.fileoperations.delete_file')
+    @mock.patch('ebcli.objects.sourcecontrol.fileoperations.zip_append_archive')
+    @mock.patch.object(sourcecontrol.Git, '_run_cmd')
+    def test_zip_submodules(
+            self,
+            _run_cmd_mock,
+            zip_append_archive_mock,
+            delete_file_mock
+    ):
+        _run_cmd_mock.return_value = '', '', 0
+
+        sourcecontrol.Git()._zip_submodules(
+            'app.zip',
+            os.path.join('path', 'to', 'project'),
+            ['vendor/lib-a', 'vendor/lib-b']
+        )
+
+        _run_cmd_mock.assert_has_calls(
+            [
+                mock.call(
+                    [
+                        'git', 'archive', '-v', '--format=zip',
+                        '--prefix', os.path.join('vendor/lib-a', ''),
+                        '-o', 'app.zip_0', 'HEAD'
+                    ],
+                    cwd=os.path.join('path', 'to', 'project', 'vendor/lib-a')
+                ),
+                mock.call(
+                    [
+                        'git', 'archive', '-v', '--format=zip',
+                        '--prefix', os.path.join('vendor/lib-b', ''),
+                        '-o', 'app.zip_1', 'HEAD'
+                    ],
+                    cwd=os.path.join('path', 'to', 'project', 'vendor/lib-b')
+                ),
+            ],
+            any_order=True
+        )
+        zip_append_archive_mock.assert_has_calls(
+            [
+                mock.call('app.zip', 'app.zip_0'),
+                mock.call('app.zip', 'app.zip_1'),
+            ]
+        )
@@ -36,8 +36,10 @@ class TestAppVersionsOperations(unittest.TestCase):
     def setUp(self):
         self.patcher_elasticbeanstalk = mock.patch('ebcli.operations.appversionops.elasticbeanstalk')
         self.patcher_io = mock.patch('ebcli.operations.appversionops.io')
+        self.patcher_completioncache = mock.patch('ebcli.operations.appversionops.completioncache')
         self.mock_elasticbeanstalk = self.patcher_elasticbeanstalk.start()
         self.mock_io = self.patcher_io.start()
+        self.mock_completioncache = self.patcher_completioncache.start()
 
         self.mock_elasticbeanstalk.get_application_versions.return_value = {u'ApplicationVersions': [
             {u'ApplicationName': self.app_name, u'VersionLabel': self.version_to_delete},
@@ -49,6 +51,7 @@ class TestAppVersionsOperations(unittest.TestCase):
     def tearDown(self):
         self.patcher_elasticbeanstalk.stop()
         self.patcher_io.stop()
+        self.patcher_completioncache.stop()
 
     def test_delete_none_app_version_label(self):
         self.assertRaises(NotFoundError, appversionops.delete_app_version_label, self.app_name, None)
@@ -62,6 +65,11 @@ class TestAppVersionsOperations(unittest.TestCase):
     def test_delete_correct_app_version_label(self):
         appversionops.delete_app_version_label(self.app_name, self.version_to_delete)
         self.mock_elasticbeanstalk.delete_application_version.assert_called_with(self.app_name, self.version_to_delete)
+        self.mock_completioncache.remove_version.assert_called_once_with(
+            mock.ANY,
+            self.app_name,
+            self.version_to_delete
+        )
 
     @mock.patch('ebcli.operations.appversionops.VersionDataPoller')
     @mock.patch('ebcli.operations.appversionops.VersionScreen')
@@ -120,6 +128,8 @@ class TestAppVersionsOperations(unittest.TestCase):
             mock.call('Version Label', None, 'VersionLabel', 'left'),
             mock.call('Date Created', None, 'DateCreated', 'left'),
             mock.call('Age', None, 'SinceCreated', 'left'),
+            mock.call('Status', None, 'Status', 'left'),
+            mock.call('In Use', None, 'InUse', 'left'),
             mock.call('Description', None, 'Description', 'left')
         ]
         Column_mock.assert_has_calls(appversion_table_columns)
@@ -65,12 +65,15 @@ class TestBuildSpecOps(unittest.TestCase):
     def setUp(self):
         self.patcher_beanstalk = mock.patch('ebcli.operations.buildspecops.elasticbeanstalk')
         self.patcher_codebuild = mock.patch('ebcli.operations.buildspecops.codebuild')
+        self.patcher_completioncache = mock.patch('ebcli.operations.buildspecops.completioncache')
         self.mock_beanstalk = self.patcher_beanstalk.start()
         self.mock_codebuild = self.patcher_codebuild.start()
+        self.mock_completioncache = self.patcher_completioncache.start()
 
     def tearDown(self):
         self.patcher_beanstalk.stop()
         self.patcher_codebuild.stop()
+        self.patcher_completioncache.stop()
 
     @mock.patch('ebcli.operations.commonops.wait_for_success_events')
     @mock.patch('ebcli.operations.buildspecops.wait_for_app_version_attribute')
@@ -167,6 +170,7 @@ class TestBuildSpecOps(unittest.TestCase):
             version_label=self.version_label
         )
         self.mock_beanstalk.delete_application_version.assert_called_with(self.app_name, self.version_label)
+        self.mock_completioncache.remove_version.assert_called_once_with(mock.ANY, self.app_name, self.version_label)
 
     def test_validate_build_config_without_service_role(self):
         build_config = copy.deepcopy(self.build_config)
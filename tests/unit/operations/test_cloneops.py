@@ -20,6 +20,11 @@ from .. import mock_responses
 
 
 class TestCloneOps(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch('ebcli.operations.cloneops.completioncache')
+        self.completioncache_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
     @mock.patch('ebcli.operations.cloneops.elasticbeanstalk.clone_environment')
     def test_clone_env(
             self,
@@ -34,6 +39,11 @@ class TestCloneOps(unittest.TestCase):
             (environment_mock, 'request-id'),
             cloneops.clone_env(clone_request_mock)
         )
+        self.completioncache_mock.add_environment.assert_called_once_with(
+            mock.ANY,
+            environment_mock.app_name,
+            environment_mock.name
+        )
 
     @mock.patch('ebcli.operations.cloneops.elasticbeanstalk.clone_environment')
     @mock.patch('ebcli.operations.cloneops.io.prompt_for_cname')
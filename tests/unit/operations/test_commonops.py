@@ -17,6 +17,7 @@ import os
 import shutil
 import sys
 import subprocess
+import zipfile
 
 from dateutil import tz
 import mock
@@ -176,7 +177,8 @@ class TestCommonOperations(unittest.TestCase):
         self.assertEqual(result, 'beep')
 
     @mock.patch('ebcli.operations.commonops.elasticbeanstalk')
-    def test_create_application_version_wrapper(self, mock_beanstalk):
+    @mock.patch('ebcli.operations.commonops.completioncache')
+    def test_create_application_version_wrapper(self, mock_completioncache, mock_beanstalk):
         actual_return = commonops._create_application_version(self.app_name, self.app_version_name,
                                               self.description, self.s3_bucket, self.s3_key)
 
@@ -185,6 +187,7 @@ class TestCommonOperations(unittest.TestCase):
         mock_beanstalk.create_application_version.assert_called_with(self.app_name, self.app_version_name,
                                                                      self.description, self.s3_bucket, self.s3_key,
                                                                      False, None, None, None)
+        mock_completioncache.add_versions.assert_called_once_with(mock.ANY, self.app_name, [self.app_version_name])
 
     @mock.patch('ebcli.operations.commonops.elasticbeanstalk')
     def test_create_application_version_wrapper_app_version_already_exists(self, mock_beanstalk):
@@ -202,7 +205,13 @@ class TestCommonOperations(unittest.TestCase):
 
     @mock.patch('ebcli.operations.commonops.elasticbeanstalk')
     @mock.patch('ebcli.operations.commonops.fileoperations')
-    def test_create_application_version_wrapper_app_does_not_exist(self, mock_fileoperations, mock_beanstalk):
+    @mock.patch('ebcli.operations.commonops.completioncache')
+    def test_create_application_version_wrapper_app_does_not_exist(
+            self,
+            mock_completioncache,
+            mock_fileoperations,
+            mock_beanstalk
+    ):
         mock_beanstalk.create_application_version.side_effect = [InvalidParameterValueError(responses['app.notexists'].replace(
                                                                 '{app-name}', '\'' + self.app_name + '\'')), None]
 
@@ -235,7 +244,8 @@ class TestCommonOperations(unittest.TestCase):
                           self.description, self.s3_bucket, self.s3_key)
 
     @mock.patch('ebcli.operations.commonops.elasticbeanstalk')
-    def test_create_application_version_wrapper_with_build_config(self, mock_beanstalk):
+    @mock.patch('ebcli.operations.commonops.completioncache')
+    def test_create_application_version_wrapper_with_build_config(self, mock_completioncache, mock_beanstalk):
         with mock.patch('ebcli.lib.iam.get_roles') as mock_iam_get_roles:
             mock_iam_get_roles.return_value = [{'RoleName': self.service_role, 'Arn': self.service_role_arn},
                                                {'RoleName': self.service_role, 'Arn': self.service_role_arn}]
@@ -533,6 +543,56 @@ class TestCommonOperations(unittest.TestCase):
             str(context_manager.exception)
         )
 
+    @mock.patch('ebcli.operations.commonops.elasticbeanstalk.get_environment')
+    @mock.patch('ebcli.operations.commonops.elasticbeanstalk.get_new_events')
+    @mock.patch('ebcli.operations.commonops.cloudformation.aws.make_api_call')
+    @mock.patch('ebcli.operations.commonops._sleep')
+    def test_wait_for_success_events__streams_stack_events(
+            self,
+            _sleep_mock,
+            make_api_call_mock,
+            get_new_events_mock,
+            get_environment_mock
+    ):
+        create_environment_events = Event.json_to_event_objects(
+            mock_responses.CREATE_ENVIRONMENT_DESCRIBE_EVENTS['Events']
+        )
+        get_new_events_mock.side_effect = [[event] for event in reversed(create_environment_events[:4])]
+        get_environment_mock.return_value = Environment(id='e-3vui9m2zcq')
+        stack_event = {
+            'EventId': 'AWSEBSecurityGroup-CREATE_FAILED',
+            'LogicalResourceId': 'AWSEBSecurityGroup',
+            'ResourceType': 'AWS::EC2::SecurityGroup',
+            'Timestamp': datetime.now(tz.tzutc()) + timedelta(seconds=1),
+            'ResourceStatus': 'CREATE_FAILED',
+            'ResourceStatusReason': 'Resource creation cancelled',
+        }
+        make_api_call_mock.side_effect = [
+            commonops.ServiceError('Stack with id awseb-e-3vui9m2zcq-stack does not exist'),
+            {'StackEvents': [stack_event]},
+        ]
+        streamer = mock.MagicMock()
+
+        commonops.wait_for_success_events(
+            create_environment_events[0].request_id,
+            streamer=streamer,
+            stack_events=True
+        )
+
+        get_environment_mock.assert_called_once_with(env_name='eb-locust-example-windows-server-dev')
+        make_api_call_mock.assert_called_with(
+            'cloudformation',
+            'describe_stack_events',
+            StackName='awseb-e-3vui9m2zcq-stack'
+        )
+        self.assertEqual(
+            '{0} ERROR   AWSEBSecurityGroup (AWS::EC2::SecurityGroup) CREATE_FAILED: Resource creation cancelled'.format(
+                stack_event['Timestamp'].strftime('%Y-%m-%d %H:%M:%S').ljust(22)
+            ),
+            streamer.stream_event.call_args_list[3][0][0]
+        )
+        self.assertEqual(5, streamer.stream_event.call_count)
+
     def test_wait_for_success_events__timeout_is_0__returns_immediately(self):
         commonops.wait_for_success_events('some-request-id', timeout_in_minutes=0)
 
@@ -595,6 +655,109 @@ class TestCommonOperations(unittest.TestCase):
             "The EB CLI timed out after {timeout_in_minutes} minute(s). The operation might still be running. To keep viewing events, run 'eb events -f'."
         )
 
+    @mock.patch('ebcli.operations.commonops.elasticbeanstalk.get_new_events')
+    @mock.patch('ebcli.operations.commonops._sleep')
+    def test_wait_for_multiple_success_events(
+            self,
+            _sleep_mock,
+            get_new_events_mock
+    ):
+        start_time = datetime(2018, 7, 19, 21, 50, 0, tzinfo=tz.tzutc())
+        get_new_events_mock.side_effect = [
+            [
+                Event(
+                    environment_name='environment-2',
+                    event_date=datetime(2018, 7, 19, 21, 50, 21, tzinfo=tz.tzutc()),
+                    message='Environment update is starting.',
+                    request_id='request-2',
+                    severity='INFO'
+                ),
+                Event(
+                    environment_name='environment-1',
+                    event_date=datetime(2018, 7, 19, 21, 50, 20, tzinfo=tz.tzutc()),
+                    message='Environment update is starting.',
+                    request_id='request-1',
+                    severity='INFO'
+                ),
+            ],
+            [
+                Event(
+                    environment_name='environment-1',
+                    event_date=datetime(2018, 7, 19, 21, 52, 20, tzinfo=tz.tzutc()),
+                    message=responses['env.updatesuccess'],
+                    request_id='request-1',
+                    severity='INFO'
+                ),
+                Event(
+                    environment_name='environment-3',
+                    event_date=datetime(2018, 7, 19, 21, 52, 0, tzinfo=tz.tzutc()),
+                    message=responses['env.updatesuccess'],
+                    request_id='unrelated-request',
+                    severity='INFO'
+                ),
+                Event(
+                    environment_name='environment-2',
+                    event_date=datetime(2018, 7, 19, 21, 51, 20, tzinfo=tz.tzutc()),
+                    message=responses['event.failedupdate'],
+                    request_id='request-2',
+                    severity='ERROR'
+                ),
+            ],
+        ]
+
+        results = commonops.wait_for_multiple_success_events(
+            'my-application',
+            {'environment-1': 'request-1', 'environment-2': 'request-2'},
+            start_time=start_time
+        )
+
+        self.assertEqual(
+            {
+                'environment-1': (commonops.OPERATION_SUCCEEDED, responses['env.updatesuccess']),
+                'environment-2': (commonops.OPERATION_FAILED, responses['event.failedupdate']),
+            },
+            results
+        )
+        get_new_events_mock.assert_has_calls(
+            [
+                mock.call('my-application', None, None, last_event_time=start_time),
+                mock.call(
+                    'my-application',
+                    None,
+                    None,
+                    last_event_time=datetime(2018, 7, 19, 21, 50, 21, tzinfo=tz.tzutc())
+                ),
+            ]
+        )
+
+    @mock.patch('ebcli.operations.commonops.elasticbeanstalk.get_new_events')
+    @mock.patch('ebcli.operations.commonops._sleep')
+    @mock.patch('ebcli.operations.commonops._timeout_reached')
+    def test_wait_for_multiple_success_events__timeout_reached(
+            self,
+            _timeout_reached_mock,
+            _sleep_mock,
+            get_new_events_mock
+    ):
+        _timeout_reached_mock.return_value = True
+
+        results = commonops.wait_for_multiple_success_events(
+            'my-application',
+            {'environment-1': 'request-1'},
+            timeout_in_minutes=5
+        )
+
+        self.assertEqual(
+            {
+                'environment-1': (
+                    commonops.OPERATION_TIMED_OUT,
+                    strings['timeout.error'].format(timeout_in_minutes=5)
+                ),
+            },
+            results
+        )
+        get_new_events_mock.assert_not_called()
+
     def test_sleep(self):
         commonops._sleep(0.001)
 
@@ -1024,25 +1187,104 @@ class TestCommonOperations(unittest.TestCase):
             warning=False
         )
 
-    @mock.patch('ebcli.operations.commonops.fileoperations.ProjectRoot.traverse')
+    @mock.patch('ebcli.operations.commonops.get_app_version_s3_location', return_value=(None, None))
+    @mock.patch('ebcli.operations.commonops.elasticbeanstalk.get_storage_location', return_value='my-bucket')
+    @mock.patch('ebcli.operations.commonops.s3.get_object_info', side_effect=commonops.NotFoundError)
+    @mock.patch('ebcli.operations.commonops.s3.upload_application_version')
+    @mock.patch('ebcli.operations.commonops._create_application_version')
+    def test_create_planned_app_version__does_not_depend_on_the_working_directory(
+            self,
+            _create_application_version_mock,
+            upload_application_version_mock,
+            get_object_info_mock,
+            get_storage_location_mock,
+            get_app_version_s3_location_mock
+    ):
+        _create_application_version_mock.return_value = 'version-label'
+        project_root = os.getcwd()
+        with open('application.py', 'w') as f:
+            f.write('print("hello")')
+        with open('notes.txt', 'w') as f:
+            f.write('not deployed')
+        with open('.ebignore', 'w') as f:
+            f.write('notes.txt\n')
+
+        plan = commonops.plan_app_version(process=True, label='version-label', message='deploying')
+        os.chdir(self.root)
+
+        self.assertEqual('version-label', commonops.create_planned_app_version('my-application', plan))
+
+        self.assertEqual(self.root, os.getcwd())
+        zip_location = os.path.join(project_root, '.elasticbeanstalk', 'app_versions', 'version-label.zip')
+        with zipfile.ZipFile(zip_location) as zip:
+            self.assertEqual(['application.py'], [name for name in zip.namelist() if not name.endswith('/')])
+        upload_application_version_mock.assert_called_once_with(
+            'my-bucket',
+            'my-application/version-label.zip',
+            zip_location
+        )
+        _create_application_version_mock.assert_called_once_with(
+            'my-application',
+            'version-label',
+            'deploying',
+            'my-bucket',
+            'my-application/version-label.zip',
+            True,
+            build_config=None,
+            relative_to_project_root=True
+        )
+        self.assertTrue(plan.zipped)
+
+    @mock.patch('ebcli.operations.commonops.get_app_version_s3_location', return_value=(None, None))
+    @mock.patch('ebcli.operations.commonops.handle_upload_target')
+    def test_create_planned_app_version__reuses_only_unchanged_cached_bundles(
+            self,
+            handle_upload_target_mock,
+            get_app_version_s3_location_mock
+    ):
+        with open('application.py', 'w') as f:
+            f.write('print("hello")')
+
+        plan = commonops.plan_app_version(label='version-label')
+        self.assertFalse(plan.reuse_zip)
+        commonops.create_planned_app_version('my-application', plan)
+        commonops.record_planned_artifact(plan)
+
+        plan = commonops.plan_app_version(label='version-label')
+        self.assertTrue(plan.reuse_zip)
+        commonops.create_planned_app_version('my-application', plan)
+        self.assertFalse(plan.zipped)
+
+        with open(plan.zip_location, 'ab') as f:
+            f.write(b'garbage')
+        plan = commonops.plan_app_version(label='version-label')
+        self.assertFalse(plan.reuse_zip)
+        commonops.create_planned_app_version('my-application', plan)
+        self.assertTrue(plan.zipped)
+        with zipfile.ZipFile(plan.zip_location) as zip:
+            self.assertIn('application.py', zip.namelist())
+
     @mock.patch('ebcli.operations.commonops.heuristics.directory_is_empty')
     @mock.patch('ebcli.operations.commonops.io.echo')
     def test_create_app_version__directory_is_empty(
             self,
             echo_mock,
-            directory_is_empty_mock,
-            traverse_mock
+            directory_is_empty_mock
     ):
         directory_is_empty_mock.return_value = True
+        project_root = os.getcwd()
+        os.mkdir('src')
+        os.chdir('src')
 
         self.assertIsNone(commonops.create_app_version('my-application'))
 
+        directory_is_empty_mock.assert_called_once_with(project_root)
+        self.assertEqual(os.path.join(project_root, 'src'), os.getcwd())
         echo_mock.assert_called_once_with(
             'NOTE: The current directory does not contain any source code. '
             'Elastic Beanstalk is launching the sample application instead.'
         )
 
-    @mock.patch('ebcli.operations.commonops.fileoperations.ProjectRoot.traverse')
     @mock.patch('ebcli.operations.commonops.heuristics.directory_is_empty')
     @mock.patch('ebcli.operations.commonops.SourceControl.get_source_control')
     @mock.patch('ebcli.operations.commonops.fileoperations.get_config_setting')
@@ -1058,8 +1300,7 @@ class TestCommonOperations(unittest.TestCase):
             get_app_version_s3_location_mock,
             get_config_setting_mock,
             get_source_control_mock,
-            directory_is_empty_mock,
-            traverse_mock
+            directory_is_empty_mock
     ):
         directory_is_empty_mock.return_value = False
         source_control_mock = mock.MagicMock()
@@ -1090,7 +1331,6 @@ class TestCommonOperations(unittest.TestCase):
             relative_to_project_root=True,
         )
 
-    @mock.patch('ebcli.operations.commonops.fileoperations.ProjectRoot.traverse')
     @mock.patch('ebcli.operations.commonops.heuristics.directory_is_empty')
     @mock.patch('ebcli.operations.commonops.SourceControl.get_source_control')
     @mock.patch('ebcli.operations.commonops.fileoperations.get_config_setting')
@@ -1112,8 +1352,7 @@ class TestCommonOperations(unittest.TestCase):
             get_app_version_s3_location_mock,
             get_config_setting_mock,
             get_source_control_mock,
-            directory_is_empty_mock,
-            traverse_mock
+            directory_is_empty_mock
     ):
         directory_is_empty_mock.return_value = False
         source_control_mock = mock.MagicMock()
@@ -1152,7 +1391,6 @@ class TestCommonOperations(unittest.TestCase):
             relative_to_project_root=True,
         )
 
-    @mock.patch('ebcli.operations.commonops.fileoperations.ProjectRoot.traverse')
     @mock.patch('ebcli.operations.commonops.heuristics.directory_is_empty')
     @mock.patch('ebcli.operations.commonops.SourceControl.get_source_control')
     @mock.patch('ebcli.operations.commonops.fileoperations.get_config_setting')
@@ -1170,8 +1408,7 @@ class TestCommonOperations(unittest.TestCase):
             get_object_info_mock,
             get_config_setting_mock,
             get_source_control_mock,
-            directory_is_empty_mock,
-            traverse_mock
+            directory_is_empty_mock
     ):
         directory_is_empty_mock.return_value = False
         source_control_mock = mock.MagicMock()
@@ -1209,7 +1446,6 @@ class TestCommonOperations(unittest.TestCase):
             relative_to_project_root=True,
         )
 
-    @mock.patch('ebcli.operations.commonops.fileoperations.ProjectRoot.traverse')
     @mock.patch('ebcli.operations.commonops.heuristics.directory_is_empty')
     @mock.patch('ebcli.operations.commonops.SourceControl.get_source_control')
     @mock.patch('ebcli.operations.commonops.fileoperations.get_config_setting')
@@ -1231,8 +1467,7 @@ class TestCommonOperations(unittest.TestCase):
             get_app_version_s3_location_mock,
             get_config_setting_mock,
             get_source_control_mock,
-            directory_is_empty_mock,
-            traverse_mock
+            directory_is_empty_mock
     ):
         directory_is_empty_mock.return_value = False
         source_control_mock = mock.MagicMock()
@@ -1270,7 +1505,6 @@ class TestCommonOperations(unittest.TestCase):
             relative_to_project_root=True,
         )
 
-    @mock.patch('ebcli.operations.commonops.fileoperations.ProjectRoot.traverse')
     @mock.patch('ebcli.operations.commonops.heuristics.directory_is_empty')
     @mock.patch('ebcli.operations.commonops.SourceControl.get_source_control')
     @mock.patch('ebcli.operations.commonops.fileoperations.get_config_setting')
@@ -1288,8 +1522,7 @@ class TestCommonOperations(unittest.TestCase):
             get_app_version_s3_location_mock,
             get_config_setting_mock,
             get_source_control_mock,
-            directory_is_empty_mock,
-            traverse_mock
+            directory_is_empty_mock
     ):
         directory_is_empty_mock.return_value = False
         source_control_mock = mock.MagicMock()
@@ -1556,16 +1789,17 @@ class TestCommonOperations(unittest.TestCase):
         _create_application_version_mock.assert_not_called()
 
 
-    @mock.patch('ebcli.operations.commonops.fileoperations.ProjectRoot.traverse')
     @mock.patch('ebcli.operations.commonops.heuristics.directory_is_empty')
     @mock.patch('ebcli.operations.commonops.io.echo')
     def test_create_app_version_from_source__directory_is_empty(
             self,
             echo_mock,
-            directory_is_empty_mock,
-            traverse_mock
+            directory_is_empty_mock
     ):
         directory_is_empty_mock.return_value = True
+        project_root = os.getcwd()
+        os.mkdir('src')
+        os.chdir('src')
 
         self.assertIsNone(
             commonops.create_app_version_from_source(
@@ -1574,12 +1808,13 @@ class TestCommonOperations(unittest.TestCase):
             )
         )
 
+        directory_is_empty_mock.assert_called_once_with(project_root)
+        self.assertEqual(os.path.join(project_root, 'src'), os.getcwd())
         echo_mock.assert_called_once_with(
             'NOTE: The current directory does not contain any source code. '
             'Elastic Beanstalk is launching the sample application instead.'
         )
 
-    @mock.patch('ebcli.operations.commonops.fileoperations.ProjectRoot.traverse')
     @mock.patch('ebcli.operations.commonops.heuristics.directory_is_empty')
     @mock.patch('ebcli.operations.commonops.SourceControl.get_source_control')
     @mock.patch('ebcli.operations.commonops._create_application_version')
@@ -1589,8 +1824,7 @@ class TestCommonOperations(unittest.TestCase):
             get_branch_mock,
             _create_application_version_mock,
             get_source_control_mock,
-            directory_is_empty_mock,
-            traverse_mock
+            directory_is_empty_mock
     ):
         directory_is_empty_mock.return_value = False
         source_control_mock = mock.MagicMock()
@@ -1629,7 +1863,6 @@ class TestCommonOperations(unittest.TestCase):
             repository='my-repository'
         )
 
-    @mock.patch('ebcli.operations.commonops.fileoperations.ProjectRoot.traverse')
     @mock.patch('ebcli.operations.commonops.heuristics.directory_is_empty')
     @mock.patch('ebcli.operations.commonops.SourceControl.get_source_control')
     @mock.patch('ebcli.operations.commonops._create_application_version')
@@ -1639,8 +1872,7 @@ class TestCommonOperations(unittest.TestCase):
             get_branch_mock,
             _create_application_version_mock,
             get_source_control_mock,
-            directory_is_empty_mock,
-            traverse_mock
+            directory_is_empty_mock
     ):
         directory_is_empty_mock.return_value = False
         source_control_mock = mock.MagicMock()
@@ -1663,7 +1895,6 @@ class TestCommonOperations(unittest.TestCase):
         get_branch_mock.assert_not_called()
         _create_application_version_mock.assert_not_called()
 
-    @mock.patch('ebcli.operations.commonops.fileoperations.ProjectRoot.traverse')
     @mock.patch('ebcli.operations.commonops.heuristics.directory_is_empty')
     @mock.patch('ebcli.operations.commonops.SourceControl.get_source_control')
     @mock.patch('ebcli.operations.commonops._create_application_version')
@@ -1675,8 +1906,7 @@ class TestCommonOperations(unittest.TestCase):
             get_branch_mock,
             _create_application_version_mock,
             get_source_control_mock,
-            directory_is_empty_mock,
-            traverse_mock
+            directory_is_empty_mock
     ):
         directory_is_empty_mock.return_value = False
         source_control_mock = mock.MagicMock()
@@ -1699,7 +1929,6 @@ class TestCommonOperations(unittest.TestCase):
         get_branch_mock.assert_called_once_with('my-repository', 'my-branch')
         _create_application_version_mock.assert_not_called()
 
-    @mock.patch('ebcli.operations.commonops.fileoperations.ProjectRoot.traverse')
     @mock.patch('ebcli.operations.commonops.heuristics.directory_is_empty')
     @mock.patch('ebcli.operations.commonops.SourceControl.get_source_control')
     @mock.patch('ebcli.operations.commonops._create_application_version')
@@ -1707,8 +1936,7 @@ class TestCommonOperations(unittest.TestCase):
             self,
             _create_application_version_mock,
             get_source_control_mock,
-            directory_is_empty_mock,
-            traverse_mock
+            directory_is_empty_mock
     ):
         directory_is_empty_mock.return_value = False
         source_control_mock = mock.MagicMock()
@@ -1730,16 +1958,18 @@ class TestCommonOperations(unittest.TestCase):
         _create_application_version_mock.assert_not_called()
 
     @mock.patch('ebcli.operations.commonops.fileoperations.get_zip_location')
-    @mock.patch('ebcli.operations.commonops.fileoperations.file_exists')
-    @mock.patch('ebcli.operations.commonops.fileoperations.get_ebignore_list')
-    def test_zip_up_project__file_already_exists(
-            self,
-            get_ebignore_list_mock,
-            file_exists_mock,
+    @mock.patch('ebcli.operations.commonops.artifactcache.find_reusable_bundle')
+    @mock.patch('ebcli.operations.commonops.fileoperations.delete_file')
+    @mock.patch('ebcli.operations.commonops.artifactcache.record_artifact')
+    def test_zip_up_project__reuses_cached_bundle(
+            self,
+            record_artifact_mock,
+            delete_file_mock,
+            find_reusable_bundle_mock,
             get_zip_location_mock
     ):
         get_zip_location_mock.return_value = 'file_path'
-        file_exists_mock.return_value = True
+        find_reusable_bundle_mock.return_value = 'file_path'
         source_control_mock = mock.MagicMock()
 
         self.assertEqual(
@@ -1750,17 +1980,26 @@ class TestCommonOperations(unittest.TestCase):
             )
         )
 
+        find_reusable_bundle_mock.assert_called_once_with('file_path', 'version-label')
+        source_control_mock.do_zip.assert_not_called()
+        delete_file_mock.assert_not_called()
+        record_artifact_mock.assert_not_called()
+
     @mock.patch('ebcli.operations.commonops.fileoperations.get_zip_location')
-    @mock.patch('ebcli.operations.commonops.fileoperations.file_exists')
+    @mock.patch('ebcli.operations.commonops.artifactcache.find_reusable_bundle')
+    @mock.patch('ebcli.operations.commonops.fileoperations.delete_file')
+    @mock.patch('ebcli.operations.commonops.artifactcache.record_artifact')
     @mock.patch('ebcli.operations.commonops.fileoperations.get_ebignore_list')
-    def test_zip_up_project__file_doesnt_exist(
+    def test_zip_up_project__rezips_bundle_missing_from_cache(
             self,
             get_ebignore_list_mock,
-            file_exists_mock,
+            record_artifact_mock,
+            delete_file_mock,
+            find_reusable_bundle_mock,
             get_zip_location_mock
     ):
         get_zip_location_mock.return_value = 'file_path'
-        file_exists_mock.return_value = False
+        find_reusable_bundle_mock.return_value = None
         source_control_mock = mock.MagicMock()
         get_ebignore_list_mock.return_value = None
 
@@ -1773,20 +2012,24 @@ class TestCommonOperations(unittest.TestCase):
         )
 
         source_control_mock.do_zip.assert_called_once_with('file_path', False)
+        delete_file_mock.assert_called_once_with('file_path')
+        record_artifact_mock.assert_called_once_with('file_path', label='version-label', hash_contents=True)
 
     @mock.patch('ebcli.operations.commonops.fileoperations.get_zip_location')
-    @mock.patch('ebcli.operations.commonops.fileoperations.file_exists')
+    @mock.patch('ebcli.operations.commonops.artifactcache.find_reusable_bundle')
+    @mock.patch('ebcli.operations.commonops.artifactcache.record_artifact')
     @mock.patch('ebcli.operations.commonops.fileoperations.get_ebignore_list')
     @mock.patch('ebcli.operations.commonops.fileoperations.zip_up_project')
-    def test_zip_up_project__file_doesnt_exist(
+    def test_zip_up_project__rezips_bundle_with_ebignore(
             self,
             zip_up_project_mock,
             get_ebignore_list_mock,
-            file_exists_mock,
+            record_artifact_mock,
+            find_reusable_bundle_mock,
             get_zip_location_mock
     ):
         get_zip_location_mock.return_value = 'file_path'
-        file_exists_mock.return_value = False
+        find_reusable_bundle_mock.return_value = None
         source_control_mock = mock.MagicMock()
         get_ebignore_list_mock.return_value = {'index.html'}
 
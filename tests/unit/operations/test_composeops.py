@@ -13,6 +13,9 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import threading
+import time
+
 import mock
 from mock import Mock
 import unittest
@@ -203,3 +206,59 @@ class TestComposeOps(unittest.TestCase):
             'dev'
         )
         wait_for_compose_events_mock.assert_not_called()
+
+    @mock.patch('ebcli.operations.composeops.aws.warm_up')
+    @mock.patch('ebcli.operations.composeops.commonops.record_planned_artifact')
+    @mock.patch('ebcli.operations.composeops.commonops.create_planned_app_version')
+    def test_create_module_app_versions__builds_modules_concurrently(
+            self,
+            create_planned_app_version_mock,
+            record_planned_artifact_mock,
+            warm_up_mock
+    ):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def create_planned_app_version(app_name, plan):
+            warm_up_mock.assert_called_once_with(['s3', 'elasticbeanstalk'])
+            # Fails with BrokenBarrierError unless both modules are built at once
+            barrier.wait()
+            return plan.version_label
+
+        create_planned_app_version_mock.side_effect = create_planned_app_version
+        plans = [Mock(version_label='version-label-1'), None, Mock(version_label='version-label-2')]
+
+        self.assertEqual(
+            ['version-label-1', None, 'version-label-2'],
+            composeops.create_module_app_versions('my-application', plans, max_concurrency=2)
+        )
+        record_planned_artifact_mock.assert_has_calls([mock.call(plans[0]), mock.call(plans[2])])
+
+    @mock.patch('ebcli.operations.composeops.aws.warm_up')
+    @mock.patch('ebcli.operations.composeops.commonops.record_planned_artifact')
+    @mock.patch('ebcli.operations.composeops.commonops.create_planned_app_version')
+    def test_create_module_app_versions__bounds_the_number_of_modules_in_progress(
+            self,
+            create_planned_app_version_mock,
+            record_planned_artifact_mock,
+            warm_up_mock
+    ):
+        lock = threading.Lock()
+        in_progress = [0, 0]
+
+        def create_planned_app_version(app_name, plan):
+            with lock:
+                in_progress[0] += 1
+                in_progress[1] = max(in_progress)
+            time.sleep(0.01)
+            with lock:
+                in_progress[0] -= 1
+            return plan.version_label
+
+        create_planned_app_version_mock.side_effect = create_planned_app_version
+        plans = [Mock(version_label='version-label-{}'.format(index)) for index in range(8)]
+
+        self.assertEqual(
+            [plan.version_label for plan in plans],
+            composeops.create_module_app_versions('my-application', plans, max_concurrency=3)
+        )
+        self.assertLessEqual(in_progress[1], 3)
@@ -400,27 +400,20 @@ Actual error: """,
             createops.get_service_role()
         )
 
-    @mock.patch('ebcli.operations.createops.utils.get_data_from_url')
-    @mock.patch('ebcli.operations.createops.fileoperations.write_to_data_file')
+    @mock.patch('ebcli.operations.createops.download.download_url')
     def test_download_application_version(
             self,
-            write_to_data_file_mock,
-            get_data_from_url_mock
+            download_url_mock
     ):
-        get_data_from_url_mock.return_value = 'data'
-
         createops.download_application_version(
             'http://my-app.com',
             'path/to/zip/file.zip'
         )
 
-        get_data_from_url_mock.assert_called_once_with(
+        download_url_mock.assert_called_once_with(
             'http://my-app.com',
-            timeout=30
-        )
-        write_to_data_file_mock.assert_called_once_with(
             'path/to/zip/file.zip',
-            'data'
+            timeout=30
         )
 
     @mock.patch('ebcli.operations.createops.retrieve_application_version_url')
@@ -587,7 +580,7 @@ Actual error: """,
             health=False
         )
         alert_environment_status_mock.assert_called_once_with(create_environment_result_mock)
-        wait_for_success_events_mock.assert_called_once_with('request-id', timeout_in_minutes=None)
+        wait_for_success_events_mock.assert_called_once_with('request-id', timeout_in_minutes=None, stack_events=True)
         create_env_mock.assert_called_once_with(env_request, interactive=True)
         upload_keypair_if_needed_mock.assert_called_once_with('aws-eb-us-west-2')
         create_app_version_mock.assert_called_once_with(
@@ -656,7 +649,7 @@ Actual error: """,
             health=False
         )
         alert_environment_status_mock.assert_called_once_with(create_environment_result_mock)
-        wait_for_success_events_mock.assert_called_once_with('request-id', timeout_in_minutes=10)
+        wait_for_success_events_mock.assert_called_once_with('request-id', timeout_in_minutes=10, stack_events=True)
         create_env_mock.assert_called_once_with(env_request, interactive=True)
         upload_keypair_if_needed_mock.assert_called_once_with('aws-eb-us-west-2')
         wait_for_processed_app_versions_mock.assert_called_once_with(
@@ -805,7 +798,7 @@ Actual error: """,
             health=False
         )
         alert_environment_status_mock.assert_called_once_with(create_environment_result_mock)
-        wait_for_success_events_mock.assert_called_once_with('request-id', timeout_in_minutes=None)
+        wait_for_success_events_mock.assert_called_once_with('request-id', timeout_in_minutes=None, stack_events=True)
         create_env_mock.assert_called_once_with(env_request, interactive=True)
         upload_keypair_if_needed_mock.assert_called_once_with('aws-eb-us-west-2')
         wait_for_processed_app_versions_mock.assert_called_once_with(
@@ -893,7 +886,7 @@ Actual error: """,
             health=False
         )
         alert_environment_status_mock.assert_called_once_with(create_environment_result_mock)
-        wait_for_success_events_mock.assert_called_once_with('request-id', timeout_in_minutes=None)
+        wait_for_success_events_mock.assert_called_once_with('request-id', timeout_in_minutes=None, stack_events=True)
         create_env_mock.assert_called_once_with(env_request, interactive=True)
         upload_keypair_if_needed_mock.assert_called_once_with('aws-eb-us-west-2')
         wait_for_processed_app_versions_mock.assert_called_once_with(
@@ -965,7 +958,7 @@ Actual error: """,
             health=False
         )
         alert_environment_status_mock.assert_called_once_with(create_environment_result_mock)
-        wait_for_success_events_mock.assert_called_once_with('request-id', timeout_in_minutes=None)
+        wait_for_success_events_mock.assert_called_once_with('request-id', timeout_in_minutes=None, stack_events=True)
         create_env_mock.assert_called_once_with(env_request, interactive=True)
         upload_keypair_if_needed_mock.assert_called_once_with('aws-eb-us-west-2')
         create_dummy_app_version_mock.assert_called_once_with('my-application')
@@ -979,3 +972,21 @@ Actual error: """,
                 mock.call('Printing Status:')
             ]
         )
+
+    @mock.patch('ebcli.operations.createops.elasticbeanstalk.create_environment')
+    @mock.patch('ebcli.operations.createops.aws.get_region_name')
+    @mock.patch('ebcli.operations.createops.completioncache.add_environment')
+    def test_create_env__records_environment_for_completion(
+            self,
+            add_environment_mock,
+            get_region_name_mock,
+            create_environment_mock
+    ):
+        get_region_name_mock.return_value = 'us-west-2'
+        environment = Environment(name='my-environment', app_name='my-application')
+        create_environment_mock.return_value = (environment, 'request-id')
+        env_request = CreateEnvironmentRequest(app_name='my-application', env_name='my-environment')
+
+        self.assertEqual((environment, 'request-id'), createops.create_env(env_request))
+
+        add_environment_mock.assert_called_once_with('us-west-2', 'my-application', 'my-environment')
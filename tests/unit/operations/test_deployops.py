@@ -64,6 +64,7 @@ class TestDeployOperations(unittest.TestCase):
             can_abort=True,
             env_name='ebcli-env',
             timeout_in_minutes=5,
+            stack_events=True,
         )
 
     @mock.patch('ebcli.operations.deployops.elasticbeanstalk')
@@ -84,7 +85,8 @@ class TestDeployOperations(unittest.TestCase):
             self.request_id,
             can_abort=True,
             env_name='ebcli-env',
-            timeout_in_minutes=5
+            timeout_in_minutes=5,
+            stack_events=True
         )
 
     @mock.patch('ebcli.operations.deployops.elasticbeanstalk')
@@ -113,7 +115,8 @@ class TestDeployOperations(unittest.TestCase):
             self.request_id,
             can_abort=True,
             env_name='ebcli-env',
-            timeout_in_minutes=10
+            timeout_in_minutes=10,
+            stack_events=True
         )
 
     @mock.patch('ebcli.operations.deployops.elasticbeanstalk')
@@ -140,7 +143,8 @@ class TestDeployOperations(unittest.TestCase):
             self.request_id,
             can_abort=True,
             env_name='ebcli-env',
-            timeout_in_minutes=5
+            timeout_in_minutes=5,
+            stack_events=True
         )
 
     @mock.patch('ebcli.operations.deployops.buildspecops')
@@ -172,7 +176,8 @@ class TestDeployOperations(unittest.TestCase):
             self.request_id,
             can_abort=True,
             env_name='ebcli-env',
-            timeout_in_minutes=5
+            timeout_in_minutes=5,
+            stack_events=True
         )
         
     @mock.patch('ebcli.operations.deployops.elasticbeanstalk')
@@ -211,7 +216,8 @@ class TestDeployOperations(unittest.TestCase):
             self.request_id,
             can_abort=True,
             env_name='ebcli-env',
-            timeout_in_minutes=5
+            timeout_in_minutes=5,
+            stack_events=True
         )
         
     @mock.patch('ebcli.operations.deployops.elasticbeanstalk')
@@ -249,7 +255,8 @@ class TestDeployOperations(unittest.TestCase):
             self.request_id,
             can_abort=True,
             env_name='ebcli-env',
-            timeout_in_minutes=5
+            timeout_in_minutes=5,
+            stack_events=True
         )
         
     @mock.patch('ebcli.operations.deployops.elasticbeanstalk')
@@ -296,3 +303,124 @@ class TestDeployOperations(unittest.TestCase):
         mock_beanstalk.update_env_application_version.assert_called_with(self.env_name, self.app_version_name, None)
         # Verify buildspecops.stream_build_configuration_app_version_creation is NOT called with source_bundle
         mock_buildspecops.stream_build_configuration_app_version_creation.assert_not_called()
+
+
+class TestDeployToEnvironments(unittest.TestCase):
+    app_name = 'ebcli-app'
+    app_version_name = 'ebcli-app-version'
+
+    @mock.patch('ebcli.operations.deployops.elasticbeanstalk')
+    @mock.patch('ebcli.operations.deployops.commonops')
+    @mock.patch('ebcli.operations.deployops.gitops')
+    @mock.patch('ebcli.operations.deployops.aws')
+    @mock.patch('ebcli.operations.deployops.fileoperations')
+    @mock.patch('ebcli.operations.deployops.io')
+    def test_deploy_to_environments__builds_once_and_waits_on_all_environments(
+            self, mock_io, mock_fileops, mock_aws, mock_gitops, mock_commonops, mock_beanstalk
+    ):
+        mock_aws.get_region_name.return_value = 'us-east-1'
+        mock_fileops.build_spec_exists.return_value = False
+        mock_gitops.git_management_enabled.return_value = False
+        mock_commonops.create_app_version.return_value = self.app_version_name
+        mock_beanstalk.update_env_application_version.side_effect = lambda env_name, *args: env_name + '-request'
+        mock_commonops.wait_for_multiple_success_events.return_value = {
+            'env-1': (deployops.OPERATION_SUCCEEDED, 'Environment update completed successfully.'),
+            'env-2': (deployops.OPERATION_SUCCEEDED, 'Environment update completed successfully.'),
+        }
+
+        results = deployops.deploy_to_environments(
+            self.app_name, ['env-1', 'env-2'], None, None, None, timeout=10
+        )
+
+        mock_commonops.create_app_version.assert_called_once_with(
+            self.app_name, process=False, label=None, message=None, staged=False, build_config=None
+        )
+        mock_beanstalk.update_env_application_version.assert_has_calls(
+            [
+                mock.call('env-1', self.app_version_name, None),
+                mock.call('env-2', self.app_version_name, None),
+            ],
+            any_order=True
+        )
+        mock_commonops.wait_for_multiple_success_events.assert_called_once_with(
+            self.app_name,
+            {'env-1': 'env-1-request', 'env-2': 'env-2-request'},
+            timeout_in_minutes=10,
+            start_time=mock.ANY
+        )
+        self.assertEqual(mock_commonops.wait_for_multiple_success_events.return_value, results)
+
+    @mock.patch('ebcli.operations.deployops.elasticbeanstalk')
+    @mock.patch('ebcli.operations.deployops.commonops')
+    @mock.patch('ebcli.operations.deployops.aws')
+    @mock.patch('ebcli.operations.deployops.fileoperations')
+    @mock.patch('ebcli.operations.deployops.io')
+    def test_deploy_to_environments__failed_wave_skips_remaining_waves(
+            self, mock_io, mock_fileops, mock_aws, mock_commonops, mock_beanstalk
+    ):
+        mock_fileops.build_spec_exists.return_value = False
+        mock_beanstalk.update_env_application_version.side_effect = lambda env_name, *args: env_name + '-request'
+        mock_commonops.wait_for_multiple_success_events.return_value = {
+            'env-1': (deployops.OPERATION_SUCCEEDED, 'Environment update completed successfully.'),
+            'env-2': (deployops.OPERATION_FAILED, 'Failed to deploy application.'),
+        }
+
+        with self.assertRaises(deployops.ServiceError) as context_manager:
+            deployops.deploy_to_environments(
+                self.app_name, ['env-1', 'env-2', 'env-3'], self.app_version_name, None, None, wave_size=2
+            )
+
+        self.assertEqual(
+            'Deployment did not succeed for the following environments: env-2, env-3',
+            str(context_manager.exception)
+        )
+        self.assertEqual(2, mock_beanstalk.update_env_application_version.call_count)
+        mock_commonops.wait_for_multiple_success_events.assert_called_once()
+
+    @mock.patch('ebcli.operations.deployops.elasticbeanstalk')
+    @mock.patch('ebcli.operations.deployops.commonops')
+    @mock.patch('ebcli.operations.deployops.aws')
+    @mock.patch('ebcli.operations.deployops.fileoperations')
+    @mock.patch('ebcli.operations.deployops.io')
+    def test_deploy_to_environments__nohang_does_not_wait(
+            self, mock_io, mock_fileops, mock_aws, mock_commonops, mock_beanstalk
+    ):
+        mock_fileops.build_spec_exists.return_value = False
+        mock_beanstalk.update_env_application_version.side_effect = lambda env_name, *args: env_name + '-request'
+
+        results = deployops.deploy_to_environments(
+            self.app_name, ['env-1', 'env-2'], self.app_version_name, None, None, timeout=0, wave_size=1
+        )
+
+        self.assertEqual(
+            {
+                'env-1': (deployops.DEPLOYMENT_TRIGGERED, 'env-1-request'),
+                'env-2': (deployops.DEPLOYMENT_TRIGGERED, 'env-2-request'),
+            },
+            results
+        )
+        mock_commonops.wait_for_multiple_success_events.assert_not_called()
+
+    @mock.patch('ebcli.operations.deployops.elasticbeanstalk.get_environment_names')
+    def test_resolve_environment_names(self, get_environment_names_mock):
+        get_environment_names_mock.return_value = ['web-2', 'worker-1', 'web-1']
+
+        self.assertEqual(
+            ['worker-1', 'web-1', 'web-2'],
+            deployops.resolve_environment_names(self.app_name, ['worker-1', 'web-*', 'web-1'])
+        )
+
+    @mock.patch('ebcli.operations.deployops.elasticbeanstalk.get_environment_names')
+    def test_resolve_environment_names__pattern_matches_nothing(self, get_environment_names_mock):
+        get_environment_names_mock.return_value = ['web-1']
+
+        with self.assertRaises(deployops.NotFoundError):
+            deployops.resolve_environment_names(self.app_name, ['api-*'])
+
+    @mock.patch('ebcli.operations.deployops.elasticbeanstalk.get_environment_names')
+    def test_resolve_environment_names__no_patterns_does_not_describe_environments(self, get_environment_names_mock):
+        self.assertEqual(
+            ['env-1', 'env-2'],
+            deployops.resolve_environment_names(self.app_name, ['env-1', 'env-2'])
+        )
+        get_environment_names_mock.assert_not_called()
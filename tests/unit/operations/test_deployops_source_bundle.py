@@ -74,7 +74,8 @@ class TestDeployWithSourceBundle(unittest.TestCase):
             self.request_id,
             can_abort=True,
             env_name='ebcli-env',
-            timeout_in_minutes=5
+            timeout_in_minutes=5,
+            stack_events=True
         )
         
     @mock.patch('ebcli.operations.deployops.elasticbeanstalk')
@@ -10,6 +10,7 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import mock
 from mock import patch
 
 
@@ -28,7 +29,7 @@ class TestCreateEnvironment(baseinttest.BaseOperationsTest):
         mock_names.return_value = ['my-env', 'my-env2']
         self.mock_elasticbeanstalk.create_environment.side_effect = [
             InvalidParameterValueError('Environment env-name already exists.'),
-            None,
+            (mock.MagicMock(), 'request-id'),
         ]
 
         self.mock_input.return_value = 'new-env-name'
@@ -58,7 +59,7 @@ class TestCreateEnvironment(baseinttest.BaseOperationsTest):
     def test_create_new_environment_cname_taken(self):
         self.mock_elasticbeanstalk.create_environment.side_effect = [
             InvalidParameterValueError('DNS name (cname) is not available.'),
-            None,
+            (mock.MagicMock(), 'request-id'),
         ]
 
         self.mock_input.return_value = 'new-cname'
@@ -17,51 +17,64 @@ from dateutil import tz
 import mock
 import unittest
 
+from ebcli.core import eventstore
 from ebcli.operations import eventsops
 from ebcli.objects.event import Event
 
 
+EVENTS = Event.json_to_event_objects(
+    [
+        {
+            'EventDate': datetime.datetime(2018, 7, 19, 21, 50, 21, 623000, tzinfo=tz.tzutc()),
+            'Message': 'Successfully launched environment: eb-locust-example-windows-server-dev',
+            'ApplicationName': 'eb-locust-example-windows-server',
+            'EnvironmentName': 'eb-locust-example-windows-server-dev',
+            'RequestId': 'a28c2685-b6a0-4785-82bf-45de6451bd01',
+            'Severity': 'INFO'
+        },
+        {
+            'EventDate': datetime.datetime(2018, 7, 19, 21, 50, 0, 909000, tzinfo=tz.tzutc()),
+            'Message': 'Environment health has transitioned from Pending to Ok. Initialization completed 26 seconds ago and took 5 minutes.',
+            'ApplicationName': 'eb-locust-example-windows-server',
+            'EnvironmentName': 'eb-locust-example-windows-server-dev',
+            'Severity': 'INFO'
+        },
+        {
+            'EventDate': datetime.datetime(2018, 7, 19, 21, 49, 10, tzinfo=tz.tzutc()),
+            'Message': "Nginx configuration detected in the '.ebextensions/nginx' directory. AWS Elastic Beanstalk will no longer manage the Nginx configuration for this environment.",
+            'ApplicationName': 'eb-locust-example-windows-server',
+            'EnvironmentName': 'eb-locust-example-windows-server-dev',
+            'RequestId': 'a28c2685-b6a0-4785-82bf-45de6451bd01',
+            'Severity': 'INFO'
+        }
+    ]
+)
+
+
 class TestEventOps(unittest.TestCase):
+    def setUp(self):
+        self.store = eventstore.EventStore(':memory:')
+        self.store.close = mock.MagicMock()
+        self.for_region_patcher = mock.patch(
+            'ebcli.operations.eventsops.eventstore.EventStore.for_region',
+            return_value=self.store
+        )
+        self.for_region_patcher.start()
+
+    def tearDown(self):
+        self.for_region_patcher.stop()
+        self.store.connection.close()
+
     @mock.patch('ebcli.operations.eventsops.io.get_event_streamer')
-    @mock.patch('ebcli.operations.eventsops.elasticbeanstalk.get_new_events')
+    @mock.patch('ebcli.operations.eventsops.elasticbeanstalk.describe_events')
     @mock.patch('ebcli.operations.eventsops._sleep')
     def test_follow_events(
             self,
             _sleep_mock,
-            get_new_events_mock,
+            describe_events_mock,
             get_event_streamer_mock
     ):
-        get_new_events_mock.side_effect = [
-            [event]
-            for event in
-            Event.json_to_event_objects(
-                [
-                    {
-                        'EventDate': datetime.datetime(2018, 7, 19, 21, 50, 21, 623000, tzinfo=tz.tzutc()),
-                        'Message': 'Successfully launched environment: eb-locust-example-windows-server-dev',
-                        'ApplicationName': 'eb-locust-example-windows-server',
-                        'EnvironmentName': 'eb-locust-example-windows-server-dev',
-                        'RequestId': 'a28c2685-b6a0-4785-82bf-45de6451bd01',
-                        'Severity': 'INFO'
-                    },
-                    {
-                        'EventDate': datetime.datetime(2018, 7, 19, 21, 50, 0, 909000, tzinfo=tz.tzutc()),
-                        'Message': 'Environment health has transitioned from Pending to Ok. Initialization completed 26 seconds ago and took 5 minutes.',
-                        'ApplicationName': 'eb-locust-example-windows-server',
-                        'EnvironmentName': 'eb-locust-example-windows-server-dev',
-                        'Severity': 'INFO'
-                    },
-                    {
-                        'EventDate': datetime.datetime(2018, 7, 19, 21, 49, 10, tzinfo=tz.tzutc()),
-                        'Message': "Nginx configuration detected in the '.ebextensions/nginx' directory. AWS Elastic Beanstalk will no longer manage the Nginx configuration for this environment.",
-                        'ApplicationName': 'eb-locust-example-windows-server',
-                        'EnvironmentName': 'eb-locust-example-windows-server-dev',
-                        'RequestId': 'a28c2685-b6a0-4785-82bf-45de6451bd01',
-                        'Severity': 'INFO'
-                    }
-                ]
-            )
-        ]
+        describe_events_mock.side_effect = [([event], None) for event in EVENTS]
         _sleep_mock.side_effect = [
             mock.MagicMock(),
             mock.MagicMock(),
@@ -80,46 +93,63 @@ class TestEventOps(unittest.TestCase):
                 mock.call("2018-07-19 21:49:10    INFO    Nginx configuration detected in the '.ebextensions/nginx' directory. AWS Elastic Beanstalk will no longer manage the Nginx configuration for this environment.")
             ]
         )
+        self.assertEqual(3, streamer_mock.stream_event.call_count)
         streamer_mock.end_stream.assert_called_once_with()
 
+    @mock.patch('ebcli.operations.eventsops.io.get_event_streamer')
+    @mock.patch('ebcli.operations.eventsops.elasticbeanstalk.describe_events')
+    @mock.patch('ebcli.operations.eventsops._sleep')
+    def test_follow_events__resumes_from_the_latest_archived_event(
+            self,
+            _sleep_mock,
+            describe_events_mock,
+            get_event_streamer_mock
+    ):
+        self.store.add(eventstore.stream_name('my-application', 'environment-1'), EVENTS[1:])
+        self.store.mark_synced_since(eventstore.stream_name('my-application', 'environment-1'), 0)
+        describe_events_mock.return_value = (EVENTS[:2], None)
+        _sleep_mock.side_effect = eventsops.EndOfTestError
+        streamer_mock = mock.MagicMock()
+        get_event_streamer_mock.return_value = streamer_mock
+
+        eventsops.follow_events('my-application', 'environment-1')
+
+        describe_events_mock.assert_called_once_with(
+            app_name='my-application',
+            env_name='environment-1',
+            platform_arn=None,
+            start_time=datetime.datetime(2018, 7, 19, 21, 50, 0, 909000, tzinfo=tz.tzutc()),
+            max_records=eventsops.MAX_EVENTS,
+            next_token=None
+        )
+        self.assertEqual(
+            [
+                "2018-07-19 21:49:10    INFO    Nginx configuration detected in the '.ebextensions/nginx' directory. AWS Elastic Beanstalk will no longer manage the Nginx configuration for this environment.",
+                '2018-07-19 21:50:00    INFO    Environment health has transitioned from Pending to Ok. Initialization completed 26 seconds ago and took 5 minutes.',
+                '2018-07-19 21:50:21    INFO    Successfully launched environment: eb-locust-example-windows-server-dev',
+            ],
+            [call[0][0] for call in streamer_mock.stream_event.call_args_list]
+        )
+
     @mock.patch('ebcli.operations.eventsops.io.echo_with_pager')
-    @mock.patch('ebcli.operations.eventsops.elasticbeanstalk.get_new_events')
+    @mock.patch('ebcli.operations.eventsops.elasticbeanstalk.describe_events')
     def test_print_events(
             self,
-            get_new_events_mock,
+            describe_events_mock,
             echo_with_pager_mock
     ):
-        get_new_events_mock.return_value = Event.json_to_event_objects(
-            [
-                {
-                    'EventDate': datetime.datetime(2018, 7, 19, 21, 50, 21, 623000, tzinfo=tz.tzutc()),
-                    'Message': 'Successfully launched environment: eb-locust-example-windows-server-dev',
-                    'ApplicationName': 'eb-locust-example-windows-server',
-                    'EnvironmentName': 'eb-locust-example-windows-server-dev',
-                    'RequestId': 'a28c2685-b6a0-4785-82bf-45de6451bd01',
-                    'Severity': 'INFO'
-                },
-                {
-                    'EventDate': datetime.datetime(2018, 7, 19, 21, 50, 0, 909000, tzinfo=tz.tzutc()),
-                    'Message': 'Environment health has transitioned from Pending to Ok. Initialization completed 26 seconds ago and took 5 minutes.',
-                    'ApplicationName': 'eb-locust-example-windows-server',
-                    'EnvironmentName': 'eb-locust-example-windows-server-dev',
-                    'Severity': 'INFO'
-                },
-                {
-                    'EventDate': datetime.datetime(2018, 7, 19, 21, 49, 10, tzinfo=tz.tzutc()),
-                    'Message': "Nginx configuration detected in the '.ebextensions/nginx' directory. AWS Elastic Beanstalk will no longer manage the Nginx configuration for this environment.",
-                    'ApplicationName': 'eb-locust-example-windows-server',
-                    'EnvironmentName': 'eb-locust-example-windows-server-dev',
-                    'RequestId': 'a28c2685-b6a0-4785-82bf-45de6451bd01',
-                    'Severity': 'INFO'
-                }
-            ]
-        )
+        describe_events_mock.return_value = (EVENTS, None)
 
         eventsops.print_events('my-application', 'environment-1', False)
 
-        get_new_events_mock.assert_called_once_with('my-application', 'environment-1', None, platform_arn=None)
+        describe_events_mock.assert_called_once_with(
+            app_name='my-application',
+            env_name='environment-1',
+            platform_arn=None,
+            start_time=None,
+            max_records=eventsops.MAX_EVENTS,
+            next_token=None
+        )
         echo_with_pager_mock.assert_called_once_with(
             os.linesep.join(
                 [
@@ -130,11 +160,81 @@ class TestEventOps(unittest.TestCase):
             )
         )
 
+    @mock.patch('ebcli.operations.eventsops.io.echo_with_pager')
+    @mock.patch('ebcli.operations.eventsops.elasticbeanstalk.describe_events')
+    def test_print_events__filters_the_archive_after_an_incremental_sync(
+            self,
+            describe_events_mock,
+            echo_with_pager_mock
+    ):
+        describe_events_mock.return_value = (EVENTS, None)
+        eventsops.print_events('my-application', 'environment-1', False)
+        describe_events_mock.reset_mock()
+        describe_events_mock.return_value = ([EVENTS[0]], None)
+
+        eventsops.print_events(
+            'my-application',
+            'environment-1',
+            False,
+            request_id='a28c2685-b6a0-4785-82bf-45de6451bd01'
+        )
+
+        describe_events_mock.assert_called_once_with(
+            app_name='my-application',
+            env_name='environment-1',
+            platform_arn=None,
+            start_time=datetime.datetime(2018, 7, 19, 21, 50, 21, 623000, tzinfo=tz.tzutc()),
+            max_records=eventsops.MAX_EVENTS,
+            next_token=None
+        )
+        echo_with_pager_mock.assert_called_with(
+            os.linesep.join(
+                [
+                    "2018-07-19 21:49:10    INFO    Nginx configuration detected in the '.ebextensions/nginx' directory. AWS Elastic Beanstalk will no longer manage the Nginx configuration for this environment.",
+                    '2018-07-19 21:50:21    INFO    Successfully launched environment: eb-locust-example-windows-server-dev',
+                ]
+            )
+        )
+
+    @mock.patch('ebcli.operations.eventsops.io.echo_with_pager')
+    @mock.patch('ebcli.operations.eventsops.elasticbeanstalk.describe_events')
+    def test_print_events__since_pages_back_beyond_the_archive(
+            self,
+            describe_events_mock,
+            echo_with_pager_mock
+    ):
+        describe_events_mock.side_effect = [
+            ([EVENTS[0]], 'next-page'),
+            ([EVENTS[0]], 'next-page'),
+            (EVENTS[1:], None),
+        ]
+        eventsops.print_events('my-application', 'environment-1', False)
+
+        eventsops.print_events('my-application', 'environment-1', False, since='2018-07-19T21:49:00Z')
+
+        self.assertEqual(
+            [None, 'next-page'],
+            [call[1]['next_token'] for call in describe_events_mock.call_args_list[1:]]
+        )
+        self.assertEqual(
+            datetime.datetime(2018, 7, 19, 21, 49, tzinfo=tz.tzutc()),
+            describe_events_mock.call_args_list[1][1]['start_time']
+        )
+        self.assertEqual(3, len(echo_with_pager_mock.call_args[0][0].split(os.linesep)))
+
     @mock.patch('ebcli.operations.eventsops.follow_events')
     def test_print_events__follow_events(
             self,
             follow_events_mock
     ):
-        eventsops.print_events('my-application', 'environment-1', True)
+        eventsops.print_events('my-application', 'environment-1', True, severity='WARN')
 
-        follow_events_mock.assert_called_once_with('my-application', 'environment-1', None)
+        follow_events_mock.assert_called_once_with(
+            'my-application',
+            'environment-1',
+            None,
+            since=None,
+            severity='WARN',
+            request_id=None,
+            version_label=None
+        )
@@ -0,0 +1,54 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import mock
+import unittest
+
+from ebcli.objects.application import Application
+from ebcli.operations import listops
+
+
+class TestListOps(unittest.TestCase):
+    @mock.patch('ebcli.operations.listops.aws.get_region_name')
+    @mock.patch('ebcli.operations.listops.elasticbeanstalk.get_all_applications')
+    @mock.patch('ebcli.operations.listops.elasticbeanstalk.get_environment_names')
+    @mock.patch('ebcli.operations.listops.commonops.get_current_branch_environment')
+    @mock.patch('ebcli.operations.listops.completioncache')
+    @mock.patch('ebcli.operations.listops.io.echo')
+    def test_list_env_names__all_applications_refresh_the_completion_cache(
+            self,
+            echo_mock,
+            completioncache_mock,
+            get_current_branch_environment_mock,
+            get_environment_names_mock,
+            get_all_applications_mock,
+            get_region_name_mock
+    ):
+        get_region_name_mock.return_value = 'us-west-2'
+        get_all_applications_mock.return_value = [
+            Application(name='app-1', versions=['v2', 'v1']),
+            Application(name='app-2', versions=[]),
+        ]
+        get_environment_names_mock.side_effect = [['env-2', 'env-1'], []]
+        get_current_branch_environment_mock.return_value = 'env-1'
+
+        listops.list_env_names(None, False, True)
+
+        completioncache_mock.replace_applications.assert_called_once_with(
+            'us-west-2',
+            {'app-1': ['v2', 'v1'], 'app-2': []}
+        )
+        completioncache_mock.replace_environments.assert_has_calls([
+            mock.call('us-west-2', {'app-1': ['env-1', 'env-2']}, app_name='app-1'),
+            mock.call('us-west-2', {'app-2': []}, app_name='app-2'),
+        ])
+        echo_mock.assert_has_calls([mock.call('* env-1'), mock.call('env-2')])
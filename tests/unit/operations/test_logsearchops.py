@@ -0,0 +1,155 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import json
+import os
+import shutil
+
+import mock
+import unittest
+
+from ebcli.objects.exceptions import InvalidOptionsError
+from ebcli.operations import logsearchops
+
+
+ENGINE_LOG = (
+    '2018/03/26 17:00:00.100 [INFO] Starting deployment\n'
+    '2018/03/26 17:00:05.000 [ERROR] Command failed\n'
+    'Traceback (most recent call last):\n'
+    '2018/03/26 17:00:10.000 [INFO] Deployment completed\n'
+)
+ACCESS_LOG = (
+    '10.0.0.1 - - [26/Mar/2018:17:00:03 +0000] "GET / HTTP/1.1" 200 612\n'
+    '10.0.0.1 - - [26/Mar/2018:17:00:07 +0000] "GET /health HTTP/1.1" 500 12\n'
+)
+
+
+class TestLogSearchOperations(unittest.TestCase):
+    def setUp(self):
+        self.root_dir = os.getcwd()
+        if os.path.isdir('testDir'):
+            shutil.rmtree('testDir')
+        self.bundle_location = os.path.abspath(os.path.join('testDir', '180326_170100'))
+        self._write('i-1/var/log/eb-engine.log', ENGINE_LOG)
+        self._write('i-2/var/log/nginx/access.log', ACCESS_LOG)
+
+    def tearDown(self):
+        os.chdir(self.root_dir)
+        shutil.rmtree('testDir')
+
+    def _write(self, relative_path, contents):
+        location = os.path.join(self.bundle_location, *relative_path.split('/'))
+        if not os.path.isdir(os.path.dirname(location)):
+            os.makedirs(os.path.dirname(location))
+        with open(location, 'wb') as f:
+            f.write(contents.encode('utf-8'))
+        return location
+
+    def _search(self, pattern, **kwargs):
+        return [
+            str(hit) for hit in logsearchops.search(self.bundle_location, pattern, **kwargs)
+        ]
+
+    def test_parse_timestamp(self):
+        self.assertEqual(1522083600100, logsearchops.parse_timestamp(b'2018/03/26 17:00:00.100 [INFO] x'))
+        self.assertEqual(1522083600000, logsearchops.parse_timestamp(b'[2018-03-26T17:00:00Z] INFO x'))
+        self.assertEqual(1522083600000, logsearchops.parse_timestamp(b'2018-03-26T10:00:00-07:00 x'))
+        self.assertEqual(
+            1522083600000,
+            logsearchops.parse_timestamp(b'10.0.0.1 - - [26/Mar/2018:19:00:00 +0200] "GET /"')
+        )
+        self.assertEqual(
+            1522083600000,
+            logsearchops.parse_timestamp(b'Mar 26 17:00:00 ip-10-0-0-1 systemd: x', default_year=2018)
+        )
+        self.assertIsNone(logsearchops.parse_timestamp(b'Traceback (most recent call last):'))
+
+    def test_search__merges_hits_across_instances_in_timestamp_order(self):
+        self.assertEqual(
+            [
+                'i-2/var/log/nginx/access.log:1: 10.0.0.1 - - [26/Mar/2018:17:00:03 +0000] "GET / HTTP/1.1" 200 612',
+                'i-1/var/log/eb-engine.log:2: 2018/03/26 17:00:05.000 [ERROR] Command failed',
+                'i-2/var/log/nginx/access.log:2: 10.0.0.1 - - [26/Mar/2018:17:00:07 +0000] "GET /health HTTP/1.1" 500 12',
+            ],
+            self._search(r'GET|ERROR')
+        )
+
+    def test_search__lines_without_timestamp_inherit_the_preceding_one(self):
+        hits = list(logsearchops.search(self.bundle_location, '^Traceback'))
+
+        self.assertEqual(1, len(hits))
+        self.assertEqual(1522083605000, hits[0].timestamp)
+        self.assertEqual(3, hits[0].line_number)
+
+    def test_search__time_window_and_instance(self):
+        self.assertEqual(
+            [
+                'i-1/var/log/eb-engine.log:2: 2018/03/26 17:00:05.000 [ERROR] Command failed',
+                'i-1/var/log/eb-engine.log:3: Traceback (most recent call last):',
+            ],
+            self._search('.', start_time=1522083604000, end_time=1522083610000, path_prefix='i-1')
+        )
+
+    def test_search__instance_matches_whole_path_components(self):
+        self._write('i-0abcd/var/log/eb-engine.log', ENGINE_LOG)
+        self._write('i-0abc/var/log/eb-engine.log', ENGINE_LOG)
+
+        self.assertEqual(
+            {'i-0abc/var/log/eb-engine.log'},
+            set(hit.path for hit in logsearchops.search(self.bundle_location, '.', path_prefix='i-0abc'))
+        )
+
+    def test_search__invalid_pattern(self):
+        with self.assertRaises(InvalidOptionsError):
+            self._search('(unclosed')
+
+    def test_build_index__reuses_index_of_unchanged_files(self):
+        logsearchops.build_index(self.bundle_location)
+
+        with mock.patch('ebcli.operations.logsearchops._index_file') as _index_file_mock:
+            self.assertEqual(1, len(self._search('Deployment completed')))
+            _index_file_mock.assert_not_called()
+
+    def test_build_index__reindexes_changed_files_and_forgets_deleted_ones(self):
+        logsearchops.build_index(self.bundle_location)
+        self._write('i-1/var/log/eb-engine.log', ENGINE_LOG + '2018/03/26 17:00:20.000 [INFO] Restarted\n')
+        os.remove(os.path.join(self.bundle_location, 'i-2', 'var', 'log', 'nginx', 'access.log'))
+
+        self.assertEqual(['i-1/var/log/eb-engine.log:5: 2018/03/26 17:00:20.000 [INFO] Restarted'], self._search('Restarted'))
+
+        with open(os.path.join(self.bundle_location, '.index', 'manifest.json')) as f:
+            manifest = json.load(f)
+        self.assertEqual(['i-1/var/log/eb-engine.log'], list(manifest['files']))
+        self.assertEqual(2, len(os.listdir(os.path.join(self.bundle_location, '.index'))) - 1)
+
+    def test_build_index__skips_binary_and_empty_files(self):
+        self._write('i-1/var/log/eb-engine.log.1.gz', '\x1f\x8b\x00\x00')
+        self._write('i-1/var/log/empty.log', '')
+
+        manifest = logsearchops.build_index(self.bundle_location)
+
+        self.assertIsNone(manifest['files']['i-1/var/log/eb-engine.log.1.gz']['index'])
+        self.assertIsNone(manifest['files']['i-1/var/log/empty.log']['index'])
+        self.assertEqual(
+            {'i-1/var/log/eb-engine.log'},
+            set(hit.path for hit in logsearchops.search(self.bundle_location, '.', path_prefix='i-1'))
+        )
+
+    @mock.patch('ebcli.operations.logsearchops.PROCESS_POOL_THRESHOLD', 0)
+    def test_search__in_process_pool(self):
+        self.assertEqual(
+            [
+                'i-1/var/log/eb-engine.log:1: 2018/03/26 17:00:00.100 [INFO] Starting deployment',
+                'i-1/var/log/eb-engine.log:4: 2018/03/26 17:00:10.000 [INFO] Deployment completed',
+            ],
+            self._search('INFO')
+        )
@@ -10,13 +10,16 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import collections
 import os
 import shutil
 import sys
+import threading
 
 import pytest
 import unittest
 import mock
+from six.moves.urllib.error import URLError
 
 from ebcli.operations import logsops
 from ebcli.objects.exceptions import (
@@ -71,88 +74,127 @@ class TestLogsOperations(unittest.TestCase):
 
     @mock.patch('ebcli.operations.logsops.io.get_event_streamer')
     @mock.patch('ebcli.operations.logsops.cloudwatch_log_stream_names')
-    @mock.patch('ebcli.operations.logsops._create_log_stream_for_log_group')
-    @mock.patch('ebcli.operations.logsops._delay_subsequent_stream_creation')
+    @mock.patch('ebcli.operations.logsops.cloudwatch.get_log_events')
     @mock.patch('ebcli.operations.logsops._wait_to_poll_cloudwatch')
     def test_stream_cloudwatch_logs(
             self,
             _wait_to_poll_cloudwatch_mock,
-            _delay_subsequent_stream_creation_mock,
-            _create_log_stream_for_log_group_mock,
+            get_log_events_mock,
             cloudwatch_log_stream_names_mock,
             get_event_streamer_mock,
     ):
         streamer = mock.MagicMock()
         get_event_streamer_mock.return_value = streamer
         _wait_to_poll_cloudwatch_mock.side_effect = KeyboardInterrupt
-        _delay_subsequent_stream_creation_mock.return_value = None
-        cloudwatch_log_stream_names_mock.return_value = ['log_group_1', 'log_group_2']
-
-        calls = [
-            mock.call('/aws/elasticbeanstalk/my_environment', 'log_group_1', streamer, 0, None),
-            mock.call('/aws/elasticbeanstalk/my_environment', 'log_group_2', streamer, 0, None),
-        ]
-
-        try:
+        cloudwatch_log_stream_names_mock.return_value = ['i-1', 'i-2']
+        get_log_events_mock.side_effect = lambda log_group, stream_name, **kwargs: {
+            'i-1': {'events': [{'timestamp': 3, 'message': 'third\n'}, {'timestamp': 1, 'message': 'first'}],
+                    'nextForwardToken': 'f/i-1'},
+            'i-2': {'events': [{'timestamp': 2, 'message': 'second'}], 'nextForwardToken': 'f/i-2'},
+        }[stream_name]
+
+        with self.assertRaises(KeyboardInterrupt):
             logsops.stream_instance_logs_from_cloudwatch(
                 sleep_time=0,
                 log_group='/aws/elasticbeanstalk/my_environment',
-                specific_log_stream='i-213123qsdasdad'
+                specific_log_stream='i-'
             )
-        except KeyboardInterrupt:
-            pass
 
-        _create_log_stream_for_log_group_mock.assert_has_calls(calls, any_order=True)
+        cloudwatch_log_stream_names_mock.assert_called_once_with('/aws/elasticbeanstalk/my_environment', 'i-')
+        streamer.stream_event.assert_has_calls(
+            [
+                mock.call('[i-1] first'),
+                mock.call('[i-2] second'),
+                mock.call('[i-1] third'),
+            ]
+        )
+        streamer.end_stream.assert_called_once_with()
 
     @mock.patch('ebcli.operations.logsops.io.get_event_streamer')
     @mock.patch('ebcli.operations.logsops.cloudwatch_log_stream_names')
-    @mock.patch('ebcli.operations.logsops._create_log_stream_for_log_group')
-    @mock.patch('ebcli.operations.logsops._delay_subsequent_stream_creation')
-    @mock.patch('ebcli.operations.logsops._wait_to_poll_cloudwatch')
-    @mock.patch('ebcli.operations.logsops._updated_start_time')
-    def test_stream_cloudwatch_logs__multiple_times(
+    def test_stream_environment_health_logs_from_cloudwatch__no_log_streams(
             self,
-            _updated_start_time_mock,
-            _wait_to_poll_cloudwatch_mock,
-            _delay_subsequent_stream_creation_mock,
-            _create_log_stream_for_log_group_mock,
             cloudwatch_log_stream_names_mock,
             get_event_streamer_mock,
     ):
-        streamer = mock.MagicMock()
-        _updated_start_time_mock.return_value = '1231231231234'
-        get_event_streamer_mock.return_value = streamer
-        _wait_to_poll_cloudwatch_mock.side_effect = [None, KeyboardInterrupt]
-        _delay_subsequent_stream_creation_mock.return_value = None
-        cloudwatch_log_stream_names_mock.return_value = ['log_group_1']
+        cloudwatch_log_stream_names_mock.return_value = []
+
+        logsops.stream_environment_health_logs_from_cloudwatch(
+            log_group='/aws/elasticbeanstalk/my_environment/environment-health.log'
+        )
 
-        calls = [
-            mock.call('/aws/elasticbeanstalk/my_environment', 'log_group_1', streamer, 0, None),
-            mock.call('/aws/elasticbeanstalk/my_environment', 'log_group_1', streamer, 0, '1231231231234'),
+        get_event_streamer_mock.assert_not_called()
+
+    @mock.patch('ebcli.operations.logsops.cloudwatch_log_stream_names')
+    @mock.patch('ebcli.operations.logsops.cloudwatch.get_log_events')
+    @mock.patch('ebcli.operations.logsops._updated_start_time')
+    @mock.patch('ebcli.operations.logsops.time.time')
+    def test_cloudwatch_log_tail__follows_forward_tokens_and_backs_off_idle_streams(
+            self,
+            time_mock,
+            _updated_start_time_mock,
+            get_log_events_mock,
+            cloudwatch_log_stream_names_mock,
+    ):
+        time_mock.return_value = 100
+        _updated_start_time_mock.return_value = 1000000
+        cloudwatch_log_stream_names_mock.return_value = ['i-1']
+        get_log_events_mock.side_effect = [
+            {'events': [{'timestamp': 1, 'message': 'hello'}], 'nextForwardToken': 'f/1'},
+            {'events': [], 'nextForwardToken': 'f/1'},
+            {'events': [], 'nextForwardToken': 'f/1'},
         ]
+        tail = logsops.CloudWatchLogTail('my-group', min_interval=1, max_interval=3, discovery_interval=60)
+
+        self.assertEqual([(1, 'i-1', 'hello')], tail.poll())
+        self.assertEqual(1, tail.seconds_until_next_poll())
+        time_mock.return_value = 101
+        self.assertEqual([], tail.poll())
+        self.assertEqual(2, tail.seconds_until_next_poll())
+        time_mock.return_value = 103
+        self.assertEqual([], tail.poll())
+        self.assertEqual(3, tail.seconds_until_next_poll())
+        time_mock.return_value = 104
+        self.assertEqual([], tail.poll())
+        tail.close()
+
+        get_log_events_mock.assert_has_calls(
+            [
+                mock.call('my-group', 'i-1', start_from_head=True, start_time=1000000 - logsops.STREAM_BACKLOG),
+                mock.call('my-group', 'i-1', next_token='f/1', start_from_head=True),
+                mock.call('my-group', 'i-1', next_token='f/1', start_from_head=True),
+            ]
+        )
+        self.assertEqual(3, get_log_events_mock.call_count)
+        cloudwatch_log_stream_names_mock.assert_called_once_with('my-group', None)
 
-        try:
-            logsops.stream_instance_logs_from_cloudwatch(
-                sleep_time=0,
-                log_group='/aws/elasticbeanstalk/my_environment',
-                specific_log_stream='i-213123qsdasdad'
-            )
-        except KeyboardInterrupt:
-            pass
+    @mock.patch('ebcli.operations.logsops.cloudwatch_log_stream_names')
+    @mock.patch('ebcli.operations.logsops.cloudwatch.get_log_events')
+    @mock.patch('ebcli.operations.logsops.time.time')
+    def test_cloudwatch_log_tail__discovers_new_streams_and_drops_deleted_streams(
+            self,
+            time_mock,
+            get_log_events_mock,
+            cloudwatch_log_stream_names_mock,
+    ):
+        time_mock.return_value = 100
+        cloudwatch_log_stream_names_mock.side_effect = [['i-1', 'i-2'], ['i-1', 'i-3']]
 
-        _create_log_stream_for_log_group_mock.assert_has_calls(calls, any_order=True)
+        def get_log_events(log_group, stream_name, **kwargs):
+            if stream_name == 'i-2':
+                raise NotFoundError('stream deleted')
+            return {'events': [{'timestamp': 5, 'message': stream_name}], 'nextForwardToken': 'f'}
 
-    def test_create_log_stream_for_log_group(self):
-        streamer = mock.MagicMock()
+        get_log_events_mock.side_effect = get_log_events
+        tail = logsops.CloudWatchLogTail('my-group', min_interval=1, max_interval=10, discovery_interval=30)
 
-        with mock.patch('ebcli.operations.logsops.stream_single_stream'):
-            for i in range(1, 3):
-                logsops._create_log_stream_for_log_group(
-                    '/aws/elasticbeanstalk/my_environment',
-                    'log_group_2',
-                    streamer,
-                    0
-                )
+        self.assertEqual([(5, 'i-1', 'i-1')], tail.poll())
+        self.assertEqual(['i-1'], list(tail.streams))
+
+        time_mock.return_value = 130
+        self.assertEqual([(5, 'i-1', 'i-1'), (5, 'i-3', 'i-3')], tail.poll())
+        self.assertEqual(['i-1', 'i-3'], sorted(tail.streams))
+        tail.close()
 
     @mock.patch('ebcli.operations.logsops.commonops.update_environment')
     @mock.patch('ebcli.operations.logsops.instance_log_streaming_enabled')
@@ -907,12 +949,14 @@ class TestLogsOperations(unittest.TestCase):
         self.assertEqual('tail', logsops.resolve_log_result_type(None, None))
 
     @mock.patch('ebcli.operations.logsops.get_cloudwatch_log_stream_events')
-    @mock.patch('ebcli.operations.logsops.io.echo_with_pager')
+    @mock.patch('ebcli.operations.logsops.io.echo_with_pager_incrementally')
     def test_stream_logs_in_terminal(
             self,
-            echo_with_pager_mock,
+            echo_with_pager_incrementally_mock,
             get_cloudwatch_stream_logs_for_instance_mock
     ):
+        paged_output = []
+        echo_with_pager_incrementally_mock.side_effect = lambda chunks: paged_output.append(''.join(chunks))
         log_stream_1_events = """[my_log_stream_1] [2018-03-19T23:19:55.811Z] INFO  [2810]  - [Initialization] : Starting activity...
 [my_log_stream] [2018-03-19T23:19:55.811Z] INFO  [2810]  - [Initialization/AddonsBefore] : Starting activity..."""
 
@@ -926,17 +970,20 @@ class TestLogsOperations(unittest.TestCase):
 
         logsops.stream_logs_in_terminal('log_group', ['log_stream_1', 'log_stream_2'])
 
-        echo_with_pager_mock.assert_called_with(
-            '{linesep}{linesep}============= log_stream_1 - log_group =============={linesep}{linesep}'
-            '[my_log_stream_1] [2018-03-19T23:19:55.811Z] INFO  [2810]  - [Initialization] : Starting activity...\n'
-            '[my_log_stream] [2018-03-19T23:19:55.811Z] INFO  [2810]  - [Initialization/AddonsBefore] : Starting activity...'
-            '{linesep}'
-            '{linesep}============= log_stream_2 - log_group =============={linesep}'
-            '{linesep}'
-            '[my_log_stream_2] [2018-03-19T23:19:55.811Z] INFO  [2810]  - [Initialization] : Starting activity...\n'
-            '[my_log_stream] [2018-03-19T23:19:55.811Z] INFO  [2810]  - [Initialization/AddonsBefore] : Starting activity...'.format(
-                linesep=os.linesep
-            )
+        self.assertEqual(
+            [
+                '{linesep}{linesep}============= log_stream_1 - log_group =============={linesep}{linesep}'
+                '[my_log_stream_1] [2018-03-19T23:19:55.811Z] INFO  [2810]  - [Initialization] : Starting activity...\n'
+                '[my_log_stream] [2018-03-19T23:19:55.811Z] INFO  [2810]  - [Initialization/AddonsBefore] : Starting activity...'
+                '{linesep}'
+                '{linesep}============= log_stream_2 - log_group =============={linesep}'
+                '{linesep}'
+                '[my_log_stream_2] [2018-03-19T23:19:55.811Z] INFO  [2810]  - [Initialization] : Starting activity...\n'
+                '[my_log_stream] [2018-03-19T23:19:55.811Z] INFO  [2810]  - [Initialization/AddonsBefore] : Starting activity...'.format(
+                    linesep=os.linesep
+                )
+            ],
+            paged_output
         )
 
     @mock.patch('ebcli.operations.logsops.cloudwatch.get_all_stream_names')
@@ -974,21 +1021,24 @@ class TestLogsOperations(unittest.TestCase):
         reason="`os` module does not define `symlink` function for Python 2.7 on Windows"
     )
     @mock.patch('ebcli.operations.logsops.cloudwatch.get_all_stream_names')
-    @mock.patch('ebcli.operations.logsops.get_cloudwatch_log_stream_events')
+    @mock.patch('ebcli.operations.logsops.cloudwatch.get_log_events')
     def test_retrieve_cloudwatch_logs__info_type_bundle(
             self,
-            get_cloudwatch_log_stream_events_mock,
+            get_log_events_mock,
             get_all_stream_names_mock
     ):
         os.mkdir('.elasticbeanstalk')
 
         get_all_stream_names_mock.return_value = ['log_stream_1']
-        get_cloudwatch_log_stream_events_mock.return_value = 'These are the full logs\\xe2\\x96'
+        get_log_events_mock.side_effect = [
+            {'events': [{'message': 'These are the full logs\\xe2\\x96'}], 'nextForwardToken': 'f/1'},
+            {'events': [], 'nextForwardToken': 'f/1'},
+        ]
 
         logsops.retrieve_cloudwatch_logs('some_log_group', 'bundle')
 
         self.assertEqual(
-            'These are the full logs\\xe2\\x96',
+            '[log_stream_1] These are the full logs\\xe2\\x96\n',
             open(os.path.join('.elasticbeanstalk', 'logs', 'latest', 'log_stream_1.log')).read()
         )
 
@@ -998,10 +1048,10 @@ class TestLogsOperations(unittest.TestCase):
     )
     @mock.patch('ebcli.operations.logsops._timestamped_directory_name')
     @mock.patch('ebcli.operations.logsops.cloudwatch.get_all_stream_names')
-    @mock.patch('ebcli.operations.logsops.get_cloudwatch_log_stream_events')
+    @mock.patch('ebcli.operations.logsops.cloudwatch.get_log_events')
     def test_retrieve_cloudwatch_logs__info_type_bundle__multiple_retrieves(
             self,
-            get_cloudwatch_log_stream_events_mock,
+            get_log_events_mock,
             get_all_stream_names_mock,
             _timestamped_directory_name_mock
     ):
@@ -1012,32 +1062,41 @@ class TestLogsOperations(unittest.TestCase):
             '180417_175450'
         ]
         get_all_stream_names_mock.return_value = ['log_stream_1']
-        get_cloudwatch_log_stream_events_mock.return_value = 'These are the full logs\\xe2\\x96'
+        get_log_events_mock.side_effect = [
+            {'events': [{'message': 'These are the full logs\\xe2\\x96'}], 'nextForwardToken': 'f/1'},
+            {'events': [], 'nextForwardToken': 'f/1'},
+        ]
         logsops.retrieve_cloudwatch_logs('some_log_group', 'bundle')
         self.assertEqual(
-            'These are the full logs\\xe2\\x96',
+            '[log_stream_1] These are the full logs\\xe2\\x96\n',
             open(os.path.join('.elasticbeanstalk', 'logs', 'latest', 'log_stream_1.log')).read()
         )
 
         get_all_stream_names_mock.return_value = ['log_stream_2']
-        get_cloudwatch_log_stream_events_mock.return_value = 'These are also the full logs\\xe2\\x96'
+        get_log_events_mock.side_effect = [
+            {'events': [{'message': 'These are also the full logs\\xe2\\x96'}], 'nextForwardToken': 'f/1'},
+            {'events': [], 'nextForwardToken': 'f/1'},
+        ]
         logsops.retrieve_cloudwatch_logs('some_log_group', 'bundle')
         self.assertEqual(
-            'These are also the full logs\\xe2\\x96',
+            '[log_stream_2] These are also the full logs\\xe2\\x96\n',
             open(os.path.join('.elasticbeanstalk', 'logs', 'latest', 'log_stream_2.log')).read()
         )
 
     @mock.patch('ebcli.operations.logsops.cloudwatch.get_all_stream_names')
-    @mock.patch('ebcli.operations.logsops.get_cloudwatch_log_stream_events')
+    @mock.patch('ebcli.operations.logsops.cloudwatch.get_log_events')
     def test_retrieve_cloudwatch_logs__info_type_bundle__create_zip(
             self,
-            get_cloudwatch_log_stream_events_mock,
+            get_log_events_mock,
             get_all_stream_names_mock
     ):
         os.mkdir('.elasticbeanstalk')
 
         get_all_stream_names_mock.return_value = ['log_stream_1']
-        get_cloudwatch_log_stream_events_mock.return_value = 'These are the full logs\\xe2\\x96'
+        get_log_events_mock.side_effect = [
+            {'events': [{'message': 'These are the full logs\\xe2\\x96'}], 'nextForwardToken': 'f/1'},
+            {'events': [], 'nextForwardToken': 'f/1'},
+        ]
 
         logsops.retrieve_cloudwatch_logs('some_log_group', 'bundle', do_zip=True)
 
@@ -1049,16 +1108,19 @@ class TestLogsOperations(unittest.TestCase):
         reason="`os` module does not define `symlink` function for Python 2.7 on Windows"
     )
     @mock.patch('ebcli.operations.logsops.cloudwatch.get_all_stream_names')
-    @mock.patch('ebcli.operations.logsops.get_cloudwatch_log_stream_events')
+    @mock.patch('ebcli.operations.logsops.cloudwatch.get_log_events')
     def test_retrieve_cloudwatch_logs__info_type_bundle__environment_health_source(
             self,
-            get_cloudwatch_log_stream_events_mock,
+            get_log_events_mock,
             get_all_stream_names_mock
     ):
         os.mkdir('.elasticbeanstalk')
 
         get_all_stream_names_mock.return_value = ['log_stream_1']
-        get_cloudwatch_log_stream_events_mock.return_value = 'These are the full logs\\xe2\\x96'
+        get_log_events_mock.side_effect = [
+            {'events': [{'message': 'These are the full logs\\xe2\\x96'}], 'nextForwardToken': 'f/1'},
+            {'events': [], 'nextForwardToken': 'f/1'},
+        ]
 
         logsops.retrieve_cloudwatch_logs(
             'some_log_group',
@@ -1067,21 +1129,24 @@ class TestLogsOperations(unittest.TestCase):
         )
 
         self.assertEqual(
-            'These are the full logs\\xe2\\x96',
+            '[log_stream_1] These are the full logs\\xe2\\x96\n',
             open(os.path.join('.elasticbeanstalk', 'logs', 'environment-health', 'latest', 'log_stream_1.log')).read()
         )
 
     @mock.patch('ebcli.operations.logsops.cloudwatch.get_all_stream_names')
-    @mock.patch('ebcli.operations.logsops.get_cloudwatch_log_stream_events')
+    @mock.patch('ebcli.operations.logsops.cloudwatch.get_log_events')
     def test_retrieve_cloudwatch_logs__info_type_bundle__environment_health_log_source__create_zip(
             self,
-            get_cloudwatch_log_stream_events_mock,
+            get_log_events_mock,
             get_all_stream_names_mock
     ):
         os.mkdir('.elasticbeanstalk')
 
         get_all_stream_names_mock.return_value = ['log_stream_1']
-        get_cloudwatch_log_stream_events_mock.return_value = 'These are the full logs\\xe2\\x96'
+        get_log_events_mock.side_effect = [
+            {'events': [{'message': 'These are the full logs\\xe2\\x96'}], 'nextForwardToken': 'f/1'},
+            {'events': [], 'nextForwardToken': 'f/1'},
+        ]
 
         logsops.retrieve_cloudwatch_logs(
             'some_log_group',
@@ -1093,6 +1158,64 @@ class TestLogsOperations(unittest.TestCase):
         logs_dir_contents = os.listdir(os.path.join('.elasticbeanstalk', 'logs', 'environment-health'))
         self.assertEqual('.zip', logs_dir_contents[0][-4:])
 
+    @mock.patch('ebcli.operations.logsops.cloudwatch.get_log_events')
+    def test_export_cloudwatch_log_stream__pages_until_forward_token_repeats(
+            self,
+            get_log_events_mock
+    ):
+        get_log_events_mock.side_effect = [
+            {'events': [{'message': 'one\n'}, {'message': 'two'}], 'nextForwardToken': 'f/1'},
+            {'events': [{'message': 'three'}], 'nextForwardToken': 'f/2'},
+            {'events': [], 'nextForwardToken': 'f/2'},
+        ]
+
+        self.assertEqual(
+            3,
+            logsops.export_cloudwatch_log_stream('my-group', 'i-1', 'i-1.log', start_time=100, end_time=200)
+        )
+
+        with open('i-1.log') as log_file:
+            self.assertEqual('[i-1] one\n[i-1] two\n[i-1] three\n', log_file.read())
+        get_log_events_mock.assert_has_calls(
+            [
+                mock.call('my-group', 'i-1', next_token=None, start_from_head=True, start_time=100, end_time=200),
+                mock.call('my-group', 'i-1', next_token='f/1', start_from_head=True, start_time=100, end_time=200),
+                mock.call('my-group', 'i-1', next_token='f/2', start_from_head=True, start_time=100, end_time=200),
+            ]
+        )
+
+    @mock.patch('ebcli.operations.logsops.io.log_warning')
+    @mock.patch('ebcli.operations.logsops.cloudwatch.get_log_events')
+    def test_export_cloudwatch_logs__reports_streams_which_fail_and_exports_others(
+            self,
+            get_log_events_mock,
+            log_warning_mock
+    ):
+        def get_log_events(log_group_name, stream_name, **kwargs):
+            if stream_name == 'i-2':
+                raise ServiceError('Rate exceeded')
+            if kwargs['next_token']:
+                return {'events': [], 'nextForwardToken': kwargs['next_token']}
+            return {'events': [{'message': stream_name}], 'nextForwardToken': 'f/1'}
+
+        get_log_events_mock.side_effect = get_log_events
+        os.mkdir('logs')
+
+        logsops.export_cloudwatch_logs('my-group', ['i-1', 'i-2', 'i-3'], 'logs', thread_count=2)
+
+        self.assertEqual(['i-1.log', 'i-2.log', 'i-3.log'], sorted(os.listdir('logs')))
+        with open(os.path.join('logs', 'i-3.log')) as log_file:
+            self.assertEqual('[i-3] i-3\n', log_file.read())
+        log_warning_mock.assert_called_once_with('Unable to retrieve the logs of i-2: Rate exceeded')
+
+    def test_parse_log_time(self):
+        self.assertEqual(1522083600000, logsops.parse_log_time('2018-03-26T17:00:00Z'))
+        self.assertEqual(1522083600250, logsops.parse_log_time('2018-03-26 17:00:00.250'))
+        self.assertEqual(1522083600000, logsops.parse_log_time('2018-03-26T10:00:00-07:00'))
+
+        with self.assertRaises(InvalidOptionsError):
+            logsops.parse_log_time('yesterday-ish')
+
     @mock.patch('ebcli.operations.logsops.instance_log_streaming_enabled')
     def test_raise_if_instance_log_streaming_is_not_enabled__not_enabled__raises_exception(
             self,
@@ -1408,13 +1531,15 @@ class TestLogsOperations(unittest.TestCase):
         logsops._raise_if_environment_is_not_using_enhanced_health(describe_configuration_settings)
 
 
-    @mock.patch('ebcli.operations.logsops.io.echo_with_pager')
+    @mock.patch('ebcli.operations.logsops.io.echo_with_pager_incrementally')
     @mock.patch('ebcli.operations.logsops.utils.get_data_from_url')
     def test_handle_tail_logs(
             self,
             get_data_from_url_mock,
-            echo_with_pager_mock
+            echo_with_pager_incrementally_mock
     ):
+        paged_output = []
+        echo_with_pager_incrementally_mock.side_effect = lambda chunks: paged_output.append(''.join(chunks))
         get_data_from_url_mock.return_value = mock_logs.INSTANCE_TAIL_LOGS_RESPONSE
         logsops._handle_tail_logs(
             {
@@ -1423,25 +1548,63 @@ class TestLogsOperations(unittest.TestCase):
             }
         )
 
-        # six.iteritems does not guarantee order in which key, value pairs of a dict are parsed
-        try:
-            echo_with_pager_mock.assert_called_with(
+        self.assertEqual(
+            [
                 os.linesep.join(
                     [
                         '============= i-090689581e5afcfc6 =============={linesep}-------------------------------------\n/var/log/awslogs.log\n-------------------------------------\n{\'skipped_events_count\': 0, \'first_event\': {\'timestamp\': 1522962583519, \'start_position\': 559799L, \'end_position\': 560017L}, \'fallback_events_count\': 0, \'last_event\': {\'timestamp\': 1522962583519, \'start_position\': 559799L, \'end_position\': 560017L}, \'source_id\': \'77b026040b93055eb448bdc0b59e446f\', \'num_of_events\': 1, \'batch_size_in_bytes\': 243}\n\n\n\n-------------------------------------\n/var/log/httpd/error_log\n-------------------------------------\n[Thu Apr 05 19:54:23.624780 2018] [mpm_prefork:warn] [pid 3470] AH00167: long lost child came home! (pid 3088)\n\n\n\n-------------------------------------\n/var/log/httpd/access_log\n-------------------------------------\n172.31.69.153 (94.208.192.103) - - [05/Apr/2018:20:57:55 +0000] "HEAD /pma/ HTTP/1.1" 404 - "-" "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/63.0.3239.132 Safari/537.36"\n\n\n\n-------------------------------------\n/var/log/eb-activity.log\n-------------------------------------\n  + chown -R webapp:webapp /var/app/ondeck\n[2018-04-05T19:54:21.630Z] INFO  [3555]  - [Application update app-180406_044630@3/AppDeployStage0/AppDeployPreHook/02_setup_envvars.sh] : Starting activity...\n\n\n-------------------------------------\n/tmp/sample-app.log\n-------------------------------------\n2018-04-05 20:52:51 Received message: \\xe2\\x96\\x88\\xe2\n\n\n\n-------------------------------------\n/var/log/eb-commandprocessor.log\n-------------------------------------\n[2018-04-05T19:45:05.526Z] INFO  [2853]  : Running 2 of 2 actions: AppDeployPostHook...',
                         '============= i-053efe7c102d0a540 =============={linesep}-------------------------------------\n/var/log/awslogs.log\n-------------------------------------\n{\'skipped_events_count\': 0, \'first_event\': {\'timestamp\': 1522962583519, \'start_position\': 559799L, \'end_position\': 560017L}, \'fallback_events_count\': 0, \'last_event\': {\'timestamp\': 1522962583519, \'start_position\': 559799L, \'end_position\': 560017L}, \'source_id\': \'77b026040b93055eb448bdc0b59e446f\', \'num_of_events\': 1, \'batch_size_in_bytes\': 243}\n\n\n\n-------------------------------------\n/var/log/httpd/error_log\n-------------------------------------\n[Thu Apr 05 19:54:23.624780 2018] [mpm_prefork:warn] [pid 3470] AH00167: long lost child came home! (pid 3088)\n\n\n\n-------------------------------------\n/var/log/httpd/access_log\n-------------------------------------\n172.31.69.153 (94.208.192.103) - - [05/Apr/2018:20:57:55 +0000] "HEAD /pma/ HTTP/1.1" 404 - "-" "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/63.0.3239.132 Safari/537.36"\n\n\n\n-------------------------------------\n/var/log/eb-activity.log\n-------------------------------------\n  + chown -R webapp:webapp /var/app/ondeck\n[2018-04-05T19:54:21.630Z] INFO  [3555]  - [Application update app-180406_044630@3/AppDeployStage0/AppDeployPreHook/02_setup_envvars.sh] : Starting activity...\n\n\n-------------------------------------\n/tmp/sample-app.log\n-------------------------------------\n2018-04-05 20:52:51 Received message: \\xe2\\x96\\x88\\xe2\n\n\n\n-------------------------------------\n/var/log/eb-commandprocessor.log\n-------------------------------------\n[2018-04-05T19:45:05.526Z] INFO  [2853]  : Running 2 of 2 actions: AppDeployPostHook...',
                     ]
                 ).replace('{linesep}', os.linesep)
+            ],
+            paged_output
+        )
+        get_data_from_url_mock.assert_called_with(
+            'https://elasticbeanstalk-us-east-1-1231231231234.s3.amazonaws.com/resources/environments/logs/tail/e-spfgk5xbd',
+            timeout=logsops.TAIL_FETCH_TIMEOUT
+        )
+
+    @mock.patch('ebcli.operations.logsops.TAIL_FETCH_TIMEOUT', 0.1)
+    @mock.patch('ebcli.operations.logsops.io.echo_with_pager_incrementally')
+    @mock.patch('ebcli.operations.logsops.utils.get_data_from_url')
+    def test_handle_tail_logs__failed_and_slow_instances_do_not_hold_up_others(
+            self,
+            get_data_from_url_mock,
+            echo_with_pager_incrementally_mock
+    ):
+        release_slow_instance = threading.Event()
+
+        def get_data_from_url(url, timeout):
+            if url == 'slow':
+                release_slow_instance.wait(5)
+            if url == 'failing':
+                raise URLError('connection refused')
+            return url.encode('utf-8')
+
+        paged_output = []
+        echo_with_pager_incrementally_mock.side_effect = lambda chunks: paged_output.append(''.join(chunks))
+        get_data_from_url_mock.side_effect = get_data_from_url
+
+        try:
+            logsops._handle_tail_logs(
+                collections.OrderedDict(
+                    [('i-1', 'slow'), ('i-2', 'failing'), ('i-3', 'tail of i-3')]
+                )
             )
-        except AssertionError:
-            echo_with_pager_mock.assert_called_with(
-                os.linesep.join(
-                    [
-                        '============= i-053efe7c102d0a540 =============={linesep}-------------------------------------\n/var/log/awslogs.log\n-------------------------------------\n{\'skipped_events_count\': 0, \'first_event\': {\'timestamp\': 1522962583519, \'start_position\': 559799L, \'end_position\': 560017L}, \'fallback_events_count\': 0, \'last_event\': {\'timestamp\': 1522962583519, \'start_position\': 559799L, \'end_position\': 560017L}, \'source_id\': \'77b026040b93055eb448bdc0b59e446f\', \'num_of_events\': 1, \'batch_size_in_bytes\': 243}\n\n\n\n-------------------------------------\n/var/log/httpd/error_log\n-------------------------------------\n[Thu Apr 05 19:54:23.624780 2018] [mpm_prefork:warn] [pid 3470] AH00167: long lost child came home! (pid 3088)\n\n\n\n-------------------------------------\n/var/log/httpd/access_log\n-------------------------------------\n172.31.69.153 (94.208.192.103) - - [05/Apr/2018:20:57:55 +0000] "HEAD /pma/ HTTP/1.1" 404 - "-" "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/63.0.3239.132 Safari/537.36"\n\n\n\n-------------------------------------\n/var/log/eb-activity.log\n-------------------------------------\n  + chown -R webapp:webapp /var/app/ondeck\n[2018-04-05T19:54:21.630Z] INFO  [3555]  - [Application update app-180406_044630@3/AppDeployStage0/AppDeployPreHook/02_setup_envvars.sh] : Starting activity...\n\n\n-------------------------------------\n/tmp/sample-app.log\n-------------------------------------\n2018-04-05 20:52:51 Received message: \\xe2\\x96\\x88\\xe2\n\n\n\n-------------------------------------\n/var/log/eb-commandprocessor.log\n-------------------------------------\n[2018-04-05T19:45:05.526Z] INFO  [2853]  : Running 2 of 2 actions: AppDeployPostHook...',
-                        '============= i-090689581e5afcfc6 =============={linesep}-------------------------------------\n/var/log/awslogs.log\n-------------------------------------\n{\'skipped_events_count\': 0, \'first_event\': {\'timestamp\': 1522962583519, \'start_position\': 559799L, \'end_position\': 560017L}, \'fallback_events_count\': 0, \'last_event\': {\'timestamp\': 1522962583519, \'start_position\': 559799L, \'end_position\': 560017L}, \'source_id\': \'77b026040b93055eb448bdc0b59e446f\', \'num_of_events\': 1, \'batch_size_in_bytes\': 243}\n\n\n\n-------------------------------------\n/var/log/httpd/error_log\n-------------------------------------\n[Thu Apr 05 19:54:23.624780 2018] [mpm_prefork:warn] [pid 3470] AH00167: long lost child came home! (pid 3088)\n\n\n\n-------------------------------------\n/var/log/httpd/access_log\n-------------------------------------\n172.31.69.153 (94.208.192.103) - - [05/Apr/2018:20:57:55 +0000] "HEAD /pma/ HTTP/1.1" 404 - "-" "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/63.0.3239.132 Safari/537.36"\n\n\n\n-------------------------------------\n/var/log/eb-activity.log\n-------------------------------------\n  + chown -R webapp:webapp /var/app/ondeck\n[2018-04-05T19:54:21.630Z] INFO  [3555]  - [Application update app-180406_044630@3/AppDeployStage0/AppDeployPreHook/02_setup_envvars.sh] : Starting activity...\n\n\n-------------------------------------\n/tmp/sample-app.log\n-------------------------------------\n2018-04-05 20:52:51 Received message: \\xe2\\x96\\x88\\xe2\n\n\n\n-------------------------------------\n/var/log/eb-commandprocessor.log\n-------------------------------------\n[2018-04-05T19:45:05.526Z] INFO  [2853]  : Running 2 of 2 actions: AppDeployPostHook...',
-                    ]
-                ).replace('{linesep}', os.linesep)
-            )
+        finally:
+            release_slow_instance.set()
+
+        self.assertEqual(
+            [
+                '============= i-1 =============={linesep}'
+                'Timed out after 0.1 seconds retrieving the tail logs of this instance.{linesep}'
+                '============= i-2 =============={linesep}'
+                'Unable to retrieve the tail logs of this instance: <urlopen error connection refused>{linesep}'
+                '============= i-3 =============={linesep}'
+                'tail of i-3'.format(linesep=os.linesep)
+            ],
+            paged_output
+        )
 
 
 class TestSetupLogs(unittest.TestCase):
@@ -1785,3 +1948,44 @@ class TestSetupLogs(unittest.TestCase):
             '/aws/elasticbeanstalk/platform/my-platform',
             4
         )
+
+    @mock.patch('ebcli.operations.logsops.fileoperations.get_logs_location')
+    @mock.patch('ebcli.operations.logsops.io.echo')
+    def test_search_retrieved_logs(
+            self,
+            echo_mock,
+            get_logs_location_mock
+    ):
+        bundle_location = os.path.abspath(os.path.join('logs', '180326_170100'))
+        os.makedirs(os.path.join(bundle_location, 'i-1'))
+        os.makedirs(os.path.join(bundle_location, 'i-2'))
+        with open(os.path.join(bundle_location, 'i-1', 'eb-engine.log'), 'w') as log_file:
+            log_file.write('2018/03/26 17:00:05 [ERROR] Command failed\n2018/03/26 17:00:06 [INFO] Retrying\n')
+        with open(os.path.join(bundle_location, 'i-2', 'eb-engine.log'), 'w') as log_file:
+            log_file.write('2018/03/26 17:00:01 [ERROR] Disk full\n')
+        get_logs_location_mock.return_value = bundle_location
+
+        logsops.search_retrieved_logs('ERROR')
+
+        get_logs_location_mock.assert_called_once_with('latest')
+        echo_mock.assert_has_calls(
+            [
+                mock.call('i-2/eb-engine.log:1: 2018/03/26 17:00:01 [ERROR] Disk full'),
+                mock.call('i-1/eb-engine.log:1: 2018/03/26 17:00:05 [ERROR] Command failed'),
+            ]
+        )
+
+        echo_mock.reset_mock()
+        logsops.search_retrieved_logs('ERROR', start_time=1522083602000, instance_id='i-2')
+
+        echo_mock.assert_called_once_with('No log lines match.')
+
+    @mock.patch('ebcli.operations.logsops.fileoperations.get_logs_location')
+    def test_search_retrieved_logs__no_logs_retrieved(
+            self,
+            get_logs_location_mock
+    ):
+        get_logs_location_mock.return_value = os.path.abspath('latest')
+
+        with self.assertRaises(NotFoundError):
+            logsops.search_retrieved_logs('ERROR')
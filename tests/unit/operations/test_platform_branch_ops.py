@@ -177,7 +177,7 @@ class TestPlatformBranchOperations(unittest.TestCase):
         _resolve_conflicting_platform_branches_mock.assert_not_called()
         self.assertEqual(None, result)
 
-    @mock.patch('ebcli.operations.platform_branch_ops._non_retired_platform_branches_cache', None)
+    @mock.patch.dict('ebcli.operations.platform_branch_ops._non_retired_platform_branches_cache', {}, clear=True)
     @mock.patch('ebcli.operations.platform_branch_ops.elasticbeanstalk.list_platform_branches')
     def test_list_nonretired_platform_branches(
         self,
@@ -203,7 +203,7 @@ class TestPlatformBranchOperations(unittest.TestCase):
         list_platform_branches_mock.assert_called_once_with(filters=expected_filters)
         self.assertEqual(platform_branches, result)
 
-    @mock.patch('ebcli.operations.platform_branch_ops._non_retired_platform_branches_cache', None)
+    @mock.patch.dict('ebcli.operations.platform_branch_ops._non_retired_platform_branches_cache', {}, clear=True)
     @mock.patch('ebcli.operations.platform_branch_ops.elasticbeanstalk.list_platform_branches')
     def test_list_nonretired_platform_branches__multiple_calls(
         self,
@@ -233,6 +233,30 @@ class TestPlatformBranchOperations(unittest.TestCase):
         self.assertEqual(platform_branches, results[0])
         self.assertEqual(platform_branches, results[1])
 
+    @mock.patch.dict('ebcli.operations.platform_branch_ops._non_retired_platform_branches_cache', {}, clear=True)
+    @mock.patch('ebcli.operations.platform_branch_ops.aws.get_region_name')
+    @mock.patch('ebcli.operations.platform_branch_ops.elasticbeanstalk.list_platform_branches')
+    def test_list_nonretired_platform_branches__cached_per_region(
+        self,
+        list_platform_branches_mock,
+        get_region_name_mock,
+    ):
+        list_platform_branches_mock.side_effect = [
+            [{'PlatformName': 'Python', 'LifecycleState': 'Supported'}],
+            [{'PlatformName': 'Docker', 'LifecycleState': 'Supported'}],
+        ]
+
+        get_region_name_mock.return_value = 'us-west-2'
+        us_west_2_branches = platform_branch_ops.list_nonretired_platform_branches()
+        get_region_name_mock.return_value = 'eu-west-1'
+        eu_west_1_branches = platform_branch_ops.list_nonretired_platform_branches()
+        get_region_name_mock.return_value = 'us-west-2'
+
+        self.assertEqual('Python', us_west_2_branches[0]['PlatformName'])
+        self.assertEqual('Docker', eu_west_1_branches[0]['PlatformName'])
+        self.assertEqual(us_west_2_branches, platform_branch_ops.list_nonretired_platform_branches())
+        self.assertEqual(2, list_platform_branches_mock.call_count)
+
     def test__resolve_conflicting_platform_branches(self):
         branches = [
             {
@@ -10,6 +10,7 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import io
 import os
 import shutil
 from copy import deepcopy
@@ -594,3 +595,102 @@ class TestSSHOps(unittest.TestCase):
         log_error_mock.assert_called_once_with(
             'This environment is not set up for SSH. Use "eb ssh --setup" to set up SSH for the environment.'
         )
+
+    @mock.patch('ebcli.operations.sshops.commonops.get_instance_ids')
+    @mock.patch('ebcli.operations.sshops.ec2.describe_instances')
+    @mock.patch('ebcli.operations.sshops.ec2.describe_security_groups')
+    @mock.patch('ebcli.operations.sshops.ec2.authorize_ssh')
+    @mock.patch('ebcli.operations.sshops.ec2.revoke_ssh')
+    @mock.patch('ebcli.operations.sshops._get_ssh_file')
+    @mock.patch('ebcli.operations.sshops.subprocess.Popen')
+    @mock.patch('ebcli.operations.sshops.io.echo')
+    def test_run_on_all_instances(
+            self,
+            echo_mock,
+            popen_mock,
+            _get_ssh_file_mock,
+            revoke_ssh_mock,
+            authorize_ssh_mock,
+            describe_security_groups_mock,
+            describe_instances_mock,
+            get_instance_ids_mock
+    ):
+        instances = []
+        for index in range(3):
+            instance = deepcopy(mock_responses.DESCRIBE_INSTANCES_RESPONSE['Reservations'][0]['Instances'][0])
+            instance['InstanceId'] = 'i-{0}'.format(index)
+            instance['PublicIpAddress'] = '10.0.0.{0}'.format(index)
+            instances.append(instance)
+        del instances[2]['PublicIpAddress']
+        del instances[2]['PrivateIpAddress']
+        get_instance_ids_mock.return_value = [instance['InstanceId'] for instance in instances]
+        describe_instances_mock.return_value = instances
+        security_group = deepcopy(mock_responses.DESCRIBE_SECURITY_GROUPS_RESPONSE['SecurityGroups'][1])
+        security_group['GroupId'] = 'sg-12312313'
+        describe_security_groups_mock.return_value = [security_group]
+        _get_ssh_file_mock.return_value = 'aws-eb-us-west-2'
+
+        def popen(command, **kwargs):
+            process = mock.MagicMock()
+            host = command[-2]
+            process.stdout = io.BytesIO('up on {0}\nload 0.1\n'.format(host).encode('utf-8'))
+            process.wait.return_value = 0 if host.endswith('.0') else 255
+            process.poll.return_value = process.wait.return_value
+            return process
+        popen_mock.side_effect = popen
+
+        with self.assertRaises(sshops.CommandError) as context_manager:
+            sshops.run_on_all_instances('my-environment', 'uptime', concurrency=2)
+
+        self.assertEqual('The command failed on 2 of 3 instances.', str(context_manager.exception))
+        describe_instances_mock.assert_called_once_with(['i-0', 'i-1', 'i-2'])
+        describe_security_groups_mock.assert_called_once_with(['sg-12312313'])
+        authorize_ssh_mock.assert_called_once_with('sg-12312313')
+        revoke_ssh_mock.assert_called_once_with('sg-12312313')
+        popen_mock.assert_any_call(
+            [
+                'ssh', '-i', 'aws-eb-us-west-2', '-o', 'IdentitiesOnly yes', '-o', 'BatchMode yes',
+                'ec2-user@10.0.0.0', 'uptime'
+            ],
+            stdin=sshops.subprocess.DEVNULL,
+            stdout=sshops.subprocess.PIPE,
+            stderr=sshops.subprocess.STDOUT
+        )
+        self.assertEqual(2, popen_mock.call_count)
+        echoed = [call[0][0] for call in echo_mock.call_args_list if call[0]]
+        self.assertIn('[i-0] up on ec2-user@10.0.0.0', echoed)
+        self.assertIn('[i-1] load 0.1', echoed)
+        self.assertEqual(
+            ['  i-0: 0', '  i-1: 255', '  i-2: not run, the instance has no IP address'],
+            echoed[-3:]
+        )
+
+    @mock.patch('ebcli.operations.sshops.commonops.get_instance_ids')
+    @mock.patch('ebcli.operations.sshops.ec2.describe_instances')
+    @mock.patch('ebcli.operations.sshops.ec2.describe_security_groups')
+    @mock.patch('ebcli.operations.sshops.ec2.revoke_ssh')
+    @mock.patch('ebcli.operations.sshops._get_ssh_file')
+    @mock.patch('ebcli.operations.sshops.subprocess.Popen')
+    def test_run_on_all_instances__closes_port_when_the_command_cannot_start(
+            self,
+            popen_mock,
+            _get_ssh_file_mock,
+            revoke_ssh_mock,
+            describe_security_groups_mock,
+            describe_instances_mock,
+            get_instance_ids_mock
+    ):
+        instance = mock_responses.DESCRIBE_INSTANCES_RESPONSE['Reservations'][0]['Instances'][0]
+        get_instance_ids_mock.return_value = [instance['InstanceId']]
+        describe_instances_mock.return_value = [instance]
+        security_group = deepcopy(mock_responses.DESCRIBE_SECURITY_GROUPS_RESPONSE['SecurityGroups'][1])
+        security_group['GroupId'] = 'sg-12312313'
+        describe_security_groups_mock.return_value = [security_group]
+        _get_ssh_file_mock.return_value = 'aws-eb-us-west-2'
+        popen_mock.side_effect = OSError
+
+        with mock.patch('ebcli.operations.sshops.ec2.authorize_ssh'):
+            with self.assertRaises(sshops.CommandError):
+                sshops.run_on_all_instances('my-environment', 'uptime')
+
+        revoke_ssh_mock.assert_called_once_with('sg-12312313')
@@ -37,6 +37,9 @@ class TestTerminateOps(unittest.TestCase):
             'us-west-2',
             '64bit Amazon Linux 2014.03 v1.0.6 running PHP 5.5'
         )
+        patcher = mock.patch('ebcli.operations.terminateops.completioncache')
+        self.completioncache_mock = patcher.start()
+        self.addCleanup(patcher.stop)
 
     def tearDown(self):
         os.chdir(self.root_dir)
@@ -176,6 +179,7 @@ Application versions: 1
 
         ask_for_customer_confirmation_to_delete_all_application_resources_mock.assert_not_called()
         cleanup_application_versions_mock.assert_called_once_with('my-application')
+        self.completioncache_mock.remove_application.assert_called_once_with(mock.ANY, 'my-application')
         wait_for_success_events_mock.assert_called_once_with(
             'some-request-id',
             sleep_time=5,
@@ -272,6 +276,7 @@ Application versions: 1
 
         terminateops.terminate('my-environment')
 
+        self.completioncache_mock.remove_environment.assert_called_once_with(mock.ANY, 'my-environment')
         wait_for_success_events_mock.assert_called_once_with(
             'some-request-id',
             timeout_in_minutes=15